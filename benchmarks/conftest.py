@@ -0,0 +1,152 @@
+"""Fixtures for the hot path microbenchmarks.
+
+Benchmarks use pytest-benchmark for timing. The ``measure`` fixture adds two
+fields to each result's ``extra_info``. ``us_per_event`` is the mean time
+divided by the number of events or messages one operation handles.
+``alloc_peak_bytes`` and ``alloc_blocks`` are the peak traced memory of one
+operation and the memory blocks it leaves allocated, measured with
+tracemalloc in separate rounds so that tracing does not skew the timings.
+"""
+
+import asyncio
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+import pytest
+import structlog
+
+from benchmarks import payloads
+
+
+T = TypeVar("T")
+
+ALLOCATION_ROUNDS = 3
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging() -> Iterator[None]:
+    """Filter log calls below WARNING the way a production server does."""
+    import logging
+
+    previous = structlog.get_config()
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+        cache_logger_on_first_use=False,
+    )
+    yield
+    structlog.configure(**previous)
+
+
+def measure_allocations(
+    func: Callable[[], Any], rounds: int = ALLOCATION_ROUNDS
+) -> tuple[int, int]:
+    """Return the mean peak traced bytes and retained blocks per call."""
+    func()  # Warm caches so they are not attributed to the operation
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        blocks_total = 0
+        for _ in range(rounds):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            result = func()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            del result
+            peak_total += peak - baseline
+            blocks_total += sum(
+                stat.count_diff
+                for stat in after.compare_to(before, "filename")
+                if stat.count_diff > 0
+            )
+    finally:
+        tracemalloc.stop()
+    return peak_total // rounds, blocks_total // rounds
+
+
+class Measure:
+    """Run a benchmark and record per-event time and allocations."""
+
+    def __init__(self, benchmark: Any) -> None:
+        self.benchmark = benchmark
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __call__(self, func: Callable[[], T], events: int = 1) -> T:
+        """Benchmark ``func``, which handles ``events`` items per call."""
+        result: T = self.benchmark(func)
+        info = self.benchmark.extra_info
+        info["events"] = events
+        stats = getattr(self.benchmark, "stats", None)
+        if stats is not None:
+            info["us_per_event"] = stats.stats.mean / events * 1e6
+        info["alloc_peak_bytes"], info["alloc_blocks"] = measure_allocations(func)
+        return result
+
+    def run_async(self, factory: Callable[[], Awaitable[T]], events: int = 1) -> T:
+        """Benchmark a coroutine, created afresh for each call on one loop."""
+        loop = self._loop = self._loop or asyncio.new_event_loop()
+        return self(lambda: loop.run_until_complete(factory()), events)
+
+    def close(self) -> None:
+        if self._loop is not None:
+            self._loop.close()
+
+
+@pytest.fixture
+def measure(benchmark: Any) -> Iterator[Measure]:
+    """Benchmark runner recording per-event time and allocations."""
+    runner = Measure(benchmark)
+    yield runner
+    runner.close()
+
+
+async def aiter_items(items: Iterable[T]) -> AsyncIterator[T]:
+    """Yield items from an async iterator, as an upstream stream would."""
+    for item in items:
+        yield item
+
+
+async def drain(stream: AsyncIterator[T]) -> int:
+    """Consume a stream and return the number of items produced."""
+    count = 0
+    async for _ in stream:
+        count += 1
+    return count
+
+
+# Session fixtures: built once, reused by every benchmark
+
+
+@pytest.fixture(scope="session")
+def anthropic_requests() -> dict[str, dict[str, Any]]:
+    return {
+        "small_chat": payloads.anthropic_small_chat(),
+        "agent_transcript": payloads.anthropic_agent_transcript(),
+        "image": payloads.anthropic_image_chat(),
+    }
+
+
+@pytest.fixture(scope="session")
+def openai_requests() -> dict[str, dict[str, Any]]:
+    return {
+        "small_chat": payloads.openai_small_chat(),
+        "agent_transcript": payloads.openai_agent_transcript(),
+        "image": payloads.openai_image_chat(),
+    }
+
+
+@pytest.fixture(scope="session")
+def anthropic_events() -> list[dict[str, Any]]:
+    return payloads.anthropic_stream_events()
+
+
+@pytest.fixture(scope="session")
+def anthropic_sse(anthropic_events: list[dict[str, Any]]) -> list[str]:
+    return payloads.anthropic_sse_chunks(anthropic_events)
+
+
+@pytest.fixture(scope="session")
+def responses_sse() -> list[bytes]:
+    return payloads.responses_sse_chunks()
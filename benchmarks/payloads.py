@@ -0,0 +1,442 @@
+"""Deterministic request payloads and streams for the microbenchmarks.
+
+Requests come in three shapes: a small chat, an agent transcript of about
+200 KB with tool calls and results, and a chat carrying a base64 image.
+Streams are Anthropic events, their SSE encoding and Responses API SSE bytes
+of about 5000 events each. Set ``CCPROXY_BENCHMARK_CASSETTES`` to a directory
+of mock upstream cassettes (``scripts/mock_upstream.py record``) to replay
+recorded streams instead, repeated up to the same event count.
+"""
+
+import base64
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any
+
+from ccproxy.testing.mock_upstream import Cassette, event_data, load_cassettes
+
+
+STREAM_EVENTS = 5000
+TRANSCRIPT_BYTES = 200_000
+IMAGE_BYTES = 256 * 1024
+
+MODEL = "claude-sonnet-4-20250514"
+SYSTEM_PROMPT = "You are a careful assistant working in a Python repository."
+
+_WORDS = (
+    "the",
+    "proxy",
+    "forwards",
+    "each",
+    "request",
+    "upstream",
+    "and",
+    "streams",
+    "tokens",
+    "back",
+    "while",
+    "metrics",
+    "are",
+    "collected",
+    "per",
+    "chunk",
+    "and",
+    "tool",
+    "calls",
+    "are",
+    "converted",
+    "between",
+    "formats",
+)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _image_data(size: int) -> str:
+    return base64.b64encode(random.Random(size).randbytes(size)).decode("ascii")
+
+
+# Anthropic Messages requests
+
+
+def anthropic_small_chat() -> dict[str, Any]:
+    """A three-turn chat without a system prompt."""
+    rng = random.Random(1)
+    return {
+        "model": MODEL,
+        "max_tokens": 1024,
+        "messages": [
+            {"role": "user", "content": _text(rng, 20)},
+            {"role": "assistant", "content": _text(rng, 40)},
+            {"role": "user", "content": _text(rng, 15)},
+        ],
+    }
+
+
+def anthropic_agent_transcript(size: int = TRANSCRIPT_BYTES) -> dict[str, Any]:
+    """An agent session of tool use turns, grown to about ``size`` bytes."""
+    rng = random.Random(2)
+    messages: list[dict[str, Any]] = [{"role": "user", "content": _text(rng, 60)}]
+    body: dict[str, Any] = {
+        "model": MODEL,
+        "max_tokens": 8192,
+        "system": [
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "tools": [
+            {
+                "name": name,
+                "description": _text(rng, 30),
+                "input_schema": {
+                    "type": "object",
+                    "properties": {"path": {"type": "string"}},
+                    "required": ["path"],
+                },
+            }
+            for name in ("Read", "Edit", "Bash", "Grep")
+        ],
+        "messages": messages,
+    }
+    turn = 0
+    while len(json.dumps(body)) < size:
+        tool_id = f"toolu_{turn:06d}"
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": _text(rng, 30)},
+                    {
+                        "type": "tool_use",
+                        "id": tool_id,
+                        "name": rng.choice(("Read", "Edit", "Bash", "Grep")),
+                        "input": {"path": f"src/module_{turn}.py"},
+                    },
+                ],
+            }
+        )
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": tool_id,
+                        "content": _text(rng, 250),
+                    }
+                ],
+            }
+        )
+        turn += 1
+    return body
+
+
+def anthropic_image_chat(size: int = IMAGE_BYTES) -> dict[str, Any]:
+    """A single user turn with a base64 PNG of ``size`` raw bytes."""
+    return {
+        "model": MODEL,
+        "max_tokens": 1024,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": _image_data(size),
+                        },
+                    },
+                    {"type": "text", "text": "Describe this screenshot."},
+                ],
+            }
+        ],
+    }
+
+
+# OpenAI Chat Completions requests
+
+
+def openai_small_chat() -> dict[str, Any]:
+    """A three-turn chat with a system message."""
+    rng = random.Random(1)
+    return {
+        "model": "gpt-4o",
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": _text(rng, 20)},
+            {"role": "assistant", "content": _text(rng, 40)},
+            {"role": "user", "content": _text(rng, 15)},
+        ],
+    }
+
+
+def openai_agent_transcript(size: int = TRANSCRIPT_BYTES) -> dict[str, Any]:
+    """An agent session of tool call turns, grown to about ``size`` bytes."""
+    rng = random.Random(2)
+    messages: list[dict[str, Any]] = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": _text(rng, 60)},
+    ]
+    body: dict[str, Any] = {
+        "model": "gpt-4o",
+        "max_tokens": 8192,
+        "tools": [
+            {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": _text(rng, 30),
+                    "parameters": {
+                        "type": "object",
+                        "properties": {"path": {"type": "string"}},
+                        "required": ["path"],
+                    },
+                },
+            }
+            for name in ("Read", "Edit", "Bash", "Grep")
+        ],
+        "messages": messages,
+    }
+    turn = 0
+    while len(json.dumps(body)) < size:
+        call_id = f"call_{turn:06d}"
+        messages.append(
+            {
+                "role": "assistant",
+                "content": _text(rng, 30),
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {
+                            "name": rng.choice(("Read", "Edit", "Bash", "Grep")),
+                            "arguments": json.dumps({"path": f"src/module_{turn}.py"}),
+                        },
+                    }
+                ],
+            }
+        )
+        messages.append(
+            {"role": "tool", "tool_call_id": call_id, "content": _text(rng, 250)}
+        )
+        turn += 1
+    return body
+
+
+def openai_image_chat(size: int = IMAGE_BYTES) -> dict[str, Any]:
+    """A single user turn with a base64 PNG data URL of ``size`` raw bytes."""
+    return {
+        "model": "gpt-4o",
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Describe this screenshot."},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/png;base64,{_image_data(size)}"
+                        },
+                    },
+                ],
+            }
+        ],
+    }
+
+
+# Streams
+
+
+def _recorded(api: str) -> Cassette | None:
+    directory = os.environ.get("CCPROXY_BENCHMARK_CASSETTES")
+    if not directory:
+        return None
+    cassettes = [c for c in load_cassettes(Path(directory)) if c.api == api]
+    return max(cassettes, key=lambda c: len(c.events), default=None)
+
+
+def _repeat_middle(events: list[Any], count: int) -> list[Any]:
+    """Pad a recorded stream to ``count`` events by repeating its body."""
+    head, body, tail = events[:2], events[2:-2], events[-2:]
+    if not body or len(events) >= count:
+        return events
+    repeats = (count - len(head) - len(tail)) // len(body) + 1
+    return head + (body * repeats)[: count - len(head) - len(tail)] + tail
+
+
+def anthropic_stream_events(count: int = STREAM_EVENTS) -> list[dict[str, Any]]:
+    """Parsed Anthropic stream events: thinking, text and a tool call."""
+    recorded = _recorded("anthropic")
+    if recorded is not None:
+        parsed = [event_data(event) for event in recorded.events]
+        return _repeat_middle([data for data in parsed if data], count)
+
+    rng = random.Random(3)
+    # Fixed events: message_start, three block starts and stops, message_delta
+    # and message_stop; the deltas fill the rest 10% thinking, 5% tool input
+    deltas = max(count - 9, 3)
+    thinking = max(deltas // 10, 1)
+    tool_input = max(deltas // 20, 1)
+    text = deltas - thinking - tool_input
+
+    events: list[dict[str, Any]] = [
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_benchmark",
+                "type": "message",
+                "role": "assistant",
+                "model": MODEL,
+                "content": [],
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {
+                    "input_tokens": 12000,
+                    "cache_read_input_tokens": 10000,
+                    "cache_creation_input_tokens": 500,
+                    "output_tokens": 1,
+                },
+            },
+        },
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "thinking", "thinking": ""},
+        },
+    ]
+    events.extend(
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "thinking_delta", "thinking": f" {rng.choice(_WORDS)}"},
+        }
+        for _ in range(thinking)
+    )
+    events.append({"type": "content_block_stop", "index": 0})
+    events.append(
+        {
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {"type": "text", "text": ""},
+        }
+    )
+    events.extend(
+        {
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "text_delta", "text": f" {rng.choice(_WORDS)}"},
+        }
+        for _ in range(text)
+    )
+    events.append({"type": "content_block_stop", "index": 1})
+    events.append(
+        {
+            "type": "content_block_start",
+            "index": 2,
+            "content_block": {
+                "type": "tool_use",
+                "id": "toolu_benchmark",
+                "name": "Edit",
+                "input": {},
+            },
+        }
+    )
+    arguments = json.dumps({"path": "src/app.py", "content": _text(rng, tool_input)})
+    step = -(-len(arguments) // tool_input)
+    events.extend(
+        {
+            "type": "content_block_delta",
+            "index": 2,
+            "delta": {"type": "input_json_delta", "partial_json": part},
+        }
+        for part in (arguments[i * step : (i + 1) * step] for i in range(tool_input))
+    )
+    events.append({"type": "content_block_stop", "index": 2})
+    events.append(
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "tool_use", "stop_sequence": None},
+            "usage": {"output_tokens": deltas},
+        }
+    )
+    events.append({"type": "message_stop"})
+    return events
+
+
+def anthropic_sse_chunks(events: list[dict[str, Any]]) -> list[str]:
+    """Encode Anthropic events as the SSE chunks read from upstream."""
+    return [
+        f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events
+    ]
+
+
+def responses_sse_chunks(count: int = STREAM_EVENTS) -> list[bytes]:
+    """Responses API SSE events: reasoning and output text deltas."""
+    recorded = _recorded("codex")
+    if recorded is not None:
+        return [
+            f"{event}\n\n".encode() for event in _repeat_middle(recorded.events, count)
+        ]
+
+    rng = random.Random(4)
+    response = {
+        "id": "resp_benchmark",
+        "object": "response",
+        "model": "gpt-5",
+        "status": "in_progress",
+        "output": [],
+    }
+    deltas = max(count - 2, 2)
+    reasoning = deltas // 10
+    events: list[tuple[str, dict[str, Any]]] = [
+        ("response.created", {"type": "response.created", "response": response})
+    ]
+    events.extend(
+        (
+            "response.reasoning.delta",
+            {"type": "response.reasoning.delta", "delta": f" {rng.choice(_WORDS)}"},
+        )
+        for _ in range(reasoning)
+    )
+    events.extend(
+        (
+            "response.output_text.delta",
+            {
+                "type": "response.output_text.delta",
+                "item_id": "msg_benchmark",
+                "output_index": 0,
+                "content_index": 0,
+                "delta": f" {rng.choice(_WORDS)}",
+            },
+        )
+        for _ in range(deltas - reasoning)
+    )
+    events.append(
+        (
+            "response.completed",
+            {
+                "type": "response.completed",
+                "response": {
+                    **response,
+                    "status": "completed",
+                    "usage": {
+                        "input_tokens": 12000,
+                        "output_tokens": deltas,
+                        "total_tokens": 12000 + deltas,
+                    },
+                },
+            },
+        )
+    )
+    return [
+        f"event: {name}\ndata: {json.dumps(data)}\n\n".encode() for name, data in events
+    ]
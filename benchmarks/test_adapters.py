@@ -0,0 +1,92 @@
+"""Benchmarks for OpenAI format adapters and streaming converters."""
+
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import Measure, aiter_items, drain
+from ccproxy.adapters.openai.adapter import OpenAIAdapter
+from ccproxy.adapters.openai.response_adapter import ResponseAdapter
+from ccproxy.adapters.openai.streaming import OpenAIStreamProcessor
+from ccproxy.utils.streaming_metrics import StreamingMetricsCollector
+
+
+@pytest.mark.benchmark(group="openai_adapt_request")
+@pytest.mark.parametrize("shape", ["small_chat", "agent_transcript", "image"])
+def test_adapt_request(
+    measure: Measure, openai_requests: dict[str, dict[str, Any]], shape: str
+) -> None:
+    """Convert a Chat Completions request to the Messages API."""
+    request = openai_requests[shape]
+    adapter = OpenAIAdapter()
+
+    result = measure(
+        lambda: adapter.adapt_request(request), events=len(request["messages"])
+    )
+
+    assert result["messages"]
+
+
+@pytest.mark.benchmark(group="stream_conversion")
+def test_adapt_stream(measure: Measure, anthropic_events: list[dict[str, Any]]) -> None:
+    """Convert an Anthropic event stream to Chat Completions chunk dicts."""
+    adapter = OpenAIAdapter()
+
+    chunks = measure.run_async(
+        lambda: drain(adapter.adapt_stream(aiter_items(anthropic_events))),
+        events=len(anthropic_events),
+    )
+
+    assert chunks > 0
+
+
+@pytest.mark.benchmark(group="stream_conversion")
+@pytest.mark.parametrize("output_format", ["sse", "bytes"])
+def test_openai_stream_processor(
+    measure: Measure,
+    anthropic_events: list[dict[str, Any]],
+    output_format: Any,
+) -> None:
+    """Convert an Anthropic event stream to encoded Chat Completions SSE."""
+
+    def process() -> Any:
+        processor = OpenAIStreamProcessor(
+            message_id="chatcmpl-benchmark",
+            created=1,
+            output_format=output_format,
+        )
+        return drain(processor.process_stream(aiter_items(anthropic_events)))
+
+    chunks = measure.run_async(process, events=len(anthropic_events))
+
+    assert chunks > 0
+
+
+@pytest.mark.benchmark(group="stream_conversion")
+def test_stream_response_to_chat(measure: Measure, responses_sse: list[bytes]) -> None:
+    """Convert a Responses API SSE stream to Chat Completions chunk dicts."""
+    adapter = ResponseAdapter()
+
+    chunks = measure.run_async(
+        lambda: drain(adapter.stream_response_to_chat(aiter_items(responses_sse))),
+        events=len(responses_sse),
+    )
+
+    assert chunks > 0
+
+
+@pytest.mark.benchmark(group="streaming_metrics")
+def test_streaming_metrics_process_chunk(
+    measure: Measure, anthropic_sse: list[str]
+) -> None:
+    """Extract token usage from every SSE chunk of an Anthropic stream."""
+
+    def collect() -> StreamingMetricsCollector:
+        collector = StreamingMetricsCollector(request_id="benchmark")
+        for chunk in anthropic_sse:
+            collector.process_chunk(chunk)
+        return collector
+
+    collector = measure(collect, events=len(anthropic_sse))
+
+    assert collector.get_metrics()["tokens_output"]
@@ -0,0 +1,86 @@
+"""Benchmarks for request body transformation and SDK message conversion."""
+
+import json
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import Measure
+from ccproxy.claude_sdk.converter import MessageConverter
+from ccproxy.config.claude import SDKMessageMode
+from ccproxy.core.http_transformers import HTTPRequestTransformer
+from ccproxy.models import claude_sdk as sdk_models
+
+
+SHAPES = ["small_chat", "agent_transcript", "image"]
+
+
+@pytest.mark.benchmark(group="transform_system_prompt")
+@pytest.mark.parametrize("shape", SHAPES)
+def test_transform_system_prompt(
+    measure: Measure, anthropic_requests: dict[str, dict[str, Any]], shape: str
+) -> None:
+    """Inject the system prompt into a raw Anthropic request body."""
+    request = anthropic_requests[shape]
+    body = json.dumps(request).encode()
+    transformer = HTTPRequestTransformer()
+
+    result = measure(
+        lambda: transformer.transform_system_prompt(body),
+        events=len(request["messages"]),
+    )
+
+    assert b'"system"' in result
+
+
+@pytest.mark.benchmark(group="message_converter")
+@pytest.mark.parametrize("shape", SHAPES)
+def test_format_messages_to_prompt(
+    measure: Measure, anthropic_requests: dict[str, dict[str, Any]], shape: str
+) -> None:
+    """Flatten Anthropic messages into an SDK prompt."""
+    messages = anthropic_requests[shape]["messages"]
+
+    prompt = measure(
+        lambda: MessageConverter.format_messages_to_prompt(messages),
+        events=len(messages),
+    )
+
+    assert prompt.startswith("Human:")
+
+
+@pytest.mark.benchmark(group="message_converter")
+@pytest.mark.parametrize("mode", [SDKMessageMode.FORWARD, SDKMessageMode.FORMATTED])
+def test_convert_to_anthropic_response(
+    measure: Measure,
+    anthropic_requests: dict[str, dict[str, Any]],
+    mode: SDKMessageMode,
+) -> None:
+    """Convert an SDK reply of text, tool use and tool result blocks."""
+    blocks: list[Any] = []
+    for message in anthropic_requests["agent_transcript"]["messages"][1:]:
+        for block in message["content"]:
+            if block["type"] == "text":
+                blocks.append(sdk_models.TextBlock(text=block["text"]))
+            elif block["type"] == "tool_use":
+                blocks.append(sdk_models.ToolUseBlock(**block))
+            else:
+                blocks.append(sdk_models.ToolResultBlock(**block))
+    assistant = sdk_models.AssistantMessage(content=blocks)
+    result = sdk_models.ResultMessage.model_validate(
+        {
+            "session_id": "benchmark",
+            "stop_reason": "end_turn",
+            "total_cost_usd": 0.01,
+            "usage": {"input_tokens": 12000, "output_tokens": 800},
+        }
+    )
+
+    response = measure(
+        lambda: MessageConverter.convert_to_anthropic_response(
+            assistant, result, "claude-sonnet-4-20250514", mode
+        ),
+        events=len(blocks),
+    )
+
+    assert response.content
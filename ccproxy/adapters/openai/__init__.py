@@ -18,7 +18,7 @@ from .models import (
     generate_openai_response_id,
     generate_openai_system_fingerprint,
 )
-from .streaming import OpenAISSEFormatter, OpenAIStreamProcessor
+from .streaming import OpenAIChunkEncoder, OpenAISSEFormatter, OpenAIStreamProcessor
 
 
 __all__ = [
@@ -37,6 +37,7 @@ __all__ = [
     "generate_openai_response_id",
     "generate_openai_system_fingerprint",
     # Streaming
+    "OpenAIChunkEncoder",
     "OpenAISSEFormatter",
     "OpenAIStreamProcessor",
 ]
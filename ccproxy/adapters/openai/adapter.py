@@ -591,6 +591,29 @@ class OpenAIAdapter(APIAdapter):
             )
             raise ValueError(f"Error processing streaming response: {e}") from e
 
+    async def adapt_stream_sse(
+        self, stream: AsyncIterator[dict[str, Any]]
+    ) -> AsyncIterator[bytes]:
+        """Convert Anthropic streaming response to encoded OpenAI SSE frames.
+
+        Produces the same chunks as ``adapt_stream`` but serialized through a
+        per-stream precompiled template, terminated by ``data: [DONE]``.
+
+        Args:
+            stream: Anthropic streaming response
+
+        Yields:
+            OpenAI SSE frames as bytes
+        """
+        processor = OpenAIStreamProcessor(
+            enable_usage=True,
+            enable_tool_calls=True,
+            output_format="bytes",
+        )
+
+        async for frame in processor.process_stream(stream):
+            yield frame  # type: ignore[misc]  # frame is guaranteed to be bytes when output_format="bytes"
+
     def _convert_messages_to_anthropic(
         self, openai_messages: list[Any]
     ) -> tuple[list[dict[str, Any]], str | None]:
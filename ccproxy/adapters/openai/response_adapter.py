@@ -32,6 +32,7 @@ from ccproxy.adapters.openai.response_models import (
 from ccproxy.config.codex import CodexSettings
 from ccproxy.config.settings import get_settings
 from ccproxy.services.model_info_service import get_model_info_service
+from ccproxy.services.model_registry import get_model_registry
 
 if TYPE_CHECKING:  # pragma: no cover
     from ccproxy.services.model_info_service import ModelInfoService
@@ -379,11 +380,7 @@ class ResponseAdapter:
         else:
             default_dynamic_max = max_tokens
 
-        await self._ensure_model_supported(
-            response_model,
-            codex_settings,
-            model_info_service=model_info_service,
-        )
+        self._ensure_model_supported(response_model, codex_settings)
 
         # Handle response_format for JSON mode
         response_format = chat_dict.get("response_format")
@@ -476,44 +473,18 @@ class ResponseAdapter:
         )
         raise UnsupportedCodexModelError(mapped, sorted(SUPPORTED_RESPONSE_MODELS))
 
-    def _is_response_api_model_name(self, model_name: str | None) -> bool:
-        if not model_name:
-            return False
-        model_lower = model_name.lower()
-        return model_lower.startswith("gpt-") or model_lower.startswith("o1") or model_lower.startswith("o3")
-
     def _is_model_supported(self, model: str, supported: set[str]) -> bool:
         if model in supported:
             return True
         return any(model.startswith(candidate) for candidate in supported)
 
-    async def _ensure_model_supported(
-        self,
-        model: str,
-        settings: CodexSettings,
-        model_info_service: "ModelInfoService" | None = None,
-    ) -> None:
+    def _ensure_model_supported(self, model: str, settings: CodexSettings) -> None:
         """Ensure the mapped Response API model is supported."""
 
         supported_models = set(SUPPORTED_RESPONSE_MODELS)
 
         if settings.enable_dynamic_model_info:
-            try:
-                service = model_info_service or get_model_info_service()
-                dynamic_models = await service.get_available_models()
-                if dynamic_models:
-                    supported_models.update(
-                        {
-                            m
-                            for m in dynamic_models
-                            if self._is_response_api_model_name(m)
-                        }
-                    )
-            except Exception as exc:
-                logger.debug(
-                    "codex_dynamic_model_list_failed",
-                    error=str(exc),
-                )
+            supported_models |= get_model_registry().response_api_models
 
         if not self._is_model_supported(model, supported_models):
             raise UnsupportedCodexModelError(model, sorted(supported_models))
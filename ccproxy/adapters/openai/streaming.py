@@ -20,6 +20,127 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
+# C-accelerated JSON string escaping, identical to json.dumps(str)
+_encode_json_string = json.encoder.encode_basestring_ascii
+
+SSE_DONE = b"data: [DONE]\n\n"
+
+
+class OpenAIChunkEncoder:
+    """Per-stream precompiled encoder for ``chat.completion.chunk`` SSE frames.
+
+    The id, object, created and model fields are identical for every chunk
+    of a stream, so they are serialized once into a byte prefix. Content
+    chunks then only escape the delta text and splice it into the template,
+    avoiding a dict build and a full ``json.dumps`` per token.
+    """
+
+    __slots__ = ("message_id", "model", "created", "_prefix", "_content_templates")
+
+    DONE = SSE_DONE
+
+    def __init__(self, message_id: str, model: str, created: int) -> None:
+        """Initialize the encoder.
+
+        Args:
+            message_id: Unique identifier for the completion
+            model: Model name reported in every chunk
+            created: Unix timestamp when the completion was created
+        """
+        self.message_id = message_id
+        self.model = model
+        self.created = created
+        self._prefix = (
+            f'data: {{"id":{_encode_json_string(message_id)},'
+            f'"object":"chat.completion.chunk","created":{created:d},'
+            f'"model":{_encode_json_string(model)},"choices":[{{"index":'
+        ).encode("ascii")
+        self._content_templates: dict[int, bytes] = {}
+
+    def _content_template(self, index: int) -> bytes:
+        template = self._content_templates.get(index)
+        if template is None:
+            template = self._prefix.replace(b"%", b"%%") + (
+                b'%d,"delta":{"content":%%s},"logprobs":null,"finish_reason":null}]}\n\n'
+                % index
+            )
+            self._content_templates[index] = template
+        return template
+
+    def content(self, text: str, index: int = 0) -> bytes:
+        """Encode a content delta chunk."""
+        return self._content_template(index) % _encode_json_string(text).encode("ascii")
+
+    def role(self, role: str = "assistant", index: int = 0) -> bytes:
+        """Encode the first chunk announcing the assistant role."""
+        return self.chunk({"role": role}, index=index)
+
+    def finish(
+        self,
+        finish_reason: str = "stop",
+        usage: dict[str, Any] | None = None,
+        index: int = 0,
+    ) -> bytes:
+        """Encode the final chunk with a finish reason and optional usage."""
+        return self.chunk({}, finish_reason=finish_reason, usage=usage, index=index)
+
+    def chunk(
+        self,
+        delta: dict[str, Any],
+        finish_reason: str | None = None,
+        usage: dict[str, Any] | None = None,
+        index: int = 0,
+        extra: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Encode an arbitrary chunk; only the variable parts are serialized.
+
+        Args:
+            delta: Delta object for the choice
+            finish_reason: Optional finish reason
+            usage: Optional usage information
+            index: Index of the choice
+            extra: Additional top-level fields (e.g. ``error``)
+
+        Returns:
+            Complete SSE frame as bytes
+        """
+        if (
+            finish_reason is None
+            and not usage
+            and not extra
+            and len(delta) == 1
+            and "content" in delta
+        ):
+            return self.content(delta["content"], index)
+
+        parts = [
+            self._prefix,
+            b"%d" % index,
+            b',"delta":',
+            json.dumps(delta, separators=(",", ":")).encode("utf-8"),
+            b',"logprobs":null,"finish_reason":',
+            _encode_json_string(finish_reason).encode("ascii")
+            if finish_reason is not None
+            else b"null",
+            b"}]",
+        ]
+        if usage:
+            parts.append(b',"usage":')
+            parts.append(json.dumps(usage, separators=(",", ":")).encode("utf-8"))
+        for key, value in (extra or {}).items():
+            parts.append(b",%s:" % _encode_json_string(key).encode("ascii"))
+            parts.append(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        parts.append(b"}\n\n")
+        return b"".join(parts)
+
+    def error(self, error_type: str, error_message: str) -> bytes:
+        """Encode an error chunk."""
+        return self.chunk(
+            {},
+            finish_reason="error",
+            extra={"error": {"type": error_type, "message": error_message}},
+        )
+
 
 class OpenAISSEFormatter:
     """Formats streaming responses to match OpenAI's SSE format."""
@@ -246,7 +367,7 @@ class OpenAIStreamProcessor:
         created: int | None = None,
         enable_usage: bool = True,
         enable_tool_calls: bool = True,
-        output_format: Literal["sse", "dict"] = "sse",
+        output_format: Literal["sse", "dict", "bytes"] = "sse",
     ):
         """Initialize the stream processor.
 
@@ -256,7 +377,8 @@ class OpenAIStreamProcessor:
             created: Creation timestamp, current time if not provided
             enable_usage: Whether to include usage information
             enable_tool_calls: Whether to process tool calls
-            output_format: Output format - "sse" for Server-Sent Events strings, "dict" for dict objects
+            output_format: Output format - "sse" for Server-Sent Events strings, "dict" for dict objects,
+                "bytes" for encoded SSE frames (chunk semantics of "dict", terminated by [DONE])
         """
         self.message_id = message_id or generate_openai_response_id()
         self.model = model
@@ -265,6 +387,9 @@ class OpenAIStreamProcessor:
         self.enable_tool_calls = enable_tool_calls
         self.output_format = output_format
         self.formatter = OpenAISSEFormatter()
+        self.encoder = OpenAIChunkEncoder(self.message_id, self.model, self.created)
+        # "dict" and "bytes" emit tool calls as soon as they are known
+        self._immediate_tool_calls = output_format != "sse"
 
         # State tracking
         self.role_sent = False
@@ -278,14 +403,14 @@ class OpenAIStreamProcessor:
 
     async def process_stream(
         self, claude_stream: AsyncIterator[dict[str, Any]]
-    ) -> AsyncIterator[str | dict[str, Any]]:
+    ) -> AsyncIterator[str | dict[str, Any] | bytes]:
         """Process a Claude/Anthropic stream into OpenAI format.
 
         Args:
             claude_stream: Async iterator of Claude response chunks
 
         Yields:
-            OpenAI-formatted SSE strings or dict objects based on output_format
+            OpenAI-formatted SSE strings, dict objects or SSE bytes based on output_format
         """
         try:
             chunk_count = 0
@@ -323,13 +448,18 @@ class OpenAIStreamProcessor:
             else:
                 yield self._format_chunk_output(finish_reason="stop")
 
-            # Send DONE event (only for SSE format)
+            # Send DONE event (only for SSE formats)
             if self.output_format == "sse":
                 yield self.formatter.format_done()
+            elif self.output_format == "bytes":
+                yield self.encoder.DONE
 
         except Exception as e:
             # Send error chunk
-            if self.output_format == "sse":
+            if self.output_format == "bytes":
+                yield self.encoder.error("error", str(e))
+                yield self.encoder.DONE
+            elif self.output_format == "sse":
                 yield self.formatter.format_error_chunk(
                     self.message_id, self.model, self.created, "error", str(e)
                 )
@@ -340,14 +470,14 @@ class OpenAIStreamProcessor:
 
     async def _process_chunk(
         self, chunk: dict[str, Any]
-    ) -> AsyncIterator[str | dict[str, Any]]:
+    ) -> AsyncIterator[str | dict[str, Any] | bytes]:
         """Process a single chunk from the Claude stream.
 
         Args:
             chunk: Claude response chunk
 
         Yields:
-            OpenAI-formatted SSE strings or dict objects based on output_format
+            OpenAI-formatted SSE strings, dict objects or SSE bytes based on output_format
         """
         # Handle both Claude SDK and standard Anthropic API formats:
         # Claude SDK format: {"event": "...", "data": {"type": "..."}}
@@ -389,8 +519,8 @@ class OpenAIStreamProcessor:
                 tool_input = block.get("input", {})
                 source = block.get("source", "claude_code_sdk")
 
-                # For dict format, immediately yield the tool call
-                if self.output_format == "dict":
+                # For dict/bytes format, immediately yield the tool call
+                if self._immediate_tool_calls:
                     yield self._format_chunk_output(
                         delta={
                             "tool_calls": [
@@ -572,7 +702,7 @@ class OpenAIStreamProcessor:
         delta: dict[str, Any] | None = None,
         finish_reason: str | None = None,
         usage: dict[str, int] | None = None,
-    ) -> str | dict[str, Any]:
+    ) -> str | dict[str, Any] | bytes:
         """Format chunk output based on output_format flag.
 
         Args:
@@ -581,8 +711,10 @@ class OpenAIStreamProcessor:
             usage: Optional usage information
 
         Returns:
-            Either SSE string or dict based on output_format
+            SSE string, dict or SSE bytes based on output_format
         """
+        if self.output_format == "bytes":
+            return self.encoder.chunk(delta or {}, finish_reason, usage)
         if self.output_format == "dict":
             return self._create_chunk_dict(delta, finish_reason, usage)
         else:
@@ -601,13 +733,9 @@ class OpenAIStreamProcessor:
                         self.message_id, self.model, self.created, finish_reason
                     )
             elif delta and delta.get("role"):
-                return self.formatter.format_first_chunk(
-                    self.message_id, self.model, self.created, delta["role"]
-                )
+                return self.encoder.role(delta["role"]).decode("ascii")
             elif delta and delta.get("content"):
-                return self.formatter.format_content_chunk(
-                    self.message_id, self.model, self.created, delta["content"]
-                )
+                return self.encoder.content(delta["content"]).decode("ascii")
             elif delta and delta.get("tool_calls"):
                 # Handle tool calls
                 tool_call = delta["tool_calls"][0]  # Assume single tool call for now
@@ -627,6 +755,7 @@ class OpenAIStreamProcessor:
 
 
 __all__ = [
+    "OpenAIChunkEncoder",
     "OpenAISSEFormatter",
     "OpenAIStreamProcessor",
 ]
@@ -1,10 +1,9 @@
 """FastAPI application factory for CCProxy API Server."""
 
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Any, TypedDict
 
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.staticfiles import StaticFiles
 from structlog import get_logger
 
@@ -17,6 +16,7 @@ from ccproxy.api.middleware.request_content_logging import (
 )
 from ccproxy.api.middleware.request_id import RequestIDMiddleware
 from ccproxy.api.middleware.server_header import ServerHeaderMiddleware
+from ccproxy.api.routes.batches import router as batches_router
 from ccproxy.api.routes.claude import router as claude_router
 from ccproxy.api.routes.codex import router as codex_router
 from ccproxy.api.routes.health import router as health_router
@@ -28,50 +28,54 @@ from ccproxy.api.routes.metrics import (
 )
 from ccproxy.api.routes.permissions import router as permissions_router
 from ccproxy.api.routes.proxy import router as proxy_router
+from ccproxy.api.routes.tokens import router as tokens_router
 from ccproxy.auth.oauth.routes import router as oauth_router
 from ccproxy.config.settings import Settings, get_settings
 from ccproxy.core.logging import setup_logging
-from ccproxy.utils.models_provider import get_models_list
+from ccproxy.services.model_registry import get_model_registry
 from ccproxy.utils.startup_helpers import (
     check_claude_cli_startup,
     check_codex_cli_startup,
     check_version_updates_startup,
     flush_streaming_batches_shutdown,
+    initialize_batch_service_startup,
     initialize_claude_detection_startup,
     initialize_claude_sdk_startup,
     initialize_codex_detection_startup,
     initialize_log_storage_shutdown,
     initialize_log_storage_startup,
+    initialize_model_registry_startup,
     initialize_permission_service_startup,
+    load_claude_detection_cache_startup,
+    load_codex_detection_cache_startup,
+    setup_batch_service_shutdown,
+    setup_log_archival_startup,
     setup_permission_service_shutdown,
     setup_scheduler_shutdown,
     setup_scheduler_startup,
     setup_session_manager_shutdown,
+    start_access_log_bus_startup,
+    start_loop_lag_monitor_startup,
+    stop_access_log_bus_shutdown,
+    stop_loop_lag_monitor_shutdown,
     validate_claude_authentication_startup,
     validate_codex_authentication_startup,
 )
+from ccproxy.utils.startup_orchestrator import (
+    LifecycleComponent,
+    ShutdownComponent,
+    StartupOrchestrator,
+    component_slug,
+)
 
 
 logger = get_logger(__name__)
 
 
-# Type definitions for lifecycle components
-class LifecycleComponent(TypedDict):
-    name: str
-    startup: Callable[[FastAPI, Any], Awaitable[None]] | None
-    shutdown: (
-        Callable[[FastAPI], Awaitable[None]]
-        | Callable[[FastAPI, Any], Awaitable[None]]
-        | None
-    )
-
-
-class ShutdownComponent(TypedDict):
-    name: str
-    shutdown: Callable[[FastAPI], Awaitable[None]] | None
-
-
-# Define lifecycle components for startup/shutdown organization
+# Define lifecycle components for startup/shutdown organization.
+# Startups run concurrently once their dependencies have finished; deferred
+# components run in the background after the server starts accepting traffic.
+# Shutdowns run sequentially in reverse declaration order.
 LIFECYCLE_COMPONENTS: list[LifecycleComponent] = [
     {
         "name": "Claude Authentication",
@@ -87,42 +91,95 @@ LIFECYCLE_COMPONENTS: list[LifecycleComponent] = [
         "name": "Version Check",
         "startup": check_version_updates_startup,
         "shutdown": None,  # One-time check, no cleanup needed
+        "deferred": True,
     },
     {
         "name": "Claude CLI",
         "startup": check_claude_cli_startup,
         "shutdown": None,  # Detection only, no cleanup needed
+        "deferred": True,
     },
     {
         "name": "Codex CLI",
         "startup": check_codex_cli_startup,
         "shutdown": None,  # Detection only, no cleanup needed
+        "deferred": True,
     },
     {
         "name": "Claude Detection",
-        "startup": initialize_claude_detection_startup,
+        "startup": load_claude_detection_cache_startup,
         "shutdown": None,  # No cleanup needed
     },
     {
         "name": "Codex Detection",
+        "startup": load_codex_detection_cache_startup,
+        "shutdown": None,  # No cleanup needed
+    },
+    {
+        "name": "Claude Detection Refresh",
+        "startup": initialize_claude_detection_startup,
+        "shutdown": None,  # No cleanup needed
+        "depends_on": ["Claude Detection"],
+        "timeout": 60.0,
+        "deferred": True,
+    },
+    {
+        "name": "Codex Detection Refresh",
         "startup": initialize_codex_detection_startup,
         "shutdown": None,  # No cleanup needed
+        "depends_on": ["Codex Detection", "Codex CLI"],
+        "timeout": 60.0,
+        "deferred": True,
     },
     {
         "name": "Claude SDK",
         "startup": initialize_claude_sdk_startup,
         "shutdown": setup_session_manager_shutdown,
     },
+    {
+        "name": "Model Registry",
+        "startup": initialize_model_registry_startup,
+        "shutdown": None,  # Refreshed in place by the pricing updater
+    },
     {
         "name": "Scheduler",
         "startup": setup_scheduler_startup,
         "shutdown": setup_scheduler_shutdown,
+        "depends_on": ["Claude SDK", "Model Registry"],
     },
     {
         "name": "Log Storage",
         "startup": initialize_log_storage_startup,
         "shutdown": initialize_log_storage_shutdown,
     },
+    {
+        "name": "Access Log Bus",
+        "startup": start_access_log_bus_startup,
+        "shutdown": stop_access_log_bus_shutdown,
+        "depends_on": ["Log Storage"],
+    },
+    {
+        "name": "Event Loop Monitor",
+        "startup": start_loop_lag_monitor_startup,
+        "shutdown": stop_loop_lag_monitor_shutdown,
+    },
+    {
+        "name": "Log Archival",
+        "startup": setup_log_archival_startup,
+        "shutdown": None,  # Task is stopped with the scheduler
+        "depends_on": ["Scheduler", "Log Storage"],
+    },
+    {
+        "name": "Batch Service",
+        "startup": initialize_batch_service_startup,
+        "shutdown": setup_batch_service_shutdown,
+        "depends_on": [
+            "Claude Detection",
+            "Codex Detection",
+            "Claude SDK",
+            "Access Log Bus",
+        ],
+    },
     {
         "name": "Permission Service",
         "startup": initialize_permission_service_startup,
@@ -143,14 +200,32 @@ SHUTDOWN_ONLY_COMPONENTS: list[ShutdownComponent] = [
 models_router = APIRouter(tags=["models"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @models_router.get("/v1/models", response_model=None)
-async def list_models() -> dict[str, Any]:
+async def list_models(request: Request) -> Response:
     """List available models.
 
     Returns a combined list of Anthropic models and recent OpenAI models.
-    This endpoint is shared between both SDK and proxy APIs.
+    This endpoint is shared between both SDK and proxy APIs. The body is
+    pre-rendered by the model registry and revalidated through its ETag.
     """
-    return get_models_list()
+    registry = get_model_registry()
+    headers = {"ETag": registry.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), registry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=registry.models_body, media_type="application/json", headers=headers
+    )
 
 
 @asynccontextmanager
@@ -181,36 +256,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "claude_cli_search_paths", paths=settings.claude.get_searched_paths()
         )
 
-    # Execute startup components in order
-    for component in LIFECYCLE_COMPONENTS:
-        if component["startup"]:
-            component_name = component["name"]
-            try:
-                logger.debug(f"starting_{component_name.lower().replace(' ', '_')}")
-                await component["startup"](app, settings)
-            except Exception as e:
-                logger.error(
-                    f"{component_name.lower().replace(' ', '_')}_startup_failed",
-                    error=str(e),
-                    component=component_name,
-                )
-                # Continue with graceful degradation
+    # Start components concurrently in dependency order; deferred components
+    # keep running in the background after the server starts
+    orchestrator = StartupOrchestrator(LIFECYCLE_COMPONENTS)
+    app.state.startup = orchestrator
+    await orchestrator.start(app, settings)
 
     yield
 
     # Shutdown
     logger.debug("server_stop")
 
+    await orchestrator.cancel_deferred()
+
     # Execute shutdown-only components first
     for shutdown_component in SHUTDOWN_ONLY_COMPONENTS:
         if shutdown_component["shutdown"]:
             component_name = shutdown_component["name"]
             try:
-                logger.debug(f"stopping_{component_name.lower().replace(' ', '_')}")
+                logger.debug(f"stopping_{component_slug(component_name)}")
                 await shutdown_component["shutdown"](app)
             except Exception as e:
                 logger.error(
-                    f"{component_name.lower().replace(' ', '_')}_shutdown_failed",
+                    f"{component_slug(component_name)}_shutdown_failed",
                     error=str(e),
                     component=component_name,
                 )
@@ -220,7 +288,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if component["shutdown"]:
             component_name = component["name"]
             try:
-                logger.debug(f"stopping_{component_name.lower().replace(' ', '_')}")
+                logger.debug(f"stopping_{component_slug(component_name)}")
                 # Some shutdown functions need settings, others don't
                 if component_name == "Permission Service":
                     await component["shutdown"](app, settings)  # type: ignore
@@ -228,7 +296,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     await component["shutdown"](app)  # type: ignore
             except Exception as e:
                 logger.error(
-                    f"{component_name.lower().replace(' ', '_')}_shutdown_failed",
+                    f"{component_slug(component_name)}_shutdown_failed",
                     error=str(e),
                     component=component_name,
                 )
@@ -266,6 +334,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             json_logs=json_logs,
             log_level_name=settings.server.log_level,
             log_file=settings.server.log_file,
+            async_logs=settings.server.log_async,
+            queue_size=settings.server.log_queue_size,
+            debug_sample_rate=settings.server.log_debug_sample_rate,
         )
 
     app = FastAPI(
@@ -313,6 +384,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # New /sdk/ routes for Claude SDK endpoints
     app.include_router(claude_router, prefix="/sdk", tags=["claude-sdk"])
 
+    # Local message batches, executed through the /api proxy pipeline
+    if settings.batch.enabled:
+        app.include_router(batches_router, prefix="/api", tags=["batches"])
+
     # New /api/ routes for proxy endpoints (includes OpenAI-compatible /v1/chat/completions)
     app.include_router(proxy_router, prefix="/api", tags=["proxy-api"])
 
@@ -320,6 +395,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     app.include_router(models_router, prefix="/sdk", tags=["claude-sdk", "models"])
     app.include_router(models_router, prefix="/api", tags=["proxy-api", "models"])
 
+    # Local token counting for both SDK and proxy APIs
+    app.include_router(tokens_router, prefix="/sdk", tags=["claude-sdk", "tokens"])
+    app.include_router(tokens_router, prefix="/api", tags=["proxy-api", "tokens"])
+
     # Confirmation endpoints for SSE streaming and responses (conditional on builtin_permissions)
     if settings.claude.builtin_permissions:
         app.include_router(
@@ -4,16 +4,21 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Depends, Request
+from fastapi import Depends, HTTPException, Request
 from structlog import get_logger
 
 from ccproxy.config.settings import Settings, get_settings
 from ccproxy.core.http import BaseProxyClient
 from ccproxy.observability import PrometheusMetrics, get_metrics
 from ccproxy.observability.storage.duckdb_simple import SimpleDuckDBStorage
+from ccproxy.services.batch import BatchService
 from ccproxy.services.claude_sdk_service import ClaudeSDKService
 from ccproxy.services.credentials.manager import CredentialsManager
 from ccproxy.services.proxy_service import ProxyService
+from ccproxy.services.token_count_service import (
+    TokenCountService,
+    get_token_count_service,
+)
 
 
 logger = get_logger(__name__)
@@ -205,6 +210,29 @@ async def get_duckdb_storage(request: Request) -> SimpleDuckDBStorage | None:
     return storage
 
 
+def get_batch_service(request: Request) -> BatchService:
+    """Get the local batch service from app state.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        BatchService instance created during application startup
+
+    Raises:
+        HTTPException: If batch processing is disabled or failed to start
+    """
+    batch_service: BatchService | None = getattr(
+        request.app.state, "batch_service", None
+    )
+    if batch_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Batch processing is not available (enable with BATCH__ENABLED=true)",
+        )
+    return batch_service
+
+
 # Type aliases for service dependencies
 ClaudeServiceDep = Annotated[ClaudeSDKService, Depends(get_cached_claude_service)]
 ProxyServiceDep = Annotated[ProxyService, Depends(get_proxy_service)]
@@ -213,3 +241,5 @@ ObservabilityMetricsDep = Annotated[
 ]
 LogStorageDep = Annotated[SimpleDuckDBStorage | None, Depends(get_log_storage)]
 DuckDBStorageDep = Annotated[SimpleDuckDBStorage | None, Depends(get_duckdb_storage)]
+BatchServiceDep = Annotated[BatchService, Depends(get_batch_service)]
+TokenCountServiceDep = Annotated[TokenCountService, Depends(get_token_count_service)]
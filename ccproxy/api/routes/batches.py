@@ -0,0 +1,281 @@
+"""Local Message Batches endpoints for CCProxy API Server.
+
+Provides the Anthropic ``/v1/messages/batches`` API and a minimal OpenAI
+``/v1/batches`` API. Batches are executed locally through ProxyService, so
+they use the same authentication and transformations as ``/api`` requests.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import structlog
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from ccproxy.api.dependencies import BatchServiceDep
+from ccproxy.auth.conditional import ConditionalAuthDep
+from ccproxy.services.batch import (
+    BatchItem,
+    BatchNotFoundError,
+    BatchRecord,
+    BatchService,
+)
+
+
+# Create the router for batch endpoints
+router = APIRouter(tags=["batches"])
+
+logger = structlog.get_logger(__name__)
+
+JSONL_MEDIA_TYPE = "application/x-jsonl"
+
+
+def _parse_batch_body(body: bytes, content_type: str) -> list[dict[str, Any]]:
+    """Parse a batch submission.
+
+    Accepts either a JSON object with a ``requests`` list (the Anthropic
+    create-batch shape) or a JSONL document with one request per line.
+    """
+    if not body.strip():
+        raise HTTPException(status_code=400, detail="Batch body is empty")
+
+    if "json" in content_type and "jsonl" not in content_type:
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}") from e
+        if isinstance(data, dict) and isinstance(data.get("requests"), list):
+            return data["requests"]  # type: ignore[no-any-return]
+        if isinstance(data, list):
+            return data
+        raise HTTPException(
+            status_code=400, detail="Expected a 'requests' list in the request body"
+        )
+
+    lines = []
+    for line_number, line in enumerate(body.decode("utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            lines.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid JSONL on line {line_number}: {e}",
+            ) from e
+    return lines
+
+
+def _anthropic_items(entries: list[dict[str, Any]]) -> list[BatchItem]:
+    try:
+        return [BatchItem.model_validate(entry) for entry in entries]
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def _openai_items(entries: list[dict[str, Any]]) -> list[BatchItem]:
+    items = []
+    for entry in entries:
+        url = entry.get("url", "/v1/chat/completions")
+        if not str(url).endswith("/chat/completions"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported batch endpoint '{url}', only /v1/chat/completions is supported",
+            )
+        try:
+            items.append(
+                BatchItem(custom_id=entry.get("custom_id", ""), params=entry["body"])
+            )
+        except (KeyError, ValidationError) as e:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid batch line: {e}"
+            ) from e
+    return items
+
+
+async def _create(
+    batch_service: BatchService, items: list[BatchItem], batch_format: str
+) -> BatchRecord:
+    try:
+        return await batch_service.create_batch(items, batch_format)  # type: ignore[arg-type]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+async def _get(batch_service: BatchService, batch_id: str) -> BatchRecord:
+    try:
+        return await batch_service.get_batch(batch_id)
+    except BatchNotFoundError as e:
+        raise HTTPException(
+            status_code=404, detail=f"Batch '{batch_id}' not found"
+        ) from e
+
+
+def _results_url(request: Request, batch_id: str) -> str:
+    return str(request.url_for("get_message_batch_results", batch_id=batch_id))
+
+
+# Anthropic Message Batches API
+
+
+@router.post("/v1/messages/batches")
+async def create_message_batch(
+    request: Request,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Create a message batch from a ``requests`` list or a JSONL body."""
+    body = await request.body()
+    entries = _parse_batch_body(body, request.headers.get("content-type", ""))
+    record = await _create(batch_service, _anthropic_items(entries), "anthropic")
+    return record.to_anthropic()
+
+
+@router.get("/v1/messages/batches")
+async def list_message_batches(
+    request: Request,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+    limit: int = Query(20, ge=1, le=1000),
+) -> dict[str, Any]:
+    """List message batches, newest first."""
+    records = await batch_service.list_batches(limit=limit)
+    data = [record.to_anthropic(_results_url(request, record.id)) for record in records]
+    return {
+        "data": data,
+        "has_more": False,
+        "first_id": data[0]["id"] if data else None,
+        "last_id": data[-1]["id"] if data else None,
+    }
+
+
+@router.get("/v1/messages/batches/{batch_id}")
+async def get_message_batch(
+    batch_id: str,
+    request: Request,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Retrieve the status of a message batch."""
+    record = await _get(batch_service, batch_id)
+    return record.to_anthropic(_results_url(request, batch_id))
+
+
+@router.post("/v1/messages/batches/{batch_id}/cancel")
+async def cancel_message_batch(
+    batch_id: str,
+    request: Request,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Cancel a message batch; items not yet started are marked canceled."""
+    try:
+        record = await batch_service.cancel_batch(batch_id)
+    except BatchNotFoundError as e:
+        raise HTTPException(
+            status_code=404, detail=f"Batch '{batch_id}' not found"
+        ) from e
+    return record.to_anthropic(_results_url(request, batch_id))
+
+
+@router.get("/v1/messages/batches/{batch_id}/results")
+async def get_message_batch_results(
+    batch_id: str,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> StreamingResponse:
+    """Stream the results of a message batch as JSONL.
+
+    Results are available while the batch is still running; only items
+    that have completed so far are returned.
+    """
+    await _get(batch_service, batch_id)
+
+    async def results_generator() -> AsyncIterator[bytes]:
+        async for result in batch_service.iter_results(batch_id):
+            yield (json.dumps(result.to_anthropic()) + "\n").encode()
+
+    return StreamingResponse(results_generator(), media_type=JSONL_MEDIA_TYPE)
+
+
+# OpenAI Batch API (the input file is posted inline as JSONL)
+
+
+@router.post("/v1/batches")
+async def create_openai_batch(
+    request: Request,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Create a batch from OpenAI batch input lines.
+
+    Unlike the hosted API, the JSONL input is sent as the request body
+    instead of being uploaded through /v1/files first.
+    """
+    body = await request.body()
+    entries = _parse_batch_body(body, request.headers.get("content-type", ""))
+    record = await _create(batch_service, _openai_items(entries), "openai")
+    return record.to_openai()
+
+
+@router.get("/v1/batches")
+async def list_openai_batches(
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+    limit: int = Query(20, ge=1, le=100),
+) -> dict[str, Any]:
+    """List batches in OpenAI format."""
+    records = await batch_service.list_batches(limit=limit)
+    data = [record.to_openai() for record in records]
+    return {
+        "object": "list",
+        "data": data,
+        "first_id": data[0]["id"] if data else None,
+        "last_id": data[-1]["id"] if data else None,
+        "has_more": False,
+    }
+
+
+@router.get("/v1/batches/{batch_id}")
+async def get_openai_batch(
+    batch_id: str,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Retrieve a batch in OpenAI format."""
+    record = await _get(batch_service, batch_id)
+    return record.to_openai()
+
+
+@router.post("/v1/batches/{batch_id}/cancel")
+async def cancel_openai_batch(
+    batch_id: str,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Cancel a batch in OpenAI format."""
+    try:
+        record = await batch_service.cancel_batch(batch_id)
+    except BatchNotFoundError as e:
+        raise HTTPException(
+            status_code=404, detail=f"Batch '{batch_id}' not found"
+        ) from e
+    return record.to_openai()
+
+
+@router.get("/v1/batches/{batch_id}/output")
+async def get_openai_batch_output(
+    batch_id: str,
+    batch_service: BatchServiceDep,
+    auth: ConditionalAuthDep,
+) -> StreamingResponse:
+    """Stream batch output lines in OpenAI format as JSONL."""
+    await _get(batch_service, batch_id)
+
+    async def output_generator() -> AsyncIterator[bytes]:
+        async for result in batch_service.iter_results(batch_id):
+            yield (json.dumps(result.to_openai()) + "\n").encode()
+
+    return StreamingResponse(output_generator(), media_type=JSONL_MEDIA_TYPE)
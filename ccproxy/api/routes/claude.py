@@ -66,11 +66,9 @@ async def create_openai_chat_completion(
         if stream:
             # Handle streaming response
             async def openai_stream_generator() -> AsyncIterator[bytes]:
-                # Use adapt_stream for streaming responses
-                async for openai_chunk in adapter.adapt_stream(response):  # type: ignore[arg-type]
-                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
-                # Send final chunk
-                yield b"data: [DONE]\n\n"
+                # Encoded SSE frames, terminated by data: [DONE]
+                async for sse_frame in adapter.adapt_stream_sse(response):  # type: ignore[arg-type]
+                    yield sse_frame
 
             # Use unified streaming wrapper with logging
             return StreamingResponseWithLogging(
@@ -154,11 +152,9 @@ async def create_openai_chat_completion_with_session(
         if stream:
             # Handle streaming response
             async def openai_stream_generator() -> AsyncIterator[bytes]:
-                # Use adapt_stream for streaming responses
-                async for openai_chunk in adapter.adapt_stream(response):  # type: ignore[arg-type]
-                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
-                # Send final chunk
-                yield b"data: [DONE]\n\n"
+                # Encoded SSE frames, terminated by data: [DONE]
+                async for sse_frame in adapter.adapt_stream_sse(response):  # type: ignore[arg-type]
+                    yield sse_frame
 
             # Use unified streaming wrapper with logging
             # Session interrupts are now handled directly by the StreamHandle
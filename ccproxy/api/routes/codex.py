@@ -20,6 +20,7 @@ from ccproxy.adapters.openai.response_adapter import (
     UnsupportedCodexModelError,
     UnsupportedOpenAIParametersError,
 )
+from ccproxy.adapters.openai.streaming import OpenAIChunkEncoder
 from ccproxy.api.dependencies import ProxyServiceDep
 from ccproxy.auth.openai import OpenAITokenManager
 from ccproxy.config.settings import Settings, get_settings
@@ -263,6 +264,8 @@ async def codex_chat_completions(
             # Generate stream_id and timestamp outside the nested function to avoid closure issues
             stream_id = f"chatcmpl_{uuid.uuid4().hex[:29]}"
             created = int(time.time())
+            # Precompiled chunk template, rebuilt when the upstream names the model
+            encoder = OpenAIChunkEncoder(stream_id, "gpt-5", created)
 
             async def stream_codex_response() -> AsyncIterator[bytes]:
                 """Stream and convert Response API to Chat Completions format."""
@@ -280,7 +283,7 @@ async def codex_chat_completions(
                     transfer_encoding = response.headers.get("transfer-encoding", "")
 
                     # Capture response headers for forwarding
-                    nonlocal response_headers
+                    nonlocal response_headers, encoder
                     response_headers = dict(response.headers)
 
                     logger.debug(
@@ -374,23 +377,25 @@ async def codex_chat_completions(
                                         event_data = json.loads(data_str)
                                         event_type = event_data.get("type")
 
+                                        # Report the model named by the upstream in every chunk
+                                        response_obj = event_data.get("response")
+                                        upstream_model = event_data.get("model") or (
+                                            response_obj.get("model")
+                                            if isinstance(response_obj, dict)
+                                            else None
+                                        )
+                                        if (
+                                            isinstance(upstream_model, str)
+                                            and upstream_model != encoder.model
+                                        ):
+                                            encoder = OpenAIChunkEncoder(
+                                                stream_id, upstream_model, created
+                                            )
+
                                         # Send initial role message if this is the first chunk
                                         if not first_chunk_sent:
                                             # Send an initial chunk to indicate streaming has started
-                                            initial_chunk = {
-                                                "id": stream_id,
-                                                "object": "chat.completion.chunk",
-                                                "created": created,
-                                                "model": "gpt-5",
-                                                "choices": [
-                                                    {
-                                                        "index": 0,
-                                                        "delta": {"role": "assistant"},
-                                                        "finish_reason": None,
-                                                    }
-                                                ],
-                                            }
-                                            yield f"data: {json.dumps(initial_chunk)}\n\n".encode()
+                                            yield encoder.role("assistant")
                                             first_chunk_sent = True
                                             chunk_count += 1
 
@@ -419,22 +424,7 @@ async def codex_chat_completions(
                                                 )
 
                                                 # Send opening reasoning tag (no signature in official API)
-                                                openai_chunk = {
-                                                    "id": stream_id,
-                                                    "object": "chat.completion.chunk",
-                                                    "created": created,
-                                                    "model": "gpt-5",
-                                                    "choices": [
-                                                        {
-                                                            "index": 0,
-                                                            "delta": {
-                                                                "content": "<reasoning>"
-                                                            },
-                                                            "finish_reason": None,
-                                                        }
-                                                    ],
-                                                }
-                                                yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                yield encoder.content("<reasoning>")
                                                 chunk_count += 1
 
                                         # Handle content part deltas - various content types from API
@@ -451,22 +441,7 @@ async def codex_chat_completions(
                                                 # Regular text content
                                                 text_content = delta.get("text", "")
                                                 if text_content:
-                                                    openai_chunk = {
-                                                        "id": stream_id,
-                                                        "object": "chat.completion.chunk",
-                                                        "created": created,
-                                                        "model": "gpt-5",
-                                                        "choices": [
-                                                            {
-                                                                "index": 0,
-                                                                "delta": {
-                                                                    "content": text_content
-                                                                },
-                                                                "finish_reason": None,
-                                                            }
-                                                        ],
-                                                    }
-                                                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                    yield encoder.content(text_content)
                                                     chunk_count += 1
 
                                             elif (
@@ -478,22 +453,7 @@ async def codex_chat_completions(
                                                     "reasoning", ""
                                                 )
                                                 if reasoning_content:
-                                                    openai_chunk = {
-                                                        "id": stream_id,
-                                                        "object": "chat.completion.chunk",
-                                                        "created": created,
-                                                        "model": "gpt-5",
-                                                        "choices": [
-                                                            {
-                                                                "index": 0,
-                                                                "delta": {
-                                                                    "content": reasoning_content
-                                                                },
-                                                                "finish_reason": None,
-                                                            }
-                                                        ],
-                                                    }
-                                                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                    yield encoder.content(reasoning_content)
                                                     chunk_count += 1
 
                                         # Handle reasoning summary text - the actual reasoning content
@@ -507,22 +467,7 @@ async def codex_chat_completions(
 
                                             if reasoning_text:
                                                 chunk_count += 1
-                                                openai_chunk = {
-                                                    "id": stream_id,
-                                                    "object": "chat.completion.chunk",
-                                                    "created": created,
-                                                    "model": "gpt-5",
-                                                    "choices": [
-                                                        {
-                                                            "index": 0,
-                                                            "delta": {
-                                                                "content": reasoning_text
-                                                            },
-                                                            "finish_reason": None,
-                                                        }
-                                                    ],
-                                                }
-                                                yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                yield encoder.content(reasoning_text)
 
                                         # Handle reasoning block completion - official API
                                         elif (
@@ -537,22 +482,7 @@ async def codex_chat_completions(
                                                 thinking_block_active = False
 
                                                 # Send closing reasoning tag
-                                                openai_chunk = {
-                                                    "id": stream_id,
-                                                    "object": "chat.completion.chunk",
-                                                    "created": created,
-                                                    "model": "gpt-5",
-                                                    "choices": [
-                                                        {
-                                                            "index": 0,
-                                                            "delta": {
-                                                                "content": "</reasoning>\n"
-                                                            },
-                                                            "finish_reason": None,
-                                                        }
-                                                    ],
-                                                }
-                                                yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                yield encoder.content("</reasoning>\n")
                                                 chunk_count += 1
 
                                                 logger.debug(
@@ -570,24 +500,7 @@ async def codex_chat_completions(
                                                 )
                                                 if delta_content:
                                                     chunk_count += 1
-                                                    openai_chunk = {
-                                                        "id": stream_id,
-                                                        "object": "chat.completion.chunk",
-                                                        "created": created,
-                                                        "model": event_data.get(
-                                                            "model", "gpt-5"
-                                                        ),
-                                                        "choices": [
-                                                            {
-                                                                "index": 0,
-                                                                "delta": {
-                                                                    "content": delta_content
-                                                                },
-                                                                "finish_reason": None,
-                                                            }
-                                                        ],
-                                                    }
-                                                    chunk_data = f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                    chunk_data = encoder.content(delta_content)
                                                     total_bytes += len(chunk_data)
 
                                                     logger.debug(
@@ -626,22 +539,7 @@ async def codex_chat_completions(
                                                             )
                                                             if thinking_content:
                                                                 chunk_count += 1
-                                                                openai_chunk = {
-                                                                    "id": stream_id,
-                                                                    "object": "chat.completion.chunk",
-                                                                    "created": created,
-                                                                    "model": "gpt-5",
-                                                                    "choices": [
-                                                                        {
-                                                                            "index": 0,
-                                                                            "delta": {
-                                                                                "content": thinking_content
-                                                                            },
-                                                                            "finish_reason": None,
-                                                                        }
-                                                                    ],
-                                                                }
-                                                                yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                                yield encoder.content(thinking_content)
                                                         elif (
                                                             block.get("type")
                                                             in [
@@ -655,24 +553,7 @@ async def codex_chat_completions(
                                                             )
                                                             if delta_content:
                                                                 chunk_count += 1
-                                                                openai_chunk = {
-                                                                    "id": stream_id,
-                                                                    "object": "chat.completion.chunk",
-                                                                    "created": created,
-                                                                    "model": event_data.get(
-                                                                        "model", "gpt-5"
-                                                                    ),
-                                                                    "choices": [
-                                                                        {
-                                                                            "index": 0,
-                                                                            "delta": {
-                                                                                "content": delta_content
-                                                                            },
-                                                                            "finish_reason": None,
-                                                                        }
-                                                                    ],
-                                                                }
-                                                                chunk_data = f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                                chunk_data = encoder.content(delta_content)
                                                                 total_bytes += len(
                                                                     chunk_data
                                                                 )
@@ -703,22 +584,7 @@ async def codex_chat_completions(
                                                 )
                                                 if arguments:
                                                     chunk_count += 1
-                                                    openai_chunk = {
-                                                        "id": stream_id,
-                                                        "object": "chat.completion.chunk",
-                                                        "created": created,
-                                                        "model": "gpt-5",
-                                                        "choices": [
-                                                            {
-                                                                "index": 0,
-                                                                "delta": {
-                                                                    "content": arguments
-                                                                },
-                                                                "finish_reason": None,
-                                                            }
-                                                        ],
-                                                    }
-                                                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                    yield encoder.content(arguments)
 
                                         elif (
                                             event_type
@@ -731,22 +597,7 @@ async def codex_chat_completions(
                                                 )
                                                 if transcript:
                                                     chunk_count += 1
-                                                    openai_chunk = {
-                                                        "id": stream_id,
-                                                        "object": "chat.completion.chunk",
-                                                        "created": created,
-                                                        "model": "gpt-5",
-                                                        "choices": [
-                                                            {
-                                                                "index": 0,
-                                                                "delta": {
-                                                                    "content": f"[Audio: {transcript}]"
-                                                                },
-                                                                "finish_reason": None,
-                                                            }
-                                                        ],
-                                                    }
-                                                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                    yield encoder.content(f"[Audio: {transcript}]")
 
                                         elif (
                                             event_type
@@ -759,22 +610,7 @@ async def codex_chat_completions(
                                                 )
                                                 if function_name:
                                                     chunk_count += 1
-                                                    openai_chunk = {
-                                                        "id": stream_id,
-                                                        "object": "chat.completion.chunk",
-                                                        "created": created,
-                                                        "model": "gpt-5",
-                                                        "choices": [
-                                                            {
-                                                                "index": 0,
-                                                                "delta": {
-                                                                    "content": f"[Function: {function_name}]"
-                                                                },
-                                                                "finish_reason": None,
-                                                            }
-                                                        ],
-                                                    }
-                                                    yield f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                                    yield encoder.content(f"[Function: {function_name}]")
 
                                         elif event_type == "response.completed":
                                             # Final chunk with usage info
@@ -783,24 +619,9 @@ async def codex_chat_completions(
                                             )
                                             usage = response_obj.get("usage")
 
-                                            openai_chunk = {
-                                                "id": stream_id,
-                                                "object": "chat.completion.chunk",
-                                                "created": created,
-                                                "model": response_obj.get(
-                                                    "model", "gpt-5"
-                                                ),
-                                                "choices": [
-                                                    {
-                                                        "index": 0,
-                                                        "delta": {},
-                                                        "finish_reason": "stop",
-                                                    }
-                                                ],
-                                            }
-
+                                            openai_usage = None
                                             if usage:
-                                                openai_chunk["usage"] = {
+                                                openai_usage = {
                                                     "prompt_tokens": usage.get(
                                                         "input_tokens", 0
                                                     ),
@@ -812,7 +633,9 @@ async def codex_chat_completions(
                                                     ),
                                                 }
 
-                                            chunk_data = f"data: {json.dumps(openai_chunk)}\n\n".encode()
+                                            chunk_data = encoder.finish(
+                                                "stop", usage=openai_usage
+                                            )
                                             yield chunk_data
 
                                             logger.debug(
@@ -843,7 +666,7 @@ async def codex_chat_completions(
                             total_chunks=chunk_count,
                             total_bytes=total_bytes,
                         )
-                        yield b"data: [DONE]\n\n"
+                        yield encoder.DONE
                     else:
                         # Backend didn't return streaming or returned unexpected format
                         # When using client.stream(), we need to collect the response differently
@@ -17,7 +17,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Request, Response, status
 from pydantic import BaseModel
 from structlog import get_logger
 
@@ -665,10 +665,11 @@ async def readiness_probe(response: Response) -> dict[str, Any]:
 
 
 @router.get("/health")
-async def detailed_health_check(response: Response) -> dict[str, Any]:
+async def detailed_health_check(request: Request, response: Response) -> dict[str, Any]:
     """Comprehensive health check for diagnostics and monitoring.
 
-    Provides detailed status of all services and dependencies.
+    Provides detailed status of all services and dependencies, plus
+    per-component startup timings when the application lifespan has run.
     Used by monitoring dashboards, debugging, and operations teams.
 
     Returns:
@@ -707,6 +708,8 @@ async def detailed_health_check(response: Response) -> dict[str, Any]:
 
     current_time = datetime.now(UTC).isoformat()
 
+    startup = getattr(request.app.state, "startup", None)
+
     return {
         "status": overall_status,
         "version": __version__,
@@ -765,4 +768,5 @@ async def detailed_health_check(response: Response) -> dict[str, Any]:
                 }
             ],
         },
+        "startup": startup.report() if startup is not None else None,
     }
@@ -11,6 +11,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from structlog import get_logger
 
 from ccproxy.api.dependencies import SettingsDep
+from ccproxy.api.services.permission_policy import get_permission_policy
 from ccproxy.api.services.permission_service import get_permission_service
 from ccproxy.models.permissions import PermissionStatus
 from ccproxy.models.responses import (
@@ -80,6 +81,20 @@ async def check_permission(
         elif status == PermissionStatus.EXPIRED:
             return PermissionToolDenyResponse(message="Permission request expired")
 
+    decision = get_permission_policy().evaluate(request.tool_name, request.input)
+    if decision is not None:
+        logger.info(
+            "permission_decided_by_policy",
+            tool_name=request.tool_name,
+            allowed=decision.allowed,
+            source=decision.source,
+        )
+        if decision.allowed:
+            return PermissionToolAllowResponse(updated_input=request.input)
+        return PermissionToolDenyResponse(
+            message=f"Operation denied by permission policy ({decision.source})"
+        )
+
     logger.info(
         "permission_requires_authorization",
         tool_name=request.tool_name,
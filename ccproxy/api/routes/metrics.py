@@ -14,6 +14,9 @@ from ccproxy.api.dependencies import (
     ObservabilityMetricsDep,
     SettingsDep,
 )
+from ccproxy.observability.live_stats import get_live_stats
+from ccproxy.observability.loop_lag import get_loop_lag_monitor
+from ccproxy.observability.storage.archive import access_log_source, clear_archive
 from ccproxy.observability.storage.models import AccessLog
 
 
@@ -167,7 +170,9 @@ async def get_dashboard_favicon() -> FileResponse:
 
 
 @prometheus_router.get("/metrics")
-async def get_prometheus_metrics(metrics: ObservabilityMetricsDep) -> Response:
+async def get_prometheus_metrics(
+    metrics: ObservabilityMetricsDep, settings: SettingsDep
+) -> Response:
     """Export metrics in Prometheus format using native prometheus_client.
 
     This endpoint exposes operational metrics collected by the hybrid observability
@@ -175,6 +180,7 @@ async def get_prometheus_metrics(metrics: ObservabilityMetricsDep) -> Response:
 
     Args:
         metrics: Observability metrics dependency
+        settings: Application settings dependency
 
     Returns:
         Prometheus-formatted metrics text
@@ -182,7 +188,7 @@ async def get_prometheus_metrics(metrics: ObservabilityMetricsDep) -> Response:
     try:
         # Check if prometheus_client is available
         try:
-            from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+            from prometheus_client import CONTENT_TYPE_LATEST
         except ImportError as err:
             raise HTTPException(
                 status_code=503,
@@ -195,12 +201,10 @@ async def get_prometheus_metrics(metrics: ObservabilityMetricsDep) -> Response:
                 detail="Prometheus metrics not enabled. Ensure prometheus-client is installed.",
             )
 
-        # Generate prometheus format using the registry
-        from prometheus_client import REGISTRY
-
-        # Use the global registry if metrics.registry is None (default behavior)
-        registry = metrics.registry if metrics.registry is not None else REGISTRY
-        prometheus_data = generate_latest(registry)
+        # Rendered off the event loop and shared by scrapes within the cache window
+        prometheus_data = await metrics.render_exposition(
+            settings.observability.metrics_cache_seconds
+        )
 
         # Return the metrics data with proper content type
         from fastapi import Response
@@ -254,28 +258,29 @@ async def query_logs(
         if hasattr(storage, "_engine") and storage._engine:
             try:
                 with Session(storage._engine) as session:
-                    # Build base query
-                    statement = select(AccessLog)
-
                     # Add filters - convert Unix timestamps to datetime
                     start_dt = dt.fromtimestamp(start_time) if start_time else None
                     end_dt = dt.fromtimestamp(end_time) if end_time else None
 
+                    # Hot table plus archived partitions overlapping the range
+                    logs = access_log_source(
+                        settings.observability.log_archive_dir, start_dt, end_dt
+                    )
+
+                    # Build base query
+                    statement = select(logs)
+
                     if start_dt:
-                        statement = statement.where(AccessLog.timestamp >= start_dt)
+                        statement = statement.where(logs.timestamp >= start_dt)
                     if end_dt:
-                        statement = statement.where(AccessLog.timestamp <= end_dt)
+                        statement = statement.where(logs.timestamp <= end_dt)
                     if model:
-                        statement = statement.where(AccessLog.model == model)
+                        statement = statement.where(logs.model == model)
                     if service_type:
-                        statement = statement.where(
-                            AccessLog.service_type == service_type
-                        )
+                        statement = statement.where(logs.service_type == service_type)
 
                     # Apply limit and order
-                    statement = statement.order_by(desc(AccessLog.timestamp)).limit(
-                        limit
-                    )
+                    statement = statement.order_by(desc(logs.timestamp)).limit(limit)
 
                     # Execute query
                     results = session.exec(statement).all()
@@ -359,22 +364,24 @@ async def get_logs_analytics(
         if hasattr(storage, "_engine") and storage._engine:
             try:
                 with Session(storage._engine) as session:
-                    # Build base query
-                    statement = select(AccessLog)
-
                     # Add filters - convert Unix timestamps to datetime
                     start_dt = dt.fromtimestamp(start_time) if start_time else None
                     end_dt = dt.fromtimestamp(end_time) if end_time else None
 
+                    # Hot table plus archived partitions overlapping the range
+                    logs = access_log_source(
+                        settings.observability.log_archive_dir, start_dt, end_dt
+                    )
+
                     # Helper function to build filter conditions
                     def build_filter_conditions() -> list[Any]:
                         conditions: list[Any] = []
                         if start_dt:
-                            conditions.append(AccessLog.timestamp >= start_dt)
+                            conditions.append(logs.timestamp >= start_dt)
                         if end_dt:
-                            conditions.append(AccessLog.timestamp <= end_dt)
+                            conditions.append(logs.timestamp <= end_dt)
                         if model:
-                            conditions.append(AccessLog.model == model)
+                            conditions.append(logs.model == model)
 
                         # Apply service type filtering with comma-separated values and negation
                         if service_type:
@@ -390,11 +397,11 @@ async def get_logs_analytics(
 
                             if include_filters:
                                 conditions.append(
-                                    col(AccessLog.service_type).in_(include_filters)
+                                    col(logs.service_type).in_(include_filters)
                                 )
                             if exclude_filters:
                                 conditions.append(
-                                    ~col(AccessLog.service_type).in_(exclude_filters)
+                                    ~col(logs.service_type).in_(exclude_filters)
                                 )
 
                         return conditions
@@ -405,66 +412,62 @@ async def get_logs_analytics(
                     filter_conditions = build_filter_conditions()
 
                     total_requests = session.exec(
-                        select(func.count())
-                        .select_from(AccessLog)
-                        .where(*filter_conditions)
+                        select(func.count()).select_from(logs).where(*filter_conditions)
                     ).first()
 
                     avg_duration = session.exec(
-                        select(func.avg(AccessLog.duration_ms))
-                        .select_from(AccessLog)
+                        select(func.avg(logs.duration_ms))
+                        .select_from(logs)
                         .where(*filter_conditions)
                     ).first()
 
                     total_cost = session.exec(
-                        select(func.sum(AccessLog.cost_usd))
-                        .select_from(AccessLog)
+                        select(func.sum(logs.cost_usd))
+                        .select_from(logs)
                         .where(*filter_conditions)
                     ).first()
 
                     total_tokens_input = session.exec(
-                        select(func.sum(AccessLog.tokens_input))
-                        .select_from(AccessLog)
+                        select(func.sum(logs.tokens_input))
+                        .select_from(logs)
                         .where(*filter_conditions)
                     ).first()
 
                     total_tokens_output = session.exec(
-                        select(func.sum(AccessLog.tokens_output))
-                        .select_from(AccessLog)
+                        select(func.sum(logs.tokens_output))
+                        .select_from(logs)
                         .where(*filter_conditions)
                     ).first()
 
                     # Token analytics - all token types
                     total_cache_read_tokens = session.exec(
-                        select(func.sum(AccessLog.cache_read_tokens))
-                        .select_from(AccessLog)
+                        select(func.sum(logs.cache_read_tokens))
+                        .select_from(logs)
                         .where(*filter_conditions)
                     ).first()
 
                     total_cache_write_tokens = session.exec(
-                        select(func.sum(AccessLog.cache_write_tokens))
-                        .select_from(AccessLog)
+                        select(func.sum(logs.cache_write_tokens))
+                        .select_from(logs)
                         .where(*filter_conditions)
                     ).first()
 
                     # Success and error request analytics
                     success_conditions = filter_conditions + [
-                        AccessLog.status_code >= 200,
-                        AccessLog.status_code < 400,
+                        logs.status_code >= 200,
+                        logs.status_code < 400,
                     ]
                     total_successful_requests = session.exec(
                         select(func.count())
-                        .select_from(AccessLog)
+                        .select_from(logs)
                         .where(*success_conditions)
                     ).first()
 
                     error_conditions = filter_conditions + [
-                        AccessLog.status_code >= 400,
+                        logs.status_code >= 400,
                     ]
                     total_error_requests = session.exec(
-                        select(func.count())
-                        .select_from(AccessLog)
-                        .where(*error_conditions)
+                        select(func.count()).select_from(logs).where(*error_conditions)
                     ).first()
 
                     # Summary results are already computed individually above
@@ -473,9 +476,7 @@ async def get_logs_analytics(
                     service_breakdown = {}
                     # Get unique service types first
                     unique_services = session.exec(
-                        select(AccessLog.service_type)
-                        .distinct()
-                        .where(*filter_conditions)
+                        select(logs.service_type).distinct().where(*filter_conditions)
                     ).all()
 
                     # For each service type, get its statistics
@@ -484,73 +485,71 @@ async def get_logs_analytics(
                             # Build service-specific filter conditions
                             service_conditions = []
                             if start_dt:
-                                service_conditions.append(
-                                    AccessLog.timestamp >= start_dt
-                                )
+                                service_conditions.append(logs.timestamp >= start_dt)
                             if end_dt:
-                                service_conditions.append(AccessLog.timestamp <= end_dt)
+                                service_conditions.append(logs.timestamp <= end_dt)
                             if model:
-                                service_conditions.append(AccessLog.model == model)
-                            service_conditions.append(AccessLog.service_type == service)
+                                service_conditions.append(logs.model == model)
+                            service_conditions.append(logs.service_type == service)
 
                             service_count = session.exec(
                                 select(func.count())
-                                .select_from(AccessLog)
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_avg_duration = session.exec(
-                                select(func.avg(AccessLog.duration_ms))
-                                .select_from(AccessLog)
+                                select(func.avg(logs.duration_ms))
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_total_cost = session.exec(
-                                select(func.sum(AccessLog.cost_usd))
-                                .select_from(AccessLog)
+                                select(func.sum(logs.cost_usd))
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_total_tokens_input = session.exec(
-                                select(func.sum(AccessLog.tokens_input))
-                                .select_from(AccessLog)
+                                select(func.sum(logs.tokens_input))
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_total_tokens_output = session.exec(
-                                select(func.sum(AccessLog.tokens_output))
-                                .select_from(AccessLog)
+                                select(func.sum(logs.tokens_output))
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_cache_read_tokens = session.exec(
-                                select(func.sum(AccessLog.cache_read_tokens))
-                                .select_from(AccessLog)
+                                select(func.sum(logs.cache_read_tokens))
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_cache_write_tokens = session.exec(
-                                select(func.sum(AccessLog.cache_write_tokens))
-                                .select_from(AccessLog)
+                                select(func.sum(logs.cache_write_tokens))
+                                .select_from(logs)
                                 .where(*service_conditions)
                             ).first()
 
                             service_success_conditions = service_conditions + [
-                                AccessLog.status_code >= 200,
-                                AccessLog.status_code < 400,
+                                logs.status_code >= 200,
+                                logs.status_code < 400,
                             ]
                             service_success_count = session.exec(
                                 select(func.count())
-                                .select_from(AccessLog)
+                                .select_from(logs)
                                 .where(*service_success_conditions)
                             ).first()
 
                             service_error_conditions = service_conditions + [
-                                AccessLog.status_code >= 400,
+                                logs.status_code >= 400,
                             ]
                             service_error_count = session.exec(
                                 select(func.count())
-                                .select_from(AccessLog)
+                                .select_from(logs)
                                 .where(*service_error_conditions)
                             ).first()
 
@@ -661,6 +660,35 @@ async def get_logs_analytics(
         ) from e
 
 
+@logs_router.get("/live")
+async def get_live_stats_windows() -> dict[str, Any]:
+    """
+    Get live request statistics for the last 1, 5 and 15 minutes.
+
+    Served from running per-window aggregates kept in process, so a read
+    only summarizes three aggregates and does not query DuckDB. Each window
+    reports request, error, token and cost totals, average and percentile
+    latencies, and per-model request counts; totals cover requests since
+    server start.
+    """
+    return get_live_stats().snapshot()
+
+
+@logs_router.get("/loop-lag")
+async def get_loop_lag(
+    window_seconds: float = Query(
+        60.0, gt=0, le=900, description="Seconds of samples to summarize"
+    ),
+) -> dict[str, Any]:
+    """
+    Get event loop lag percentiles for the last ``window_seconds``.
+
+    Lag is sampled only when ``observability.event_loop_lag_interval_ms`` is
+    set; otherwise the summary reports zero samples.
+    """
+    return get_loop_lag_monitor().snapshot(window_seconds)
+
+
 @logs_router.get("/stream")
 async def stream_logs(
     request: Request,
@@ -773,6 +801,12 @@ async def stream_logs(
 
         return True
 
+    def is_visible(event_obj: dict[str, Any]) -> bool:
+        """Check whether an event passes the filters (system events always do)."""
+        if event_obj.get("type") not in ["request_complete", "request_start"]:
+            return True
+        return should_include_event(event_obj)
+
     async def event_stream() -> AsyncIterator[str]:
         """Generate Server-Sent Events for real-time metrics."""
         from ccproxy.observability.sse_events import get_sse_manager
@@ -788,8 +822,8 @@ async def stream_logs(
             async for event_data in sse_manager.add_connection(
                 connection_id, request_id
             ):
-                # Parse event data to check for filtering
-                if event_data.startswith("data: "):
+                # Unfiltered streams forward the shared pre-encoded frames as is
+                if filter_criteria and event_data.startswith("data: "):
                     try:
                         import json
 
@@ -798,11 +832,19 @@ async def stream_logs(
                             event_obj = json.loads(json_str)
 
                             # Apply filters for data events (not connection/system events)
-                            if (
-                                event_obj.get("type")
-                                in ["request_complete", "request_start"]
-                                and filter_criteria
-                            ) and not should_include_event(event_obj):
+                            if event_obj.get("type") == "batch":
+                                events = [
+                                    event
+                                    for event in event_obj["events"]
+                                    if is_visible(event)
+                                ]
+                                if not events:
+                                    continue  # Skip this batch
+                                if len(events) != len(event_obj["events"]):
+                                    event_obj["events"] = events
+                                    event_obj["count"] = len(events)
+                                    event_data = f"data: {json.dumps(event_obj)}\n\n"
+                            elif not is_visible(event_obj):
                                 continue  # Skip this event
 
                     except (json.JSONDecodeError, KeyError):
@@ -1009,6 +1051,8 @@ async def reset_logs_data(
         success = await storage.reset_data()
 
         if success:
+            clear_archive(settings.observability.log_archive_dir)
+            get_live_stats().clear()
             return {
                 "status": "success",
                 "message": "All logs data has been reset",
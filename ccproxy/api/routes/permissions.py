@@ -3,6 +3,7 @@
 import asyncio
 import json
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
@@ -10,6 +11,7 @@ from sse_starlette.sse import EventSourceResponse
 from structlog import get_logger
 
 from ccproxy.api.dependencies import SettingsDep
+from ccproxy.api.services.permission_policy import RememberScope
 from ccproxy.api.services.permission_service import get_permission_service
 from ccproxy.auth.conditional import ConditionalAuthDep
 from ccproxy.core.errors import (
@@ -29,6 +31,7 @@ class PermissionResponse(BaseModel):
     """Response to a permission request."""
 
     allowed: bool
+    remember: RememberScope | None = None
 
 
 class PermissionRequestInfo(BaseModel):
@@ -126,6 +129,19 @@ async def stream_permissions(
     )
 
 
+@router.get("/stats")
+async def get_permission_stats(
+    settings: SettingsDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Get permission policy hit rates and estimated time saved on confirmations.
+
+    Returns:
+        Permission request and policy statistics
+    """
+    return get_permission_service().get_stats()
+
+
 @router.get("/{permission_id}")
 async def get_permission(
     permission_id: str,
@@ -197,7 +213,9 @@ async def respond_to_permission(
                 detail=e.message,
             ) from e
 
-    success = await service.resolve(permission_id, response.allowed)
+    success = await service.resolve(
+        permission_id, response.allowed, remember=response.remember
+    )
 
     if not success:
         raise HTTPException(
@@ -208,6 +226,7 @@ async def respond_to_permission(
         "permission_resolved_via_api",
         permission_id=permission_id,
         allowed=response.allowed,
+        remember=response.remember,
     )
 
     return {
@@ -0,0 +1,76 @@
+"""Token counting endpoints for CCProxy API Server.
+
+``/v1/messages/count_tokens`` is served locally for both the ``/api`` and
+``/sdk`` prefixes instead of costing an extra upstream round trip. Local
+estimates for ``/api`` include the system prompt the proxy injects upstream.
+"""
+
+import json
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from structlog import get_logger
+
+from ccproxy.api.dependencies import (
+    ProxyServiceDep,
+    SettingsDep,
+    TokenCountServiceDep,
+)
+from ccproxy.auth.conditional import ConditionalAuthDep
+from ccproxy.core.http_transformers import get_system_field_fragment
+
+
+# Create the router for token counting endpoints (shared by /api and /sdk)
+router = APIRouter(tags=["tokens"])
+
+logger = get_logger(__name__)
+
+
+@router.post("/v1/messages/count_tokens")
+async def count_message_tokens(
+    request: Request,
+    response: Response,
+    settings: SettingsDep,
+    proxy_service: ProxyServiceDep,
+    token_count_service: TokenCountServiceDep,
+    auth: ConditionalAuthDep,
+) -> dict[str, Any]:
+    """Count input tokens for a Messages API request.
+
+    Returns a local estimate by default. With ``claude.count_tokens_mode``
+    set to ``exact`` the count is fetched from upstream once per distinct
+    request and cached.
+    """
+    try:
+        payload = json.loads(await request.body())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}") from e
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("messages"), list):
+        raise HTTPException(
+            status_code=400, detail="Request body must include a 'messages' list"
+        )
+
+    injected_system = None
+    if request.url.path.startswith("/api/"):
+        # Upstream counts include the system prompt /api injects, so must ours
+        injected_system = get_system_field_fragment(
+            request.app.state, settings.claude.system_prompt_injection_mode.value
+        ).value
+
+    result = await token_count_service.count(
+        payload,
+        mode=settings.claude.count_tokens_mode,
+        proxy_service=proxy_service,
+        headers=dict(request.headers),
+        injected_system=injected_system,
+    )
+
+    logger.debug(
+        "count_tokens_served",
+        input_tokens=result.input_tokens,
+        source=result.source,
+        model=payload.get("model"),
+    )
+    response.headers["X-CCProxy-Token-Count-Source"] = result.source
+    return {"input_tokens": result.input_tokens}
@@ -1,6 +1,12 @@
 """Services for CCProxy API."""
 
+from .permission_policy import PermissionPolicy, get_permission_policy
 from .permission_service import PermissionService, get_permission_service
 
 
-__all__ = ["PermissionService", "get_permission_service"]
+__all__ = [
+    "PermissionPolicy",
+    "PermissionService",
+    "get_permission_policy",
+    "get_permission_service",
+]
@@ -0,0 +1,217 @@
+"""Rule engine and remembered decisions for MCP permission checks."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import posixpath
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Literal
+
+from structlog import get_logger
+
+from ccproxy.config.security import PermissionPolicySettings, PermissionRule
+
+
+logger = get_logger(__name__)
+
+RememberScope = Literal["process", "window"]
+
+# A ".." path segment, in POSIX or Windows form, also inside shell commands
+_PARENT_SEGMENT = re.compile(r"(^|[/\\\s])\.\.([/\\\s]|$)")
+
+
+@dataclass(frozen=True)
+class PolicyDecision:
+    """Decision made without asking a human."""
+
+    allowed: bool
+    source: Literal["rule", "remembered"]
+
+
+def decision_key(tool_name: str, input: dict[str, str]) -> str:
+    """Hash of a tool call, insensitive to input ordering and surrounding whitespace."""
+    normalized = {
+        "tool": tool_name.strip(),
+        "input": {key.strip(): str(value).strip() for key, value in input.items()},
+    }
+    encoded = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class PermissionPolicy:
+    """Decides tool calls from configured rules and remembered human decisions.
+
+    Rules are evaluated first and a matching deny rule wins over allow rules
+    and remembered decisions. Decisions a human asked to remember are kept in
+    a bounded LRU cache, either until the proxy process exits ("process") or
+    for a time window.
+    """
+
+    def __init__(
+        self,
+        rules: list[PermissionRule] | None = None,
+        cache_size: int = 1024,
+        remember_window_seconds: float = 600,
+    ) -> None:
+        self.rules = list(rules or [])
+        self.cache_size = cache_size
+        self.remember_window_seconds = remember_window_seconds
+        # decision key -> (allowed, monotonic expiry or None for the session)
+        self._cache: OrderedDict[str, tuple[bool, float | None]] = OrderedDict()
+        self._stats = {
+            "rule_allows": 0,
+            "rule_denies": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "remembered": 0,
+            "evictions": 0,
+        }
+        self._human_decisions = 0
+        self._human_wait_seconds = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: PermissionPolicySettings) -> PermissionPolicy:
+        """Create a policy from the permission policy settings."""
+        return cls(
+            rules=settings.rules,
+            cache_size=settings.decision_cache_size,
+            remember_window_seconds=settings.remember_window_seconds,
+        )
+
+    def evaluate(self, tool_name: str, input: dict[str, str]) -> PolicyDecision | None:
+        """Decide a tool call, or return None when a human has to be asked."""
+        allowed = self._match_rules(tool_name, input)
+        if allowed is not None:
+            self._stats["rule_allows" if allowed else "rule_denies"] += 1
+            return PolicyDecision(allowed=allowed, source="rule")
+
+        key = decision_key(tool_name, input)
+        entry = self._cache.get(key)
+        if entry is not None:
+            allowed, expires_at = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                self._stats["cache_hits"] += 1
+                return PolicyDecision(allowed=allowed, source="remembered")
+            del self._cache[key]
+
+        self._stats["cache_misses"] += 1
+        return None
+
+    def record_decision(
+        self,
+        tool_name: str,
+        input: dict[str, str],
+        allowed: bool,
+        waited_seconds: float,
+        remember: RememberScope | None = None,
+    ) -> None:
+        """Record a human decision and remember it when asked to."""
+        self._human_decisions += 1
+        self._human_wait_seconds += max(0.0, waited_seconds)
+        if remember is None or self.cache_size == 0:
+            return
+
+        expires_at = (
+            None
+            if remember == "process"
+            else time.monotonic() + self.remember_window_seconds
+        )
+        key = decision_key(tool_name, input)
+        self._cache[key] = (allowed, expires_at)
+        self._cache.move_to_end(key)
+        self._stats["remembered"] += 1
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        logger.debug(
+            "permission_decision_remembered",
+            tool_name=tool_name,
+            allowed=allowed,
+            scope=remember,
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rule and decision cache statistics."""
+        lookups = self._stats["cache_hits"] + self._stats["cache_misses"]
+        automatic = (
+            self._stats["rule_allows"]
+            + self._stats["rule_denies"]
+            + self._stats["cache_hits"]
+        )
+        avg_wait = (
+            self._human_wait_seconds / self._human_decisions
+            if self._human_decisions
+            else 0.0
+        )
+        return {
+            **self._stats,
+            "rules": len(self.rules),
+            "cache_entries": len(self._cache),
+            "hit_rate": self._stats["cache_hits"] / lookups if lookups else 0.0,
+            "human_decisions": self._human_decisions,
+            "avg_human_wait_seconds": round(avg_wait, 3),
+            # Estimated from the average time humans took to answer
+            "time_saved_seconds": round(automatic * avg_wait, 3),
+        }
+
+    def _match_rules(self, tool_name: str, input: dict[str, str]) -> bool | None:
+        allowed: bool | None = None
+        for rule in self.rules:
+            if not fnmatchcase(tool_name, rule.tool):
+                continue
+            deny = rule.action == "deny"
+            if any(
+                field not in input
+                or not _input_matches(str(input[field]), pattern, deny)
+                for field, pattern in rule.input.items()
+            ):
+                continue
+            if deny:
+                return False
+            allowed = True
+        return allowed
+
+
+def _input_matches(value: str, pattern: str, deny: bool) -> bool:
+    """Match an input value against a rule pattern.
+
+    Path-like values are matched after normalization so ``..`` segments
+    cannot escape an allowed directory. Deny rules also match the raw value,
+    and allow rules never match a value that still contains ``..``.
+    """
+    normalized = value
+    if "/" in value and not any(char.isspace() for char in value):
+        normalized = posixpath.normpath(value)
+    if deny:
+        return fnmatchcase(value, pattern) or fnmatchcase(normalized, pattern)
+    if _PARENT_SEGMENT.search(value):
+        return False
+    return fnmatchcase(normalized, pattern)
+
+
+# Global instance
+_permission_policy: PermissionPolicy | None = None
+
+
+def get_permission_policy() -> PermissionPolicy:
+    """Get the global permission policy instance."""
+    global _permission_policy
+    if _permission_policy is None:
+        _permission_policy = PermissionPolicy()
+    return _permission_policy
+
+
+def configure_permission_policy(
+    settings: PermissionPolicySettings,
+) -> PermissionPolicy:
+    """Replace the global permission policy with one built from settings."""
+    global _permission_policy
+    _permission_policy = PermissionPolicy.from_settings(settings)
+    return _permission_policy
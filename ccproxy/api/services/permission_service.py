@@ -7,6 +7,10 @@ from typing import Any
 
 from structlog import get_logger
 
+from ccproxy.api.services.permission_policy import (
+    RememberScope,
+    get_permission_policy,
+)
 from ccproxy.core.errors import (
     PermissionNotFoundError,
 )
@@ -129,12 +133,19 @@ class PermissionService:
         async with self._lock:
             return self._requests.get(request_id)
 
-    async def resolve(self, request_id: str, allowed: bool) -> bool:
+    async def resolve(
+        self,
+        request_id: str,
+        allowed: bool,
+        remember: RememberScope | None = None,
+    ) -> bool:
         """Manually resolve a permission request.
 
         Args:
             request_id: ID of the permission request
             allowed: Whether to allow or deny the request
+            remember: Apply the decision to identical tool calls until the
+                proxy process exits or for the configured time window
 
         Returns:
             True if resolved successfully, False if not found or already resolved
@@ -156,6 +167,15 @@ class PermissionService:
             except ValueError:
                 return False
 
+        waited = (request.resolved_at or request.created_at) - request.created_at
+        get_permission_policy().record_decision(
+            request.tool_name,
+            request.input,
+            allowed,
+            waited.total_seconds(),
+            remember,
+        )
+
         logger.info(
             "permission_request_resolved",
             request_id=request_id,
@@ -279,6 +299,13 @@ class PermissionService:
             with contextlib.suppress(asyncio.QueueFull):
                 queue.put_nowait(event)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get permission request and policy statistics."""
+        return {
+            "requests": len(self._requests),
+            "policy": get_permission_policy().get_stats(),
+        }
+
     async def get_pending_requests(self) -> list[PermissionRequest]:
         """Get all pending permission requests.
 
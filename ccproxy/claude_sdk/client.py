@@ -43,6 +43,11 @@ with patched_typing():
         UserMessage as SDKUserMessage,
     )
 
+    try:
+        from claude_code_sdk.types import StreamEvent as SDKStreamEvent
+    except ImportError:  # claude-code-sdk without partial message support
+        SDKStreamEvent = None  # type: ignore[misc,assignment]
+
 
 logger = structlog.get_logger(__name__)
 
@@ -66,6 +71,8 @@ class ClaudeSDKClient:
         SDKSystemMessage: sdk_models.SystemMessage,
         SDKResultMessage: sdk_models.ResultMessage,
     }
+    if SDKStreamEvent is not None:
+        MESSAGE_TYPE_MAP[SDKStreamEvent] = sdk_models.StreamEvent
 
     def __init__(
         self,
@@ -140,6 +147,7 @@ class ClaudeSDKClient:
         | sdk_models.AssistantMessage
         | sdk_models.SystemMessage
         | sdk_models.ResultMessage
+        | sdk_models.StreamEvent
     ]:
         """Execute query with standard 4-second first chunk timeout."""
         # Send message
@@ -351,6 +359,7 @@ class ClaudeSDKClient:
         | sdk_models.AssistantMessage
         | sdk_models.SystemMessage
         | sdk_models.ResultMessage
+        | sdk_models.StreamEvent
     ]:
         """Execute query using direct connection (no pool)."""
         async with (
@@ -393,6 +402,7 @@ class ClaudeSDKClient:
         | sdk_models.AssistantMessage
         | sdk_models.SystemMessage
         | sdk_models.ResultMessage
+        | sdk_models.StreamEvent
     ]:
         """Execute query using session-aware pooled connection."""
         async with timed_operation("claude_sdk_query_session_pool", request_id) as op:
@@ -434,6 +444,7 @@ class ClaudeSDKClient:
                         | sdk_models.AssistantMessage
                         | sdk_models.SystemMessage
                         | sdk_models.ResultMessage
+                        | sdk_models.StreamEvent
                     ]:
                         stream_iterator = None
                         try:
@@ -577,6 +588,7 @@ class ClaudeSDKClient:
         | sdk_models.AssistantMessage
         | sdk_models.SystemMessage
         | sdk_models.ResultMessage
+        | sdk_models.StreamEvent
     ]:
         """
         Process messages from an async iterator, converting them to Pydantic models.
@@ -600,7 +612,8 @@ class ClaudeSDKClient:
                             sdk_models.UserMessage
                             | sdk_models.AssistantMessage
                             | sdk_models.SystemMessage
-                            | sdk_models.ResultMessage,
+                            | sdk_models.ResultMessage
+                            | sdk_models.StreamEvent,
                             self._convert_message(sdk_msg, model_type),
                         )
 
@@ -62,7 +62,9 @@ class SessionManager:
         )
 
         if session_pool_enabled:
-            self._session_pool = SessionPool(settings.claude.sdk_session_pool)
+            self._session_pool = SessionPool(
+                settings.claude.sdk_session_pool, options_factory=self._restore_options
+            )
             logger.info(
                 "session_manager_session_pool_initialized",
                 session_ttl=self._session_pool.config.session_ttl,
@@ -75,6 +77,19 @@ class SessionManager:
                 reason="session_pool_disabled_in_settings",
             )
 
+    def _restore_options(
+        self, model: str | None, system_prompt: str | None
+    ) -> ClaudeCodeOptions:
+        """Build the options a request for a snapshotted session would use."""
+        from ccproxy.claude_sdk.options import OptionsHandler
+
+        options = OptionsHandler(self._settings).create_options(
+            model=model or "", system_message=system_prompt
+        )
+        if self._settings.claude.sdk_streaming.partial_messages:
+            options.include_partial_messages = True
+        return options
+
     def _should_enable_session_pool(self) -> bool:
         """Check if session pool should be enabled."""
         import structlog
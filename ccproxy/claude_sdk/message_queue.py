@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import logging
 import time
 import uuid
 from collections.abc import AsyncIterator
@@ -13,6 +14,8 @@ from typing import Any, TypeVar
 
 import structlog
 
+from ccproxy.core.logging import is_enabled_for
+
 
 logger = structlog.get_logger(__name__)
 
@@ -208,11 +211,12 @@ class MessageQueue:
         async with self._lock:
             if not self._listeners:
                 self._total_messages_discarded += 1
-                logger.debug(
-                    "message_queue_discard",
-                    reason="no_listeners",
-                    message_type=type(message).__name__,
-                )
+                if is_enabled_for(logger, logging.DEBUG):
+                    logger.debug(
+                        "message_queue_discard",
+                        reason="no_listeners",
+                        message_type=type(message).__name__,
+                    )
                 return 0
 
             # Create queue message
@@ -242,12 +246,13 @@ class MessageQueue:
             if delivered_count == 0:
                 self._total_messages_discarded += 1
 
-            logger.debug(
-                "message_queue_broadcast",
-                listeners_count=len(self._listeners),
-                delivered_count=delivered_count,
-                message_type=type(message).__name__,
-            )
+            if is_enabled_for(logger, logging.DEBUG):
+                logger.debug(
+                    "message_queue_broadcast",
+                    listeners_count=len(self._listeners),
+                    delivered_count=delivered_count,
+                    message_type=type(message).__name__,
+                )
 
             return delivered_count
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
@@ -89,6 +90,8 @@ class SessionClient:
         self.active_stream_handle: Any = (
             None  # StreamHandle when using queue-based approach
         )
+        # Called once the CLI process has finished a turn
+        self.stream_finished_callback: Callable[[SessionClient], None] | None = None
 
         # Interrupt synchronization
         self._interrupt_complete_event = asyncio.Event()
@@ -493,6 +496,19 @@ class SessionClient:
         # For now, assume active status means healthy
         return bool(self.claude_client and self.status == SessionStatus.ACTIVE)
 
+    @property
+    def cli_pid(self) -> int | None:
+        """Pid of the connected Claude CLI subprocess, if any."""
+        transport = getattr(self.claude_client, "_transport", None)
+        process = getattr(transport, "_process", None)
+        pid = getattr(process, "pid", None)
+        return pid if isinstance(pid, int) else None
+
+    def notify_stream_finished(self) -> None:
+        """Report that the CLI process has finished streaming a turn."""
+        if self.stream_finished_callback is not None:
+            self.stream_finished_callback(self)
+
     def is_expired(self) -> bool:
         """Check if session has exceeded TTL."""
         return self.metrics.age_seconds > self.ttl_seconds
@@ -4,14 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import copy
+import heapq
+import itertools
+import time
+from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
 from claude_code_sdk import ClaudeCodeOptions
 
 from ccproxy.claude_sdk.session_client import SessionClient, SessionStatus
+from ccproxy.claude_sdk.session_snapshot import (
+    SessionPoolSnapshot,
+    SessionSnapshotEntry,
+    default_snapshot_file,
+    load_snapshot,
+    options_fingerprint,
+    save_snapshot,
+)
 from ccproxy.config.claude import SessionPoolSettings
 from ccproxy.core.errors import ClaudeProxyError, ServiceUnavailableError
+from ccproxy.utils.process_memory import proc_available, process_tree_rss
 
 
 if TYPE_CHECKING:
@@ -20,17 +35,72 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Age after which a session still in use is considered stuck
+STUCK_THRESHOLD = 900
+
+# Builds the options a request would use from a snapshot's model and system prompt
+OptionsFactory = Callable[[str | None, str | None], ClaudeCodeOptions]
+
 
 class SessionPool:
     """Manages persistent Claude SDK connections by session."""
 
-    def __init__(self, config: SessionPoolSettings | None = None):
+    def __init__(
+        self,
+        config: SessionPoolSettings | None = None,
+        options_factory: OptionsFactory | None = None,
+    ):
         self.config = config or SessionPoolSettings()
         self.sessions: dict[str, SessionClient] = {}
         self.cleanup_task: asyncio.Task[None] | None = None
         self._shutdown = False
         self._lock = asyncio.Lock()
 
+        # Min-heap of (deadline, seq, session) with one entry per session. The
+        # deadline is the earliest time the session may need cleanup; entries of
+        # sessions used since they were scheduled are re-pushed when popped.
+        self._expiry_heap: list[tuple[float, int, SessionClient]] = []
+        self._expiry_seq = itertools.count()
+        self._expired_sessions = 0
+
+        # Last sampled RSS in bytes per session CLI process tree
+        self._session_rss: dict[str, int] = {}
+        self._memory_evictions = 0
+
+        # Snapshot restore: entries of the last manifest not yet resumed or
+        # requested, options fingerprints of resumed sessions until their first
+        # request, and how well the resumed sessions were used
+        self._options_factory = options_factory
+        self._restore_task: asyncio.Task[None] | None = None
+        self._resume_entries: dict[str, SessionSnapshotEntry] = {}
+        self._restored: dict[str, str] = {}
+        self._restore_stats: dict[str, Any] = {
+            "restored": 0,
+            "failed": 0,
+            "hits": 0,
+            "misses": 0,
+            "resumed_cold": 0,
+            "warmup_ms": None,
+        }
+
+        # Process recycling: start time and message count of each session's
+        # current CLI process, recycles waiting for the current turn to end,
+        # and replacements connecting in the background with the message
+        # count they resumed at
+        self._process_started: dict[str, tuple[float, int]] = {}
+        self._recycle_due: dict[str, str] = {}
+        self._recycling: dict[
+            str, tuple[SessionClient, str, asyncio.Task[bool], int]
+        ] = {}
+        self._recycles = {"messages": 0, "rss": 0, "age": 0}
+        self._recycle_failures = 0
+        self._background_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def snapshot_file(self) -> Path:
+        """Path of the session manifest."""
+        return self.config.snapshot_file or default_snapshot_file()
+
     async def start(self) -> None:
         """Start the session pool and cleanup task."""
         if not self.config.enabled:
@@ -41,29 +111,57 @@ class SessionPool:
             max_sessions=self.config.max_sessions,
             ttl=self.config.session_ttl,
             cleanup_interval=self.config.cleanup_interval,
+            memory_budget_mb=self.config.memory_budget_mb,
         )
 
+        if self._samples_memory and not proc_available():
+            logger.warning(
+                "session_pool_memory_budget_unsupported",
+                memory_budget_mb=self.config.memory_budget_mb,
+                recycle_max_rss_mb=self.config.recycle_max_rss_mb,
+                message="Process memory cannot be read on this platform, memory limits are not enforced",
+            )
+
         self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+        if self.config.snapshot_enabled:
+            self._restore_task = asyncio.create_task(self._restore_sessions())
 
     async def stop(self) -> None:
         """Stop the session pool and cleanup all sessions."""
         self._shutdown = True
 
-        if self.cleanup_task:
-            self.cleanup_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.cleanup_task
+        for task in (self._restore_task, self.cleanup_task):
+            if task:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
         # Disconnect all active sessions
         async with self._lock:
+            if self.config.snapshot_enabled:
+                await self._save_snapshot_unlocked()
+
             disconnect_tasks = [
                 session_client.disconnect() for session_client in self.sessions.values()
             ]
+            disconnect_tasks.extend(
+                replacement.disconnect()
+                for replacement, _, _, _ in self._recycling.values()
+            )
 
             if disconnect_tasks:
                 await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+            if self._background_tasks:
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
 
             self.sessions.clear()
+            self._recycling.clear()
+            self._recycle_due.clear()
+            self._process_started.clear()
+            self._expiry_heap.clear()
+            self._session_rss.clear()
+            self._resume_entries.clear()
+            self._restored.clear()
 
         logger.debug("session_pool_stopped")
 
@@ -104,6 +202,9 @@ class SessionPool:
                     f"Session pool at capacity: {self.config.max_sessions}"
                 )
             options.continue_conversation = True
+            await self._claim_restored_unlocked(session_id, options)
+            await self._wait_for_replacement_unlocked(session_id)
+            self._swap_recycled_unlocked(session_id)
             # Get existing session or create new one
             if session_id in self.sessions:
                 session_client = self.sessions[session_id]
@@ -305,6 +406,8 @@ class SessionPool:
                     f"Failed to establish session connection: {session_id}"
                 )
 
+            self._maybe_recycle_unlocked(session_client)
+
         logger.debug(
             "session_pool_get_client_complete",
             session_id=session_id,
@@ -315,6 +418,146 @@ class SessionPool:
         )
         return session_client
 
+    async def _claim_restored_unlocked(
+        self, session_id: str, options: ClaudeCodeOptions
+    ) -> None:
+        """Match a request against the snapshot (requires lock to be held).
+
+        A session resumed on startup is kept when the request's options match
+        the ones it was resumed with. Otherwise, and for snapshot entries that
+        were not resumed eagerly, the new CLI process resumes the conversation.
+        """
+        entry = self._resume_entries.pop(session_id, None)
+        sdk_session_id = entry.sdk_session_id if entry else None
+
+        fingerprint = self._restored.pop(session_id, None)
+        session_client = self.sessions.get(session_id)
+        if session_client is not None and fingerprint is not None:
+            if options_fingerprint(options) == fingerprint:
+                self._restore_stats["hits"] += 1
+                return
+
+            self._restore_stats["misses"] += 1
+            logger.debug("session_restore_options_mismatch", session_id=session_id)
+            sdk_session_id = session_client.sdk_session_id
+            await self._remove_session_unlocked(session_id)
+
+        if sdk_session_id and session_id not in self.sessions:
+            options.resume = sdk_session_id
+            options.continue_conversation = False
+            self._restore_stats["resumed_cold"] += 1
+
+    async def _save_snapshot_unlocked(self) -> None:
+        """Write the session manifest (requires lock to be held)."""
+        now = time.time()
+        entries = {
+            session_id: entry
+            for session_id, entry in self._resume_entries.items()
+            if entry.last_used + self.config.session_ttl > now
+        }
+        for session_id, session_client in self.sessions.items():
+            options = session_client.options
+            entries[session_id] = SessionSnapshotEntry(
+                session_id=session_id,
+                sdk_session_id=session_client.sdk_session_id,
+                options_fingerprint=self._restored.get(session_id)
+                or options_fingerprint(options),
+                last_used=session_client.metrics.last_used,
+                model=options.model,
+                system_prompt=options.system_prompt,
+            )
+
+        snapshot = SessionPoolSnapshot(sessions=list(entries.values()))
+        try:
+            await asyncio.to_thread(save_snapshot, self.snapshot_file, snapshot)
+        except OSError as e:
+            logger.warning(
+                "session_snapshot_save_failed",
+                path=str(self.snapshot_file),
+                error=str(e),
+            )
+            return
+
+        logger.info(
+            "session_snapshot_saved",
+            path=str(self.snapshot_file),
+            sessions=len(snapshot.sessions),
+        )
+
+    async def _restore_sessions(self) -> None:
+        """Reconnect the most recently used sessions of the last snapshot."""
+        started = time.perf_counter()
+        snapshot = await asyncio.to_thread(load_snapshot, self.snapshot_file)
+        if snapshot is None:
+            return
+
+        now = time.time()
+        entries = sorted(
+            (
+                entry
+                for entry in snapshot.sessions
+                if entry.last_used + self.config.session_ttl > now
+            ),
+            key=lambda entry: entry.last_used,
+            reverse=True,
+        )
+        restoring: list[tuple[SessionSnapshotEntry, SessionClient]] = []
+        async with self._lock:
+            for entry in entries:
+                self._resume_entries.setdefault(entry.session_id, entry)
+
+            for entry in entries[: self.config.restore_max_sessions]:
+                if (
+                    self._options_factory is None
+                    or entry.last_used + self.config.idle_threshold <= now
+                    or entry.session_id in self.sessions
+                    or len(self.sessions) >= self.config.max_sessions
+                ):
+                    continue
+
+                options = self._options_factory(entry.model, entry.system_prompt)
+                if options_fingerprint(options) != entry.options_fingerprint:
+                    # Configuration changed since the snapshot
+                    continue
+                if entry.sdk_session_id:
+                    options.resume = entry.sdk_session_id
+                    options.continue_conversation = False
+
+                session_client = SessionClient(
+                    session_id=entry.session_id,
+                    options=options,
+                    ttl_seconds=self.config.session_ttl,
+                )
+                session_client.sdk_session_id = entry.sdk_session_id
+                session_client.metrics.last_used = entry.last_used
+                self.sessions[entry.session_id] = session_client
+                self._resume_entries.pop(entry.session_id, None)
+                self._restored[entry.session_id] = entry.options_fingerprint
+                self._schedule_expiry(session_client, now)
+                restoring.append((entry, session_client))
+
+        results = await asyncio.gather(
+            *(session_client.connect_background() for _, session_client in restoring)
+        )
+        failed = 0
+        for (entry, session_client), connected in zip(restoring, results, strict=True):
+            if not connected and await self._remove_if_current(session_client):
+                # Fall back to resuming the conversation on first request
+                self._resume_entries.setdefault(entry.session_id, entry)
+                failed += 1
+
+        warmup_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._restore_stats["restored"] += len(restoring) - failed
+        self._restore_stats["failed"] += failed
+        self._restore_stats["warmup_ms"] = warmup_ms
+        logger.info(
+            "session_pool_restored",
+            snapshot_sessions=len(snapshot.sessions),
+            restored=len(restoring) - failed,
+            failed=failed,
+            warmup_ms=warmup_ms,
+        )
+
     async def _create_session(
         self, session_id: str, options: ClaudeCodeOptions
     ) -> SessionClient:
@@ -335,6 +578,8 @@ class SessionPool:
 
         # Add to sessions immediately (will connect in background)
         self.sessions[session_id] = session_client
+        self._process_started[session_id] = (time.time(), 0)
+        self._schedule_expiry(session_client, time.time())
 
         # Optionally wait for connection to verify it works
         # For now, we'll let it connect in background and check on first use
@@ -364,6 +609,13 @@ class SessionPool:
             return
 
         session_client = self.sessions.pop(session_id)
+        self._session_rss.pop(session_id, None)
+        self._restored.pop(session_id, None)
+        self._process_started.pop(session_id, None)
+        self._recycle_due.pop(session_id, None)
+        pending = self._recycling.pop(session_id, None)
+        if pending is not None:
+            self._disconnect_later(pending[0])
         await session_client.disconnect()
 
         logger.debug(
@@ -374,12 +626,64 @@ class SessionPool:
             message_count=session_client.metrics.message_count,
         )
 
+    def _next_deadline(self, session_client: SessionClient, now: float) -> float:
+        """Earliest time at which a session may need cleanup."""
+        metrics = session_client.metrics
+        deadline = min(
+            metrics.created_at + session_client.ttl_seconds,
+            metrics.last_used + self.config.idle_threshold,
+        )
+        stuck_at = metrics.created_at + STUCK_THRESHOLD
+        if stuck_at > now:
+            deadline = min(deadline, stuck_at)
+        return deadline
+
+    def _schedule_expiry(self, session_client: SessionClient, now: float) -> None:
+        """Push the next cleanup check of a session onto the expiry heap."""
+        deadline = self._next_deadline(session_client, now)
+        heapq.heappush(
+            self._expiry_heap, (deadline, next(self._expiry_seq), session_client)
+        )
+
+    def _pop_due_sessions_unlocked(self, now: float) -> list[SessionClient]:
+        """Pop sessions whose deadline has passed (requires lock to be held).
+
+        Entries of removed or replaced sessions are dropped, and sessions used
+        since they were scheduled are pushed back with their new deadline, so a
+        pass costs O(due log n) rather than a scan of every session.
+        """
+        due: list[SessionClient] = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, _, session_client = heapq.heappop(heap)
+            if self.sessions.get(session_client.session_id) is not session_client:
+                continue
+            if self._next_deadline(session_client, now) > now:
+                self._schedule_expiry(session_client, now)
+            else:
+                due.append(session_client)
+        return due
+
+    async def _remove_if_current(self, session_client: SessionClient) -> bool:
+        """Remove a session unless it was already removed or replaced."""
+        async with self._lock:
+            if self.sessions.get(session_client.session_id) is not session_client:
+                return False
+            await self._remove_session_unlocked(session_client.session_id)
+            return True
+
     async def _cleanup_loop(self) -> None:
         """Background task to cleanup expired sessions."""
+        interval: float = self.config.cleanup_interval
+        if self._samples_memory:
+            interval = min(interval, self.config.memory_check_interval)
+
         while not self._shutdown:
             try:
-                await asyncio.sleep(self.config.cleanup_interval)
+                await asyncio.sleep(interval)
                 await self._cleanup_sessions()
+                if self._samples_memory:
+                    await self._check_memory()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -390,17 +694,19 @@ class SessionPool:
         sessions_to_remove = []
         stuck_sessions = []
 
-        # Get a snapshot of sessions to check
+        # Only sessions whose next deadline has passed need checking
+        now = time.time()
         async with self._lock:
-            sessions_snapshot = list(self.sessions.items())
+            due_sessions = self._pop_due_sessions_unlocked(now)
 
         # Check sessions outside the lock to avoid holding it too long
-        for session_id, session_client in sessions_snapshot:
+        for session_client in due_sessions:
+            session_id = session_client.session_id
             # Check if session is potentially stuck (active too long)
             is_stuck = (
                 session_client.status.value == "active"
                 and session_client.metrics.idle_seconds < 10
-                and session_client.metrics.age_seconds > 900  # 15 minutes
+                and session_client.metrics.age_seconds > STUCK_THRESHOLD
             )
 
             if is_stuck:
@@ -426,9 +732,11 @@ class SessionPool:
 
             # Check normal cleanup criteria (including stuck sessions)
             if session_client.should_cleanup(
-                self.config.idle_threshold, stuck_threshold=900
+                self.config.idle_threshold, stuck_threshold=STUCK_THRESHOLD
             ):
-                sessions_to_remove.append(session_id)
+                sessions_to_remove.append(session_client)
+            else:
+                self._schedule_expiry(session_client, now)
 
         if sessions_to_remove:
             logger.debug(
@@ -438,8 +746,285 @@ class SessionPool:
                 total_sessions=len(self.sessions),
             )
 
-            for session_id in sessions_to_remove:
-                await self._remove_session(session_id)
+            for session_client in sessions_to_remove:
+                if await self._remove_if_current(session_client):
+                    self._expired_sessions += 1
+
+    @staticmethod
+    def _is_idle(session_client: SessionClient) -> bool:
+        """Check if a session can be evicted without cutting off a request."""
+        handle = session_client.active_stream_handle
+        return (
+            session_client.status
+            not in (SessionStatus.CONNECTING, SessionStatus.INTERRUPTING)
+            and not session_client.has_active_stream
+            and (handle is None or handle.is_completed)
+        )
+
+    async def _sample_memory(self) -> int:
+        """Sample the RSS of every session's CLI process tree.
+
+        Returns:
+            Total RSS in bytes of all sampled sessions
+        """
+        async with self._lock:
+            pids = {
+                session_id: pid
+                for session_id, session_client in self.sessions.items()
+                if (pid := session_client.cli_pid) is not None
+            }
+
+        rss_by_pid = await asyncio.to_thread(process_tree_rss, pids.values())
+        self._session_rss = {
+            session_id: rss_by_pid[pid]
+            for session_id, pid in pids.items()
+            if pid in rss_by_pid
+        }
+        return sum(self._session_rss.values())
+
+    @property
+    def session_rss_bytes(self) -> dict[str, int]:
+        """Last sampled RSS in bytes of each session's process tree."""
+        return dict(self._session_rss)
+
+    @property
+    def _samples_memory(self) -> bool:
+        return bool(self.config.memory_budget_mb or self.config.recycle_max_rss_mb)
+
+    async def _check_memory(self) -> None:
+        """Sample memory, recycle oversized processes and enforce the budget."""
+        total_rss = await self._sample_memory()
+
+        async with self._lock:
+            if self.config.recycle_max_rss_mb:
+                limit = self.config.recycle_max_rss_mb * 1024 * 1024
+                for session_id, rss in self._session_rss.items():
+                    session_client = self.sessions.get(session_id)
+                    if session_client is not None and rss > limit:
+                        self._request_recycle_unlocked(session_client, "rss")
+            # Idle sessions get their replacement without waiting for a request
+            for session_id in list(self._recycling):
+                self._swap_recycled_unlocked(session_id)
+
+        if self.config.memory_budget_mb:
+            await self._enforce_memory_budget(total_rss)
+
+    async def _enforce_memory_budget(self, total_rss: int | None = None) -> None:
+        """Evict idle sessions, least recently used first, while over budget."""
+        budget = self.config.memory_budget_mb * 1024 * 1024
+        if total_rss is None:
+            total_rss = await self._sample_memory()
+        if total_rss <= budget:
+            return
+
+        evicted = 0
+        async with self._lock:
+            candidates = sorted(
+                (
+                    session_client
+                    for session_id, session_client in self.sessions.items()
+                    if session_id in self._session_rss and self._is_idle(session_client)
+                ),
+                key=lambda session_client: session_client.metrics.last_used,
+            )
+            for session_client in candidates:
+                if total_rss <= budget:
+                    break
+                session_rss = self._session_rss[session_client.session_id]
+                logger.info(
+                    "session_evicted_memory_budget",
+                    session_id=session_client.session_id,
+                    rss_mb=round(session_rss / 1048576, 1),
+                    idle_seconds=round(session_client.metrics.idle_seconds, 1),
+                    total_rss_mb=round(total_rss / 1048576, 1),
+                    memory_budget_mb=self.config.memory_budget_mb,
+                )
+                await self._remove_session_unlocked(session_client.session_id)
+                total_rss -= session_rss
+                evicted += 1
+
+        self._memory_evictions += evicted
+        if total_rss > budget:
+            logger.warning(
+                "session_pool_over_memory_budget",
+                total_rss_mb=round(total_rss / 1048576, 1),
+                memory_budget_mb=self.config.memory_budget_mb,
+                evicted=evicted,
+                message="No more idle sessions to evict",
+            )
+
+    def _disconnect_later(self, session_client: SessionClient) -> None:
+        """Disconnect a session client without blocking the caller."""
+        task = asyncio.create_task(session_client.disconnect())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _maybe_recycle_unlocked(self, session_client: SessionClient) -> None:
+        """Replace a CLI process that reached its message or age limit.
+
+        Called before the request's turn runs, so the replacement is only
+        started once that turn has finished.
+        """
+        max_messages = self.config.recycle_max_messages
+        max_age = self.config.recycle_max_age
+        if not (max_messages or max_age):
+            return
+
+        started_at, start_count = self._process_started.get(
+            session_client.session_id, (session_client.metrics.created_at, 0)
+        )
+        messages = session_client.metrics.message_count - start_count
+        if max_messages and messages >= max_messages:
+            self._defer_recycle_unlocked(session_client, "messages")
+        elif max_age and time.time() - started_at >= max_age:
+            self._defer_recycle_unlocked(session_client, "age")
+
+    def _request_recycle_unlocked(
+        self, session_client: SessionClient, reason: str
+    ) -> None:
+        """Recycle now if the process is idle, else after its current turn."""
+        if self._is_idle(session_client):
+            self._start_recycle_unlocked(session_client, reason)
+        else:
+            self._defer_recycle_unlocked(session_client, reason)
+
+    def _defer_recycle_unlocked(
+        self, session_client: SessionClient, reason: str
+    ) -> None:
+        """Start the recycle when the current turn finishes (requires lock to be held)."""
+        session_id = session_client.session_id
+        if session_id in self._recycling:
+            return
+        self._recycle_due.setdefault(session_id, reason)
+        session_client.stream_finished_callback = self._on_stream_finished
+
+    def _on_stream_finished(self, session_client: SessionClient) -> None:
+        """Start a deferred recycle now that the turn is in the transcript."""
+        if session_client.session_id not in self._recycle_due:
+            return
+        task = asyncio.create_task(self._start_deferred_recycle(session_client))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _start_deferred_recycle(self, session_client: SessionClient) -> None:
+        async with self._lock:
+            session_id = session_client.session_id
+            if self.sessions.get(session_id) is not session_client:
+                self._recycle_due.pop(session_id, None)
+                return
+            reason = self._recycle_due.pop(session_id, None)
+            if reason is not None:
+                self._start_recycle_unlocked(session_client, reason)
+
+    def _start_recycle_unlocked(
+        self, session_client: SessionClient, reason: str
+    ) -> None:
+        """Connect a replacement CLI process in the background (requires lock to be held).
+
+        The replacement resumes the session's SDK conversation as of the last
+        finished turn and is swapped in by _swap_recycled_unlocked once the
+        current process is idle.
+        """
+        session_id = session_client.session_id
+        if session_id in self._recycling:
+            return
+        self._recycle_due.pop(session_id, None)
+
+        # Shallow copy keeps options set outside the dataclass fields
+        options = copy.copy(session_client.options)
+        if session_client.sdk_session_id:
+            options.resume = session_client.sdk_session_id
+            options.continue_conversation = False
+
+        replacement = SessionClient(
+            session_id=session_id,
+            options=options,
+            ttl_seconds=session_client.ttl_seconds,
+        )
+        self._recycling[session_id] = (
+            replacement,
+            reason,
+            replacement.connect_background(),
+            session_client.metrics.message_count,
+        )
+        logger.info(
+            "session_recycle_started",
+            session_id=session_id,
+            client_id=session_client.client_id,
+            reason=reason,
+            message_count=session_client.metrics.message_count,
+            rss_mb=round(self._session_rss.get(session_id, 0) / 1048576, 1),
+            resume=bool(session_client.sdk_session_id),
+        )
+
+    async def _wait_for_replacement_unlocked(self, session_id: str) -> None:
+        """Let a replacement finish connecting before the next turn (requires lock to be held).
+
+        Serving the turn on the old process would leave the replacement
+        without it, so the request waits for the connection instead.
+        """
+        pending = self._recycling.get(session_id)
+        session_client = self.sessions.get(session_id)
+        if (
+            pending is not None
+            and session_client is not None
+            and self._is_idle(session_client)
+        ):
+            await asyncio.wait([pending[2]])
+
+    def _swap_recycled_unlocked(self, session_id: str) -> None:
+        """Swap in a connected replacement between requests (requires lock to be held)."""
+        pending = self._recycling.get(session_id)
+        if pending is None:
+            return
+
+        replacement, reason, connect_task, message_count = pending
+        session_client = self.sessions.get(session_id)
+        if not connect_task.done() or (
+            session_client is not None and not self._is_idle(session_client)
+        ):
+            # Never swap mid-stream; try again on the next request or pass
+            return
+
+        del self._recycling[session_id]
+        if (
+            session_client is not None
+            and session_client.metrics.message_count != message_count
+        ):
+            # The old process handled a turn the replacement has not seen
+            self._disconnect_later(replacement)
+            self._defer_recycle_unlocked(session_client, reason)
+            return
+        if (
+            session_client is None
+            or connect_task.cancelled()
+            or not connect_task.result()
+        ):
+            self._recycle_failures += 1
+            self._disconnect_later(replacement)
+            logger.warning(
+                "session_recycle_failed", session_id=session_id, reason=reason
+            )
+            return
+
+        replacement.metrics = session_client.metrics.model_copy()
+        replacement.sdk_session_id = session_client.sdk_session_id
+        replacement.is_newly_created = False
+        now = time.time()
+        self.sessions[session_id] = replacement
+        self._process_started[session_id] = (now, replacement.metrics.message_count)
+        self._session_rss.pop(session_id, None)
+        self._schedule_expiry(replacement, now)
+        self._recycles[reason] += 1
+        self._disconnect_later(session_client)
+
+        logger.info(
+            "session_recycled",
+            session_id=session_id,
+            old_client_id=session_client.client_id,
+            client_id=replacement.client_id,
+            reason=reason,
+        )
 
     async def interrupt_session(self, session_id: str) -> bool:
         """Interrupt a specific session due to client disconnection.
@@ -538,6 +1123,10 @@ class SessionPool:
         )
 
         total_messages = sum(s.metrics.message_count for s in sessions_list)
+        next_expiry = self._expiry_heap[0][0] if self._expiry_heap else None
+        restore = dict(self._restore_stats)
+        claimed = restore["hits"] + restore["misses"]
+        restore["hit_rate"] = round(restore["hits"] / claimed, 3) if claimed else None
 
         return {
             "enabled": self.config.enabled,
@@ -547,4 +1136,22 @@ class SessionPool:
             "total_messages": total_messages,
             "session_ttl": self.config.session_ttl,
             "cleanup_interval": self.config.cleanup_interval,
+            "expiry_heap_size": len(self._expiry_heap),
+            "next_expiry_in_seconds": (
+                round(max(next_expiry - time.time(), 0.0), 1)
+                if next_expiry is not None
+                else None
+            ),
+            "expired_sessions": self._expired_sessions,
+            "memory_budget_mb": self.config.memory_budget_mb,
+            "memory_rss_mb": round(sum(self._session_rss.values()) / 1048576, 1),
+            "memory_rss_by_session_mb": {
+                session_id: round(rss / 1048576, 1)
+                for session_id, rss in self._session_rss.items()
+            },
+            "memory_evictions": self._memory_evictions,
+            "restore": restore,
+            "recycles": dict(self._recycles),
+            "recycles_pending": len(self._recycling) + len(self._recycle_due),
+            "recycle_failures": self._recycle_failures,
         }
@@ -0,0 +1,101 @@
+"""Session pool manifest persisted across proxy restarts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+from claude_code_sdk import ClaudeCodeOptions
+from pydantic import BaseModel, Field
+
+from ccproxy.config.discovery import get_ccproxy_cache_dir
+
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Options that change per request or cannot be serialized; they do not affect
+# whether a resumed CLI process can serve a request
+_UNFINGERPRINTED_OPTIONS = frozenset(
+    {
+        "continue_conversation",
+        "resume",
+        "include_partial_messages",
+        "env",
+        "debug_stderr",
+        "can_use_tool",
+        "hooks",
+    }
+)
+
+
+class SessionSnapshotEntry(BaseModel):
+    """What is needed to resume one pooled session."""
+
+    session_id: str
+    sdk_session_id: str | None = None
+    options_fingerprint: str
+    last_used: float
+    model: str | None = None
+    system_prompt: str | None = None
+
+
+class SessionPoolSnapshot(BaseModel):
+    """Manifest of pooled sessions written on graceful shutdown."""
+
+    version: int = SNAPSHOT_VERSION
+    saved_at: float = Field(default_factory=time.time)
+    sessions: list[SessionSnapshotEntry] = Field(default_factory=list)
+
+
+def default_snapshot_file() -> Path:
+    """Default location of the session pool manifest."""
+    return get_ccproxy_cache_dir() / "session_pool.json"
+
+
+def options_fingerprint(options: ClaudeCodeOptions) -> str:
+    """Stable hash of the options that determine how a CLI process behaves."""
+    relevant: dict[str, Any] = {
+        key: value
+        for key, value in sorted(vars(options).items())
+        if key not in _UNFINGERPRINTED_OPTIONS
+    }
+    encoded = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def save_snapshot(path: Path, snapshot: SessionPoolSnapshot) -> None:
+    """Write the manifest atomically so a crash never leaves a partial file."""
+    # The manifest holds session ids and system prompts; keep it owner-only
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.touch(mode=0o600)
+    tmp_path.chmod(0o600)
+    tmp_path.write_text(snapshot.model_dump_json())
+    tmp_path.replace(path)
+
+
+def load_snapshot(path: Path) -> SessionPoolSnapshot | None:
+    """Read the manifest, ignoring missing, unreadable or outdated files."""
+    try:
+        snapshot = SessionPoolSnapshot.model_validate_json(path.read_text())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("session_snapshot_load_failed", path=str(path), error=str(e))
+        return None
+
+    if snapshot.version != SNAPSHOT_VERSION:
+        logger.warning(
+            "session_snapshot_version_mismatch",
+            path=str(path),
+            version=snapshot.version,
+            expected=SNAPSHOT_VERSION,
+        )
+        return None
+    return snapshot
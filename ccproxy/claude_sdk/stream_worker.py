@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from collections.abc import AsyncIterator
 from enum import Enum
@@ -12,6 +13,7 @@ import structlog
 
 from ccproxy.claude_sdk.exceptions import StreamTimeoutError
 from ccproxy.claude_sdk.message_queue import MessageQueue
+from ccproxy.core.logging import is_enabled_for
 from ccproxy.models import claude_sdk as sdk_models
 
 
@@ -185,6 +187,7 @@ class StreamWorker:
                 session_id=self.session_id,
             )
 
+            log_messages = is_enabled_for(logger, logging.DEBUG)
             async for message in self._message_iterator:
                 self._total_messages += 1
                 self._last_message_time = time.time()
@@ -195,24 +198,26 @@ class StreamWorker:
                     delivered_count = await self._message_queue.broadcast(message)
                     self._messages_delivered += delivered_count
 
-                    logger.debug(
-                        "stream_worker_message_delivered",
-                        worker_id=self.worker_id,
-                        message_type=type(message).__name__,
-                        delivered_to=delivered_count,
-                        total_messages=self._total_messages,
-                    )
+                    if log_messages:
+                        logger.debug(
+                            "stream_worker_message_delivered",
+                            worker_id=self.worker_id,
+                            message_type=type(message).__name__,
+                            delivered_to=delivered_count,
+                            total_messages=self._total_messages,
+                        )
                 else:
                     # No listeners - discard message
                     self._messages_discarded += 1
 
-                    logger.debug(
-                        "stream_worker_message_discarded",
-                        worker_id=self.worker_id,
-                        message_type=type(message).__name__,
-                        total_messages=self._total_messages,
-                        total_discarded=self._messages_discarded,
-                    )
+                    if log_messages:
+                        logger.debug(
+                            "stream_worker_message_discarded",
+                            worker_id=self.worker_id,
+                            message_type=type(message).__name__,
+                            total_messages=self._total_messages,
+                            total_discarded=self._messages_discarded,
+                        )
 
                 # Update stream handle with message lifecycle tracking
                 if self._stream_handle:
@@ -294,6 +299,7 @@ class StreamWorker:
             # Clean up
             if self._session_client:
                 self._session_client.has_active_stream = False
+                self._session_client.notify_stream_finished()
 
             # Close the message queue
             await self._message_queue.close()
@@ -1,5 +1,8 @@
 """Handles processing of Claude SDK streaming responses."""
 
+import asyncio
+import logging
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Any
 from uuid import uuid4
@@ -7,7 +10,8 @@ from uuid import uuid4
 import structlog
 
 from ccproxy.claude_sdk.converter import MessageConverter
-from ccproxy.config.claude import SDKMessageMode
+from ccproxy.config.claude import SDKMessageMode, SDKStreamingSettings
+from ccproxy.core.logging import is_enabled_for
 from ccproxy.models import claude_sdk as sdk_models
 from ccproxy.observability.context import RequestContext
 from ccproxy.observability.metrics import PrometheusMetrics
@@ -17,21 +21,49 @@ logger = structlog.get_logger(__name__)
 
 
 class ClaudeStreamProcessor:
-    """Processes streaming responses from the Claude SDK."""
+    """Processes streaming responses from the Claude SDK.
+
+    Text arrives either as partial message events (``StreamEvent``), which are
+    forwarded delta by delta, or as whole ``TextBlock``s, which are split into
+    paced deltas so clients can start rendering before the block is complete.
+    """
 
     def __init__(
         self,
         message_converter: MessageConverter,
         metrics: PrometheusMetrics | None = None,
+        streaming_settings: SDKStreamingSettings | None = None,
     ) -> None:
         """Initialize the stream processor.
 
         Args:
             message_converter: Converter for message formats.
             metrics: Prometheus metrics instance.
+            streaming_settings: Re-chunking settings for whole text blocks.
         """
         self.message_converter = message_converter
         self.metrics = metrics
+        self.streaming_settings = streaming_settings or SDKStreamingSettings()
+
+    def _text_delta(self, index: int, text: str) -> dict[str, Any]:
+        chunk = self.message_converter.create_streaming_delta_chunk(text)[1]
+        chunk["index"] = index
+        return chunk
+
+    async def _text_block_deltas(
+        self, index: int, text: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield a whole text block as deltas of at most ``rechunk_chars``."""
+        size = self.streaming_settings.rechunk_chars
+        if not size or len(text) <= size:
+            yield self._text_delta(index, text)
+            return
+
+        interval = self.streaming_settings.rechunk_interval_ms / 1000
+        for start in range(0, len(text), size):
+            if start and interval:
+                await asyncio.sleep(interval)
+            yield self._text_delta(index, text[start : start + size])
 
     async def process_stream(
         self,
@@ -40,6 +72,7 @@ class ClaudeStreamProcessor:
             | sdk_models.AssistantMessage
             | sdk_models.SystemMessage
             | sdk_models.ResultMessage
+            | sdk_models.StreamEvent
         ],
         model: str,
         request_id: str | None,
@@ -71,17 +104,53 @@ class ClaudeStreamProcessor:
         for _, chunk in start_chunks:
             yield chunk
 
+        # Text of blocks already forwarded from partial message events, in
+        # order; the complete AssistantMessage repeats them and they are skipped
+        streamed_text_blocks: deque[str] = deque()
+        streaming_text: list[str] | None = None
+
+        # Dumping every message is only worth it when it will be logged
+        log_messages = is_enabled_for(logger, logging.DEBUG)
         async for message in sdk_stream:
-            logger.debug(
-                "sdk_message_received",
-                message_type=type(message).__name__,
-                request_id=request_id,
-                message_content=message.model_dump()
-                if hasattr(message, "model_dump")
-                else str(message)[:200],
-            )
+            if log_messages:
+                logger.debug(
+                    "sdk_message_received",
+                    message_type=type(message).__name__,
+                    request_id=request_id,
+                    message_content=message.model_dump()
+                    if hasattr(message, "model_dump")
+                    else str(message)[:200],
+                )
 
-            if isinstance(message, sdk_models.SystemMessage):
+            if isinstance(message, sdk_models.StreamEvent):
+                # Sub-agent output only surfaces through its tool blocks
+                if message.parent_tool_use_id is not None:
+                    continue
+                event = message.event
+                event_type = event.get("type")
+                if event_type == "content_block_start":
+                    if event.get("content_block", {}).get("type") == "text":
+                        streaming_text = []
+                        yield {
+                            "type": "content_block_start",
+                            "index": content_block_index,
+                            "content_block": {"type": "text", "text": ""},
+                        }
+                elif streaming_text is None:
+                    # Deltas of tool use and thinking blocks are not forwarded
+                    continue
+                elif event_type == "content_block_delta":
+                    delta = event.get("delta", {})
+                    if delta.get("type") == "text_delta" and delta.get("text"):
+                        streaming_text.append(delta["text"])
+                        yield self._text_delta(content_block_index, delta["text"])
+                elif event_type == "content_block_stop":
+                    streamed_text_blocks.append("".join(streaming_text))
+                    streaming_text = None
+                    yield {"type": "content_block_stop", "index": content_block_index}
+                    content_block_index += 1
+
+            elif isinstance(message, sdk_models.SystemMessage):
                 logger.debug(
                     "sdk_system_message_processing",
                     mode=sdk_message_mode.value,
@@ -107,8 +176,17 @@ class ClaudeStreamProcessor:
                     block_types=[type(block).__name__ for block in message.content],
                     request_id=request_id,
                 )
+                from_subagent = getattr(message, "parent_tool_use_id", None)
                 for block in message.content:
                     if isinstance(block, sdk_models.TextBlock):
+                        if streamed_text_blocks and not from_subagent:
+                            if streamed_text_blocks.popleft() != block.text:
+                                logger.debug(
+                                    "sdk_streamed_text_mismatch",
+                                    text_length=len(block.text),
+                                    request_id=request_id,
+                                )
+                            continue
                         logger.debug(
                             "sdk_text_block_processing",
                             text_length=len(block.text),
@@ -121,9 +199,10 @@ class ClaudeStreamProcessor:
                             "index": content_block_index,
                             "content_block": {"type": "text", "text": ""},
                         }
-                        yield self.message_converter.create_streaming_delta_chunk(
-                            block.text
-                        )[1]
+                        async for delta in self._text_block_deltas(
+                            content_block_index, block.text
+                        ):
+                            yield delta
                         yield {
                             "type": "content_block_stop",
                             "index": content_block_index,
@@ -250,6 +329,11 @@ class ClaudeStreamProcessor:
                         )
 
             elif isinstance(message, sdk_models.ResultMessage):
+                if streaming_text is not None:
+                    # Partial text block that never got its stop event
+                    yield {"type": "content_block_stop", "index": content_block_index}
+                    content_block_index += 1
+                    streaming_text = None
                 logger.debug(
                     "sdk_result_message_processing",
                     session_id=message.session_id,
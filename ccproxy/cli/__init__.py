@@ -1,8 +1,22 @@
-from .commands.serve import api, claude
+from typing import TYPE_CHECKING, Any
+
 from .helpers import get_rich_toolkit
 from .main import app, app_main, main, version_callback
 
 
+if TYPE_CHECKING:
+    from .commands.serve import api, claude
+
+
+def __getattr__(name: str) -> Any:
+    # The serve module imports uvicorn and the Docker adapter; load it on demand
+    if name in ("api", "claude"):
+        from .commands import serve
+
+        return getattr(serve, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "app",
     "main",
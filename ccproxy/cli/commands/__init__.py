@@ -1,8 +1,32 @@
-"""Command modules for CCProxy API CLI."""
+"""Command modules for CCProxy API CLI.
 
-from .auth import app as auth_app
-from .config import app as config_app
-from .serve import api
+Command modules are imported on attribute access so that running one command
+does not import the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .auth import app as auth_app
+    from .config import app as config_app
+    from .serve import api
+
+
+_LAZY_IMPORTS = {
+    "api": (".serve", "api"),
+    "auth_app": (".auth", "app"),
+    "config_app": (".config", "app"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name, __name__), attr)
 
 
 __all__ = [
@@ -22,13 +22,7 @@ from ccproxy.config.settings import (
     config_manager,
 )
 from ccproxy.core.async_utils import get_root_package_name
-from ccproxy.docker import (
-    create_docker_adapter,
-)
 
-from ..docker import (
-    _create_docker_adapter_from_settings,
-)
 from ..options.claude_options import (
     ClaudeOptions,
     validate_claude_cli_path,
@@ -182,6 +176,10 @@ def _run_docker_server(
     if settings.security.auth_token:
         _show_api_usage_info(toolkit, settings)
 
+    # Docker support is imported only when running in a container
+    from ccproxy.cli.docker import _create_docker_adapter_from_settings
+    from ccproxy.docker import create_docker_adapter
+
     # Execute using the new Docker adapter
     image, volumes, environment, command, user_context, additional_args = (
         _create_docker_adapter_from_settings(
@@ -714,6 +712,9 @@ def api(
             json_logs=settings.server.log_format == "json",
             log_level_name=settings.server.log_level,
             log_file=settings.server.log_file,
+            async_logs=settings.server.log_async,
+            queue_size=settings.server.log_queue_size,
+            debug_sample_rate=settings.server.log_debug_sample_rate,
         )
 
         # Re-get logger after logging is configured
@@ -908,6 +909,9 @@ def claude(
         )
 
         if docker:
+            from ccproxy.cli.docker import _create_docker_adapter_from_settings
+            from ccproxy.docker import create_docker_adapter
+
             # Prepare Docker execution using new adapter
 
             toolkit.print_title(f"image {settings.docker.docker_image}", tag="docker")
@@ -6,8 +6,6 @@ from typing import Any
 from rich_toolkit import RichToolkit, RichToolkitTheme
 from rich_toolkit.styles import TaggedStyle
 
-from ccproxy.core.async_utils import patched_typing
-
 
 def get_rich_toolkit() -> RichToolkit:
     theme = RichToolkitTheme(
@@ -90,6 +88,8 @@ def merge_claude_code_options(base_options: Any, **overrides: Any) -> Any:
     Returns:
         New ClaudeCodeOptions instance with merged options
     """
+    from ccproxy.core.async_utils import patched_typing
+
     with patched_typing():
         from claude_code_sdk import ClaudeCodeOptions
 
@@ -0,0 +1,75 @@
+"""Typer group that imports subcommand modules only when they are used."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, ClassVar, NamedTuple
+
+import click
+import typer
+from click.shell_completion import CompletionItem
+from typer.core import TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """A subcommand registered by import path instead of by object.
+
+    Attributes:
+        import_path: ``"module:attribute"`` of a Typer app or command function
+        help: Short help shown in shell completion without importing the module
+    """
+
+    import_path: str
+    help: str
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group resolving ``lazy_commands`` on first lookup.
+
+    Invoking ``ccproxy auth ...`` imports only the auth module, and options
+    handled eagerly by the root callback (``--version``) import none of them.
+    Subclasses declare the commands in ``lazy_commands``.
+    """
+
+    lazy_commands: ClassVar[dict[str, LazyCommand]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        return commands + [name for name in self.lazy_commands if name not in commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_commands[cmd_name].import_path.split(":")
+        target = getattr(importlib.import_module(module_name), attr)
+
+        if isinstance(target, typer.Typer):
+            command: click.Command = typer.main.get_group(target)
+        else:
+            single = typer.Typer(rich_markup_mode=self.rich_markup_mode)
+            single.command(name=cmd_name)(target)
+            command = typer.main.get_command(single)
+        command.name = cmd_name
+        return command
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[Any]:
+        """Complete subcommand names from the registry without importing them."""
+        loaded = super().list_commands(ctx)
+        results: list[Any] = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            if name in loaded:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                results.append(CompletionItem(name, help=command.get_short_help_str()))
+            else:
+                results.append(CompletionItem(name, help=self.lazy_commands[name].help))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
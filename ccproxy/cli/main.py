@@ -10,12 +10,7 @@ from ccproxy._version import __version__
 from ccproxy.cli.helpers import (
     get_rich_toolkit,
 )
-
-from .commands.auth import app as auth_app
-from .commands.codex import app as codex_app
-from .commands.config import app as config_app
-from .commands.permission_handler import app as permission_handler_app
-from .commands.serve import api
+from ccproxy.cli.lazy_group import LazyCommand, LazyTyperGroup
 
 
 def version_callback(value: bool) -> None:
@@ -26,7 +21,31 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+class CCProxyGroup(LazyTyperGroup):
+    """Root command group; subcommand modules are imported when invoked."""
+
+    lazy_commands = {
+        "serve": LazyCommand(
+            "ccproxy.cli.commands.serve:api", "Start the CCProxy API server."
+        ),
+        "config": LazyCommand(
+            "ccproxy.cli.commands.config:app", "Configuration management commands"
+        ),
+        "auth": LazyCommand(
+            "ccproxy.cli.commands.auth:app", "Authentication and credential management"
+        ),
+        "confirmation-handler": LazyCommand(
+            "ccproxy.cli.commands.permission_handler:app",
+            "Connect to the API server and handle confirmation requests",
+        ),
+        "codex": LazyCommand(
+            "ccproxy.cli.commands.codex:app", "Codex (OpenAI) management commands"
+        ),
+    }
+
+
 app = typer.Typer(
+    cls=CCProxyGroup,
     rich_markup_mode="rich",
     add_completion=True,
     no_args_is_help=False,
@@ -79,21 +98,6 @@ def app_main(
         ctx.invoke(api)
 
 
-# Register config command
-app.add_typer(config_app)
-
-# Register auth command
-app.add_typer(auth_app)
-
-# Register permission handler command
-app.add_typer(permission_handler_app)
-
-
-# Register imported commands
-app.command(name="serve")(api)
-# Claude command removed - functionality moved to serve command
-
-
 def main() -> None:
     """Entry point for the CLI application."""
     app()
@@ -0,0 +1,67 @@
+"""Local message batch processing configuration settings."""
+
+import os
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class BatchSettings(BaseModel):
+    """Configuration settings for the local Message Batches subsystem."""
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Enable local /v1/messages/batches and /v1/batches endpoints; "
+            "batches are persisted under storage_dir"
+        ),
+    )
+
+    storage_dir: str = Field(
+        default_factory=lambda: str(
+            Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+            / "ccproxy"
+            / "batches"
+        ),
+        description="Directory where batch manifests, inputs and results are persisted",
+    )
+
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum number of batch items executed concurrently per batch",
+    )
+
+    max_requests_per_batch: int = Field(
+        default=10000,
+        ge=1,
+        le=100000,
+        description="Maximum number of requests accepted in a single batch",
+    )
+
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=10,
+        description="Maximum retries for rate-limited or overloaded batch items",
+    )
+
+    rate_limit_backoff_seconds: float = Field(
+        default=5.0,
+        ge=0.1,
+        le=600.0,
+        description="Pause applied to a batch after a 429/529 without a retry-after header",
+    )
+
+    checkpoint_interval: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Number of completed items between manifest checkpoints",
+    )
+
+    resume_on_startup: bool = Field(
+        default=True,
+        description="Resume batches that were in progress when the server stopped",
+    )
@@ -4,7 +4,7 @@ import os
 import shutil
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import structlog
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -133,6 +133,58 @@ class SessionPoolSettings(BaseModel):
         description="Stream interrupt timeout in seconds for SDK and worker operations (2-60 seconds)",
     )
 
+    memory_budget_mb: int = Field(
+        default=0,
+        ge=0,
+        le=1048576,
+        description="Resident memory budget in MB for all session CLI process trees; idle sessions are evicted least recently used first when exceeded (0 disables)",
+    )
+
+    memory_check_interval: int = Field(
+        default=30,
+        ge=5,
+        le=3600,
+        description="Interval in seconds between memory samples when a memory budget is set (5 seconds to 1 hour)",
+    )
+
+    recycle_max_messages: int = Field(
+        default=0,
+        ge=0,
+        le=100000,
+        description="Replace a session's CLI process after this many messages (0 disables)",
+    )
+
+    recycle_max_rss_mb: int = Field(
+        default=0,
+        ge=0,
+        le=1048576,
+        description="Replace a session's CLI process when its process tree exceeds this RSS in MB, sampled every memory_check_interval (0 disables)",
+    )
+
+    recycle_max_age: int = Field(
+        default=0,
+        ge=0,
+        le=86400,
+        description="Replace a session's CLI process after this many seconds (0 disables)",
+    )
+
+    snapshot_enabled: bool = Field(
+        default=False,
+        description="Save a session manifest on shutdown and resume the most recently used sessions on startup",
+    )
+
+    snapshot_file: Path | None = Field(
+        default=None,
+        description="Session manifest path (defaults to session_pool.json in the ccproxy cache directory)",
+    )
+
+    restore_max_sessions: int = Field(
+        default=10,
+        ge=0,
+        le=1000,
+        description="Number of most recently used sessions reconnected in the background on startup",
+    )
+
     @model_validator(mode="after")
     def validate_timeout_hierarchy(self) -> "SessionPoolSettings":
         """Ensure stream timeouts are less than session TTL."""
@@ -149,6 +201,53 @@ class SessionPoolSettings(BaseModel):
         return self
 
 
+class ContextCompactionSettings(BaseModel):
+    """Context-window aware history compaction settings."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Compact conversation history that would overflow the model's context window before forwarding requests",
+    )
+
+    safety_margin_tokens: int = Field(
+        default=1024,
+        ge=0,
+        description="Tokens kept free in addition to max_tokens to absorb estimation error",
+    )
+
+    preserve_recent_messages: int = Field(
+        default=4,
+        ge=1,
+        description="Number of most recent messages that are never compacted",
+    )
+
+    min_tool_result_tokens: int = Field(
+        default=200,
+        ge=0,
+        description="Tool results smaller than this estimated size are never elided",
+    )
+
+
+class SDKStreamingSettings(BaseModel):
+    """Incremental output settings for streaming Claude SDK responses."""
+
+    partial_messages: bool = Field(
+        default=True,
+        description="Request partial message events from the Claude CLI for streaming requests and forward text deltas as they are generated",
+    )
+    rechunk_chars: int = Field(
+        default=256,
+        description="When only whole text blocks arrive, split blocks longer than this into deltas of this many characters (0 disables)",
+        ge=0,
+    )
+    rechunk_interval_ms: int = Field(
+        default=0,
+        description="Delay between re-chunked deltas in milliseconds, pacing whole-block output",
+        ge=0,
+        le=1000,
+    )
+
+
 class ClaudeSettings(BaseModel):
     """Claude-specific configuration settings."""
 
@@ -182,11 +281,26 @@ class ClaudeSettings(BaseModel):
         description="Whether to use pretty formatting (indented JSON, newlines after XML tags, unescaped content). When false: compact JSON, no newlines, escaped content between XML tags",
     )
 
+    sdk_streaming: SDKStreamingSettings = Field(
+        default_factory=SDKStreamingSettings,
+        description="Token-level streaming and whole-block re-chunking for SDK responses",
+    )
+
     sdk_session_pool: SessionPoolSettings = Field(
         default_factory=SessionPoolSettings,
         description="Configuration settings for session-aware SDK client pooling",
     )
 
+    context_compaction: ContextCompactionSettings = Field(
+        default_factory=ContextCompactionSettings,
+        description="Context-window aware history compaction for proxied Messages API requests",
+    )
+
+    count_tokens_mode: Literal["estimate", "exact"] = Field(
+        default="estimate",
+        description="How /v1/messages/count_tokens is answered. Options: estimate (local estimate), exact (forward upstream once and cache the result)",
+    )
+
     @field_validator("cli_path")
     @classmethod
     def validate_claude_cli_path(cls, v: str | None) -> str | None:
@@ -49,6 +49,69 @@ class ObservabilitySettings(BaseModel):
         description="Path to DuckDB database file",
     )
 
+    log_retention_days: int = Field(
+        default=30,
+        ge=1,
+        le=3650,
+        description="Days of access logs kept in the DuckDB table before archival to Parquet",
+    )
+
+    log_archive_path: str | None = Field(
+        default=None,
+        description="Directory for archived Parquet access logs (defaults to 'access_logs_archive' next to duckdb_path)",
+    )
+
+    # Prometheus Exposition
+    metrics_cache_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds a rendered /metrics response is reused by later scrapes (0 disables caching)",
+    )
+
+    metrics_max_model_labels: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Maximum distinct 'model' label values before new ones are reported as 'other'",
+    )
+
+    # Dashboard Event Stream
+    dashboard_stream_max_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1000.0,
+        description="Maximum frames per second sent to each /logs/stream client, batching the events in between (0 sends every event as its own frame)",
+    )
+
+    dashboard_stream_buffer_size: int = Field(
+        default=100,
+        ge=1,
+        le=100000,
+        description="Events buffered per /logs/stream client before the oldest are dropped",
+    )
+
+    access_log_bus_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        le=1000000,
+        description="Access records buffered for dispatch to the access log sinks before the oldest are dropped",
+    )
+
+    access_log_sink_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        le=1000000,
+        description="Access records buffered per access log sink (storage, SSE, Prometheus, structlog, live stats) before its drop policy applies",
+    )
+
+    event_loop_lag_interval_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=60000.0,
+        description="Interval between event loop lag samples served at /logs/loop-lag (0 disables the monitor)",
+    )
+
     # Pushgateway Configuration
     pushgateway_url: str | None = Field(
         default=None,
@@ -132,6 +195,13 @@ class ObservabilitySettings(BaseModel):
         """Check if any feature requires storage backend initialization."""
         return self.logs_endpoints_enabled or self.logs_collection_enabled
 
+    @property
+    def log_archive_dir(self) -> Path:
+        """Directory holding the day-partitioned Parquet access log archive."""
+        if self.log_archive_path:
+            return Path(self.log_archive_path)
+        return Path(self.duckdb_path).parent / "access_logs_archive"
+
     @property
     def any_endpoint_enabled(self) -> bool:
         """Check if any observability endpoint is enabled."""
@@ -61,6 +61,21 @@ class PricingSettings(BaseSettings):
         description="Time to live for in-memory pricing cache in seconds",
     )
 
+    # Background refresh settings
+    refresh_retry_base_seconds: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=3600.0,
+        description="Initial delay before retrying a failed background refresh",
+    )
+
+    refresh_retry_max_seconds: float = Field(
+        default=3600.0,
+        ge=1.0,
+        le=86400.0,
+        description="Maximum delay between retries of a failing background refresh",
+    )
+
     @field_validator("cache_dir", mode="before")
     @classmethod
     def validate_cache_dir(cls, v: str | Path | None) -> Path:
@@ -102,6 +102,19 @@ class SchedulerSettings(BaseSettings):
         description="Maximum age in hours since last check version check",
     )
 
+    # Access log archival task settings
+    log_archival_enabled: bool = Field(
+        default=False,
+        description="Whether access logs older than the retention window are archived to Parquet (only /logs/query and /logs/analytics read the archive)",
+    )
+
+    log_archival_interval_hours: int = Field(
+        default=6,
+        ge=1,
+        le=168,  # Max 1 week
+        description="Interval in hours between access log archival runs",
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="SCHEDULER__",
         case_sensitive=False,
@@ -1,8 +1,53 @@
 """Security configuration settings."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
+class PermissionRule(BaseModel):
+    """Rule deciding MCP tool permission checks without asking a human."""
+
+    tool: str = Field(
+        description="Glob pattern matched against the tool name (e.g. 'Read', 'mcp__*')",
+    )
+
+    input: dict[str, str] = Field(
+        default_factory=dict,
+        description="Glob patterns that named tool input fields must match (e.g. {'file_path': '/workspace/*'})",
+    )
+
+    action: Literal["allow", "deny"] = Field(
+        description="Decision for tool calls matching the rule",
+    )
+
+
+class PermissionPolicySettings(BaseModel):
+    """Rules and decision caching applied before asking for confirmation."""
+
+    rules: list[PermissionRule] = Field(
+        default_factory=list,
+        description="Allow/deny rules evaluated before a permission request is created; deny rules win",
+    )
+
+    decision_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        le=100000,
+        description=(
+            "Maximum remembered confirmation decisions (0 disables remembering); "
+            "decisions remembered with the 'process' scope last until the proxy exits"
+        ),
+    )
+
+    remember_window_seconds: int = Field(
+        default=600,
+        ge=1,
+        le=86400,
+        description="How long decisions remembered with the 'window' scope stay valid",
+    )
+
+
 class SecuritySettings(BaseModel):
     """Security-specific configuration settings."""
 
@@ -17,3 +62,8 @@ class SecuritySettings(BaseModel):
         le=300,
         description="Timeout in seconds for permission confirmation requests (5-300)",
     )
+
+    permission_policy: PermissionPolicySettings = Field(
+        default_factory=PermissionPolicySettings,
+        description="Permission rules and remembered decisions for MCP tool checks",
+    )
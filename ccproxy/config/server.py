@@ -60,6 +60,23 @@ class ServerSettings(BaseModel):
         description="Path to JSON log file. If specified, logs will be written to this file in JSON format",
     )
 
+    log_async: bool = Field(
+        default=False,
+        description="Render and write logs on a background thread; request handlers only enqueue records",
+    )
+
+    log_queue_size: int = Field(
+        default=10000,
+        description="Maximum queued log records when log_async is enabled; further records are dropped",
+        ge=1,
+    )
+
+    log_debug_sample_rate: int = Field(
+        default=0,
+        description="Maximum DEBUG events per second for each event name (0 disables sampling)",
+        ge=0,
+    )
+
     use_terminal_permission_handler: bool = Field(
         default=False,
         description="Enable terminal UI for permission prompts. Set to False to use external handler via SSE (not implemented)",
@@ -14,6 +14,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from ccproxy.config.discovery import find_toml_config_file
 
 from .auth import AuthSettings
+from .batch import BatchSettings
 from .claude import ClaudeSettings
 from .codex import CodexSettings
 from .cors import CORSSettings
@@ -24,6 +25,7 @@ from .reverse_proxy import ReverseProxySettings
 from .scheduler import SchedulerSettings
 from .security import SecuritySettings
 from .server import ServerSettings
+from .streaming import StreamingSettings
 
 from ccproxy.core.async_utils import patched_typing
 
@@ -141,6 +143,18 @@ class Settings(BaseSettings):
         description="Pricing and cost calculation configuration settings",
     )
 
+    # Local batch processing settings
+    batch: BatchSettings = Field(
+        default_factory=BatchSettings,
+        description="Local message batch processing configuration settings",
+    )
+
+    # Streaming response output settings
+    streaming: StreamingSettings = Field(
+        default_factory=StreamingSettings,
+        description="Streaming response output configuration settings",
+    )
+
     @field_validator("server", mode="before")
     @classmethod
     def validate_server(cls, v: Any) -> Any:
@@ -284,6 +298,30 @@ class Settings(BaseSettings):
             return PricingSettings(**v)
         return v
 
+    @field_validator("batch", mode="before")
+    @classmethod
+    def validate_batch(cls, v: Any) -> Any:
+        """Validate and convert batch settings."""
+        if v is None:
+            return BatchSettings()
+        if isinstance(v, BatchSettings):
+            return v
+        if isinstance(v, dict):
+            return BatchSettings(**v)
+        return v
+
+    @field_validator("streaming", mode="before")
+    @classmethod
+    def validate_streaming(cls, v: Any) -> Any:
+        """Validate and convert streaming settings."""
+        if v is None:
+            return StreamingSettings()
+        if isinstance(v, StreamingSettings):
+            return v
+        if isinstance(v, dict):
+            return StreamingSettings(**v)
+        return v
+
     # validate_pool_settings method removed - connection pooling functionality has been removed
 
     @property
@@ -0,0 +1,40 @@
+"""Streaming response output configuration settings."""
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class StreamingSettings(BaseModel):
+    """Configuration settings for streaming (SSE) response output."""
+
+    coalescing_enabled: bool = Field(
+        default=True,
+        description="Coalesce adjacent SSE frames into fewer, larger socket writes",
+    )
+
+    flush_interval_ms: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=1000.0,
+        description="Maximum time a frame may be held back before it is flushed",
+    )
+
+    max_write_bytes: int = Field(
+        default=16384,
+        ge=1,
+        le=4 * 1024 * 1024,
+        description="Flush as soon as this many bytes are buffered",
+    )
+
+    max_buffer_bytes: int = Field(
+        default=1024 * 1024,
+        ge=1,
+        le=64 * 1024 * 1024,
+        description="Upper bound on buffered bytes before the upstream reader is paused",
+    )
+
+    @model_validator(mode="after")
+    def validate_buffer_sizes(self) -> "StreamingSettings":
+        """Ensure the buffer can hold at least one full write."""
+        if self.max_buffer_bytes < self.max_write_bytes:
+            raise ValueError("max_buffer_bytes must be >= max_write_bytes")
+        return self
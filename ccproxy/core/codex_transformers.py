@@ -6,6 +6,11 @@ import structlog
 from typing import Any
 from typing_extensions import TypedDict
 
+from ccproxy.core.injection_fragments import (
+    EncodedField,
+    encode_field,
+    get_fragment_cache,
+)
 from ccproxy.core.transformers import RequestTransformer
 from ccproxy.core.types import ProxyRequest, TransformContext
 from ccproxy.models.detection import CodexCacheData
@@ -13,6 +18,56 @@ from ccproxy.models.detection import CodexCacheData
 
 logger = structlog.get_logger(__name__)
 
+# Fallback instructions (from req.json) used when no detection data is available
+FALLBACK_CODEX_INSTRUCTIONS = (
+    "You are a coding agent running in the Codex CLI, a terminal-based coding assistant. "
+    "Codex CLI is an open source project led by OpenAI. You are expected to be precise, safe, and helpful.\n\n"
+    "Your capabilities:\n"
+    "- Receive user prompts and other context provided by the harness, such as files in the workspace.\n"
+    "- Communicate with the user by streaming thinking & responses, and by making & updating plans.\n"
+    "- Emit function calls to run terminal commands and apply patches. Depending on how this specific run is configured, "
+    "you can request that these function calls be escalated to the user for approval before running. "
+    'More on this in the "Sandbox and approvals" section.\n\n'
+    "Within this context, Codex refers to the open-source agentic coding interface "
+    "(not the old Codex language model built by OpenAI)."
+)
+
+# Cache key standing in for detection data when the fallback is injected
+_FALLBACK_INSTRUCTIONS_SOURCE = object()
+
+
+def get_instructions_fragment(
+    codex_detection_data: CodexCacheData | None = None,
+) -> EncodedField:
+    """Get the pre-encoded Codex instructions field for injection.
+
+    The fragment is built once per detection snapshot and rebuilt
+    automatically when the detection data is refreshed.
+
+    Args:
+        codex_detection_data: Optional detection data with instructions
+
+    Returns:
+        EncodedField with the compact-encoded instructions field
+    """
+    if codex_detection_data is None:
+        return get_fragment_cache().get(
+            _FALLBACK_INSTRUCTIONS_SOURCE,
+            "codex",
+            lambda: encode_field(
+                "instructions", FALLBACK_CODEX_INSTRUCTIONS, compact=True
+            ),
+        )
+    return get_fragment_cache().get(
+        codex_detection_data,
+        "codex",
+        lambda: encode_field(
+            "instructions",
+            codex_detection_data.instructions.instructions_field,
+            compact=True,
+        ),
+    )
+
 
 class CodexRequestData(TypedDict):
     """Typed structure for transformed Codex request data."""
@@ -389,43 +444,40 @@ class CodexRequestTransformer(RequestTransformer):
                 data["stream"] = True
             return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
-        # Get the instructions to inject
-        detected_instructions = None
-        if codex_detection_data:
-            detected_instructions = codex_detection_data.instructions.instructions_field
-        else:
-            # Fallback instructions from req.json
-            detected_instructions = (
-                "You are a coding agent running in the Codex CLI, a terminal-based coding assistant. "
-                "Codex CLI is an open source project led by OpenAI. You are expected to be precise, safe, and helpful.\n\n"
-                "Your capabilities:\n"
-                "- Receive user prompts and other context provided by the harness, such as files in the workspace.\n"
-                "- Communicate with the user by streaming thinking & responses, and by making & updating plans.\n"
-                "- Emit function calls to run terminal commands and apply patches. Depending on how this specific run is configured, "
-                "you can request that these function calls be escalated to the user for approval before running. "
-                'More on this in the "Sandbox and approvals" section.\n\n'
-                "Within this context, Codex refers to the open-source agentic coding interface "
-                "(not the old Codex language model built by OpenAI)."
-            )
-
-        # Apply injection based on mode
-        if injection_mode == "override":
-            # Always inject/override the instructions field
-            data["instructions"] = detected_instructions
-            logger.debug("codex_transform_override_instructions")
-        elif injection_mode == "append":
-            # Append Codex instructions to existing ones
-            if existing_instructions:
-                data["instructions"] = f"{existing_instructions}\n\n{detected_instructions}"
-                logger.debug("codex_transform_append_instructions")
-            else:
-                data["instructions"] = detected_instructions
-                logger.debug("codex_transform_set_instructions")
-        # disabled mode already handled above
+        # Get the pre-encoded instructions to inject
+        fragment = get_instructions_fragment(codex_detection_data)
 
         # Only inject stream: true if user explicitly requested streaming or didn't specify
         # For now, we'll inject stream: true by default since Codex seems to expect it
-        if "stream" not in data:
+        needs_rewrite = "stream" not in data
+        if needs_rewrite:
             data["stream"] = True
 
+        # Apply injection based on mode
+        if injection_mode == "append" and existing_instructions:
+            # Append Codex instructions to existing ones
+            data["instructions"] = f"{existing_instructions}\n\n{fragment.value}"
+            logger.debug("codex_transform_append_instructions")
+        elif injection_mode in ("override", "append"):
+            # Inject/override the instructions field by splicing the encoded
+            # fragment, re-serializing the client payload only if it changed
+            if "instructions" in data:
+                del data["instructions"]
+                needs_rewrite = True
+            base = (
+                json.dumps(data, separators=(",", ":")).encode("utf-8")
+                if needs_rewrite
+                else body
+            )
+            spliced = fragment.splice(base)
+            if spliced is not None:
+                logger.debug(
+                    "codex_transform_override_instructions"
+                    if injection_mode == "override"
+                    else "codex_transform_set_instructions"
+                )
+                return spliced
+            data["instructions"] = fragment.value
+        # disabled mode already handled above
+
         return json.dumps(data, separators=(",", ":")).encode("utf-8")
@@ -5,6 +5,12 @@ from typing import TYPE_CHECKING, Any
 import structlog
 from typing_extensions import TypedDict
 
+from ccproxy.core.injection_fragments import (
+    EncodedField,
+    body_mentions,
+    encode_field,
+    get_fragment_cache,
+)
 from ccproxy.core.transformers import RequestTransformer, ResponseTransformer
 from ccproxy.core.types import ProxyRequest, ProxyResponse, TransformContext
 
@@ -64,6 +70,46 @@ def get_fallback_system_field() -> list[dict[str, Any]]:
     ]
 
 
+# Cache key standing in for detection data when the fallback prompt is injected
+_FALLBACK_SYSTEM_SOURCE = object()
+
+
+def get_system_field_fragment(
+    app_state: Any = None, injection_mode: str = "minimal"
+) -> EncodedField:
+    """Get the pre-encoded system field for injection.
+
+    The fragment is built once per detection snapshot and injection mode and
+    rebuilt automatically when the detection data is refreshed.
+
+    Args:
+        app_state: App state containing detection data
+        injection_mode: 'minimal' or 'full' mode
+
+    Returns:
+        EncodedField with the system field to inject (detected or fallback)
+    """
+    claude_data = getattr(app_state, "claude_detection_data", None)
+    source = claude_data if claude_data is not None else _FALLBACK_SYSTEM_SOURCE
+
+    def build() -> EncodedField:
+        system = get_detected_system_field(app_state, injection_mode)
+        if system is None:
+            system = get_fallback_system_field()
+        cache_control_blocks = (
+            sum(
+                1
+                for block in system
+                if isinstance(block, dict) and "cache_control" in block
+            )
+            if isinstance(system, list)
+            else 0
+        )
+        return encode_field("system", system, cache_control_blocks=cache_control_blocks)
+
+    return get_fragment_cache().get(source, f"claude:{injection_mode}", build)
+
+
 class RequestData(TypedDict):
     """Typed structure for transformed request data."""
 
@@ -527,6 +573,18 @@ class HTTPRequestTransformer(RequestTransformer):
         Returns:
             Transformed request body as bytes with system prompt injection
         """
+        fragment = get_system_field_fragment(app_state, injection_mode)
+
+        # Fast path: without a client system prompt and with room for every
+        # cache_control block, splice the pre-encoded field into the raw body
+        if (
+            not body_mentions(body, b"system")
+            and fragment.cache_control_blocks + body.count(b'"cache_control"') <= 4
+        ):
+            spliced = fragment.splice(body)
+            if spliced is not None:
+                return spliced
+
         try:
             import json
 
@@ -543,11 +601,8 @@ class HTTPRequestTransformer(RequestTransformer):
             )
             return body
 
-        # Get the system field to inject
-        detected_system = get_detected_system_field(app_state, injection_mode)
-        if detected_system is None:
-            # No detection data, use fallback
-            detected_system = get_fallback_system_field()
+        # Get the system field to inject (detected or fallback)
+        detected_system = fragment.value
 
         # Always inject the system prompt (detected or fallback)
         if "system" not in data:
@@ -597,10 +652,16 @@ class HTTPRequestTransformer(RequestTransformer):
             try:
                 import json
 
+                from ccproxy.services.model_registry import get_model_registry
+
                 data = json.loads(body.decode("utf-8"))
                 # Look for OpenAI-specific patterns
                 model = data.get("model", "")
-                if model.startswith(("gpt-", "o1-", "text-davinci")):
+                if (
+                    isinstance(model, str)
+                    and model
+                    and get_model_registry().provider(model) == "openai"
+                ):
                     return True
                 # Check for OpenAI message format with system in messages
                 messages = data.get("messages", [])
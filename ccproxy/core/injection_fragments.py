@@ -0,0 +1,152 @@
+"""Pre-encoded JSON fragments for injected request content.
+
+The Claude system prompt and the Codex instructions injected into every
+proxied request only change when the detection services refresh their cached
+data, yet they can be tens of kilobytes. This module serializes them once per
+detection snapshot and injection mode, and splices the encoded bytes into the
+client's request body when the body needs no other rewriting, so the hot path
+neither copies nor re-serializes the injected content.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+# A \u escape of a printable ASCII character, which could spell part of a key
+_ESCAPED_ASCII = re.compile(rb"\\u00[2-7][0-9a-fA-F]")
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedField:
+    """A top-level JSON object field with its value pre-encoded."""
+
+    value: Any
+    encoded: bytes
+    separator: bytes = b", "
+    cache_control_blocks: int = 0
+
+    def splice(self, body: bytes) -> bytes | None:
+        """Insert this field as the first member of a JSON object body.
+
+        Args:
+            body: Serialized JSON object
+
+        Returns:
+            The body with the field inserted, or None if the body is not a
+            JSON object
+        """
+        start = len(body) - len(body.lstrip())
+        if body[start : start + 1] != b"{":
+            return None
+        rest = body[start + 1 :]
+        if rest.lstrip().startswith(b"}"):
+            return b"{" + self.encoded + rest
+        return b"{" + self.encoded + self.separator + rest
+
+
+class InjectionFragmentCache:
+    """Cache of encoded fragments keyed by detection snapshot and injection mode.
+
+    Entries hold a reference to the snapshot object they were built from and
+    are only reused while the caller passes that same object, so a detection
+    refresh (which replaces the snapshot) transparently rebuilds the fragment.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of (snapshot, mode) entries kept
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, str], tuple[object, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: object, mode: str, build: Callable[[], T]) -> T:
+        """Return the fragment for ``source`` and ``mode``, building it if needed.
+
+        Args:
+            source: Detection snapshot the fragment is derived from
+            mode: Injection mode
+            build: Callable producing the fragment on a cache miss
+
+        Returns:
+            The cached or newly built fragment
+        """
+        key = (id(source), mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is source:
+                self._entries.move_to_end(key)
+                return entry[1]  # type: ignore[no-any-return]
+
+        value = build()
+        with self._lock:
+            self._entries[key] = (source, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached fragments."""
+        with self._lock:
+            self._entries.clear()
+
+
+_fragment_cache = InjectionFragmentCache()
+
+
+def get_fragment_cache() -> InjectionFragmentCache:
+    """Get the process-wide injection fragment cache."""
+    return _fragment_cache
+
+
+def encode_field(
+    name: str,
+    value: Any,
+    *,
+    compact: bool = False,
+    cache_control_blocks: int = 0,
+) -> EncodedField:
+    """Pre-encode a top-level JSON field.
+
+    Args:
+        name: Field name
+        value: Field value
+        compact: Use compact separators (matches ``separators=(",", ":")``)
+        cache_control_blocks: Number of cache_control blocks in the value
+
+    Returns:
+        EncodedField ready to be spliced into request bodies
+    """
+    separators = (",", ":") if compact else (", ", ": ")
+    encoded = (
+        json.dumps(name) + separators[1] + json.dumps(value, separators=separators)
+    ).encode("utf-8")
+    return EncodedField(
+        value=value,
+        encoded=encoded,
+        separator=separators[0].encode("ascii"),
+        cache_control_blocks=cache_control_blocks,
+    )
+
+
+def body_mentions(body: bytes, *keys: bytes) -> bool:
+    """Check whether any of the quoted JSON keys occur anywhere in the body.
+
+    A match may be a false positive (e.g. a string value equal to the key),
+    which only costs the caller a fallback to the full parse-and-rewrite path.
+    Keys could also be spelled with ``\\u`` escapes, so a body containing an
+    escaped ASCII character always counts as a match.
+    """
+    if any(b'"' + key + b'"' in body for key in keys):
+        return True
+    return b"\\u" in body and _ESCAPED_ASCII.search(body) is not None
@@ -1,7 +1,12 @@
+import atexit
+import contextvars
 import logging
+import queue
 import shutil
 import sys
-from collections.abc import MutableMapping
+import time
+from collections.abc import Callable, MutableMapping
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -19,7 +24,138 @@ suppress_debug = [
 ]
 
 
-def configure_structlog(log_level: int = logging.INFO) -> None:
+class LevelFilteringBoundLogger(BoundLogger):
+    """stdlib ``BoundLogger`` that drops disabled levels before any processing.
+
+    ``filter_by_level`` only runs once the context has been merged and the
+    event dict built, so a disabled ``debug`` call still paid for both. Here
+    the stdlib logger's cached level check runs first; per-logger levels such
+    as ``suppress_debug`` keep working.
+    """
+
+    def debug(self, event: str | None = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return None
+        return super().debug(event, *args, **kw)
+
+    def info(self, event: str | None = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.INFO):
+            return None
+        return super().info(event, *args, **kw)
+
+    def warning(self, event: str | None = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return None
+        return super().warning(event, *args, **kw)
+
+    warn = warning
+
+    def error(self, event: str | None = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return None
+        return super().error(event, *args, **kw)
+
+    def exception(self, event: str | None = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return None
+        return super().exception(event, *args, **kw)
+
+    def critical(self, event: str | None = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.CRITICAL):
+            return None
+        return super().critical(event, *args, **kw)
+
+
+class DebugEventSampler:
+    """Processor rate-limiting high-frequency DEBUG events by event name.
+
+    At most ``max_per_second`` debug events with the same name pass per
+    second. The first one let through in a later second carries
+    ``sampled_out`` with the number dropped in between.
+    """
+
+    def __init__(
+        self, max_per_second: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_per_second = max_per_second
+        self._clock = clock
+        # event name -> [second, passed, dropped]
+        self._windows: dict[Any, list[int]] = {}
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        if method_name != "debug":
+            return event_dict
+
+        second = int(self._clock())
+        key = event_dict.get("event")
+        window = self._windows.get(key)
+        if window is None or window[0] != second:
+            dropped = window[2] if window else 0
+            self._windows[key] = [second, 1, 0]
+            if dropped:
+                event_dict["sampled_out"] = dropped
+            return event_dict
+        if window[1] < self.max_per_second:
+            window[1] += 1
+            return event_dict
+        window[2] += 1
+        raise structlog.DropEvent
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue handler passing records unrendered to the listener thread.
+
+    Rendering happens in the listener so the calling thread only enqueues.
+    Foreign (stdlib) records carry a copy of the caller's context so the
+    formatter's ``merge_contextvars`` still sees the request context. When the
+    queue is full, records are dropped and counted instead of blocking.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+            record.ccproxy_context = contextvars.copy_context()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class ContextQueueListener(QueueListener):
+    """Queue listener handling each record in the context it was logged in."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        context = getattr(record, "ccproxy_context", None)
+        if context is None:
+            super().handle(record)
+        else:
+            context.run(super().handle, record)
+
+
+_queue_listener: ContextQueueListener | None = None
+
+
+def stop_log_queue() -> None:
+    """Write out queued log records and stop the background log thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def configure_structlog(
+    log_level: int = logging.INFO, debug_sample_rate: int = 0
+) -> None:
     """Configure structlog with shared processors following canonical pattern."""
     # Shared processors for all structlog loggers
     processors: list[Processor] = [
@@ -29,6 +165,9 @@ def configure_structlog(log_level: int = logging.INFO) -> None:
         structlog.stdlib.add_logger_name,
     ]
 
+    if debug_sample_rate > 0 and log_level < logging.INFO:
+        processors.append(DebugEventSampler(debug_sample_rate))
+
     # Add debug-specific processors
     if log_level < logging.INFO:
         # Dev mode (DEBUG): add callsite information
@@ -75,7 +214,7 @@ def configure_structlog(log_level: int = logging.INFO) -> None:
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=LevelFilteringBoundLogger,
         cache_logger_on_first_use=True,
     )
 
@@ -112,10 +251,17 @@ def setup_logging(
     json_logs: bool = False,
     log_level_name: str = "DEBUG",
     log_file: str | None = None,
+    async_logs: bool = False,
+    queue_size: int = 10000,
+    debug_sample_rate: int = 0,
 ) -> BoundLogger:
     """
     Setup logging for the entire application using canonical structlog pattern.
     Returns a structlog logger instance.
+
+    With ``async_logs`` the root logger only enqueues records; rendering and
+    console/file I/O run on a background listener thread. ``debug_sample_rate``
+    limits each DEBUG event name to that many events per second (0 disables).
     """
     log_level = getattr(logging, log_level_name.upper(), logging.INFO)
 
@@ -139,10 +285,12 @@ def setup_logging(
     root_logger.setLevel(log_level)
 
     # 1. Configure structlog with shared processors
-    configure_structlog(log_level=log_level)
+    configure_structlog(log_level=log_level, debug_sample_rate=debug_sample_rate)
 
     # 2. Setup root logger handlers
+    stop_log_queue()
     root_logger.handlers = []  # Clear any existing handlers
+    handlers: list[logging.Handler] = []
 
     # 3. Create shared processors for foreign (stdlib) logs
     shared_processors = [
@@ -205,7 +353,7 @@ def setup_logging(
             processor=console_renderer,
         )
     )
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # 5. Setup file handler with JSONRenderer (if log_file provided)
     if log_file:
@@ -224,7 +372,22 @@ def setup_logging(
                 processor=structlog.processors.JSONRenderer(),
             )
         )
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if async_logs:
+        global _queue_listener
+        queue_handler = ContextQueueHandler(queue.Queue(maxsize=queue_size))
+        queue_handler.setLevel(log_level)
+        root_logger.addHandler(queue_handler)
+        _queue_listener = ContextQueueListener(
+            queue_handler.queue,
+            *handlers,
+            respect_handler_level=True,
+        )
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # 6. Configure stdlib loggers to propagate to our handlers
     for logger_name in [
@@ -281,6 +444,17 @@ def setup_logging(
     return structlog.get_logger()  # type: ignore[no-any-return]
 
 
+atexit.register(stop_log_queue)
+
+
+def is_enabled_for(logger: Any, level: int) -> bool:
+    """Whether ``logger`` emits ``level``; guards log arguments that are costly to build."""
+    check = getattr(logger, "isEnabledFor", None) or getattr(
+        logger, "is_enabled_for", None
+    )
+    return True if check is None else bool(check(level))
+
+
 # Create a convenience function for getting loggers
 def get_logger(name: str | None = None) -> BoundLogger:
     """Get a structlog logger instance."""
@@ -4,7 +4,7 @@ import asyncio
 import os
 import shlex
 from pathlib import Path
-from typing import cast
+from typing import ClassVar, cast
 
 from structlog import get_logger
 
@@ -31,8 +31,25 @@ logger = get_logger(__name__)
 class DockerAdapter:
     """Implementation of Docker adapter."""
 
+    # Shared by all adapters in the process: whether docker needs sudo and the
+    # images known to exist locally (images are forgotten on build and pull)
+    _sudo_required: ClassVar[bool | None] = None
+    _known_images: ClassVar[set[str]] = set()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget memoized sudo and image existence checks."""
+        cls._sudo_required = None
+        cls._known_images.clear()
+
     async def _needs_sudo(self) -> bool:
         """Check if Docker requires sudo by testing docker info command."""
+        if DockerAdapter._sudo_required is None:
+            DockerAdapter._sudo_required = await self._check_needs_sudo()
+        return DockerAdapter._sudo_required
+
+    async def _check_needs_sudo(self) -> bool:
+        """Run docker info and look for permission errors."""
         try:
             process = await asyncio.create_subprocess_exec(
                 "docker",
@@ -288,10 +305,13 @@ class DockerAdapter:
             try:
                 import subprocess
 
-                subprocess.run(
-                    ["docker", "info"], check=True, capture_output=True, text=True
-                )
-                needs_sudo = False
+                if DockerAdapter._sudo_required is not None:
+                    needs_sudo = DockerAdapter._sudo_required
+                else:
+                    subprocess.run(
+                        ["docker", "info"], check=True, capture_output=True, text=True
+                    )
+                    needs_sudo = False
             except subprocess.CalledProcessError as e:
                 needs_sudo = e.stderr and (
                     "permission denied" in e.stderr.lower()
@@ -399,6 +419,7 @@ class DockerAdapter:
         # Format command for logging
         cmd_str = " ".join(shlex.quote(arg) for arg in docker_cmd)
         logger.info("docker_build_starting", image=image_full_name)
+        DockerAdapter._known_images.discard(image_full_name)
         logger.debug("docker_command", command=cmd_str)
 
         try:
@@ -431,6 +452,8 @@ class DockerAdapter:
     async def image_exists(self, image_name: str, image_tag: str = "latest") -> bool:
         """Check if a Docker image exists locally."""
         image_full_name = f"{image_name}:{image_tag}"
+        if image_full_name in DockerAdapter._known_images:
+            return True
 
         # Check Docker availability
         if not await self.is_available():
@@ -454,6 +477,7 @@ class DockerAdapter:
 
             if process.returncode == 0:
                 logger.debug("docker_image_exists", image=image_full_name)
+                DockerAdapter._known_images.add(image_full_name)
                 return True
 
             # Check if this is a permission error, try with sudo
@@ -479,6 +503,7 @@ class DockerAdapter:
                         logger.debug(
                             "docker_image_exists_with_sudo", image=image_full_name
                         )
+                        DockerAdapter._known_images.add(image_full_name)
                         return True
                     else:
                         # Image doesn't exist even with sudo
@@ -530,6 +555,7 @@ class DockerAdapter:
         # Format command for logging
         cmd_str = " ".join(shlex.quote(arg) for arg in docker_cmd)
         logger.info("docker_pull_starting", image=image_full_name)
+        DockerAdapter._known_images.discard(image_full_name)
         logger.debug("docker_command", command=cmd_str)
 
         try:
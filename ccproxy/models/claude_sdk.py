@@ -277,6 +277,27 @@ class ResultMessage(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class StreamEvent(BaseModel):
+    """Partial message update from Claude SDK.
+
+    Emitted when partial messages are requested; ``event`` is the raw
+    Anthropic streaming event (``content_block_delta`` and friends).
+    """
+
+    type: Literal["stream_event"] = "stream_event"
+
+    uuid: str = Field(default="", description="Event identifier")
+    session_id: str = Field(default="", description="Session ID for the event")
+    event: dict[str, Any] = Field(
+        default_factory=dict, description="Raw Anthropic API stream event"
+    )
+    parent_tool_use_id: str | None = Field(
+        None, description="Tool use this event belongs to, for sub-agent output"
+    )
+
+    model_config = ConfigDict(extra="allow")
+
+
 # Custom Content Block Types for Internal Use
 class SDKMessageMode(SystemMessage):
     """Custom content block for system messages with source attribution."""
@@ -457,6 +478,7 @@ __all__ = [
     "AssistantMessage",
     "SystemMessage",
     "ResultMessage",
+    "StreamEvent",
     # SDK Query Messages
     "SDKMessageContent",
     "SDKMessage",
@@ -0,0 +1,704 @@
+"""
+Access log event bus with compact records and off-path sinks.
+
+Each logged request becomes a single ``AccessRecord`` built once from the
+request context. Publishing it costs the request one enqueue; a dispatcher
+task then fans the record out to independent sinks (structlog, DuckDB storage,
+SSE, Prometheus and live stats). Every sink has its own bounded queue, drop
+policy and worker, so a slow sink neither delays requests nor other sinks.
+
+When the bus is not running in the current event loop (tests, CLI usage) the
+records are delivered to the sinks inline instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal
+
+import structlog
+
+
+if TYPE_CHECKING:
+    from ccproxy.observability.context import RequestContext
+    from ccproxy.observability.metrics import PrometheusMetrics
+    from ccproxy.observability.storage.duckdb_simple import (
+        AccessLogPayload,
+        SimpleDuckDBStorage,
+    )
+
+
+logger = structlog.get_logger(__name__)
+
+DropPolicy = Literal["drop_oldest", "drop_newest"]
+
+# Context metadata copied into the record's ``extra`` when present
+_EXTRA_FIELDS = (
+    "headers",
+    # Session context metadata
+    "session_id",
+    "session_type",
+    "session_status",
+    "session_age_seconds",
+    "session_message_count",
+    "session_pool_enabled",
+    "session_idle_seconds",
+    "session_error_count",
+    "session_is_new",
+    # Streaming output write statistics
+    "stream_coalesced",
+    "stream_upstream_chunks",
+    "stream_writes",
+    "stream_bytes",
+    "stream_max_buffered_bytes",
+    "stream_backpressure_waits",
+    "ttft_ms",
+    # Rate limit headers
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+    "anthropic-ratelimit-requests-limit",
+    "anthropic-ratelimit-requests-remaining",
+    "anthropic-ratelimit-requests-reset",
+    "anthropic-ratelimit-tokens-limit",
+    "anthropic-ratelimit-tokens-remaining",
+    "anthropic-ratelimit-tokens-reset",
+    "anthropic_request_id",
+)
+
+
+class AccessRecord:
+    """Access log entry for one request, shared read-only by every sink."""
+
+    __slots__ = (
+        "request_id",
+        "timestamp",
+        "event",
+        "complete",
+        "error",
+        "error_message",
+        "method",
+        "path",
+        "query",
+        "client_ip",
+        "user_agent",
+        "status_code",
+        "duration_ms",
+        "duration_seconds",
+        "endpoint",
+        "model",
+        "streaming",
+        "service_type",
+        "tokens_input",
+        "tokens_output",
+        "cache_read_tokens",
+        "cache_write_tokens",
+        "cost_usd",
+        "cost_sdk_usd",
+        "num_turns",
+        "extra",
+        "logger",
+        "storage",
+        "metrics",
+    )
+
+    def __init__(
+        self,
+        context: RequestContext,
+        status_code: int | None = None,
+        client_ip: str | None = None,
+        user_agent: str | None = None,
+        method: str | None = None,
+        path: str | None = None,
+        query: str | None = None,
+        error_message: str | None = None,
+        storage: SimpleDuckDBStorage | None = None,
+        metrics: PrometheusMetrics | None = None,
+        additional_metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Capture the access log fields of a request.
+
+        Args:
+            context: Request context with timing and metadata
+            status_code: HTTP status code
+            client_ip: Client IP address
+            user_agent: User agent string
+            method: HTTP method
+            path: Request path
+            query: Query parameters
+            error_message: Error message if applicable
+            storage: DuckDB storage instance the record is written to
+            metrics: PrometheusMetrics instance the record is counted in
+            additional_metadata: Any additional fields to include in the log
+        """
+        metadata = context.metadata
+        self.request_id = context.request_id
+        self.timestamp = time.time()
+        self.method = method or metadata.get("method")
+        self.path = path or metadata.get("path")
+        self.query = query
+        self.client_ip = client_ip
+        self.user_agent = user_agent
+        self.status_code = status_code or metadata.get("status_code")
+        self.error_message = error_message
+        self.error = metadata.get("error")
+
+        # Response fields are only logged once the response is complete
+        is_streaming = metadata.get("streaming", False)
+        is_streaming_complete = metadata.get("event_type", "") == "streaming_complete"
+        self.complete = bool(not is_streaming or is_streaming_complete or self.error)
+        # For a streaming start the real access_log comes when the stream ends
+        self.event = "access_log" if self.complete else "access_log_streaming_start"
+        self.duration_ms = context.duration_ms
+        self.duration_seconds = context.duration_seconds
+
+        self.endpoint = metadata.get("endpoint")
+        self.model = metadata.get("model")
+        self.streaming = metadata.get("streaming")
+        self.service_type = metadata.get("service_type")
+        self.tokens_input = metadata.get("tokens_input")
+        self.tokens_output = metadata.get("tokens_output")
+        self.cache_read_tokens = metadata.get("cache_read_tokens")
+        self.cache_write_tokens = metadata.get("cache_write_tokens")
+        self.cost_usd = metadata.get("cost_usd")
+        self.cost_sdk_usd = metadata.get("cost_sdk_usd")
+        self.num_turns = metadata.get("num_turns")
+
+        extra = {
+            field: metadata[field]
+            for field in _EXTRA_FIELDS
+            if metadata.get(field) is not None
+        }
+        if additional_metadata:
+            extra.update(additional_metadata)
+        self.extra = extra
+
+        self.logger = context.logger
+        self.storage = storage
+        self.metrics = metrics
+
+    @property
+    def is_error(self) -> bool:
+        """Whether the request failed."""
+        return bool(self.error_message) or (self.status_code or 200) >= 400
+
+    def log_fields(self) -> dict[str, Any]:
+        """Get the structured log fields, omitting empty values."""
+        fields: dict[str, Any] = {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "query": self.query,
+            "client_ip": self.client_ip,
+            "user_agent": self.user_agent,
+        }
+        if self.complete:
+            fields["status_code"] = self.status_code
+            fields["duration_ms"] = self.duration_ms
+            fields["duration_seconds"] = self.duration_seconds
+            fields["error_message"] = self.error_message
+        fields.update(
+            tokens_input=self.tokens_input,
+            tokens_output=self.tokens_output,
+            cache_read_tokens=self.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens,
+            cost_usd=self.cost_usd,
+            cost_sdk_usd=self.cost_sdk_usd,
+            num_turns=self.num_turns,
+            endpoint=self.endpoint,
+            model=self.model,
+            streaming=self.streaming,
+            service_type=self.service_type,
+        )
+        fields.update(self.extra)
+        return {k: v for k, v in fields.items() if v is not None}
+
+    def storage_payload(self) -> AccessLogPayload:
+        """Get the row written to DuckDB storage."""
+        extra = self.extra
+        return {
+            "timestamp": self.timestamp,
+            "request_id": self.request_id or "",
+            "method": self.method or "",
+            "endpoint": self.endpoint or self.path or "",
+            "path": self.path or "",
+            "query": self.query or "",
+            "client_ip": self.client_ip or "",
+            "user_agent": self.user_agent or "",
+            "service_type": self.service_type or "",
+            "model": self.model or "",
+            "streaming": bool(self.streaming),
+            "status_code": (self.status_code if self.complete else None) or 200,
+            "duration_ms": self.duration_ms if self.complete else 0.0,
+            "duration_seconds": self.duration_seconds if self.complete else 0.0,
+            "tokens_input": self.tokens_input or 0,
+            "tokens_output": self.tokens_output or 0,
+            "cache_read_tokens": self.cache_read_tokens or 0,
+            "cache_write_tokens": self.cache_write_tokens or 0,
+            "cost_usd": self.cost_usd or 0.0,
+            "cost_sdk_usd": self.cost_sdk_usd or 0.0,
+            "num_turns": self.num_turns or 0,
+            "session_type": extra.get("session_type", ""),
+            "session_status": extra.get("session_status", ""),
+            "session_age_seconds": extra.get("session_age_seconds", 0.0),
+            "session_message_count": extra.get("session_message_count", 0),
+            "session_client_id": extra.get("session_client_id", ""),
+            "session_pool_enabled": extra.get("session_pool_enabled", False),
+            "session_idle_seconds": extra.get("session_idle_seconds", 0.0),
+            "session_error_count": extra.get("session_error_count", 0),
+            "session_is_new": extra.get("session_is_new", True),
+        }
+
+    def sse_data(self) -> dict[str, Any]:
+        """Get the dashboard event data, omitting empty values."""
+        data = {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "query": self.query,
+            "status_code": self.status_code if self.complete else None,
+            "client_ip": self.client_ip,
+            "user_agent": self.user_agent,
+            "service_type": self.service_type,
+            "model": self.model,
+            "streaming": self.streaming,
+            "duration_ms": self.duration_ms if self.complete else None,
+            "duration_seconds": self.duration_seconds if self.complete else None,
+            "tokens_input": self.tokens_input,
+            "tokens_output": self.tokens_output,
+            "cost_usd": self.cost_usd,
+            "endpoint": self.endpoint,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+
+class AccessLogSink(ABC):
+    """Consumer of access records with its own bounded queue.
+
+    Subclasses implement ``write``, which receives records in batches of up to
+    ``batch_size``. When the queue is full, ``drop_oldest`` discards the oldest
+    queued record and ``drop_newest`` rejects the incoming one.
+    """
+
+    name = "sink"
+    drop_policy: DropPolicy = "drop_oldest"
+    batch_size = 100
+
+    def __init__(self, max_queue_size: int = 1000) -> None:
+        self.max_queue_size = max_queue_size
+        self.queue: deque[AccessRecord] = deque()
+        self.dropped = 0
+        self._overflowing = False
+        self._wakeup: asyncio.Event | None = None
+
+    def offer(self, record: AccessRecord) -> None:
+        """Queue a record for the sink's worker, applying the drop policy."""
+        if len(self.queue) >= self.max_queue_size:
+            self.dropped += 1
+            if not self._overflowing:
+                self._overflowing = True
+                logger.warning(
+                    "access_log_sink_overflow",
+                    sink=self.name,
+                    drop_policy=self.drop_policy,
+                    max_queue_size=self.max_queue_size,
+                )
+            if self.drop_policy == "drop_newest":
+                return
+            self.queue.popleft()
+        self.queue.append(record)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    @abstractmethod
+    async def write(self, records: list[AccessRecord]) -> None:
+        """Consume a batch of records."""
+
+    async def write_inline(self, record: AccessRecord) -> None:
+        """Consume a single record on the request path, without the bus."""
+        await self.write([record])
+
+    async def drain(self) -> None:
+        """Write every queued record in batches."""
+        queue = self.queue
+        while queue:
+            count = min(self.batch_size, len(queue))
+            batch = [queue.popleft() for _ in range(count)]
+            try:
+                await self.write(batch)
+            except Exception as e:
+                logger.error(
+                    "access_log_sink_error",
+                    sink=self.name,
+                    records=len(batch),
+                    error=str(e),
+                )
+            # Let request handlers run between batches
+            await asyncio.sleep(0)
+        self._overflowing = False
+
+
+class StructlogSink(AccessLogSink):
+    """Emit the ``access_log`` structured log line."""
+
+    name = "structlog"
+
+    async def write(self, records: list[AccessRecord]) -> None:
+        for record in records:
+            bound = (record.logger or logger).bind(**record.log_fields())
+            if record.error:
+                bound.warn(record.event, exc_info=record.error)
+            else:
+                bound.info(record.event)
+
+
+class StorageSink(AccessLogSink):
+    """Write records to the DuckDB storage they were logged with, in batches.
+
+    Batches are upserted by request ID, so a streaming request's final record
+    replaces the row stored when the stream started. When full, new records
+    are rejected so the stored history stays contiguous.
+    """
+
+    name = "storage"
+    drop_policy: DropPolicy = "drop_newest"
+
+    async def write(self, records: list[AccessRecord]) -> None:
+        batches: dict[int, tuple[Any, list[AccessLogPayload]]] = {}
+        for record in records:
+            if record.storage is None:
+                continue
+            _, payloads = batches.setdefault(id(record.storage), (record.storage, []))
+            payloads.append(record.storage_payload())
+
+        for storage, payloads in batches.values():
+            try:
+                await storage.store_batch(payloads)
+            except Exception as e:
+                # Log error but keep the other storages
+                logger.error(
+                    "access_log_duckdb_error",
+                    error=str(e),
+                    records=len(payloads),
+                )
+
+    async def write_inline(self, record: AccessRecord) -> None:
+        # Hand off to the storage's own write queue instead of writing inline
+        if record.storage is not None:
+            await record.storage.store_request(record.storage_payload())
+
+
+class SSESink(AccessLogSink):
+    """Emit ``request_complete`` events for real-time dashboard updates."""
+
+    name = "sse"
+
+    async def write(self, records: list[AccessRecord]) -> None:
+        from ccproxy.observability.sse_events import emit_sse_event
+
+        for record in records:
+            await emit_sse_event("request_complete", record.sse_data())
+
+
+class PrometheusSink(AccessLogSink):
+    """Record request, latency, token, cost and error metrics."""
+
+    name = "prometheus"
+
+    async def write(self, records: list[AccessRecord]) -> None:
+        for record in records:
+            if record.metrics is not None:
+                _record_metrics(record.metrics, record)
+
+
+class LiveStatsSink(AccessLogSink):
+    """Feed completed requests to the live sliding-window stats."""
+
+    name = "live_stats"
+
+    async def write(self, records: list[AccessRecord]) -> None:
+        from ccproxy.observability.live_stats import get_live_stats
+
+        live_stats = get_live_stats()
+        for record in records:
+            if not record.complete:
+                continue
+            live_stats.record(
+                duration_ms=record.duration_ms,
+                model=record.model,
+                tokens_input=record.tokens_input or 0,
+                tokens_output=record.tokens_output or 0,
+                cache_read_tokens=record.cache_read_tokens or 0,
+                cache_write_tokens=record.cache_write_tokens or 0,
+                cost_usd=record.cost_usd or 0.0,
+                error=record.is_error,
+                timestamp=record.timestamp,
+            )
+
+
+def _record_metrics(metrics: PrometheusMetrics, record: AccessRecord) -> None:
+    """Record a request's Prometheus metrics."""
+    endpoint = record.endpoint or record.path or "unknown"
+    model = record.model
+    service_type = record.service_type
+
+    if record.error_message:
+        # Extract error type from error metadata or use generic
+        metrics.record_error(
+            error_type=record.extra.get(
+                "error_type", type(record.error_message).__name__
+            ),
+            endpoint=endpoint,
+            model=model,
+            service_type=service_type,
+        )
+        return
+
+    if record.method and record.status_code:
+        metrics.record_request(
+            method=record.method,
+            endpoint=endpoint,
+            model=model,
+            status=record.status_code,
+            service_type=service_type,
+        )
+
+    if record.duration_seconds > 0:
+        metrics.record_response_time(
+            duration_seconds=record.duration_seconds,
+            model=model,
+            endpoint=endpoint,
+            service_type=service_type,
+        )
+
+    ttft_ms = record.extra.get("ttft_ms")
+    if ttft_ms is not None:
+        metrics.record_time_to_first_token(
+            ttft_seconds=ttft_ms / 1000,
+            model=model,
+            endpoint=endpoint,
+            service_type=service_type,
+        )
+
+    for token_type, token_count in (
+        ("input", record.tokens_input),
+        ("output", record.tokens_output),
+        ("cache_read", record.cache_read_tokens),
+        ("cache_write", record.cache_write_tokens),
+    ):
+        if token_count:
+            metrics.record_tokens(
+                token_count=token_count,
+                token_type=token_type,
+                model=model,
+                service_type=service_type,
+            )
+
+    if record.cost_usd:
+        metrics.record_cost(
+            cost_usd=record.cost_usd,
+            model=model,
+            cost_type="total",
+            service_type=service_type,
+        )
+
+
+def default_sinks(max_queue_size: int = 1000) -> list[AccessLogSink]:
+    """Create the standard access log sinks."""
+    return [
+        StructlogSink(max_queue_size),
+        StorageSink(max_queue_size),
+        SSESink(max_queue_size),
+        PrometheusSink(max_queue_size),
+        LiveStatsSink(max_queue_size),
+    ]
+
+
+class AccessLogBus:
+    """In-memory bus dispatching access records to independent sinks."""
+
+    def __init__(
+        self,
+        sinks: Sequence[AccessLogSink] | None = None,
+        max_queue_size: int = 10000,
+    ) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            sinks: Sinks receiving every record, defaults to ``default_sinks()``
+            max_queue_size: Records buffered for dispatch before the oldest
+                are dropped
+        """
+        self.sinks = list(sinks) if sinks is not None else default_sinks()
+        self.dropped = 0
+        self._inbox: deque[AccessRecord] = deque(maxlen=max_queue_size)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the bus is dispatching in the current event loop."""
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    def start(self) -> None:
+        """Start the dispatcher and sink workers in the running event loop."""
+        if self.is_running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._workers = []
+        for sink in self.sinks:
+            sink._wakeup = asyncio.Event()
+            self._workers.append(asyncio.create_task(self._run_sink(sink)))
+        logger.debug("access_log_bus_started", sinks=[sink.name for sink in self.sinks])
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Deliver queued records and stop the workers.
+
+        Args:
+            timeout: Seconds to wait for sinks to drain before cancelling them
+        """
+        if not self.is_running or self._dispatcher is None:
+            return
+
+        self._stopping = True
+        assert self._wakeup is not None
+        self._wakeup.set()
+        await self._dispatcher
+        for sink in self.sinks:
+            if sink._wakeup is not None:
+                sink._wakeup.set()
+        _, pending = await asyncio.wait(self._workers, timeout=timeout)
+        for task in pending:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        self._loop = None
+        self._dispatcher = None
+        self._workers = []
+        for sink in self.sinks:
+            sink._wakeup = None
+        logger.debug(
+            "access_log_bus_stopped",
+            dropped=self.dropped,
+            sinks_dropped={sink.name: sink.dropped for sink in self.sinks},
+        )
+
+    def publish(self, record: AccessRecord) -> bool:
+        """Enqueue a record for dispatch.
+
+        Returns:
+            False if the bus is not running in this event loop
+        """
+        if not self.is_running or self._stopping:
+            return False
+        inbox = self._inbox
+        if len(inbox) == inbox.maxlen:
+            self.dropped += 1
+        inbox.append(record)
+        assert self._wakeup is not None
+        self._wakeup.set()
+        return True
+
+    async def deliver(self, record: AccessRecord) -> None:
+        """Write a record to every sink inline."""
+        for sink in self.sinks:
+            try:
+                await sink.write_inline(record)
+            except Exception as e:
+                logger.error(
+                    "access_log_sink_error",
+                    sink=sink.name,
+                    records=1,
+                    error=str(e),
+                )
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue depths and drop counters of the bus and its sinks."""
+        return {
+            "running": self.is_running,
+            "queued": len(self._inbox),
+            "dropped": self.dropped,
+            "sinks": {
+                sink.name: {
+                    "queued": len(sink.queue),
+                    "dropped": sink.dropped,
+                    "drop_policy": sink.drop_policy,
+                }
+                for sink in self.sinks
+            },
+        }
+
+    def _fan_out(self) -> None:
+        inbox = self._inbox
+        sinks = self.sinks
+        while inbox:
+            record = inbox.popleft()
+            for sink in sinks:
+                sink.offer(record)
+
+    async def _dispatch(self) -> None:
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            self._fan_out()
+            if self._stopping:
+                return
+
+    async def _run_sink(self, sink: AccessLogSink) -> None:
+        assert sink._wakeup is not None
+        wakeup = sink._wakeup
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            await sink.drain()
+            if self._stopping:
+                return
+
+
+# Global access log bus instance
+_global_access_log_bus: AccessLogBus | None = None
+
+
+def get_access_log_bus() -> AccessLogBus:
+    """Get or create the global access log bus."""
+    global _global_access_log_bus
+
+    if _global_access_log_bus is None:
+        bus_queue_size = 10000
+        sink_queue_size = 1000
+        with contextlib.suppress(Exception):
+            from ccproxy.config.settings import get_settings
+
+            observability = get_settings().observability
+            bus_queue_size = observability.access_log_bus_queue_size
+            sink_queue_size = observability.access_log_sink_queue_size
+        _global_access_log_bus = AccessLogBus(
+            default_sinks(sink_queue_size), max_queue_size=bus_queue_size
+        )
+
+    return _global_access_log_bus
+
+
+def reset_access_log_bus() -> None:
+    """Reset the global access log bus (mainly for testing)."""
+    global _global_access_log_bus
+    _global_access_log_bus = None
@@ -26,6 +26,8 @@ from typing import Any
 
 import structlog
 
+from .live_stats import get_live_stats
+
 
 logger = structlog.get_logger(__name__)
 
@@ -131,6 +133,8 @@ async def request_context(
     # Increment active requests if metrics provided
     if metrics:
         metrics.inc_active_requests()
+    live_stats = get_live_stats()
+    live_stats.request_started()
 
     # Create context object
     ctx = RequestContext(
@@ -186,6 +190,9 @@ async def request_context(
 
         # Emit SSE event for real-time dashboard updates
         await _emit_request_error_event(request_id, error_type, str(e), ctx.metadata)
+        live_stats.record(
+            duration_ms=duration_ms, model=ctx.metadata.get("model"), error=True
+        )
 
         # Re-raise the exception
         raise
@@ -193,6 +200,7 @@ async def request_context(
         # Decrement active requests if metrics provided
         if metrics:
             metrics.dec_active_requests()
+        live_stats.request_finished()
 
 
 @asynccontextmanager
@@ -0,0 +1,431 @@
+"""
+In-process sliding-window aggregator for live request statistics.
+
+Completed requests are recorded into a ring of per-second buckets holding
+request, error, token and cost sums plus a mergeable latency sketch. The live
+windows (1m/5m/15m) are kept as running aggregates: a request is added to each
+window when recorded and its bucket is subtracted again once it falls out of
+the window, so reads only summarize three aggregates and never touch DuckDB or
+Prometheus internals. Ad-hoc windows merge the buckets that fall inside them.
+
+Recording and reading happen on the event loop without awaiting, so no lock is
+needed: each update runs to completion before another coroutine can observe
+the buckets.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+DEFAULT_WINDOW_SECONDS = 900
+"""Number of per-second buckets kept, bounding the longest window."""
+
+LIVE_WINDOWS: dict[str, int] = {"1m": 60, "5m": 300, "15m": 900}
+"""Windows reported by ``SlidingWindowAggregator.snapshot``."""
+
+
+class LatencySketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch).
+
+    Values are counted in logarithmically sized bins so any quantile is
+    returned within ``RELATIVE_ACCURACY`` of the true value, and two sketches
+    merge by adding their bin counts.
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    _GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+    _MIN_VALUE = 1e-3
+
+    __slots__ = ("bins", "zero_count", "count")
+
+    def __init__(self) -> None:
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add a non-negative value to the sketch."""
+        self.count += 1
+        if value <= self._MIN_VALUE:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._LOG_GAMMA)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def merge(self, other: LatencySketch) -> None:
+        """Add another sketch's counts to this one."""
+        self.count += other.count
+        self.zero_count += other.zero_count
+        bins = self.bins
+        for key, count in other.bins.items():
+            bins[key] = bins.get(key, 0) + count
+
+    def subtract(self, other: LatencySketch) -> None:
+        """Remove counts previously merged from another sketch."""
+        self.count -= other.count
+        self.zero_count -= other.zero_count
+        bins = self.bins
+        for key, count in other.bins.items():
+            remaining = bins.get(key, 0) - count
+            if remaining > 0:
+                bins[key] = remaining
+            else:
+                bins.pop(key, None)
+
+    def quantile(self, q: float) -> float:
+        """Get the approximate value at quantile ``q`` (0..1), 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return 2 * self._GAMMA**key / (self._GAMMA + 1)
+        return 2 * self._GAMMA ** max(self.bins) / (self._GAMMA + 1)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self.bins.clear()
+        self.zero_count = 0
+        self.count = 0
+
+
+class _Bucket:
+    """Sums for the requests completed within one second."""
+
+    __slots__ = (
+        "second",
+        "requests",
+        "errors",
+        "tokens_input",
+        "tokens_output",
+        "cache_read_tokens",
+        "cache_write_tokens",
+        "cost_usd",
+        "duration_ms_sum",
+        "models",
+        "latency",
+    )
+
+    def __init__(self) -> None:
+        self.latency = LatencySketch()
+        self.models: dict[str, int] = {}
+        self.reset(-1)
+
+    def reset(self, second: int) -> None:
+        self.second = second
+        self.requests = 0
+        self.errors = 0
+        self.tokens_input = 0
+        self.tokens_output = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.cost_usd = 0.0
+        self.duration_ms_sum = 0.0
+        self.models.clear()
+        self.latency.clear()
+
+    def add(
+        self,
+        duration_ms: float,
+        model: str | None,
+        tokens_input: int,
+        tokens_output: int,
+        cache_read_tokens: int,
+        cache_write_tokens: int,
+        cost_usd: float,
+        error: bool,
+    ) -> None:
+        self.requests += 1
+        if error:
+            self.errors += 1
+        self.tokens_input += tokens_input
+        self.tokens_output += tokens_output
+        self.cache_read_tokens += cache_read_tokens
+        self.cache_write_tokens += cache_write_tokens
+        self.cost_usd += cost_usd
+        self.duration_ms_sum += duration_ms
+        if model:
+            self.models[model] = self.models.get(model, 0) + 1
+        self.latency.add(duration_ms)
+
+    def subtract(self, other: _Bucket) -> None:
+        """Remove the requests of another bucket previously added to this one."""
+        self.requests -= other.requests
+        if self.requests <= 0:
+            # Reset instead of subtracting to drop accumulated float error
+            self.reset(self.second)
+            return
+        self.errors -= other.errors
+        self.tokens_input -= other.tokens_input
+        self.tokens_output -= other.tokens_output
+        self.cache_read_tokens -= other.cache_read_tokens
+        self.cache_write_tokens -= other.cache_write_tokens
+        self.cost_usd -= other.cost_usd
+        self.duration_ms_sum -= other.duration_ms_sum
+        models = self.models
+        for model, count in other.models.items():
+            remaining = models.get(model, 0) - count
+            if remaining > 0:
+                models[model] = remaining
+            else:
+                models.pop(model, None)
+        self.latency.subtract(other.latency)
+
+
+@dataclass
+class WindowStats:
+    """Aggregated statistics over a time window."""
+
+    window_seconds: float
+    requests: int = 0
+    errors: int = 0
+    tokens_input: int = 0
+    tokens_output: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+    avg_duration_ms: float = 0.0
+    p50_duration_ms: float = 0.0
+    p90_duration_ms: float = 0.0
+    p95_duration_ms: float = 0.0
+    p99_duration_ms: float = 0.0
+    requests_per_second: float = 0.0
+    error_rate: float = 0.0
+    top_model: str | None = None
+    top_model_requests: int = 0
+    models: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def _summarize(buckets: Iterable[_Bucket], window_seconds: float) -> WindowStats:
+    """Merge buckets into window statistics."""
+    stats = WindowStats(window_seconds=window_seconds)
+    latency = LatencySketch()
+    duration_ms_sum = 0.0
+    models = stats.models
+    for bucket in buckets:
+        stats.requests += bucket.requests
+        stats.errors += bucket.errors
+        stats.tokens_input += bucket.tokens_input
+        stats.tokens_output += bucket.tokens_output
+        stats.cache_read_tokens += bucket.cache_read_tokens
+        stats.cache_write_tokens += bucket.cache_write_tokens
+        stats.cost_usd += bucket.cost_usd
+        duration_ms_sum += bucket.duration_ms_sum
+        for model, count in bucket.models.items():
+            models[model] = models.get(model, 0) + count
+        latency.merge(bucket.latency)
+
+    if stats.requests:
+        stats.avg_duration_ms = duration_ms_sum / stats.requests
+        stats.p50_duration_ms = latency.quantile(0.50)
+        stats.p90_duration_ms = latency.quantile(0.90)
+        stats.p95_duration_ms = latency.quantile(0.95)
+        stats.p99_duration_ms = latency.quantile(0.99)
+        stats.error_rate = stats.errors / stats.requests
+    if window_seconds > 0:
+        stats.requests_per_second = stats.requests / window_seconds
+    if models:
+        # Ties go to the first name so every merge order gives the same answer
+        stats.top_model = min(models, key=lambda model: (-models[model], model))
+        stats.top_model_requests = models[stats.top_model]
+    return stats
+
+
+class SlidingWindowAggregator:
+    """Ring of per-second buckets summarizing recently completed requests."""
+
+    def __init__(
+        self,
+        window_seconds: int = DEFAULT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the aggregator.
+
+        Args:
+            window_seconds: Number of seconds of history kept
+            clock: Wall-clock time source, injectable for tests
+        """
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._buckets = [_Bucket() for _ in range(window_seconds)]
+        self._totals = _Bucket()
+        # Running aggregates of the live windows and the newest second in them
+        self._windows = {
+            name: (min(seconds, window_seconds), _Bucket())
+            for name, seconds in LIVE_WINDOWS.items()
+        }
+        self._head: int | None = None
+        self._started_at = clock()
+        self.active_requests = 0
+
+    def request_started(self) -> None:
+        """Count a request as in flight."""
+        self.active_requests += 1
+
+    def request_finished(self) -> None:
+        """Stop counting a request as in flight."""
+        self.active_requests = max(0, self.active_requests - 1)
+
+    def record(
+        self,
+        duration_ms: float,
+        model: str | None = None,
+        tokens_input: int = 0,
+        tokens_output: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        cost_usd: float = 0.0,
+        error: bool = False,
+        timestamp: float | None = None,
+    ) -> None:
+        """
+        Record a completed request.
+
+        Args:
+            duration_ms: Request duration in milliseconds
+            model: Model name, if known
+            tokens_input: Input tokens
+            tokens_output: Output tokens
+            cache_read_tokens: Cache read tokens
+            cache_write_tokens: Cache write tokens
+            cost_usd: Cost in USD
+            error: Whether the request failed
+            timestamp: Completion time, defaults to now
+        """
+        second = int(self._clock() if timestamp is None else timestamp)
+        values = (
+            duration_ms,
+            model,
+            tokens_input,
+            tokens_output,
+            cache_read_tokens,
+            cache_write_tokens,
+            cost_usd,
+            error,
+        )
+        self._totals.add(*values)
+
+        bucket = self._buckets[second % self.window_seconds]
+        if bucket.second != second:
+            if bucket.second > second:
+                # Older than the ring: only counted in the totals
+                return
+            # Evict the bucket's previous second before reusing it
+            self._advance(second)
+            bucket.reset(second)
+        bucket.add(*values)
+
+        head = self._advance(second)
+        for seconds, running in self._windows.values():
+            if second > head - seconds:
+                running.add(*values)
+
+    def _advance(self, second: int) -> int:
+        """Move the live windows forward to ``second``, evicting old buckets.
+
+        Returns:
+            The newest second covered by the live windows
+        """
+        head = self._head
+        if head is None:
+            self._head = second
+            return second
+        if second <= head:
+            return head
+
+        buckets = self._buckets
+        size = self.window_seconds
+        for seconds, running in self._windows.values():
+            if second - head >= seconds:
+                running.reset(-1)
+                continue
+            for expired in range(head - seconds + 1, second - seconds + 1):
+                bucket = buckets[expired % size]
+                if bucket.second == expired:
+                    running.subtract(bucket)
+        self._head = second
+        return second
+
+    def window(self, seconds: int, now: float | None = None) -> WindowStats:
+        """
+        Get statistics for the requests completed in the last ``seconds``.
+
+        Args:
+            seconds: Window length, capped at ``window_seconds``
+            now: Reference time, defaults to now
+        """
+        seconds = max(1, min(seconds, self.window_seconds))
+        current = int(self._clock() if now is None else now)
+        buckets = self._buckets
+        size = self.window_seconds
+        return _summarize(
+            (
+                bucket
+                for second in range(current - seconds + 1, current + 1)
+                if (bucket := buckets[second % size]).second == second
+            ),
+            seconds,
+        )
+
+    def totals(self) -> WindowStats:
+        """Get statistics for every request recorded since startup."""
+        return _summarize([self._totals], max(0.0, self._clock() - self._started_at))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the live windows, totals and in-flight count as a dictionary."""
+        now = self._clock()
+        self._advance(int(now))
+        return {
+            "timestamp": now,
+            "active_requests": self.active_requests,
+            "windows": {
+                name: _summarize([running], seconds).to_dict()
+                for name, (seconds, running) in self._windows.items()
+            },
+            "totals": self.totals().to_dict(),
+        }
+
+    def clear(self) -> None:
+        """Forget all recorded requests."""
+        for bucket in self._buckets:
+            bucket.reset(-1)
+        self._totals.reset(-1)
+        for _, running in self._windows.values():
+            running.reset(-1)
+        self._head = None
+        self._started_at = self._clock()
+
+
+# Global aggregator instance
+_global_live_stats: SlidingWindowAggregator | None = None
+
+
+def get_live_stats() -> SlidingWindowAggregator:
+    """Get or create the global live stats aggregator."""
+    global _global_live_stats
+
+    if _global_live_stats is None:
+        _global_live_stats = SlidingWindowAggregator()
+
+    return _global_live_stats
+
+
+def reset_live_stats() -> None:
+    """Reset the global live stats aggregator (mainly for testing)."""
+    global _global_live_stats
+    _global_live_stats = None
@@ -0,0 +1,128 @@
+"""
+Event loop lag monitor.
+
+A background task sleeps for a fixed interval and records how much later than
+requested it woke up. The overshoot is the time the loop spent running other
+callbacks, so sustained lag means request handling is CPU bound or blocked by
+synchronous work. Samples are kept for a bounded window and summarized on
+read, which is cheap enough to poll during load tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+DEFAULT_WINDOW_SECONDS = 900
+"""Longest window the monitor can summarize."""
+
+
+class EventLoopLagMonitor:
+    """Samples event loop scheduling lag in a background task."""
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        window_seconds: int = DEFAULT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval: Seconds between samples
+            window_seconds: Seconds of samples kept for ``snapshot``
+            clock: Wall clock used to timestamp samples
+        """
+        self.interval = interval
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._samples: deque[tuple[float, float]] = deque(
+            maxlen=max(1, math.ceil(window_seconds / interval))
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="event_loop_lag")
+
+    async def stop(self) -> None:
+        """Stop sampling, keeping the collected samples."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def record(self, lag_ms: float) -> None:
+        """Record one lag sample in milliseconds."""
+        self._samples.append((self._clock(), lag_ms))
+
+    def snapshot(self, window_seconds: float | None = None) -> dict[str, Any]:
+        """Summarize the samples taken in the last ``window_seconds``.
+
+        Args:
+            window_seconds: Window to summarize, the whole buffer when None
+
+        Returns:
+            Sample count and p50, p99 and maximum lag in milliseconds
+        """
+        cutoff = self._clock() - (window_seconds or self.window_seconds)
+        lags = sorted(lag for at, lag in self._samples if at >= cutoff)
+
+        def quantile(q: float) -> float:
+            return lags[min(len(lags) - 1, int(q * len(lags)))] if lags else 0.0
+
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "window_seconds": window_seconds or self.window_seconds,
+            "samples": len(lags),
+            "p50_ms": quantile(0.5),
+            "p99_ms": quantile(0.99),
+            "max_ms": lags[-1] if lags else 0.0,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - expected) * 1000)
+
+
+_global_loop_lag_monitor: EventLoopLagMonitor | None = None
+
+
+def get_loop_lag_monitor() -> EventLoopLagMonitor:
+    """Get or create the global event loop lag monitor."""
+    global _global_loop_lag_monitor
+
+    if _global_loop_lag_monitor is None:
+        _global_loop_lag_monitor = EventLoopLagMonitor()
+
+    return _global_loop_lag_monitor
+
+
+def configure_loop_lag_monitor(interval: float) -> EventLoopLagMonitor:
+    """Replace the global monitor with one sampling every ``interval`` seconds."""
+    global _global_loop_lag_monitor
+
+    _global_loop_lag_monitor = EventLoopLagMonitor(interval=interval)
+    return _global_loop_lag_monitor
+
+
+def reset_loop_lag_monitor() -> None:
+    """Reset the global event loop lag monitor (mainly for testing)."""
+    global _global_loop_lag_monitor
+    _global_loop_lag_monitor = None
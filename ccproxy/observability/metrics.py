@@ -10,11 +10,17 @@ Key features:
 - Minimal overhead for high-frequency operations
 - Standard Prometheus metric types (Counter, Histogram, Gauge)
 - Automatic label management and validation
+- Model label cardinality limiting (unknown or excess models become "other")
+- Cached exposition rendered off the event loop, shared by concurrent scrapes
 - Pushgateway integration for batch metric pushing
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
+import time
 from typing import Any
 
 
@@ -65,6 +71,9 @@ except ImportError:
         def dec(self, value: float = 1) -> None:
             pass
 
+        def set_function(self, f: Any) -> None:
+            pass
+
     class _DummyInfo:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
             pass
@@ -89,6 +98,14 @@ from structlog import get_logger
 
 logger = get_logger(__name__)
 
+# Label value reported for models that are unknown or exceed the label limit
+OVERFLOW_LABEL = "other"
+
+DEFAULT_MAX_MODEL_LABELS = 100
+
+# Cap on distinct dropped values remembered for the dropped-labels gauge
+_MAX_TRACKED_DROPPED_LABELS = 10_000
+
 
 class PrometheusMetrics:
     """
@@ -103,6 +120,7 @@ class PrometheusMetrics:
         namespace: str = "ccproxy",
         registry: CollectorRegistry | None = None,
         pushgateway_client: Any | None = None,
+        max_model_labels: int = DEFAULT_MAX_MODEL_LABELS,
     ):
         """
         Initialize Prometheus metrics.
@@ -111,6 +129,7 @@ class PrometheusMetrics:
             namespace: Metric name prefix
             registry: Custom Prometheus registry (uses default if None)
             pushgateway_client: Optional pushgateway client for dependency injection
+            max_model_labels: Maximum distinct ``model`` label values
         """
         if not PROMETHEUS_AVAILABLE:
             logger.warning(
@@ -128,6 +147,19 @@ class PrometheusMetrics:
             self.registry = registry
         self._enabled = PROMETHEUS_AVAILABLE
         self._pushgateway_client = pushgateway_client
+        self._pricing_snapshot_timestamp: float | None = None
+        # Session pool recycle counts already added to the counter, by reason
+        self._session_recycles_seen: dict[str, int] = {}
+
+        # Model label cardinality limiting
+        self._max_model_labels = max_model_labels
+        self._model_labels: set[str] = set()
+        self._dropped_model_labels: set[str] = set()
+        self._label_lock = threading.Lock()
+
+        # Cached exposition output: (registry, rendered bytes, monotonic time)
+        self._exposition: tuple[Any, bytes, float] | None = None
+        self._exposition_render: asyncio.Future[bytes] | None = None
 
         if self._enabled:
             self._init_metrics()
@@ -153,6 +185,14 @@ class PrometheusMetrics:
             registry=self.registry,
         )
 
+        self.time_to_first_token = Histogram(
+            f"{self.namespace}_time_to_first_token_seconds",
+            "Time from request start to the first streamed content delta",
+            labelnames=["model", "endpoint", "service_type"],
+            buckets=[0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0],
+            registry=self.registry,
+        )
+
         # Token metrics
         self.token_counter = Counter(
             f"{self.namespace}_tokens_total",
@@ -261,6 +301,50 @@ class PrometheusMetrics:
             registry=self.registry,
         )
 
+        # Claude SDK session pool metrics
+        self.session_recycles_total = Counter(
+            f"{self.namespace}_session_recycles_total",
+            "Total number of session CLI processes replaced by the recycling policy",
+            labelnames=["reason"],
+            registry=self.registry,
+        )
+
+        self.session_processes_rss = Gauge(
+            f"{self.namespace}_session_processes_rss_bytes",
+            "Resident memory of all session CLI process trees",
+            registry=self.registry,
+        )
+
+        self.session_process_max_rss = Gauge(
+            f"{self.namespace}_session_process_max_rss_bytes",
+            "Resident memory of the largest session CLI process tree",
+            registry=self.registry,
+        )
+
+        # Pricing and model metadata refresh metrics
+        self.pricing_refresh_duration = Histogram(
+            f"{self.namespace}_pricing_refresh_duration_seconds",
+            "Time taken to download and store fresh pricing data",
+            labelnames=["status"],
+            buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+            registry=self.registry,
+        )
+
+        self.pricing_snapshot_age = Gauge(
+            f"{self.namespace}_pricing_snapshot_age_seconds",
+            "Age of the pricing and model metadata snapshot in use",
+            registry=self.registry,
+        )
+        self.pricing_snapshot_age.set_function(self._get_pricing_snapshot_age)
+
+        # Label cardinality guard
+        self.dropped_label_values = Gauge(
+            f"{self.namespace}_metrics_dropped_label_values",
+            "Distinct model label values reported as 'other' instead of their own series",
+            registry=self.registry,
+        )
+        self.dropped_label_values.set_function(lambda: len(self._dropped_model_labels))
+
         # Set initial system info
         try:
             from ccproxy import __version__
@@ -301,6 +385,39 @@ class PrometheusMetrics:
             logger.warning("pushgateway_init_failed: error=%s", str(e))
             self._pushgateway_client = None
 
+    def _model_label(self, model: str | None) -> str:
+        """
+        Get the ``model`` label value to record for a model name.
+
+        Models known to the model registry get their own series until
+        ``max_model_labels`` distinct values are in use; anything else is
+        reported as ``"other"`` so client-supplied names cannot grow the
+        series count without bound.
+
+        Args:
+            model: Model name from the request
+
+        Returns:
+            Label value to use
+        """
+        if not model:
+            return "unknown"
+        if model in self._model_labels:
+            return model
+
+        from ccproxy.services.model_registry import get_model_registry
+
+        known = get_model_registry().is_known(model)
+        with self._label_lock:
+            if model in self._model_labels:
+                return model
+            if known and len(self._model_labels) < self._max_model_labels:
+                self._model_labels.add(model)
+                return model
+            if len(self._dropped_model_labels) < _MAX_TRACKED_DROPPED_LABELS:
+                self._dropped_model_labels.add(model)
+        return OVERFLOW_LABEL
+
     def record_request(
         self,
         method: str,
@@ -325,7 +442,7 @@ class PrometheusMetrics:
         self.request_counter.labels(
             method=method,
             endpoint=endpoint,
-            model=model or "unknown",
+            model=self._model_label(model),
             status=str(status),
             service_type=service_type or "unknown",
         ).inc()
@@ -350,11 +467,36 @@ class PrometheusMetrics:
             return
 
         self.response_time.labels(
-            model=model or "unknown",
+            model=self._model_label(model),
             endpoint=endpoint,
             service_type=service_type or "unknown",
         ).observe(duration_seconds)
 
+    def record_time_to_first_token(
+        self,
+        ttft_seconds: float,
+        model: str | None = None,
+        endpoint: str = "unknown",
+        service_type: str | None = None,
+    ) -> None:
+        """
+        Record time to first token of a streaming response.
+
+        Args:
+            ttft_seconds: Time from request start to the first content delta
+            model: Model name used
+            endpoint: API endpoint
+            service_type: Service type (claude_sdk_service, proxy_service)
+        """
+        if not self._enabled:
+            return
+
+        self.time_to_first_token.labels(
+            model=self._model_label(model),
+            endpoint=endpoint,
+            service_type=service_type or "unknown",
+        ).observe(ttft_seconds)
+
     def record_tokens(
         self,
         token_count: int,
@@ -376,7 +518,7 @@ class PrometheusMetrics:
 
         self.token_counter.labels(
             type=token_type,
-            model=model or "unknown",
+            model=self._model_label(model),
             service_type=service_type or "unknown",
         ).inc(token_count)
 
@@ -400,7 +542,7 @@ class PrometheusMetrics:
             return
 
         self.cost_counter.labels(
-            model=model or "unknown",
+            model=self._model_label(model),
             cost_type=cost_type,
             service_type=service_type or "unknown",
         ).inc(cost_usd)
@@ -427,7 +569,7 @@ class PrometheusMetrics:
         self.error_counter.labels(
             error_type=error_type,
             endpoint=endpoint,
-            model=model or "unknown",
+            model=self._model_label(model),
             service_type=service_type or "unknown",
         ).inc()
 
@@ -473,6 +615,46 @@ class PrometheusMetrics:
         """Check if metrics collection is enabled."""
         return self._enabled
 
+    async def render_exposition(self, max_age_seconds: float = 0.0) -> bytes:
+        """
+        Render the registry in Prometheus text format.
+
+        Rendering runs in a worker thread. Output younger than
+        ``max_age_seconds`` is reused, and scrapes arriving while a render is
+        in progress wait for that render instead of starting their own.
+
+        Args:
+            max_age_seconds: How long rendered output may be reused
+
+        Returns:
+            Prometheus exposition bytes
+        """
+        from prometheus_client import REGISTRY, generate_latest
+
+        registry = self.registry if self.registry is not None else REGISTRY
+        cached = self._exposition
+        if (
+            cached is not None
+            and cached[0] is registry
+            and time.monotonic() - cached[2] < max_age_seconds
+        ):
+            return cached[1]
+
+        loop = asyncio.get_running_loop()
+        render = self._exposition_render
+        if render is None or render.done() or render.get_loop() is not loop:
+            render = asyncio.ensure_future(asyncio.to_thread(generate_latest, registry))
+            self._exposition_render = render
+
+            def _store(future: asyncio.Future[bytes]) -> None:
+                if not future.cancelled() and future.exception() is None:
+                    self._exposition = (registry, future.result(), time.monotonic())
+
+            render.add_done_callback(_store)
+
+        # Shield so a disconnecting scraper does not cancel the shared render
+        return await asyncio.shield(render)
+
     def push_to_gateway(self, method: str = "push") -> bool:
         """
         Push current metrics to Pushgateway using official prometheus_client methods.
@@ -524,6 +706,37 @@ class PrometheusMetrics:
             and self._pushgateway_client.is_enabled()
         )
 
+    # Pricing refresh metrics methods
+
+    def record_pricing_refresh(self, duration_seconds: float, success: bool) -> None:
+        """
+        Record a pricing data refresh.
+
+        Args:
+            duration_seconds: Time taken by the refresh
+            success: Whether fresh data was downloaded and stored
+        """
+        if not self._enabled:
+            return
+
+        status = "success" if success else "error"
+        self.pricing_refresh_duration.labels(status=status).observe(duration_seconds)
+
+    def set_pricing_snapshot_timestamp(self, timestamp: float) -> None:
+        """
+        Set when the pricing data currently in use was fetched.
+
+        Args:
+            timestamp: Unix timestamp of the snapshot's source data
+        """
+        self._pricing_snapshot_timestamp = timestamp
+
+    def _get_pricing_snapshot_age(self) -> float:
+        """Seconds since the snapshot's source data was fetched (NaN if unknown)."""
+        if self._pricing_snapshot_timestamp is None:
+            return float("nan")
+        return max(0.0, time.time() - self._pricing_snapshot_timestamp)
+
     # Claude SDK Pool metrics methods
 
     def update_pool_gauges(
@@ -570,6 +783,28 @@ class PrometheusMetrics:
 
         self.pool_connections_created_total.inc()
 
+    def update_session_pool_metrics(
+        self, recycles: dict[str, int], process_rss_bytes: dict[str, int]
+    ) -> None:
+        """
+        Update session pool metrics from a pool statistics report.
+
+        Args:
+            recycles: Cumulative number of recycled CLI processes by reason
+            process_rss_bytes: Last sampled RSS in bytes of each session's process tree
+        """
+        if not self._enabled:
+            return
+
+        for reason, count in recycles.items():
+            added = count - self._session_recycles_seen.get(reason, 0)
+            if added > 0:
+                self.session_recycles_total.labels(reason=reason).inc(added)
+            self._session_recycles_seen[reason] = count
+
+        self.session_processes_rss.set(sum(process_rss_bytes.values()))
+        self.session_process_max_rss.set(max(process_rss_bytes.values(), default=0))
+
     def inc_pool_connections_closed(self) -> None:
         """Increment the pool connections closed counter."""
         if not self._enabled:
@@ -654,10 +889,20 @@ def get_metrics(
 
             pushgateway_client = get_pushgateway_client()
 
+        max_model_labels = DEFAULT_MAX_MODEL_LABELS
+        if settings is None:
+            with contextlib.suppress(Exception):
+                from ccproxy.config.settings import get_settings
+
+                settings = get_settings()
+        if settings is not None:
+            max_model_labels = settings.observability.metrics_max_model_labels
+
         _global_metrics = PrometheusMetrics(
             namespace=namespace,
             registry=registry,
             pushgateway_client=pushgateway_client,
+            max_model_labels=max_model_labels,
         )
 
     return _global_metrics
@@ -3,14 +3,23 @@ Server-Sent Events (SSE) event manager for real-time dashboard updates.
 
 This module provides centralized SSE connection management and event broadcasting
 for real-time dashboard notifications when requests start, complete, or error.
+
+Each event is serialized once when emitted and the encoded frame is shared by
+reference across connections. Connections buffer events in a bounded ring, and
+events pushed out of a full ring are reported with an ``overflow`` frame
+carrying the number of missed events. Every event is sent as its own frame
+unless ``max_flush_rate`` is set: connections then send at most that many
+frames per second, coalescing several pending events into one ``batch`` frame.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import time
 import uuid
+from collections import deque
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -20,24 +29,79 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
+class EncodedEvent:
+    """An event serialized once and shared by every connection."""
+
+    __slots__ = ("event", "json", "frame")
+
+    def __init__(self, event: dict[str, Any], json_data: str) -> None:
+        self.event = event
+        self.json = json_data
+        self.frame = f"data: {json_data}\n\n"
+
+
+class _SSEConnection:
+    """Per-connection ring buffer of encoded events."""
+
+    __slots__ = ("buffer", "dropped", "wakeup", "_closed")
+
+    def __init__(self, max_queue_size: int) -> None:
+        self.buffer: deque[EncodedEvent] = deque(maxlen=max_queue_size)
+        self.dropped = 0
+        self.wakeup = asyncio.Event()
+        self._closed = False
+
+    def close(self) -> None:
+        """Ask the connection's stream to end."""
+        self._closed = True
+        self.wakeup.set()
+
+    def is_closed(self) -> bool:
+        """Whether the connection was asked to end."""
+        return self._closed
+
+    def push(self, event: EncodedEvent) -> bool:
+        """Append an event, returning True if it pushed out the oldest one."""
+        overflowed = len(self.buffer) == self.buffer.maxlen
+        if overflowed:
+            self.dropped += 1
+        self.buffer.append(event)
+        self.wakeup.set()
+        return overflowed
+
+    def drain(self) -> tuple[list[EncodedEvent], int]:
+        """Take all buffered events and the number of events missed."""
+        events = list(self.buffer)
+        dropped = self.dropped
+        self.buffer.clear()
+        self.dropped = 0
+        self.wakeup.clear()
+        return events, dropped
+
+
 class SSEEventManager:
     """
     Centralized SSE connection management and event broadcasting.
 
     Manages multiple SSE connections and broadcasts events to all connected clients.
-    Uses bounded queues to prevent memory issues with slow clients.
+    Uses bounded ring buffers to prevent memory issues with slow clients.
     """
 
-    def __init__(self, max_queue_size: int = 100) -> None:
+    def __init__(self, max_queue_size: int = 100, max_flush_rate: float = 0.0) -> None:
         """
         Initialize SSE event manager.
 
         Args:
-            max_queue_size: Maximum events to queue per connection before dropping
+            max_queue_size: Maximum events buffered per connection before the
+                oldest are dropped
+            max_flush_rate: Maximum frames per second sent to each connection,
+                batching the events in between (0 sends every event as its
+                own frame)
         """
-        self._connections: dict[str, asyncio.Queue[dict[str, Any]]] = {}
+        self._connections: dict[str, _SSEConnection] = {}
         self._lock = asyncio.Lock()
         self._max_queue_size = max_queue_size
+        self._flush_interval = 1.0 / max_flush_rate if max_flush_rate > 0 else 0.0
 
     async def add_connection(
         self, connection_id: str | None = None, request_id: str | None = None
@@ -55,13 +119,10 @@ class SSEEventManager:
         if connection_id is None:
             connection_id = str(uuid.uuid4())
 
-        # Create bounded queue for this connection
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
-            maxsize=self._max_queue_size
-        )
+        connection = _SSEConnection(self._max_queue_size)
 
         async with self._lock:
-            self._connections[connection_id] = queue
+            self._connections[connection_id] = connection
 
         logger.debug(
             "sse_connection_added", connection_id=connection_id, request_id=request_id
@@ -77,16 +138,28 @@ class SSEEventManager:
             }
             yield self._format_sse_event(connection_event)
 
+            last_flush = 0.0
             while True:
-                # Wait for next event
-                event = await queue.get()
-
-                # Check for special disconnect event
-                if event.get("type") == "_disconnect":
+                # Wait for events, then hold off until the flush interval has
+                # passed so events arriving meanwhile share one frame
+                await connection.wakeup.wait()
+                if connection.is_closed():
                     break
-
-                # Yield formatted event
-                yield self._format_sse_event(event)
+                delay = last_flush + self._flush_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    if connection.is_closed():
+                        break
+
+                events, dropped = connection.drain()
+                last_flush = time.monotonic()
+                if dropped:
+                    yield self._format_overflow_event(dropped)
+                if len(events) == 1 or not self._flush_interval:
+                    for event in events:
+                        yield event.frame
+                elif events:
+                    yield self._format_batch_event(events)
 
         except asyncio.CancelledError:
             logger.debug("sse_connection_cancelled", connection_id=connection_id)
@@ -122,98 +195,30 @@ class SSEEventManager:
         if not self._connections:
             return  # No connected clients
 
-        event = {
-            "type": event_type,
-            "data": data,
-            "timestamp": time.time(),
-        }
-
-        async with self._lock:
-            # Get copy of connections to avoid modification during iteration
-            connections = dict(self._connections)
-
-        # Broadcast to all connections
-        failed_connections = []
+        encoded = self._encode_event(
+            {
+                "type": event_type,
+                "data": data,
+                "timestamp": time.time(),
+            }
+        )
 
-        for connection_id, queue in connections.items():
-            try:
-                # Try to put event in queue without blocking
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                # Queue is full, handle overflow
-                try:
-                    # Try to drop oldest event and add overflow indicator
-                    queue.get_nowait()  # Remove oldest
-                    overflow_event = {
-                        "type": "overflow",
-                        "message": "Event queue full, some events dropped",
-                        "timestamp": time.time(),
-                    }
-                    try:
-                        queue.put_nowait(overflow_event)
-                        queue.put_nowait(event)
-                    except asyncio.QueueFull:
-                        # Still full after dropping, connection is problematic
-                        failed_connections.append(connection_id)
-                        continue
-
-                    logger.warning(
-                        "sse_queue_overflow",
-                        connection_id=connection_id,
-                        max_queue_size=self._max_queue_size,
-                    )
-                except asyncio.QueueEmpty:
-                    # Queue became empty, try again
-                    try:
-                        queue.put_nowait(event)
-                    except asyncio.QueueFull:
-                        # Still full, connection is problematic
-                        failed_connections.append(connection_id)
-                except Exception as e:
-                    logger.error(
-                        "sse_overflow_error",
-                        connection_id=connection_id,
-                        error=str(e),
-                    )
-                    failed_connections.append(connection_id)
-            except Exception as e:
-                logger.error(
-                    "sse_broadcast_error",
+        # No awaits below, so the connection set cannot change mid-broadcast
+        for connection_id, connection in list(self._connections.items()):
+            if connection.push(encoded) and connection.dropped == 1:
+                logger.warning(
+                    "sse_queue_overflow",
                     connection_id=connection_id,
-                    error=str(e),
+                    max_queue_size=self._max_queue_size,
                 )
-                failed_connections.append(connection_id)
-
-        # Clean up failed connections
-        for connection_id in failed_connections:
-            await self._cleanup_connection(connection_id)
-
-        if failed_connections:
-            logger.debug(
-                "sse_connections_cleaned",
-                failed_count=len(failed_connections),
-                active_count=len(self._connections),
-            )
 
     async def disconnect_all(self) -> None:
         """Disconnect all active connections gracefully."""
         async with self._lock:
             connections = dict(self._connections)
 
-        for connection_id, queue in connections.items():
-            try:
-                # Send disconnect signal
-                disconnect_signal = {"type": "_disconnect"}
-                queue.put_nowait(disconnect_signal)
-            except asyncio.QueueFull:
-                # Queue is full, force cleanup
-                await self._cleanup_connection(connection_id)
-            except Exception as e:
-                logger.error(
-                    "sse_disconnect_error",
-                    connection_id=connection_id,
-                    error=str(e),
-                )
+        for connection in connections.values():
+            connection.close()
 
         logger.debug("sse_all_connections_disconnected")
 
@@ -224,21 +229,42 @@ class SSEEventManager:
                 del self._connections[connection_id]
                 logger.debug("sse_connection_removed", connection_id=connection_id)
 
-    def _format_sse_event(self, event: dict[str, Any]) -> str:
-        """Format event as SSE data string."""
+    def _encode_event(self, event: dict[str, Any]) -> EncodedEvent:
+        """Serialize an event once for delivery to every connection."""
         try:
-            json_data = json.dumps(event, default=self._json_serializer)
-            return f"data: {json_data}\n\n"
+            return EncodedEvent(event, json.dumps(event, default=self._json_serializer))
         except (TypeError, ValueError) as e:
             logger.error("sse_format_error", error=str(e), event_type=event.get("type"))
-            # Return error event instead
+            # Deliver an error event instead
             error_event = {
                 "type": "error",
                 "message": "Failed to format event",
                 "timestamp": time.time(),
             }
-            json_data = json.dumps(error_event, default=self._json_serializer)
-            return f"data: {json_data}\n\n"
+            return EncodedEvent(error_event, json.dumps(error_event))
+
+    def _format_sse_event(self, event: dict[str, Any]) -> str:
+        """Format event as SSE data string."""
+        return self._encode_event(event).frame
+
+    def _format_batch_event(self, events: list[EncodedEvent]) -> str:
+        """Join pre-encoded events into one batch frame without re-serializing."""
+        return (
+            f'data: {{"type": "batch", "count": {len(events)}, '
+            f'"timestamp": {json.dumps(time.time())}, '
+            f'"events": [{", ".join(event.json for event in events)}]}}\n\n'
+        )
+
+    def _format_overflow_event(self, dropped: int) -> str:
+        """Format the marker sent after events were dropped for a slow client."""
+        return self._format_sse_event(
+            {
+                "type": "overflow",
+                "message": f"Event buffer full, you missed {dropped} events",
+                "dropped": dropped,
+                "timestamp": time.time(),
+            }
+        )
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for datetime and other objects."""
@@ -272,7 +298,17 @@ def get_sse_manager() -> SSEEventManager:
     global _global_sse_manager
 
     if _global_sse_manager is None:
-        _global_sse_manager = SSEEventManager()
+        max_queue_size = 100
+        max_flush_rate = 0.0
+        with contextlib.suppress(Exception):
+            from ccproxy.config.settings import get_settings
+
+            observability = get_settings().observability
+            max_queue_size = observability.dashboard_stream_buffer_size
+            max_flush_rate = observability.dashboard_stream_max_rate
+        _global_sse_manager = SSEEventManager(
+            max_queue_size=max_queue_size, max_flush_rate=max_flush_rate
+        )
 
     return _global_sse_manager
 
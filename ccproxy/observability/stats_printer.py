@@ -2,7 +2,9 @@
 Stats collector and printer for periodic metrics summary.
 
 This module provides functionality to collect and print periodic statistics
-from the observability system, including Prometheus metrics and DuckDB storage.
+from the observability system. Statistics are read from the in-process live
+stats aggregator when available, falling back to Prometheus metrics and DuckDB
+storage otherwise.
 """
 
 from __future__ import annotations
@@ -16,6 +18,7 @@ from typing import Any
 import structlog
 
 from ccproxy.config.observability import ObservabilitySettings
+from ccproxy.observability.live_stats import SlidingWindowAggregator, get_live_stats
 
 
 logger = structlog.get_logger(__name__)
@@ -47,8 +50,9 @@ class StatsCollector:
     """
     Collects and formats metrics statistics for periodic printing.
 
-    Integrates with both Prometheus metrics and DuckDB storage to provide
-    comprehensive statistics about the API performance.
+    Reads the live stats aggregator when one is provided, otherwise integrates
+    with Prometheus metrics and DuckDB storage to provide comprehensive
+    statistics about the API performance.
     """
 
     def __init__(
@@ -56,6 +60,7 @@ class StatsCollector:
         settings: ObservabilitySettings,
         metrics_instance: Any | None = None,
         storage_instance: Any | None = None,
+        live_stats: SlidingWindowAggregator | None = None,
     ):
         """
         Initialize stats collector.
@@ -64,10 +69,12 @@ class StatsCollector:
             settings: Observability configuration settings
             metrics_instance: Prometheus metrics instance
             storage_instance: DuckDB storage instance
+            live_stats: Live stats aggregator, preferred over metrics and storage
         """
         self.settings = settings
         self._metrics_instance = metrics_instance
         self._storage_instance = storage_instance
+        self._live_stats = live_stats
         self._last_snapshot: StatsSnapshot | None = None
         self._last_collection_time = time.time()
 
@@ -101,8 +108,12 @@ class StatsCollector:
             "top_model_percentage": 0.0,
         }
 
+        # Collect from the live stats aggregator if available
+        if self._live_stats is not None:
+            self._collect_from_live_stats(stats_data)
+
         # Collect from Prometheus metrics if available
-        if self._metrics_instance and self._metrics_instance.is_enabled():
+        elif self._metrics_instance and self._metrics_instance.is_enabled():
             try:
                 await self._collect_from_prometheus(stats_data)
             except Exception as e:
@@ -111,7 +122,11 @@ class StatsCollector:
                 )
 
         # Collect from DuckDB storage if available
-        if self._storage_instance and self._storage_instance.is_enabled():
+        if (
+            self._live_stats is None
+            and self._storage_instance
+            and self._storage_instance.is_enabled()
+        ):
             try:
                 await self._collect_from_duckdb(stats_data, current_time)
             except Exception as e:
@@ -142,6 +157,42 @@ class StatsCollector:
 
         return snapshot
 
+    def _collect_from_live_stats(self, stats_data: dict[str, Any]) -> None:
+        """Collect statistics from the live stats aggregator."""
+        if self._live_stats is None:
+            return
+
+        totals = self._live_stats.totals()
+        last_minute = self._live_stats.window(60)
+
+        stats_data["requests_total"] = totals.requests
+        stats_data["avg_response_time_ms"] = totals.avg_duration_ms
+        stats_data["tokens_input_total"] = totals.tokens_input
+        stats_data["tokens_output_total"] = totals.tokens_output
+        stats_data["cost_total_usd"] = totals.cost_usd
+        stats_data["errors_total"] = totals.errors
+
+        stats_data["requests_last_minute"] = last_minute.requests
+        stats_data["avg_response_time_last_minute_ms"] = last_minute.avg_duration_ms
+        stats_data["tokens_input_last_minute"] = last_minute.tokens_input
+        stats_data["tokens_output_last_minute"] = last_minute.tokens_output
+        stats_data["cost_last_minute_usd"] = last_minute.cost_usd
+        stats_data["errors_last_minute"] = last_minute.errors
+
+        stats_data["active_requests"] = self._live_stats.active_requests
+        if last_minute.top_model:
+            stats_data["top_model"] = last_minute.top_model
+            stats_data["top_model_percentage"] = (
+                last_minute.top_model_requests / last_minute.requests * 100
+            )
+
+        logger.debug(
+            "live_stats_collected",
+            requests_total=totals.requests,
+            requests_last_minute=last_minute.requests,
+            active_requests=self._live_stats.active_requests,
+        )
+
     async def _collect_from_prometheus(self, stats_data: dict[str, Any]) -> None:
         """Collect statistics from Prometheus metrics."""
         if not self._metrics_instance:
@@ -701,14 +752,19 @@ def get_stats_collector(
     settings: ObservabilitySettings | None = None,
     metrics_instance: Any | None = None,
     storage_instance: Any | None = None,
+    live_stats: SlidingWindowAggregator | None = None,
 ) -> StatsCollector:
     """
     Get or create global stats collector instance.
 
+    The collector reads the global live stats aggregator unless another one is
+    injected, so collecting never queries DuckDB.
+
     Args:
         settings: Observability settings
         metrics_instance: Metrics instance for dependency injection
         storage_instance: Storage instance for dependency injection
+        live_stats: Live stats aggregator for dependency injection
 
     Returns:
         StatsCollector instance
@@ -729,19 +785,14 @@ def get_stats_collector(
             except Exception as e:
                 logger.warning("Failed to get metrics instance", error=str(e))
 
-        if storage_instance is None:
-            try:
-                from .storage.duckdb_simple import SimpleDuckDBStorage
-
-                storage_instance = SimpleDuckDBStorage(settings.duckdb_path)
-                # Note: Storage needs to be initialized before use
-            except Exception as e:
-                logger.warning("Failed to get storage instance", error=str(e))
+        if live_stats is None:
+            live_stats = get_live_stats()
 
         _global_stats_collector = StatsCollector(
             settings=settings,
             metrics_instance=metrics_instance,
             storage_instance=storage_instance,
+            live_stats=live_stats,
         )
 
     return _global_stats_collector
@@ -0,0 +1,219 @@
+"""Day-partitioned Parquet archive for access logs.
+
+Rows older than the retention window are moved out of the DuckDB
+``access_logs`` table into ZSTD-compressed Parquet files laid out as
+``<archive_dir>/day=YYYY-MM-DD/part-<epoch_ms>.parquet``. Queries read the
+hot table together with only the partitions overlapping the requested time
+range, so the hot table stays small and long-range scans read columnar files.
+"""
+
+import shutil
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+
+import structlog
+from sqlalchemy import column, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import aliased
+from sqlmodel import Session
+
+from .models import AccessLog
+
+
+logger = structlog.get_logger(__name__)
+
+PARTITION_PREFIX = "day="
+
+
+def partition_dir(archive_dir: Path, day: date) -> Path:
+    """Get the partition directory holding archived rows for ``day``."""
+    return archive_dir / f"{PARTITION_PREFIX}{day.isoformat()}"
+
+
+def list_archive_files(
+    archive_dir: str | Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[Path]:
+    """List archived Parquet files whose day partition overlaps a time range.
+
+    Args:
+        archive_dir: Archive root directory
+        start: Inclusive lower bound, or None for no bound
+        end: Inclusive upper bound, or None for no bound
+
+    Returns:
+        Sorted list of Parquet file paths
+    """
+    root = Path(archive_dir)
+    if not root.is_dir():
+        return []
+
+    files: list[Path] = []
+    for partition in root.iterdir():
+        name = partition.name
+        if not partition.is_dir() or not name.startswith(PARTITION_PREFIX):
+            continue
+        try:
+            day = date.fromisoformat(name[len(PARTITION_PREFIX) :])
+        except ValueError:
+            continue
+        if start is not None and day < start.date():
+            continue
+        if end is not None and day > end.date():
+            continue
+        files.extend(partition.glob("*.parquet"))
+    return sorted(files)
+
+
+def access_log_source(
+    archive_dir: str | Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Any:
+    """Get the selectable to query access logs from for a time range.
+
+    Returns the ``AccessLog`` model itself when no archived partition overlaps
+    the range, otherwise an alias of ``AccessLog`` over the hot table united
+    with the overlapping Parquet files. Both can be used interchangeably in
+    ``select()`` and attribute filters.
+
+    Args:
+        archive_dir: Archive root directory
+        start: Inclusive lower bound, or None for no bound
+        end: Inclusive upper bound, or None for no bound
+    """
+    files = list_archive_files(archive_dir, start, end)
+    if not files:
+        return AccessLog
+
+    file_list = ", ".join(_sql_string(path) for path in files)
+    union = text(
+        "SELECT * FROM access_logs UNION ALL BY NAME "
+        f"SELECT * FROM read_parquet([{file_list}], union_by_name = true)"
+    ).columns(*[column(c.name, c.type) for c in AccessLog.__table__.columns])  # type: ignore[attr-defined]
+    return aliased(AccessLog, union.subquery("access_logs"), adapt_on_names=True)
+
+
+def archive_access_logs(
+    engine: Engine,
+    archive_dir: str | Path,
+    retention_days: int,
+    now: datetime | None = None,
+) -> int:
+    """Move whole days older than the retention window into Parquet partitions.
+
+    Each day is exported and deleted in a single transaction; the Parquet file
+    is written under a temporary name and only renamed into its partition
+    before commit, so a failed day leaves neither a partial file nor lost rows.
+    The database is checkpointed afterwards so the deletions reach the
+    database file and their blocks can be reused by new rows; DuckDB does not
+    shrink the file itself.
+
+    Args:
+        engine: Engine connected to the DuckDB database
+        archive_dir: Archive root directory
+        retention_days: Number of days (including today) kept in the hot table
+        now: Reference time, defaults to the current local time
+
+    Returns:
+        Number of rows archived
+    """
+    root = Path(archive_dir)
+    cutoff = datetime.combine(
+        (now or datetime.now()).date() - timedelta(days=retention_days - 1), time()
+    )
+
+    with Session(engine) as session:
+        days = [
+            row[0]
+            for row in session.execute(
+                text(
+                    "SELECT DISTINCT CAST(timestamp AS DATE) AS day FROM access_logs "
+                    "WHERE timestamp < :cutoff ORDER BY day"
+                ),
+                {"cutoff": cutoff},
+            )
+        ]
+
+    archived = 0
+    for day in days:
+        archived += _archive_day(engine, root, day)
+
+    if days:
+        with engine.connect() as conn:
+            conn.execute(text("CHECKPOINT"))
+        logger.info(
+            "access_logs_archived",
+            rows=archived,
+            days=len(days),
+            cutoff=cutoff.isoformat(),
+            archive_dir=str(root),
+        )
+    return archived
+
+
+def _archive_day(engine: Engine, archive_dir: Path, day: date) -> int:
+    """Export one day of access logs to Parquet and delete it from the table."""
+    params = {
+        "start": datetime.combine(day, time()),
+        "end": datetime.combine(day + timedelta(days=1), time()),
+    }
+    where = "timestamp >= :start AND timestamp < :end"
+    target_dir = partition_dir(archive_dir, day)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / f"part-{int(datetime.now().timestamp() * 1000)}.parquet"
+    tmp_target = target.with_suffix(".parquet.tmp")
+
+    try:
+        with Session(engine) as session:
+            count = session.execute(
+                text(f"SELECT count(*) FROM access_logs WHERE {where}"), params
+            ).scalar_one()
+            session.execute(
+                text(
+                    f"COPY (SELECT * FROM access_logs WHERE {where} "
+                    f"ORDER BY timestamp) TO {_sql_string(tmp_target)} "
+                    "(FORMAT PARQUET, COMPRESSION ZSTD)"
+                ),
+                params,
+            )
+            session.execute(text(f"DELETE FROM access_logs WHERE {where}"), params)
+            tmp_target.rename(target)
+            try:
+                session.commit()
+            except Exception:
+                target.unlink(missing_ok=True)
+                raise
+    finally:
+        tmp_target.unlink(missing_ok=True)
+
+    logger.debug("access_log_day_archived", day=day.isoformat(), rows=count)
+    return int(count)
+
+
+def clear_archive(archive_dir: str | Path) -> int:
+    """Delete every archived day partition.
+
+    Args:
+        archive_dir: Archive root directory
+
+    Returns:
+        Number of partitions removed
+    """
+    root = Path(archive_dir)
+    if not root.is_dir():
+        return 0
+
+    removed = 0
+    for partition in root.iterdir():
+        if partition.is_dir() and partition.name.startswith(PARTITION_PREFIX):
+            shutil.rmtree(partition)
+            removed += 1
+    return removed
+
+
+def _sql_string(path: Path) -> str:
+    """Quote a path as a SQL string literal."""
+    return "'" + str(path).replace("'", "''") + "'"
@@ -18,6 +18,7 @@ from sqlalchemy.engine import Engine
 from sqlmodel import Session, SQLModel, create_engine, desc, func, select
 from typing_extensions import TypedDict
 
+from .archive import archive_access_logs
 from .models import AccessLog
 
 
@@ -662,6 +663,25 @@ class SimpleDuckDBStorage:
             logger.error("simple_duckdb_reset_error", error=str(e))
             return False
 
+    async def archive_old_logs(
+        self, archive_dir: str | Path, retention_days: int
+    ) -> int:
+        """Move access logs older than the retention window to Parquet.
+
+        Args:
+            archive_dir: Directory for the day-partitioned Parquet archive
+            retention_days: Days of logs (including today) kept in the table
+
+        Returns:
+            Number of rows archived
+        """
+        if not self._initialized or not self._engine:
+            return 0
+
+        return await asyncio.to_thread(
+            archive_access_logs, self._engine, archive_dir, retention_days
+        )
+
     def _reset_data_sync(self) -> bool:
         """Synchronous version of reset_data for thread pool execution."""
         try:
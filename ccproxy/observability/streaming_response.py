@@ -3,10 +3,17 @@
 This module provides a reusable StreamingResponseWithLogging class that wraps
 any async generator and handles access logging when the stream completes,
 eliminating code duplication between different streaming endpoints.
+
+Output can optionally be coalesced into fewer, larger writes (see
+``ccproxy.utils.stream_coalescer``); write and byte counts are recorded in the
+request context either way, as is the time to the first generated token
+(``ttft_ms``), measured the same way for every streaming endpoint.
 """
 
 from __future__ import annotations
 
+import re
+import time
 from collections.abc import AsyncGenerator, AsyncIterator
 from typing import TYPE_CHECKING, Any
 
@@ -14,14 +21,35 @@ import structlog
 from fastapi.responses import StreamingResponse
 
 from ccproxy.observability.access_logger import log_request_access
+from ccproxy.utils.stream_coalescer import (
+    SSEWriteCoalescer,
+    StreamWriteStats,
+    coalescing_disabled_by_client,
+)
 
 
 if TYPE_CHECKING:
+    from starlette.types import Receive, Scope, Send
+
+    from ccproxy.config.streaming import StreamingSettings
     from ccproxy.observability.context import RequestContext
     from ccproxy.observability.metrics import PrometheusMetrics
 
 logger = structlog.get_logger(__name__)
 
+# Events carrying generated text: Anthropic content block deltas, OpenAI chat
+# content deltas and Responses API output text deltas (the OpenAI delta is
+# matched whatever the JSON spacing)
+_TOKEN_MARKERS = re.compile(
+    rb'content_block_delta|"delta"\s*:\s*\{\s*"content"|output_text\.delta'
+)
+
+
+def _contains_token(chunk: bytes | str) -> bool:
+    """Whether a stream chunk carries generated text."""
+    data = chunk.encode() if isinstance(chunk, str) else chunk
+    return _TOKEN_MARKERS.search(data) is not None
+
 
 class StreamingResponseWithLogging(StreamingResponse):
     """FastAPI StreamingResponse that triggers access logging on completion.
@@ -29,6 +57,9 @@ class StreamingResponseWithLogging(StreamingResponse):
     This class wraps a streaming response generator to automatically trigger
     access logging when the stream completes (either successfully or with an error).
     This eliminates the need for manual access logging in individual stream processors.
+
+    Unless disabled in settings or by the client (``X-CCProxy-Stream-Coalescing: off``),
+    adjacent chunks are coalesced into fewer writes within a bounded flush window.
     """
 
     def __init__(
@@ -37,6 +68,7 @@ class StreamingResponseWithLogging(StreamingResponse):
         request_context: RequestContext,
         metrics: PrometheusMetrics | None = None,
         status_code: int = 200,
+        streaming_settings: StreamingSettings | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize streaming response with logging capability.
@@ -46,14 +78,57 @@ class StreamingResponseWithLogging(StreamingResponse):
             request_context: The request context for access logging
             metrics: Optional PrometheusMetrics instance for recording metrics
             status_code: HTTP status code for the response
+            streaming_settings: Output coalescing settings (defaults to app settings)
             **kwargs: Additional arguments passed to StreamingResponse
         """
+        self._streaming_settings = streaming_settings
+        self._coalesce = False
+
         # Wrap the content generator to add logging
         logged_content = self._wrap_with_logging(
             content, request_context, metrics, status_code
         )
         super().__init__(logged_content, status_code=status_code, **kwargs)
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Resolve coalescing for this client before streaming starts."""
+        settings = self._streaming_settings
+        if settings is None:
+            app = scope.get("app")
+            app_settings = getattr(getattr(app, "state", None), "settings", None)
+            settings = getattr(app_settings, "streaming", None)
+            self._streaming_settings = settings
+
+        self._coalesce = (
+            settings is not None
+            and settings.coalescing_enabled
+            and not coalescing_disabled_by_client(scope.get("headers", []))
+        )
+        await super().__call__(scope, receive, send)
+
+    @staticmethod
+    def _coalesced(
+        content: AsyncIterator[bytes],
+        settings: StreamingSettings,
+        stats: StreamWriteStats,
+    ) -> AsyncGenerator[bytes, None]:
+        """Wrap content with a write coalescer configured from settings."""
+        coalescer = SSEWriteCoalescer(
+            content,
+            flush_interval=settings.flush_interval_ms / 1000,
+            max_write_bytes=settings.max_write_bytes,
+            max_buffer_bytes=settings.max_buffer_bytes,
+            stats=stats,
+        )
+        return coalescer.stream()
+
+    @staticmethod
+    def _record_ttft(context: RequestContext) -> None:
+        """Record the time from request start to the first generated token."""
+        context.metadata["ttft_ms"] = round(
+            (time.perf_counter() - context.start_time) * 1000, 3
+        )
+
     async def _wrap_with_logging(
         self,
         content: AsyncGenerator[bytes, None] | AsyncIterator[bytes],
@@ -72,10 +147,26 @@ class StreamingResponseWithLogging(StreamingResponse):
         Yields:
             bytes: Content chunks from the original generator
         """
+        stats = StreamWriteStats()
+        output: AsyncGenerator[bytes, None] | None = None
+        first_token = True
         try:
-            # Stream all content from the original generator
-            async for chunk in content:
-                yield chunk
+            if self._coalesce and self._streaming_settings is not None:
+                output = self._coalesced(content, self._streaming_settings, stats)
+                async for chunk in output:
+                    if first_token and _contains_token(chunk):
+                        first_token = False
+                        self._record_ttft(context)
+                    yield chunk
+            else:
+                # Stream all content from the original generator
+                async for chunk in content:
+                    stats.upstream_chunks += 1
+                    stats.record_write(len(chunk))
+                    if first_token and _contains_token(chunk):
+                        first_token = False
+                        self._record_ttft(context)
+                    yield chunk
         except GeneratorExit:
             # Client disconnected - log this and re-raise to propagate to underlying generators
             logger.info(
@@ -86,10 +177,18 @@ class StreamingResponseWithLogging(StreamingResponse):
             # CRITICAL: Re-raise GeneratorExit to propagate disconnect to create_listener()
             raise
         finally:
+            # Stop the coalescer's upstream reader on disconnect or error
+            if output is not None:
+                await output.aclose()
+
             # Log access when stream completes (success or error)
             try:
-                # Add streaming completion event type to context
-                context.add_metadata(event_type="streaming_complete")
+                # Add streaming completion event type and write statistics
+                context.add_metadata(
+                    event_type="streaming_complete",
+                    stream_coalesced=self._coalesce,
+                    **stats.as_metadata(),
+                )
 
                 # Check if status_code was updated in context metadata (e.g., due to error)
                 final_status_code = context.metadata.get("status_code", status_code)
@@ -50,13 +50,19 @@ class PricingCache:
             logger.warning("cache_stats_check_failed", error=str(e))
             return False
 
-    def load_cached_data(self) -> dict[str, Any] | None:
+    def load_cached_data(self, allow_stale: bool = False) -> dict[str, Any] | None:
         """Load pricing data from cache.
 
+        Args:
+            allow_stale: Return the cached data even if it has expired
+
         Returns:
             Cached pricing data or None if cache is invalid/corrupted
         """
-        if not self.is_cache_valid():
+        if allow_stale:
+            if not self.cache_file.exists():
+                return None
+        elif not self.is_cache_valid():
             return None
 
         try:
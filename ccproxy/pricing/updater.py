@@ -1,5 +1,16 @@
-"""Pricing updater for managing periodic refresh of pricing data."""
-
+"""Pricing updater for managing periodic refresh of pricing data.
+
+Reads follow stale-while-revalidate semantics: ``get_current_pricing`` and
+``get_current_metadata`` return the in-memory snapshot immediately and never
+download on the caller's path. When the snapshot is due for revalidation a
+single background task checks the cache file and, if the cached data has
+expired, downloads fresh data; failures are retried with jittered exponential
+backoff. The scheduler's pricing task drives the same revalidation directly.
+"""
+
+import asyncio
+import random
+import time
 from decimal import Decimal
 from typing import Any
 
@@ -15,6 +26,9 @@ from .model_metadata import ModelsMetadata
 
 logger = get_logger(__name__)
 
+# Minimum seconds between cache file checks for a loaded snapshot
+FILE_CHECK_INTERVAL = 30.0
+
 
 class PricingUpdater:
     """Manages periodic updates of pricing data."""
@@ -37,114 +51,142 @@ class PricingUpdater:
         self._last_load_time: float = 0
         self._last_file_check_time: float = 0
         self._cached_file_mtime: float = 0
+        self._load_lock = asyncio.Lock()
+        self._revalidation_task: asyncio.Task[PricingData | None] | None = None
+        self._consecutive_failures = 0
+        self._retry_after: float = 0
 
     async def get_current_metadata(
         self, force_refresh: bool = False
     ) -> ModelsMetadata | None:
-        """Get current model metadata with automatic updates.
+        """Get current model metadata.
 
         Args:
-            force_refresh: Force refresh even if cache is valid
+            force_refresh: Download fresh data before returning
 
         Returns:
             Current model metadata
         """
-        import time
-
-        current_time = time.time()
-
-        # Return cached metadata if recent and not forced
-        if (
-            not force_refresh
-            and self._cached_metadata is not None
-            and (current_time - self._last_load_time) < self.settings.memory_cache_ttl
-        ):
-            # Only check file changes every 30 seconds to reduce I/O
-            if (current_time - self._last_file_check_time) > 30:
-                if self._has_cache_file_changed():
-                    logger.info("cache_file_changed")
-                    # File changed, need to reload
-                    _, metadata = await self._load_pricing_and_metadata()
-                    self._cached_metadata = metadata
-                    self._last_load_time = current_time
-                    return metadata
-                self._last_file_check_time = current_time
-
-            return self._cached_metadata
-
-        # Check if we need to refresh
-        should_refresh = force_refresh or (
-            self.settings.auto_update and not self.cache.is_cache_valid()
-        )
-
-        if should_refresh:
-            logger.info("metadata_refresh_start")
-            await self._refresh_pricing()
-
-        # Load metadata
-        _, metadata = await self._load_pricing_and_metadata()
-
-        # Cache the result
-        self._cached_metadata = metadata
-        self._last_load_time = current_time
-        self._last_file_check_time = current_time
-
-        return metadata
+        await self._ensure_snapshot(force_refresh)
+        return self._cached_metadata
 
     async def get_current_pricing(
         self, force_refresh: bool = False
     ) -> PricingData | None:
-        """Get current pricing data with automatic updates.
+        """Get current pricing data.
 
         Args:
-            force_refresh: Force refresh even if cache is valid
+            force_refresh: Download fresh data before returning
 
         Returns:
             Current pricing data as PricingData model
         """
-        import time
+        await self._ensure_snapshot(force_refresh)
+        return self._cached_pricing
 
-        current_time = time.time()
+    async def _ensure_snapshot(self, force_refresh: bool) -> None:
+        """Make sure a snapshot is loaded, revalidating stale ones in the background.
 
-        # Return cached pricing if recent and not forced
-        if (
-            not force_refresh
-            and self._cached_pricing is not None
-            and (current_time - self._last_load_time) < self.settings.memory_cache_ttl
+        Args:
+            force_refresh: Download and reload inline (explicit refreshes only)
+        """
+        if force_refresh:
+            self._record_refresh_outcome(await self._refresh_pricing())
+            await self._reload_snapshot()
+            return
+
+        if self._last_load_time <= 0:
+            async with self._load_lock:
+                if self._last_load_time <= 0:
+                    # Serve whatever is on disk (or embedded) right away and
+                    # let the background task fetch fresh data if needed
+                    await self._reload_snapshot()
+                    if self.settings.auto_update and not self.cache.is_cache_valid():
+                        self._schedule_revalidation(force=True)
+            return
+
+        self._schedule_revalidation()
+
+    def _schedule_revalidation(self, force: bool = False) -> None:
+        """Start a background revalidation if the snapshot is due for one.
+
+        Args:
+            force: Skip the staleness check (backoff is still respected)
+        """
+        task = self._revalidation_task
+        if task is not None and not task.done():
+            return
+
+        current_time = time.time()
+        if current_time < self._retry_after:
+            return
+        if not force and (
+            current_time - self._last_load_time < self.settings.memory_cache_ttl
+            and current_time - self._last_file_check_time < FILE_CHECK_INTERVAL
         ):
-            # Only check file changes every 30 seconds to reduce I/O
-            if (current_time - self._last_file_check_time) > 30:
-                if self._has_cache_file_changed():
-                    logger.info("cache_file_changed")
-                    # File changed, need to reload
-                    pricing_data, metadata = await self._load_pricing_and_metadata()
-                    self._cached_pricing = pricing_data
-                    self._cached_metadata = metadata
-                    self._last_load_time = current_time
-                    return pricing_data
-                self._last_file_check_time = current_time
-
-            return self._cached_pricing
-
-        # Check if we need to refresh
-        should_refresh = force_refresh or (
-            self.settings.auto_update and not self.cache.is_cache_valid()
+            return
+
+        self._last_file_check_time = current_time
+        self._revalidation_task = asyncio.create_task(
+            self.revalidate(), name="pricing_revalidation"
         )
+        self._revalidation_task.add_done_callback(_log_revalidation_failure)
 
-        if should_refresh:
-            logger.info("pricing_refresh_start")
-            await self._refresh_pricing()
+    async def revalidate(self) -> PricingData | None:
+        """Bring the snapshot up to date with the cache file and the source.
 
-        # Load pricing data
-        pricing_data, metadata = await self._load_pricing_and_metadata()
-        self._cached_metadata = metadata
+        Downloads fresh data when the cache file has expired (and auto update
+        is enabled), and reloads the snapshot when the cache file changed.
+        Used by the background revalidation task and the scheduler.
 
-        # Cache the result
-        self._cached_pricing = pricing_data
-        self._last_load_time = current_time
+        Returns:
+            The current pricing data after revalidation
+        """
+        current_time = time.time()
         self._last_file_check_time = current_time
 
-        return pricing_data
+        downloaded = False
+        if self.settings.auto_update and not self.cache.is_cache_valid():
+            downloaded = await self._refresh_pricing()
+            self._record_refresh_outcome(downloaded)
+
+        if downloaded or self._last_load_time <= 0 or self._has_cache_file_changed():
+            await self._reload_snapshot()
+        else:
+            # Nothing changed, the snapshot is current again
+            self._last_load_time = current_time
+
+        return self._cached_pricing
+
+    def _record_refresh_outcome(self, success: bool) -> None:
+        """Update the retry backoff after a download attempt."""
+        if success:
+            self._consecutive_failures = 0
+            self._retry_after = 0
+            return
+
+        self._consecutive_failures += 1
+        delay = min(
+            self.settings.refresh_retry_max_seconds,
+            self.settings.refresh_retry_base_seconds
+            * 2 ** (self._consecutive_failures - 1),
+        )
+        # Jitter so that several processes don't retry in lockstep
+        delay *= random.uniform(0.5, 1.0)
+        self._retry_after = time.time() + delay
+        logger.warning(
+            "pricing_refresh_backoff",
+            consecutive_failures=self._consecutive_failures,
+            retry_in_seconds=round(delay, 1),
+        )
+
+    async def _reload_snapshot(self) -> None:
+        """Load pricing and metadata from disk into the in-memory snapshot."""
+        pricing_data, metadata = await self._load_pricing_and_metadata()
+        self._cached_pricing = pricing_data
+        self._cached_metadata = metadata
+        self._last_load_time = time.time()
+        self._last_file_check_time = self._last_load_time
 
     def _has_cache_file_changed(self) -> bool:
         """Check if the cache file has changed since last load.
@@ -165,12 +207,21 @@ class PricingUpdater:
             # If we can't check, assume it changed
             return True
 
+    def _remember_cache_file_mtime(self) -> None:
+        """Record the mtime of the cache file the snapshot was loaded from."""
+        try:
+            self._cached_file_mtime = self.cache.cache_file.stat().st_mtime
+        except OSError:
+            self._cached_file_mtime = 0
+
     async def _refresh_pricing(self) -> bool:
         """Refresh pricing data from external source.
 
         Returns:
             True if refresh was successful
         """
+        start_time = time.perf_counter()
+        success = False
         try:
             logger.info("pricing_refresh_start")
 
@@ -185,21 +236,50 @@ class PricingUpdater:
                 logger.error("cache_save_failed")
                 return False
 
-            logger.info("pricing_refresh_completed")
+            success = True
+            logger.info(
+                "pricing_refresh_completed",
+                duration_ms=round((time.perf_counter() - start_time) * 1000, 1),
+            )
             return True
 
         except Exception as e:
             logger.error("pricing_refresh_failed", error=str(e))
             return False
+        finally:
+            _record_metrics(
+                refresh_duration=time.perf_counter() - start_time,
+                refresh_success=success,
+            )
 
     async def _load_pricing_and_metadata(self) -> tuple[PricingData | None, ModelsMetadata | None]:
-        """Load pricing and metadata from available sources.
+        """Load pricing and metadata and publish them to the model registry.
 
         Returns:
             Tuple of (pricing_data, model_metadata)
         """
-        # Try to get data from cache or download
-        raw_data = await self.cache.get_pricing_data()
+        pricing_data, metadata = await self._read_pricing_and_metadata()
+        self._remember_cache_file_mtime()
+
+        # Swap in a registry built from the freshly loaded data
+        from ccproxy.services.model_registry import update_model_registry
+
+        update_model_registry(pricing_data, metadata)
+        if pricing_data is not None:
+            _record_metrics(snapshot_timestamp=self._cached_file_mtime or time.time())
+        return pricing_data, metadata
+
+    async def _read_pricing_and_metadata(self) -> tuple[PricingData | None, ModelsMetadata | None]:
+        """Read pricing and metadata from available sources.
+
+        Returns:
+            Tuple of (pricing_data, model_metadata)
+        """
+        # Read the cache file, even if expired; downloads only happen in
+        # _refresh_pricing so that loading never blocks on the network
+        raw_data = await asyncio.to_thread(
+            self.cache.load_cached_data, allow_stale=True
+        )
 
         if raw_data is not None:
             # Load and validate pricing and metadata using Pydantic
@@ -294,13 +374,10 @@ class PricingUpdater:
         """
         logger.info("pricing_force_refresh_start")
 
-        # Clear cached pricing and metadata
-        self._cached_pricing = None
-        self._cached_metadata = None
-        self._last_load_time = 0
-
-        # Refresh from external source
+        # Refresh from external source; readers keep getting the current
+        # snapshot until the fresh data has been loaded
         success = await self._refresh_pricing()
+        self._record_refresh_outcome(success)
 
         if success:
             # Reload pricing data
@@ -376,3 +453,30 @@ class PricingUpdater:
         except Exception as e:
             logger.error("external_pricing_validation_failed", error=str(e))
             return False
+
+
+def _log_revalidation_failure(task: asyncio.Task[PricingData | None]) -> None:
+    """Log an exception that ended a background revalidation task."""
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error("pricing_revalidation_failed", error=str(error), exc_info=error)
+
+
+def _record_metrics(
+    refresh_duration: float | None = None,
+    refresh_success: bool = False,
+    snapshot_timestamp: float | None = None,
+) -> None:
+    """Export refresh duration and snapshot age, ignoring metrics failures."""
+    try:
+        from ccproxy.observability.metrics import get_metrics
+
+        metrics = get_metrics()
+        if refresh_duration is not None:
+            metrics.record_pricing_refresh(refresh_duration, refresh_success)
+        if snapshot_timestamp is not None:
+            metrics.set_pricing_snapshot_timestamp(snapshot_timestamp)
+    except Exception as e:
+        logger.debug("pricing_metrics_update_failed", error=str(e))
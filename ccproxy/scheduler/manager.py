@@ -7,6 +7,7 @@ from ccproxy.config.settings import Settings
 from .core import Scheduler
 from .registry import register_task
 from .tasks import (
+    LogArchivalTask,
     PoolStatsTask,
     PricingCacheUpdateTask,
     PushgatewayTask,
@@ -163,6 +164,8 @@ def _register_default_tasks(settings: Settings) -> None:
         register_task("version_update_check", VersionUpdateCheckTask)
     if not registry.is_registered("pool_stats"):
         register_task("pool_stats", PoolStatsTask)
+    if not registry.is_registered("log_archival"):
+        register_task("log_archival", LogArchivalTask)
 
 
 async def start_scheduler(settings: Settings) -> Scheduler | None:
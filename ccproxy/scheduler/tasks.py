@@ -460,7 +460,10 @@ class PricingCacheUpdateTask(BaseScheduledTask):
                 refresh_result = await self._pricing_updater.force_refresh()
                 success = bool(refresh_result)
             else:
-                # Regular update check
+                # Regular update check: revalidate here, off the request path
+                # (downloads only if the cache has expired), then read the
+                # resulting snapshot
+                await self._pricing_updater.revalidate()
                 pricing_data = await self._pricing_updater.get_current_pricing(
                     force_refresh=False
                 )
@@ -588,11 +591,30 @@ class PoolStatsTask(BaseScheduledTask):
                     "session_ttl": session_stats.get("session_ttl", 0)
                     if session_stats
                     else 0,
+                    "recycles": session_stats.get("recycles", {})
+                    if session_stats
+                    else {},
+                    "memory_rss_mb": session_stats.get("memory_rss_mb", 0)
+                    if session_stats
+                    else 0,
+                    "memory_rss_by_session_mb": session_stats.get(
+                        "memory_rss_by_session_mb", {}
+                    )
+                    if session_stats
+                    else {},
                 }
                 if session_pool
                 else None,
             )
 
+            if session_pool and session_stats:
+                from ccproxy.observability.metrics import get_metrics
+
+                get_metrics().update_session_pool_metrics(
+                    recycles=session_stats.get("recycles", {}),
+                    process_rss_bytes=session_pool.session_rss_bytes,
+                )
+
             return True
 
         except Exception as e:
@@ -769,3 +791,62 @@ class VersionUpdateCheckTask(BaseScheduledTask):
                 error_type=type(e).__name__,
             )
             return False
+
+
+class LogArchivalTask(BaseScheduledTask):
+    """Task for archiving old access logs to day-partitioned Parquet files."""
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        enabled: bool = True,
+        storage: Any | None = None,
+        archive_dir: str | None = None,
+        retention_days: int = 30,
+    ):
+        """
+        Initialize log archival task.
+
+        Args:
+            name: Task name
+            interval_seconds: Interval between archival runs
+            enabled: Whether task is enabled
+            storage: Injected log storage instance
+            archive_dir: Directory for archived Parquet partitions
+            retention_days: Days of logs kept in the hot table
+        """
+        super().__init__(
+            name=name,
+            interval_seconds=interval_seconds,
+            enabled=enabled,
+        )
+        self._storage = storage
+        self._archive_dir = archive_dir
+        self.retention_days = retention_days
+
+    async def run(self) -> bool:
+        """Archive access logs older than the retention window."""
+        if not self._storage or not self._archive_dir:
+            return True  # Nothing to archive without storage
+
+        try:
+            archived = await self._storage.archive_old_logs(
+                self._archive_dir, self.retention_days
+            )
+            logger.debug(
+                "log_archival_completed",
+                task_name=self.name,
+                archived_rows=archived,
+                retention_days=self.retention_days,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "log_archival_task_error",
+                task_name=self.name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
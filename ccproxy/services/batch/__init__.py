@@ -0,0 +1,39 @@
+"""Local message batch processing.
+
+Batches are accepted through the /v1/messages/batches (Anthropic) and
+/v1/batches (OpenAI) endpoints, persisted to disk, and executed in the
+background through ProxyService with bounded concurrency and rate-limit
+aware backoff.
+"""
+
+from .executor import (
+    BatchItemExecutor,
+    ExecutionOutcome,
+    ProxyServiceBatchExecutor,
+    create_proxy_batch_executor,
+)
+from .models import (
+    BatchItem,
+    BatchRecord,
+    BatchRequestCounts,
+    BatchResult,
+    BatchThroughput,
+)
+from .service import BatchNotFoundError, BatchService
+from .store import BatchStore
+
+
+__all__ = [
+    "BatchItem",
+    "BatchItemExecutor",
+    "BatchNotFoundError",
+    "BatchRecord",
+    "BatchRequestCounts",
+    "BatchResult",
+    "BatchService",
+    "BatchStore",
+    "BatchThroughput",
+    "ExecutionOutcome",
+    "ProxyServiceBatchExecutor",
+    "create_proxy_batch_executor",
+]
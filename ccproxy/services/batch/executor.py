@@ -0,0 +1,145 @@
+"""Executors that run individual batch items against an upstream service."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import structlog
+from fastapi.responses import StreamingResponse
+
+from ccproxy.adapters.openai.adapter import OpenAIAdapter
+from ccproxy.services.proxy_service import ProxyService
+
+from .models import BatchFormat
+
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class ExecutionOutcome:
+    """Raw outcome of executing one batch item."""
+
+    status_code: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: dict[str, Any] | None = None
+
+
+class BatchItemExecutor(Protocol):
+    """Protocol for executing a single batch item."""
+
+    async def execute(
+        self, batch_format: BatchFormat, params: dict[str, Any]
+    ) -> ExecutionOutcome:
+        """Execute one non-streaming request and return its outcome."""
+        ...
+
+
+class ProxyServiceBatchExecutor:
+    """Execute batch items through ProxyService, exactly like /api requests.
+
+    Items go through the same authentication, request transformation,
+    system prompt injection and access logging as interactive traffic.
+    """
+
+    _PATHS: dict[str, str] = {
+        "anthropic": "/v1/messages",
+        "openai": "/v1/chat/completions",
+    }
+
+    def __init__(self, proxy_service: ProxyService, timeout: float = 240.0) -> None:
+        """Initialize the executor.
+
+        Args:
+            proxy_service: Long-lived proxy service used for every item
+            timeout: Upstream timeout per item in seconds
+        """
+        self.proxy_service = proxy_service
+        self.timeout = timeout
+        self._openai_adapter = OpenAIAdapter()
+
+    async def close(self) -> None:
+        """Close the HTTP client owned by the proxy service."""
+        await self.proxy_service.proxy_client.close()
+
+    async def execute(
+        self, batch_format: BatchFormat, params: dict[str, Any]
+    ) -> ExecutionOutcome:
+        """Execute one batch item through the proxy pipeline."""
+        # Batches are always collected, never streamed to the client
+        body = json.dumps({**params, "stream": False}).encode("utf-8")
+
+        response = await self.proxy_service.handle_request(
+            method="POST",
+            path=self._PATHS[batch_format],
+            headers={"content-type": "application/json"},
+            body=body,
+            timeout=self.timeout,
+        )
+
+        if isinstance(response, StreamingResponse):
+            return ExecutionOutcome(
+                status_code=500,
+                body={
+                    "type": "error",
+                    "error": {
+                        "type": "api_error",
+                        "message": "Unexpected streaming response for batch item",
+                    },
+                },
+            )
+
+        status_code, headers, response_body = response
+        try:
+            data = json.loads(response_body.decode("utf-8")) if response_body else None
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            data = {
+                "type": "error",
+                "error": {
+                    "type": "api_error",
+                    "message": response_body[:500].decode("utf-8", errors="replace"),
+                },
+            }
+
+        # The /api/v1/chat/completions route converts successful Anthropic
+        # responses to OpenAI format after ProxyService; mirror that here.
+        if batch_format == "openai" and status_code < 400 and isinstance(data, dict):
+            data = self._openai_adapter.adapt_response(data)
+
+        return ExecutionOutcome(
+            status_code=status_code,
+            headers={k.lower(): v for k, v in headers.items()},
+            body=data if isinstance(data, dict) else None,
+        )
+
+
+def create_proxy_batch_executor(
+    settings: Any, app_state: Any
+) -> ProxyServiceBatchExecutor:
+    """Create a ProxyService-backed executor with its own HTTP client.
+
+    The caller owns the executor and must ``close()`` it on shutdown.
+
+    Args:
+        settings: Application settings
+        app_state: FastAPI app state (for detection data access)
+
+    Returns:
+        Executor bound to a long-lived ProxyService
+    """
+    from ccproxy.core.http import BaseProxyClient, HTTPXClient
+    from ccproxy.observability import get_metrics
+    from ccproxy.services.credentials.manager import CredentialsManager
+
+    proxy_service = ProxyService(
+        proxy_client=BaseProxyClient(HTTPXClient()),
+        credentials_manager=CredentialsManager(config=settings.auth),
+        settings=settings,
+        proxy_mode="full",
+        target_base_url=settings.reverse_proxy.target_url,
+        metrics=get_metrics(),
+        app_state=app_state,
+    )
+    return ProxyServiceBatchExecutor(
+        proxy_service, timeout=settings.reverse_proxy.timeout
+    )
@@ -0,0 +1,147 @@
+"""Data models for locally executed message batches."""
+
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+BatchFormat = Literal["anthropic", "openai"]
+ProcessingStatus = Literal["in_progress", "canceling", "ended"]
+ResultType = Literal["succeeded", "errored", "canceled", "expired"]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+class BatchItem(BaseModel):
+    """A single request inside a batch."""
+
+    custom_id: str = Field(..., min_length=1, max_length=64)
+    params: dict[str, Any]
+
+
+class BatchRequestCounts(BaseModel):
+    """Per-outcome item counters, mirroring the Anthropic batch schema."""
+
+    processing: int = 0
+    succeeded: int = 0
+    errored: int = 0
+    canceled: int = 0
+    expired: int = 0
+
+    @property
+    def completed(self) -> int:
+        """Number of items that reached a terminal state."""
+        return self.succeeded + self.errored + self.canceled + self.expired
+
+
+class BatchThroughput(BaseModel):
+    """Throughput statistics accumulated while a batch executes."""
+
+    elapsed_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    items_per_second: float = 0.0
+    tokens_per_second: float = 0.0
+    rate_limit_pauses: int = 0
+    retries: int = 0
+
+
+class BatchRecord(BaseModel):
+    """Persisted batch manifest."""
+
+    id: str
+    format: BatchFormat = "anthropic"
+    processing_status: ProcessingStatus = "in_progress"
+    request_counts: BatchRequestCounts = Field(default_factory=BatchRequestCounts)
+    total_requests: int = 0
+    created_at: datetime = Field(default_factory=_utcnow)
+    ended_at: datetime | None = None
+    cancel_initiated_at: datetime | None = None
+    throughput: BatchThroughput = Field(default_factory=BatchThroughput)
+
+    def to_anthropic(self, results_url: str | None = None) -> dict[str, Any]:
+        """Render the batch in the Anthropic Message Batches format."""
+        return {
+            "id": self.id,
+            "type": "message_batch",
+            "processing_status": self.processing_status,
+            "request_counts": self.request_counts.model_dump(),
+            "created_at": self.created_at.isoformat(),
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "cancel_initiated_at": self.cancel_initiated_at.isoformat()
+            if self.cancel_initiated_at
+            else None,
+            "expires_at": None,
+            "archived_at": None,
+            "results_url": results_url if self.processing_status == "ended" else None,
+            "throughput": self.throughput.model_dump(),
+        }
+
+    def to_openai(self) -> dict[str, Any]:
+        """Render the batch in the OpenAI Batch object format."""
+        counts = self.request_counts
+        if self.processing_status == "in_progress":
+            status = "in_progress"
+        elif self.processing_status == "canceling":
+            status = "cancelling"
+        elif self.cancel_initiated_at is not None:
+            status = "cancelled"
+        else:
+            status = "completed"
+
+        return {
+            "id": self.id,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "status": status,
+            "created_at": int(self.created_at.timestamp()),
+            "completed_at": int(self.ended_at.timestamp())
+            if self.ended_at and status == "completed"
+            else None,
+            "cancelled_at": int(self.ended_at.timestamp())
+            if self.ended_at and status == "cancelled"
+            else None,
+            "output_file_id": f"{self.id}_output" if self.ended_at else None,
+            "request_counts": {
+                "total": self.total_requests,
+                "completed": counts.succeeded,
+                "failed": counts.errored + counts.canceled + counts.expired,
+            },
+            "metadata": {"throughput": self.throughput.model_dump()},
+        }
+
+
+class BatchResult(BaseModel):
+    """Outcome of a single batch item, written as one JSONL line."""
+
+    custom_id: str
+    type: ResultType
+    status_code: int | None = None
+    body: dict[str, Any] | None = None
+    error: dict[str, Any] | None = None
+
+    def to_anthropic(self) -> dict[str, Any]:
+        """Render the result in the Anthropic batch results format."""
+        result: dict[str, Any] = {"type": self.type}
+        if self.type == "succeeded":
+            result["message"] = self.body
+        elif self.type == "errored":
+            result["error"] = self.error or self.body
+        return {"custom_id": self.custom_id, "result": result}
+
+    def to_openai(self) -> dict[str, Any]:
+        """Render the result in the OpenAI batch output format."""
+        response = None
+        if self.type == "succeeded":
+            response = {"status_code": self.status_code or 200, "body": self.body}
+        return {
+            "id": f"batch_req_{self.custom_id}",
+            "custom_id": self.custom_id,
+            "response": response,
+            "error": None
+            if self.type == "succeeded"
+            else (self.error or {"code": self.type, "message": self.type}),
+        }
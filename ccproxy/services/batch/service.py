@@ -0,0 +1,503 @@
+"""Concurrent execution engine for local message batches."""
+
+import asyncio
+import contextlib
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import structlog
+
+from ccproxy.config.batch import BatchSettings
+
+from .executor import BatchItemExecutor, ExecutionOutcome
+from .models import BatchFormat, BatchItem, BatchRecord, BatchResult
+from .store import BatchStore
+
+
+logger = structlog.get_logger(__name__)
+
+# Upstream statuses that mean "slow down and try again" rather than "failed"
+RETRYABLE_STATUS_CODES = {429, 503, 529}
+
+
+class BatchNotFoundError(KeyError):
+    """Raised when a batch id is unknown."""
+
+
+class RateLimitGate:
+    """Shared pause gate for all workers of a batch.
+
+    When any worker sees a rate limit, the gate closes until the advertised
+    reset time so the remaining workers stop hammering the upstream.
+    """
+
+    def __init__(self) -> None:
+        self._open = asyncio.Event()
+        self._open.set()
+        self._resume_at = 0.0
+        self._reopen_task: asyncio.Task[None] | None = None
+        self.pauses = 0
+
+    async def wait(self) -> None:
+        """Block while the gate is closed."""
+        await self._open.wait()
+
+    def pause(self, seconds: float) -> None:
+        """Close the gate for at least ``seconds``."""
+        resume_at = time.monotonic() + seconds
+        if resume_at <= self._resume_at:
+            return
+        self._resume_at = resume_at
+        if self._open.is_set():
+            self.pauses += 1
+            self._open.clear()
+        if self._reopen_task is None or self._reopen_task.done():
+            self._reopen_task = asyncio.create_task(self._reopen())
+
+    async def _reopen(self) -> None:
+        while (delay := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        self._open.set()
+
+    def close(self) -> None:
+        """Cancel the pending reopen timer."""
+        if self._reopen_task and not self._reopen_task.done():
+            self._reopen_task.cancel()
+        self._open.set()
+
+
+def _parse_reset_delay(headers: dict[str, str]) -> float | None:
+    """Extract a pause duration from rate limit response headers."""
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            with contextlib.suppress(TypeError, ValueError):
+                reset = parsedate_to_datetime(retry_after)
+                return max(0.0, (reset - datetime.now(UTC)).total_seconds())
+
+    for header in (
+        "anthropic-ratelimit-requests-reset",
+        "anthropic-ratelimit-tokens-reset",
+        "anthropic-ratelimit-input-tokens-reset",
+        "anthropic-ratelimit-output-tokens-reset",
+    ):
+        value = headers.get(header)
+        if not value:
+            continue
+        with contextlib.suppress(ValueError):
+            reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            return max(0.0, (reset - datetime.now(UTC)).total_seconds())
+
+    return None
+
+
+def _extract_usage(body: dict[str, Any] | None) -> tuple[int, int]:
+    """Extract (input, output) token counts from Anthropic or OpenAI usage."""
+    if not body:
+        return 0, 0
+    usage = body.get("usage") or {}
+    input_tokens = usage.get("input_tokens", usage.get("prompt_tokens")) or 0
+    output_tokens = usage.get("output_tokens", usage.get("completion_tokens")) or 0
+    return int(input_tokens), int(output_tokens)
+
+
+class _BatchRun:
+    """Mutable state for one executing batch."""
+
+    def __init__(self, record: BatchRecord) -> None:
+        self.record = record
+        self.gate = RateLimitGate()
+        self.cancel_requested = record.processing_status == "canceling"
+        self.started_at = time.perf_counter()
+        self.elapsed_before = record.throughput.elapsed_seconds
+        self.since_checkpoint = 0
+        self.task: asyncio.Task[None] | None = None
+
+    def update_throughput(self) -> None:
+        throughput = self.record.throughput
+        throughput.elapsed_seconds = self.elapsed_before + (
+            time.perf_counter() - self.started_at
+        )
+        throughput.rate_limit_pauses += self.gate.pauses
+        self.gate.pauses = 0
+        elapsed = throughput.elapsed_seconds
+        if elapsed > 0:
+            throughput.items_per_second = round(
+                self.record.request_counts.completed / elapsed, 3
+            )
+            throughput.tokens_per_second = round(
+                (throughput.input_tokens + throughput.output_tokens) / elapsed, 3
+            )
+
+
+class BatchService:
+    """Accept, persist and execute message batches with bounded concurrency."""
+
+    def __init__(
+        self,
+        settings: BatchSettings,
+        executor: BatchItemExecutor,
+        store: BatchStore | None = None,
+    ) -> None:
+        """Initialize the batch service.
+
+        Args:
+            settings: Batch configuration
+            executor: Executor used to run each batch item
+            store: Batch persistence (defaults to files under settings.storage_dir)
+        """
+        self.settings = settings
+        self.executor = executor
+        self.store = store or BatchStore(settings.storage_dir)
+        self._runs: dict[str, _BatchRun] = {}
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Resume batches that were in progress when the server last stopped."""
+        self._stopping = False
+        if not self.settings.resume_on_startup:
+            return
+
+        for record in await self.store.list_batches():
+            if record.processing_status != "ended":
+                logger.info(
+                    "batch_resuming",
+                    batch_id=record.id,
+                    completed=record.request_counts.completed,
+                    total=record.total_requests,
+                )
+                self._launch(record)
+
+    async def stop(self) -> None:
+        """Stop all running batches, checkpointing them for resumption."""
+        self._stopping = True
+        runs = list(self._runs.values())
+        for run in runs:
+            if run.task and not run.task.done():
+                run.task.cancel()
+        for run in runs:
+            if run.task:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await run.task
+
+    async def create_batch(
+        self, items: list[BatchItem], batch_format: BatchFormat = "anthropic"
+    ) -> BatchRecord:
+        """Persist a new batch and start executing it in the background.
+
+        Raises:
+            ValueError: If the batch is empty, too large or has duplicate ids
+        """
+        if not items:
+            raise ValueError("Batch must contain at least one request")
+        if len(items) > self.settings.max_requests_per_batch:
+            raise ValueError(
+                f"Batch exceeds the maximum of {self.settings.max_requests_per_batch} requests"
+            )
+        custom_ids = [item.custom_id for item in items]
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("custom_id values must be unique within a batch")
+
+        prefix = "msgbatch" if batch_format == "anthropic" else "batch"
+        record = BatchRecord(
+            id=f"{prefix}_{uuid.uuid4().hex[:24]}",
+            format=batch_format,
+            total_requests=len(items),
+        )
+        record.request_counts.processing = len(items)
+
+        await self.store.create(record, items)
+        logger.info(
+            "batch_created",
+            batch_id=record.id,
+            format=batch_format,
+            total_requests=len(items),
+        )
+        self._launch(record, items)
+        return record
+
+    async def get_batch(self, batch_id: str) -> BatchRecord:
+        """Return the latest state of a batch.
+
+        Raises:
+            BatchNotFoundError: If the batch does not exist
+        """
+        run = self._runs.get(batch_id)
+        if run is not None:
+            run.update_throughput()
+            return run.record
+        record = await self.store.load(batch_id)
+        if record is None:
+            raise BatchNotFoundError(batch_id)
+        return record
+
+    async def list_batches(self, limit: int = 20) -> list[BatchRecord]:
+        """List batches, newest first, with live state for running ones."""
+        records = await self.store.list_batches()
+        result = []
+        for record in records[:limit]:
+            run = self._runs.get(record.id)
+            if run is not None:
+                run.update_throughput()
+                record = run.record
+            result.append(record)
+        return result
+
+    async def cancel_batch(self, batch_id: str) -> BatchRecord:
+        """Request cancellation; pending items are recorded as canceled.
+
+        A batch with no running task (for example after a restart without
+        resumption) is finished immediately instead of staying ``canceling``.
+        """
+        record = await self.get_batch(batch_id)
+        run = self._runs.get(batch_id)
+        if record.processing_status == "ended" or (
+            record.processing_status == "canceling" and run is not None
+        ):
+            return record
+
+        record.processing_status = "canceling"
+        record.cancel_initiated_at = record.cancel_initiated_at or datetime.now(UTC)
+        await self.store.save(record)
+        logger.info("batch_cancel_requested", batch_id=batch_id)
+        if run is not None:
+            run.cancel_requested = True
+            run.gate.close()
+            return record
+
+        # Nothing executes this batch: mark the remaining items canceled now
+        run = self._launch(record)
+        if run.task is not None:
+            await asyncio.shield(run.task)
+        return run.record
+
+    async def iter_results(self, batch_id: str) -> AsyncIterator[BatchResult]:
+        """Iterate over the results persisted so far.
+
+        Raises:
+            BatchNotFoundError: If the batch does not exist
+        """
+        await self.get_batch(batch_id)
+        async for result in self.store.iter_results(batch_id):
+            yield result
+
+    def _launch(
+        self, record: BatchRecord, items: list[BatchItem] | None = None
+    ) -> _BatchRun:
+        run = _BatchRun(record)
+        self._runs[record.id] = run
+        run.task = asyncio.create_task(
+            self._run_batch(run, items), name=f"batch-{record.id}"
+        )
+        return run
+
+    async def _run_batch(self, run: _BatchRun, items: list[BatchItem] | None) -> None:
+        record = run.record
+        try:
+            if items is None:
+                items = await self.store.load_items(record.id)
+
+            # Rebuild counters from the durable results file so a crash between
+            # checkpoints never double counts or loses an item.
+            completed = await self.store.completed_results(record.id)
+            counts = record.request_counts
+            counts.succeeded = counts.errored = counts.canceled = counts.expired = 0
+            for result_type in completed.values():
+                setattr(counts, result_type, getattr(counts, result_type) + 1)
+            counts.processing = record.total_requests - counts.completed
+
+            queue: asyncio.Queue[BatchItem] = asyncio.Queue()
+            for item in items:
+                if item.custom_id not in completed:
+                    queue.put_nowait(item)
+
+            worker_count = min(self.settings.max_concurrency, max(1, queue.qsize()))
+            workers = [
+                asyncio.create_task(self._worker(run, queue))
+                for _ in range(worker_count)
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+            record.processing_status = "ended"
+            record.ended_at = datetime.now(UTC)
+            run.update_throughput()
+            await self.store.save(record)
+            logger.info(
+                "batch_completed",
+                batch_id=record.id,
+                succeeded=counts.succeeded,
+                errored=counts.errored,
+                canceled=counts.canceled,
+                **record.throughput.model_dump(),
+            )
+        except asyncio.CancelledError:
+            # Server shutdown: checkpoint so the batch resumes on next start
+            run.update_throughput()
+            with contextlib.suppress(Exception):
+                await self.store.save(record)
+            logger.info("batch_suspended", batch_id=record.id)
+            raise
+        except Exception as e:
+            logger.error(
+                "batch_execution_failed",
+                batch_id=record.id,
+                error=str(e),
+                exc_info=True,
+            )
+            await self._fail_batch(run, items, e)
+        finally:
+            run.gate.close()
+            self._runs.pop(record.id, None)
+            if not self._stopping:
+                self.store.forget(record.id)
+
+    async def _fail_batch(
+        self, run: _BatchRun, items: list[BatchItem] | None, error: Exception
+    ) -> None:
+        """End a batch whose execution failed, reporting unrun items as errored."""
+        record = run.record
+        body = {"type": "error", "error": {"type": "api_error", "message": str(error)}}
+        with contextlib.suppress(Exception):
+            if items is None:
+                items = await self.store.load_items(record.id)
+            completed = await self.store.completed_results(record.id)
+            for item in items:
+                if item.custom_id not in completed:
+                    await self._record_result(
+                        run,
+                        BatchResult(
+                            custom_id=item.custom_id,
+                            type="errored",
+                            status_code=500,
+                            body=body,
+                            error=body,
+                        ),
+                    )
+
+        # Whatever could not be recorded above still counts as errored
+        counts = record.request_counts
+        counts.errored += counts.processing
+        counts.processing = 0
+
+        record.processing_status = "ended"
+        record.ended_at = datetime.now(UTC)
+        run.update_throughput()
+        with contextlib.suppress(Exception):
+            await self.store.save(record)
+
+    async def _worker(self, run: _BatchRun, queue: asyncio.Queue[BatchItem]) -> None:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            if run.cancel_requested:
+                result = BatchResult(custom_id=item.custom_id, type="canceled")
+            else:
+                result = await self._execute_item(run, item)
+
+            await self._record_result(run, result)
+
+    async def _execute_item(self, run: _BatchRun, item: BatchItem) -> BatchResult:
+        record = run.record
+        attempt = 0
+        while True:
+            await run.gate.wait()
+            if run.cancel_requested:
+                return BatchResult(custom_id=item.custom_id, type="canceled")
+
+            try:
+                outcome = await self.executor.execute(record.format, item.params)
+            except Exception as e:
+                # Mirror the error envelope the HTTP routes would return
+                logger.warning(
+                    "batch_item_execution_error",
+                    batch_id=record.id,
+                    custom_id=item.custom_id,
+                    error=str(e),
+                )
+                outcome = ExecutionOutcome(
+                    status_code=getattr(e, "status_code", 500),
+                    body={
+                        "type": "error",
+                        "error": {"type": "api_error", "message": str(e)},
+                    },
+                )
+
+            if (
+                outcome.status_code in RETRYABLE_STATUS_CODES
+                and attempt < self.settings.max_retries
+            ):
+                attempt += 1
+                record.throughput.retries += 1
+                delay = _parse_reset_delay(outcome.headers)
+                if delay is None:
+                    delay = self.settings.rate_limit_backoff_seconds * (
+                        2 ** (attempt - 1)
+                    )
+                # Jitter so resumed workers don't stampede the upstream
+                run.gate.pause(delay * (1 + 0.1 * random.random()))
+                logger.info(
+                    "batch_rate_limited",
+                    batch_id=record.id,
+                    custom_id=item.custom_id,
+                    status_code=outcome.status_code,
+                    pause_seconds=round(delay, 3),
+                    attempt=attempt,
+                )
+                continue
+
+            # Proactively pause when the upstream says the window is exhausted
+            if outcome.headers.get("anthropic-ratelimit-requests-remaining") == "0":
+                delay = _parse_reset_delay(outcome.headers)
+                if delay:
+                    run.gate.pause(delay)
+
+            if outcome.status_code < 400:
+                input_tokens, output_tokens = _extract_usage(outcome.body)
+                record.throughput.input_tokens += input_tokens
+                record.throughput.output_tokens += output_tokens
+                return BatchResult(
+                    custom_id=item.custom_id,
+                    type="succeeded",
+                    status_code=outcome.status_code,
+                    body=outcome.body,
+                )
+
+            error = (outcome.body or {}).get("error")
+            return BatchResult(
+                custom_id=item.custom_id,
+                type="errored",
+                status_code=outcome.status_code,
+                body=outcome.body,
+                error={"type": "error", "error": error}
+                if isinstance(error, dict)
+                else None,
+            )
+
+    async def _record_result(self, run: _BatchRun, result: BatchResult) -> None:
+        record = run.record
+        await self.store.append_result(record.id, result)
+
+        counts = record.request_counts
+        setattr(counts, result.type, getattr(counts, result.type) + 1)
+        counts.processing = max(0, counts.processing - 1)
+
+        run.since_checkpoint += 1
+        if run.since_checkpoint >= self.settings.checkpoint_interval:
+            run.since_checkpoint = 0
+            run.update_throughput()
+            await self.store.save(record)
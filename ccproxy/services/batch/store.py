@@ -0,0 +1,200 @@
+"""File-backed persistence for local message batches.
+
+Each batch lives in its own directory::
+
+    <storage_dir>/<batch_id>/
+        manifest.json   # BatchRecord, rewritten atomically on checkpoints
+        requests.jsonl  # one BatchItem per line, written once at creation
+        results.jsonl   # one BatchResult per line, appended as items finish
+
+Results are appended as soon as an item finishes, so the set of custom_ids in
+``results.jsonl`` is the durable checkpoint used to resume a batch after a
+restart.
+"""
+
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+from typing import TextIO
+
+import structlog
+
+from .models import BatchItem, BatchRecord, BatchResult
+
+
+logger = structlog.get_logger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+REQUESTS_FILE = "requests.jsonl"
+RESULTS_FILE = "results.jsonl"
+
+
+class BatchStore:
+    """Persist batch manifests, inputs and results as files."""
+
+    def __init__(self, root: Path | str) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory under which batch directories are created
+        """
+        self.root = Path(root)
+        self._append_locks: dict[str, asyncio.Lock] = {}
+
+    def _batch_dir(self, batch_id: str) -> Path:
+        # Batch ids are generated server side, but never let one escape the root
+        if not batch_id or "/" in batch_id or batch_id.startswith("."):
+            raise KeyError(batch_id)
+        return self.root / batch_id
+
+    async def create(self, record: BatchRecord, items: Iterable[BatchItem]) -> None:
+        """Persist a new batch manifest and its input items."""
+
+        def _write() -> None:
+            batch_dir = self._batch_dir(record.id)
+            batch_dir.mkdir(parents=True, exist_ok=False)
+            with (batch_dir / REQUESTS_FILE).open("w", encoding="utf-8") as f:
+                for item in items:
+                    f.write(item.model_dump_json())
+                    f.write("\n")
+            (batch_dir / RESULTS_FILE).touch()
+            self._write_manifest_sync(record)
+
+        await asyncio.to_thread(_write)
+
+    async def save(self, record: BatchRecord) -> None:
+        """Checkpoint a batch manifest."""
+        await asyncio.to_thread(self._write_manifest_sync, record)
+
+    def _write_manifest_sync(self, record: BatchRecord) -> None:
+        path = self._batch_dir(record.id) / MANIFEST_FILE
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(record.model_dump_json(), encoding="utf-8")
+        # Atomic replace so a crash never leaves a half-written manifest
+        tmp_path.replace(path)
+
+    async def load(self, batch_id: str) -> BatchRecord | None:
+        """Load a batch manifest, or None if the batch does not exist."""
+
+        def _read() -> BatchRecord | None:
+            try:
+                path = self._batch_dir(batch_id) / MANIFEST_FILE
+            except KeyError:
+                return None
+            if not path.exists():
+                return None
+            return BatchRecord.model_validate_json(path.read_text(encoding="utf-8"))
+
+        return await asyncio.to_thread(_read)
+
+    async def list_batches(self) -> list[BatchRecord]:
+        """Load every persisted batch manifest, newest first."""
+
+        def _read_all() -> list[BatchRecord]:
+            if not self.root.exists():
+                return []
+            records = []
+            for manifest in self.root.glob(f"*/{MANIFEST_FILE}"):
+                try:
+                    records.append(
+                        BatchRecord.model_validate_json(
+                            manifest.read_text(encoding="utf-8")
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "batch_manifest_load_failed",
+                        path=str(manifest),
+                        error=str(e),
+                    )
+            records.sort(key=lambda r: r.created_at, reverse=True)
+            return records
+
+        return await asyncio.to_thread(_read_all)
+
+    async def load_items(self, batch_id: str) -> list[BatchItem]:
+        """Load the input items of a batch."""
+
+        def _read() -> list[BatchItem]:
+            path = self._batch_dir(batch_id) / REQUESTS_FILE
+            with path.open(encoding="utf-8") as f:
+                return [
+                    BatchItem.model_validate_json(line) for line in f if line.strip()
+                ]
+
+        return await asyncio.to_thread(_read)
+
+    async def completed_results(self, batch_id: str) -> dict[str, str]:
+        """Return custom_id -> result type for every persisted result."""
+
+        def _read() -> dict[str, str]:
+            path = self._batch_dir(batch_id) / RESULTS_FILE
+            if not path.exists():
+                return {}
+            completed: dict[str, str] = {}
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                        completed[data["custom_id"]] = data["type"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        # A torn final line from a crash; that item is re-run
+                        continue
+            return completed
+
+        return await asyncio.to_thread(_read)
+
+    async def append_result(self, batch_id: str, result: BatchResult) -> None:
+        """Durably append a single item result."""
+        line = result.model_dump_json() + "\n"
+        lock = self._append_locks.setdefault(batch_id, asyncio.Lock())
+
+        def _append() -> None:
+            path = self._batch_dir(batch_id) / RESULTS_FILE
+            with path.open("a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+        async with lock:
+            await asyncio.to_thread(_append)
+
+    async def iter_results(
+        self, batch_id: str, chunk_lines: int = 256
+    ) -> AsyncIterator[BatchResult]:
+        """Iterate over persisted results without loading the whole file."""
+        path = self._batch_dir(batch_id) / RESULTS_FILE
+        if not path.exists():
+            return
+
+        f = await asyncio.to_thread(path.open, "r", encoding="utf-8")
+        try:
+            while True:
+                lines = await asyncio.to_thread(_read_lines, f, chunk_lines)
+                if not lines:
+                    break
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield BatchResult.model_validate_json(line)
+                    except ValueError:
+                        continue
+        finally:
+            await asyncio.to_thread(f.close)
+
+    def forget(self, batch_id: str) -> None:
+        """Drop in-memory bookkeeping for a finished batch."""
+        self._append_locks.pop(batch_id, None)
+
+
+def _read_lines(f: TextIO, count: int) -> list[str]:
+    lines = []
+    for _ in range(count):
+        line = f.readline()
+        if not line:
+            break
+        lines.append(line)
+    return lines
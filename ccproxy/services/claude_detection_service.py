@@ -76,10 +76,34 @@ class ClaudeDetectionService:
         """Get currently cached detection data."""
         return self._cached_data
 
+    def load_latest_cached_data(self) -> ClaudeCacheData:
+        """Load the most recently cached detection data without running the CLI.
+
+        Used to serve requests while detection is refreshed in the background.
+        Falls back to the packaged data when nothing has been cached yet.
+        """
+        cache_files = sorted(
+            self.cache_dir.glob("claude_headers_*.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for cache_file in cache_files:
+            try:
+                with cache_file.open("r") as f:
+                    data = ClaudeCacheData.model_validate(json.load(f))
+            except Exception:
+                continue
+            self._cached_data = data
+            return data
+
+        self._cached_data = self._get_fallback_data()
+        return self._cached_data
+
     async def _get_claude_version(self) -> str:
         """Get Claude CLI version."""
         try:
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["claude", "--version"],
                 capture_output=True,
                 text=True,
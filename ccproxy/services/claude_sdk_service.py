@@ -70,6 +70,7 @@ class ClaudeSDKService:
         self.stream_processor = ClaudeStreamProcessor(
             message_converter=self.message_converter,
             metrics=self.metrics,
+            streaming_settings=settings.claude.sdk_streaming if settings else None,
         )
 
     def _convert_messages_to_sdk_message(
@@ -238,6 +239,13 @@ class ClaudeSDKService:
                     error=str(e),
                 )
 
+        # Partial message events let streaming responses forward text deltas
+        # as the CLI produces them instead of one delta per finished block
+        if stream and (
+            self.settings is None or self.settings.claude.sdk_streaming.partial_messages
+        ):
+            kwargs.setdefault("include_partial_messages", True)
+
         options = self.options_handler.create_options(
             model=model,
             temperature=temperature,
@@ -685,7 +693,15 @@ class ClaudeSDKService:
         # Append streaming chunk as JSON to raw file
         import json
 
-        from ccproxy.utils.simple_request_logger import append_streaming_log
+        from ccproxy.utils.simple_request_logger import (
+            append_streaming_log,
+            should_log_requests,
+        )
+
+        # Token-level streams produce many chunks; skip serializing them
+        # when request logging is off
+        if not should_log_requests():
+            return
 
         chunk_data = json.dumps(chunk, default=str) + "\n"
         await append_streaming_log(
@@ -1,4 +1,9 @@
-"""Service for providing dynamic model information including context windows."""
+"""Service for providing dynamic model information including context windows.
+
+Lookups are answered from the in-memory model registry, which the pricing
+updater rebuilds whenever pricing or model metadata is loaded, so none of the
+lookup methods perform I/O.
+"""
 
 from typing import Any
 
@@ -8,6 +13,7 @@ from ccproxy.config.pricing import PricingSettings
 from ccproxy.pricing.cache import PricingCache
 from ccproxy.pricing.model_metadata import ModelsMetadata
 from ccproxy.pricing.updater import PricingUpdater
+from ccproxy.services.model_registry import ModelRegistry, get_model_registry
 
 logger = get_logger(__name__)
 
@@ -22,45 +28,6 @@ class ModelInfoService:
             pricing_updater: Optional pricing updater instance
         """
         self._updater = pricing_updater
-        self._fallback_context_windows = {
-            # Claude 3.5 models
-            "claude-3-5-sonnet-20241022": 200_000,
-            "claude-3-5-haiku-20241022": 200_000,
-            "claude-3-5-sonnet-20240620": 200_000,
-            # Claude 3 models
-            "claude-3-opus-20240229": 200_000,
-            "claude-3-sonnet-20240229": 200_000,
-            "claude-3-haiku-20240307": 200_000,
-            # Future Claude 4 models (assumed)
-            "claude-opus-4-20250514": 200_000,
-            "claude-sonnet-4-20250514": 200_000,
-            "claude-3-7-sonnet-20250219": 200_000,
-            # OpenAI Response API models (fallback estimates)
-            "gpt-5": 200_000,
-            "gpt-4o": 128_000,
-            "gpt-4o-mini": 128_000,
-            "o1": 64_000,
-            "o1-mini": 64_000,
-            "o1-preview": 64_000,
-            "o3-mini": 64_000,
-        }
-        self._fallback_output_limits = {
-            # Most models default to 4096
-            "claude-3-5-sonnet-20241022": 8192,
-            "claude-3-5-haiku-20241022": 8192,
-            "claude-3-5-sonnet-20240620": 8192,
-            "claude-3-opus-20240229": 4096,
-            "claude-3-sonnet-20240229": 4096,
-            "claude-3-haiku-20240307": 4096,
-            # OpenAI Response API fallbacks
-            "gpt-5": 8192,
-            "gpt-4o": 8192,
-            "gpt-4o-mini": 8192,
-            "o1": 4096,
-            "o1-mini": 4096,
-            "o1-preview": 4096,
-            "o3-mini": 4096,
-        }
     
     @classmethod
     def create_default(cls) -> "ModelInfoService":
@@ -83,6 +50,22 @@ class ModelInfoService:
             return await self._updater.get_current_metadata(force_refresh=force_refresh)
         return None
     
+    async def refresh_registry(self, force_refresh: bool = False) -> ModelRegistry:
+        """Load pricing and metadata so the model registry reflects them.
+
+        Loading goes through the pricing updater, which swaps in a rebuilt
+        registry; without an updater the static registry is used.
+
+        Args:
+            force_refresh: Force refresh from external source
+
+        Returns:
+            The registry now in use
+        """
+        if self._updater:
+            await self._updater.get_current_pricing(force_refresh=force_refresh)
+        return get_model_registry()
+    
     async def get_context_window(self, model_name: str) -> int:
         """Get the context window size for a model.
         
@@ -92,15 +75,7 @@ class ModelInfoService:
         Returns:
             Context window size in tokens
         """
-        # Try to get from dynamic metadata
-        metadata = await self.get_model_metadata()
-        if metadata:
-            model_info = metadata.get(model_name)
-            if model_info:
-                return model_info.max_tokens
-        
-        # Fallback to hardcoded values
-        return self._fallback_context_windows.get(model_name, 200_000)
+        return get_model_registry().context_window(model_name)
     
     async def get_max_output_tokens(self, model_name: str) -> int:
         """Get the maximum output tokens for a model.
@@ -111,15 +86,7 @@ class ModelInfoService:
         Returns:
             Maximum output tokens
         """
-        # Try to get from dynamic metadata
-        metadata = await self.get_model_metadata()
-        if metadata:
-            model_info = metadata.get(model_name)
-            if model_info:
-                return model_info.max_output_tokens
-        
-        # Fallback to hardcoded values
-        return self._fallback_output_limits.get(model_name, 4096)
+        return get_model_registry().max_output_tokens(model_name)
     
     async def get_model_capabilities(self, model_name: str) -> dict[str, Any]:
         """Get capabilities for a model.
@@ -130,29 +97,7 @@ class ModelInfoService:
         Returns:
             Dictionary of model capabilities
         """
-        # Try to get from dynamic metadata
-        metadata = await self.get_model_metadata()
-        if metadata:
-            model_info = metadata.get(model_name)
-            if model_info:
-                return {
-                    "supports_function_calling": model_info.supports_function_calling,
-                    "supports_vision": model_info.supports_vision,
-                    "supports_streaming": model_info.supports_streaming,
-                    "max_tokens": model_info.max_tokens,
-                    "max_output_tokens": model_info.max_output_tokens,
-                    "max_input_tokens": model_info.max_input_tokens,
-                }
-        
-        # Fallback response
-        return {
-            "supports_function_calling": True,  # Most Claude models support this
-            "supports_vision": "vision" in model_name or "claude-3" in model_name,
-            "supports_streaming": True,
-            "max_tokens": self._fallback_context_windows.get(model_name, 200_000),
-            "max_output_tokens": self._fallback_output_limits.get(model_name, 4096),
-            "max_input_tokens": self._fallback_context_windows.get(model_name, 200_000),
-        }
+        return get_model_registry().capabilities(model_name)
     
     async def validate_request_tokens(
         self, model_name: str, input_tokens: int, max_output_tokens: int | None = None
@@ -192,15 +137,7 @@ class ModelInfoService:
         Returns:
             List of available model names
         """
-        try:
-            metadata = await self.get_model_metadata()
-            if metadata:
-                return metadata.model_names()
-        except Exception as e:
-            logger.warning("failed_to_get_available_models", error=str(e))
-        
-        # Return fallback list
-        return list(self._fallback_context_windows.keys())
+        return get_model_registry().available_models
 
     async def get_default_model(self) -> str:
         """Get the default model name.
@@ -0,0 +1,430 @@
+"""In-memory registry of everything the proxy knows about models.
+
+Alias resolution, context and output limits, capability flags, pricing rates
+and provider routing used to be looked up from several modules, some of them
+re-reading pricing data or awaiting the pricing updater on every request. The
+registry gathers them into one immutable snapshot built at startup and rebuilt
+whenever pricing or model metadata is (re)loaded. Lookups are plain dict hits,
+with unregistered names falling back to their model family; a refresh builds a
+new snapshot and swaps the module-level reference, so readers never observe a
+partially updated registry.
+
+The snapshot also carries the pre-rendered ``/v1/models`` response body and
+its ETag.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from ccproxy.utils.model_mapping import MODEL_MAPPING, map_model_to_claude
+
+
+if TYPE_CHECKING:
+    from ccproxy.pricing.model_metadata import ModelsMetadata
+    from ccproxy.pricing.models import PricingData
+
+
+logger = structlog.get_logger(__name__)
+
+
+DEFAULT_CONTEXT_WINDOW = 200_000
+DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+# Limits used when no model metadata has been loaded
+FALLBACK_CONTEXT_WINDOWS: dict[str, int] = {
+    # Claude 3.5 models
+    "claude-3-5-sonnet-20241022": 200_000,
+    "claude-3-5-haiku-20241022": 200_000,
+    "claude-3-5-sonnet-20240620": 200_000,
+    # Claude 3 models
+    "claude-3-opus-20240229": 200_000,
+    "claude-3-sonnet-20240229": 200_000,
+    "claude-3-haiku-20240307": 200_000,
+    # Future Claude 4 models (assumed)
+    "claude-opus-4-20250514": 200_000,
+    "claude-sonnet-4-20250514": 200_000,
+    "claude-3-7-sonnet-20250219": 200_000,
+    # OpenAI Response API models (fallback estimates)
+    "gpt-5": 200_000,
+    "gpt-4o": 128_000,
+    "gpt-4o-mini": 128_000,
+    "o1": 64_000,
+    "o1-mini": 64_000,
+    "o1-preview": 64_000,
+    "o3-mini": 64_000,
+}
+
+FALLBACK_OUTPUT_LIMITS: dict[str, int] = {
+    # Most models default to 4096
+    "claude-3-5-sonnet-20241022": 8192,
+    "claude-3-5-haiku-20241022": 8192,
+    "claude-3-5-sonnet-20240620": 8192,
+    "claude-3-opus-20240229": 4096,
+    "claude-3-sonnet-20240229": 4096,
+    "claude-3-haiku-20240307": 4096,
+    # OpenAI Response API fallbacks
+    "gpt-5": 8192,
+    "gpt-4o": 8192,
+    "gpt-4o-mini": 8192,
+    "o1": 4096,
+    "o1-mini": 4096,
+    "o1-preview": 4096,
+    "o3-mini": 4096,
+}
+
+_RESPONSE_API_PREFIXES = ("gpt-", "o1", "o3")
+_OPENAI_PREFIXES = (*_RESPONSE_API_PREFIXES, "text-davinci")
+
+# Snapshot suffix of dated Claude model names (claude-sonnet-4-20250514)
+_DATE_SUFFIX = re.compile(r"-\d{8}$")
+
+
+def is_response_api_model_name(model_name: str | None) -> bool:
+    """Check whether a model name belongs to the OpenAI Response API family."""
+    if not model_name:
+        return False
+    return model_name.lower().startswith(_RESPONSE_API_PREFIXES)
+
+
+def provider_for_model_name(model_name: str) -> str:
+    """Guess the provider of a model that has no registry entry."""
+    return "openai" if model_name.lower().startswith(_OPENAI_PREFIXES) else "anthropic"
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRates:
+    """Pricing rates in USD per 1M tokens."""
+
+    input: float
+    output: float
+    cache_read: float
+    cache_write: float
+
+    def costs(
+        self,
+        tokens_input: int | None = None,
+        tokens_output: int | None = None,
+        cache_read_tokens: int | None = None,
+        cache_write_tokens: int | None = None,
+    ) -> tuple[float, float, float, float]:
+        """Return (input, output, cache_read, cache_write) costs in USD."""
+        return (
+            ((tokens_input or 0) / 1_000_000) * self.input,
+            ((tokens_output or 0) / 1_000_000) * self.output,
+            ((cache_read_tokens or 0) / 1_000_000) * self.cache_read,
+            ((cache_write_tokens or 0) / 1_000_000) * self.cache_write,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ModelEntry:
+    """Everything known about a single model."""
+
+    id: str
+    provider: str
+    context_window: int
+    max_input_tokens: int
+    max_output_tokens: int
+    supports_function_calling: bool = True
+    supports_vision: bool = False
+    supports_streaming: bool = True
+    rates: ModelRates | None = None
+
+    def capabilities(self) -> dict[str, Any]:
+        """Return the capabilities in the ModelInfoService format."""
+        return {
+            "supports_function_calling": self.supports_function_calling,
+            "supports_vision": self.supports_vision,
+            "supports_streaming": self.supports_streaming,
+            "max_tokens": self.context_window,
+            "max_output_tokens": self.max_output_tokens,
+            "max_input_tokens": self.max_input_tokens,
+        }
+
+
+def _fallback_entry(model_name: str, rates: ModelRates | None = None) -> ModelEntry:
+    """Build an entry from the static fallback limits."""
+    context_window = FALLBACK_CONTEXT_WINDOWS.get(model_name, DEFAULT_CONTEXT_WINDOW)
+    return ModelEntry(
+        id=model_name,
+        provider=provider_for_model_name(model_name),
+        context_window=context_window,
+        max_input_tokens=context_window,
+        max_output_tokens=FALLBACK_OUTPUT_LIMITS.get(
+            model_name, DEFAULT_MAX_OUTPUT_TOKENS
+        ),
+        # Most Claude models support function calling
+        supports_function_calling=True,
+        supports_vision="vision" in model_name or "claude-3" in model_name,
+        supports_streaming=True,
+        rates=rates,
+    )
+
+
+class ModelRegistry:
+    """Immutable snapshot of model aliases, limits, capabilities and pricing."""
+
+    __slots__ = (
+        "_entries",
+        "_families",
+        "_aliases",
+        "_available_models",
+        "_response_api_models",
+        "has_pricing",
+        "has_metadata",
+        "models_body",
+        "etag",
+    )
+
+    def __init__(
+        self,
+        entries: dict[str, ModelEntry],
+        available_models: Iterable[str],
+        models_list: dict[str, Any],
+        aliases: dict[str, str] | None = None,
+        has_pricing: bool = False,
+        has_metadata: bool = False,
+    ) -> None:
+        """Initialize the registry snapshot.
+
+        Args:
+            entries: Model entries keyed by model name
+            available_models: Model names reported as available
+            models_list: ``/v1/models`` response payload
+            aliases: Alias to canonical model name mapping
+            has_pricing: Whether entries carry pricing rates
+            has_metadata: Whether entries were built from model metadata
+        """
+        self._entries = entries
+        # Undated family name -> latest dated snapshot, for prefix lookups
+        self._families = {
+            _DATE_SUFFIX.sub("", name): name
+            for name in sorted(entries)
+            if _DATE_SUFFIX.search(name)
+        }
+        self._aliases = dict(MODEL_MAPPING if aliases is None else aliases)
+        self._available_models = tuple(available_models)
+        self._response_api_models = frozenset(
+            m for m in self._available_models if is_response_api_model_name(m)
+        )
+        self.has_pricing = has_pricing
+        self.has_metadata = has_metadata
+        self.models_body = json.dumps(models_list, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        self.etag = f'"{hashlib.blake2b(self.models_body, digest_size=16).hexdigest()}"'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, model_name: object) -> bool:
+        return model_name in self._entries
+
+    @property
+    def available_models(self) -> list[str]:
+        """Model names reported as available."""
+        return list(self._available_models)
+
+    @property
+    def response_api_models(self) -> frozenset[str]:
+        """Available models that belong to the OpenAI Response API family."""
+        return self._response_api_models
+
+    def _resolve(self, model_name: str, aliases: bool = True) -> ModelEntry | None:
+        """Find the entry for a model name, its model family or its alias.
+
+        Names that are not registered are matched against the undated family
+        names of registered snapshots, dropping trailing ``-`` segments, so
+        ``claude-opus-4-1-20250805`` or ``gpt-4o-2024-08-06`` resolve to the
+        closest known model.
+        """
+        name = _DATE_SUFFIX.sub("", model_name)
+        entry = self._entries.get(model_name)
+        while entry is None and name:
+            entry = self._entries.get(name)
+            if entry is None and name in self._families:
+                entry = self._entries[self._families[name]]
+            name = name.rpartition("-")[0]
+        if entry is None and aliases and model_name in self._aliases:
+            entry = self._entries.get(self._aliases[model_name])
+        return entry
+
+    def is_known(self, model_name: str) -> bool:
+        """Check whether a name is a registered model, alias or dated variant."""
+        return model_name in self._aliases or self._resolve(model_name) is not None
+
+    def canonical_name(self, model_name: str) -> str:
+        """Resolve an alias or OpenAI model name to its canonical Claude name."""
+        return self._aliases.get(model_name) or map_model_to_claude(model_name)
+
+    def get(self, model_name: str) -> ModelEntry | None:
+        """Get the entry for a model, trying its family then its canonical name."""
+        entry = self._resolve(model_name)
+        if entry is None:
+            entry = self._entries.get(self.canonical_name(model_name))
+        return entry
+
+    def context_window(self, model_name: str) -> int:
+        """Get the context window size in tokens."""
+        entry = self._resolve(model_name)
+        return entry.context_window if entry else DEFAULT_CONTEXT_WINDOW
+
+    def max_output_tokens(self, model_name: str) -> int:
+        """Get the maximum output tokens."""
+        entry = self._resolve(model_name)
+        return entry.max_output_tokens if entry else DEFAULT_MAX_OUTPUT_TOKENS
+
+    def capabilities(self, model_name: str) -> dict[str, Any]:
+        """Get model capabilities in the ModelInfoService format."""
+        entry = self._resolve(model_name) or _fallback_entry(model_name)
+        return entry.capabilities()
+
+    def rates(self, model_name: str) -> ModelRates | None:
+        """Get pricing rates for a model, its family or its canonical name."""
+        entry = self._resolve(model_name)
+        if entry is not None and entry.rates is not None:
+            return entry.rates
+        entry = self._entries.get(self.canonical_name(model_name))
+        return entry.rates if entry else None
+
+    def provider(self, model_name: str) -> str:
+        """Get the provider a model name belongs to.
+
+        Aliases are not followed: an OpenAI name mapped to a Claude model
+        still identifies an OpenAI-format request.
+        """
+        entry = self._resolve(model_name, aliases=False)
+        if entry is not None:
+            return entry.provider
+        return provider_for_model_name(model_name)
+
+
+def _render_models_list(
+    claude_models: list[str] | None, openai_models: list[str] | None
+) -> dict[str, Any]:
+    """Build the ``/v1/models`` payload."""
+    from ccproxy.utils.models_provider import (
+        build_anthropic_model_entries,
+        build_openai_model_entries,
+    )
+
+    return {
+        "data": build_anthropic_model_entries(claude_models)
+        + build_openai_model_entries(openai_models),
+        "has_more": False,
+        "object": "list",
+    }
+
+
+def build_model_registry(
+    pricing: PricingData | None = None,
+    metadata: ModelsMetadata | None = None,
+) -> ModelRegistry:
+    """Build a registry snapshot from pricing data and model metadata.
+
+    Args:
+        pricing: Loaded pricing data, if any
+        metadata: Loaded model metadata, if any
+
+    Returns:
+        New registry snapshot
+    """
+    rates: dict[str, ModelRates] = {}
+    if pricing is not None:
+        for model_name, model_pricing in pricing.items():
+            rates[model_name] = ModelRates(
+                input=float(model_pricing.input),
+                output=float(model_pricing.output),
+                cache_read=float(model_pricing.cache_read),
+                cache_write=float(model_pricing.cache_write),
+            )
+
+    entries: dict[str, ModelEntry] = {
+        name: _fallback_entry(name, rates.get(name))
+        for name in (*FALLBACK_CONTEXT_WINDOWS, *rates)
+    }
+
+    if metadata is not None:
+        for name, info in metadata.models.items():
+            entries[name] = ModelEntry(
+                id=name,
+                provider=provider_for_model_name(name),
+                context_window=info.max_tokens,
+                max_input_tokens=info.max_input_tokens,
+                max_output_tokens=info.max_output_tokens,
+                supports_function_calling=info.supports_function_calling,
+                supports_vision=info.supports_vision,
+                supports_streaming=info.supports_streaming,
+                rates=rates.get(name),
+            )
+        available_models = metadata.model_names()
+    else:
+        available_models = list(FALLBACK_CONTEXT_WINDOWS)
+
+    # Without metadata the static model lists are served
+    claude_models: list[str] | None = None
+    openai_models: list[str] | None = None
+    if metadata is not None:
+        claude_models = [m for m in available_models if m.startswith("claude-")]
+        openai_models = [m for m in available_models if is_response_api_model_name(m)]
+    models_list = _render_models_list(claude_models or None, openai_models or None)
+
+    return ModelRegistry(
+        entries=entries,
+        available_models=available_models,
+        models_list=models_list,
+        has_pricing=bool(rates),
+        has_metadata=metadata is not None,
+    )
+
+
+# Global snapshot, replaced as a whole on refresh
+_model_registry: ModelRegistry | None = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the current registry snapshot, building a static one if needed."""
+    global _model_registry
+    registry = _model_registry
+    if registry is None:
+        registry = _model_registry = build_model_registry()
+    return registry
+
+
+def set_model_registry(registry: ModelRegistry | None) -> None:
+    """Replace the current registry snapshot (None resets to the static one)."""
+    global _model_registry
+    _model_registry = registry
+
+
+def update_model_registry(
+    pricing: PricingData | None, metadata: ModelsMetadata | None
+) -> ModelRegistry:
+    """Rebuild the registry from fresh data and swap it in.
+
+    Args:
+        pricing: Loaded pricing data, if any
+        metadata: Loaded model metadata, if any
+
+    Returns:
+        The registry now in use
+    """
+    registry = build_model_registry(pricing, metadata)
+    previous = _model_registry
+    set_model_registry(registry)
+    logger.debug(
+        "model_registry_updated",
+        model_count=len(registry),
+        has_pricing=registry.has_pricing,
+        has_metadata=registry.has_metadata,
+        models_changed=previous is None or previous.etag != registry.etag,
+    )
+    return registry
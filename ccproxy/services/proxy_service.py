@@ -3,6 +3,7 @@
 
 import asyncio
 import json
+import logging
 import os
 import random
 import time
@@ -24,7 +25,8 @@ from ccproxy.core.http_transformers import (
     HTTPRequestTransformer,
     HTTPResponseTransformer,
 )
-from ccproxy.services.model_info_service import get_model_info_service
+from ccproxy.core.logging import is_enabled_for
+from ccproxy.services.model_registry import get_model_registry
 from ccproxy.auth.exceptions import (
     CredentialsExpiredError,
     CredentialsNotFoundError,
@@ -39,6 +41,7 @@ from ccproxy.observability.access_logger import log_request_access
 from ccproxy.observability.streaming_response import StreamingResponseWithLogging
 from ccproxy.services.credentials.manager import CredentialsManager
 from ccproxy.testing import RealisticMockResponseGenerator
+from ccproxy.utils.context_compaction import ContextCompactor
 from ccproxy.utils.simple_request_logger import (
     append_streaming_log,
     write_request_log,
@@ -125,6 +128,13 @@ class ProxyService:
         # Create mock response generator for bypass mode
         self.mock_generator = RealisticMockResponseGenerator()
 
+        # History compaction for requests that overflow the context window
+        compaction_settings = settings.claude.context_compaction
+        self.context_compactor = ContextCompactor(
+            preserve_recent_messages=compaction_settings.preserve_recent_messages,
+            min_tool_result_tokens=compaction_settings.min_tool_result_tokens,
+        )
+
         # Cache environment-based configuration
         self._proxy_url = self._init_proxy_url()
         self._ssl_context = self._init_ssl_context()
@@ -164,6 +174,76 @@ class ProxyService:
 
         return model, streaming
 
+    async def _compact_request_context(
+        self, transformed_request: RequestData, ctx: "RequestContext"
+    ) -> RequestData:
+        """Drop old history that would overflow the model's context window.
+
+        Dropped-token counts are recorded in the request context metadata.
+        """
+        url_path = transformed_request["url"].split("?")[0]
+        body = transformed_request["body"]
+        if not body or not url_path.endswith("/v1/messages"):
+            return transformed_request
+
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return transformed_request
+        if not isinstance(payload, dict) or not payload.get("model"):
+            return transformed_request
+
+        model_name = payload["model"]
+        registry = get_model_registry()
+        context_window = registry.context_window(model_name)
+        max_tokens = payload.get("max_tokens")
+        if not isinstance(max_tokens, int) or max_tokens <= 0:
+            max_tokens = registry.max_output_tokens(model_name)
+
+        compaction_settings = self.settings.claude.context_compaction
+        budget = context_window - max_tokens - compaction_settings.safety_margin_tokens
+        result = self.context_compactor.compact(payload, budget)
+
+        ctx.add_metadata(
+            estimated_input_tokens=result.estimated_tokens_after,
+            context_window=context_window,
+        )
+        if not result.compacted:
+            return transformed_request
+
+        ctx.add_metadata(
+            context_compacted=True,
+            compaction_dropped_tokens=result.dropped_tokens,
+            compaction_dropped_messages=result.messages_dropped,
+            compaction_elided_tool_results=result.tool_results_elided,
+        )
+        logger.info(
+            "context_compacted",
+            model=model_name,
+            context_window=context_window,
+            budget=budget,
+            tokens_before=result.estimated_tokens_before,
+            tokens_after=result.estimated_tokens_after,
+            dropped_messages=result.messages_dropped,
+            elided_tool_results=result.tool_results_elided,
+            fits=result.fits,
+            request_id=ctx.request_id,
+        )
+
+        new_body = json.dumps(result.payload).encode("utf-8")
+        headers = {
+            k: v
+            for k, v in transformed_request["headers"].items()
+            if k.lower() != "content-length"
+        }
+        headers["Content-Length"] = str(len(new_body))
+        return RequestData(
+            method=transformed_request["method"],
+            url=transformed_request["url"],
+            headers=headers,
+            body=new_body,
+        )
+
     async def _get_access_token(self) -> str:
         """Retrieve a valid Claude access token via the credentials manager."""
 
@@ -330,6 +410,13 @@ class ProxyService:
                         )
                     )
 
+                # 2b. Optional history compaction to fit the context window
+                if self.settings.claude.context_compaction.enabled:
+                    async with timed_operation("context_compaction", ctx.request_id):
+                        transformed_request = await self._compact_request_context(
+                            transformed_request, ctx
+                        )
+
                 # 3. Check for bypass header to skip upstream forwarding
                 bypass_upstream = (
                     headers.get("X-CCProxy-Bypass-Upstream", "").lower() == "true"
@@ -634,8 +721,7 @@ class ProxyService:
                         "model"
                     ):
                         try:
-                            model_info_service = get_model_info_service()
-                            model_capabilities = await model_info_service.get_model_capabilities(
+                            model_capabilities = get_model_registry().capabilities(
                                 transformed_request_data["model"]
                             )
 
@@ -1080,8 +1166,16 @@ class ProxyService:
                 )
                 transformed_error_body = transformed_error_response["body"]
 
-                # Update context with error status
-                ctx.add_metadata(status_code=response.status_code)
+                # Update context with error status; the error also marks the
+                # streaming request as complete for the access log sinks
+                ctx.add_metadata(
+                    status_code=response.status_code,
+                    error=httpx.HTTPStatusError(
+                        f"Upstream returned HTTP {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    ),
+                )
 
                 # Log access log for error
                 from ccproxy.observability.access_logger import log_request_access
@@ -1160,11 +1254,12 @@ class ProxyService:
                 ):
                     end_time = time.perf_counter()
                     proxy_api_call_ms = (end_time - start_time) * 1000
-                    logger.debug(
-                        "stream_response_received",
-                        status_code=response.status_code,
-                        headers=dict(response.headers),
-                    )
+                    if is_enabled_for(logger, logging.DEBUG):
+                        logger.debug(
+                            "stream_response_received",
+                            status_code=response.status_code,
+                            headers=dict(response.headers),
+                        )
 
                     # Log initial stream response headers if verbose
                     if self._verbose_api:
@@ -1240,6 +1335,7 @@ class ProxyService:
 
                         # Use cached verbose streaming configuration
                         verbose_streaming = self._verbose_streaming
+                        log_chunks = is_enabled_for(logger, logging.DEBUG)
 
                         # Get timestamp once for all streaming chunks
                         request_id = ctx.request_id
@@ -1300,7 +1396,7 @@ class ProxyService:
                                             "content_block_delta_progress",
                                             count=content_block_delta_count,
                                         )
-                                elif (
+                                elif log_chunks and (
                                     verbose_streaming
                                     or "content_block_delta" not in chunk_str
                                 ):
@@ -1386,12 +1482,11 @@ class ProxyService:
                             logger.warning("sse_parse_failed", data=data_str)
                             continue
 
-        # Transform using OpenAI adapter and format back to SSE
-        async for openai_chunk in self.openai_adapter.adapt_stream(
+        # Transform using OpenAI adapter, encoded straight to SSE frames
+        async for sse_frame in self.openai_adapter.adapt_stream_sse(
             sse_to_dict_stream()
         ):
-            sse_line = f"data: {json.dumps(openai_chunk)}\n\n"
-            yield sse_line.encode("utf-8")
+            yield sse_frame
 
     def _extract_message_type_from_body(self, body: bytes | None) -> str:
         """Extract message type from request body for realistic response generation."""
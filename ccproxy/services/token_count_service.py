@@ -0,0 +1,177 @@
+"""Service for answering count_tokens requests locally."""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from fastapi.responses import StreamingResponse
+from structlog import get_logger
+
+from ccproxy.utils.token_estimation import (
+    TokenEstimator,
+    content_hash,
+    get_token_estimator,
+)
+
+
+if TYPE_CHECKING:
+    from ccproxy.services.proxy_service import ProxyService
+
+
+logger = get_logger(__name__)
+
+TokenCountMode = Literal["estimate", "exact"]
+TokenCountSource = Literal["estimate", "exact", "cache"]
+
+COUNT_TOKENS_PATH = "/v1/messages/count_tokens"
+
+# Request fields that influence the upstream token count
+_COUNTED_FIELDS = ("model", "system", "tools", "tool_choice", "messages", "thinking")
+
+
+@dataclass
+class TokenCount:
+    """Result of a token count."""
+
+    input_tokens: int
+    source: TokenCountSource
+
+
+class TokenCountService:
+    """Count input tokens for Messages API requests.
+
+    In ``estimate`` mode requests are answered from a local character-based
+    estimator. In ``exact`` mode the
+    request is forwarded upstream once and the result cached by request
+    hash; upstream failures fall back to the local estimate.
+    """
+
+    def __init__(
+        self, estimator: TokenEstimator | None = None, cache_size: int = 1024
+    ) -> None:
+        """Initialize the token count service.
+
+        Args:
+            estimator: Local token estimator (defaults to the shared instance)
+            cache_size: Maximum number of cached exact counts
+        """
+        self.estimator = estimator or get_token_estimator()
+        self.cache_size = cache_size
+        self._exact_cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def estimate(
+        self, payload: dict[str, Any], injected_system: Any = None
+    ) -> TokenCount:
+        """Estimate input tokens locally.
+
+        Args:
+            payload: count_tokens request body
+            injected_system: System field the proxy adds before forwarding
+        """
+        return TokenCount(
+            input_tokens=self.estimator.estimate_request(payload)
+            + self.estimator.estimate_system(injected_system),
+            source="estimate",
+        )
+
+    async def count(
+        self,
+        payload: dict[str, Any],
+        mode: TokenCountMode = "estimate",
+        proxy_service: "ProxyService | None" = None,
+        headers: dict[str, str] | None = None,
+        injected_system: Any = None,
+    ) -> TokenCount:
+        """Count input tokens for ``payload``.
+
+        Args:
+            payload: count_tokens request body
+            mode: ``estimate`` for a local estimate, ``exact`` to ask upstream
+            proxy_service: Proxy service used for exact counts
+            headers: Original request headers forwarded with exact counts
+            injected_system: System field the proxy adds upstream, included
+                in local estimates
+
+        Returns:
+            Token count and where it came from
+        """
+        if mode != "exact" or proxy_service is None:
+            return self.estimate(payload, injected_system)
+
+        key = content_hash({k: payload.get(k) for k in _COUNTED_FIELDS})
+        with self._lock:
+            cached = self._exact_cache.get(key)
+            if cached is not None:
+                self._exact_cache.move_to_end(key)
+                return TokenCount(input_tokens=cached, source="cache")
+
+        input_tokens = await self._count_upstream(payload, proxy_service, headers)
+        if input_tokens is None:
+            return self.estimate(payload, injected_system)
+
+        with self._lock:
+            self._exact_cache[key] = input_tokens
+            if len(self._exact_cache) > self.cache_size:
+                self._exact_cache.popitem(last=False)
+
+        return TokenCount(input_tokens=input_tokens, source="exact")
+
+    async def _count_upstream(
+        self,
+        payload: dict[str, Any],
+        proxy_service: "ProxyService",
+        headers: dict[str, str] | None,
+    ) -> int | None:
+        """Forward a count_tokens request upstream, returning None on failure."""
+        forward_headers = {
+            k: v
+            for k, v in (headers or {}).items()
+            if k.lower() not in ("content-length", "host")
+        }
+        forward_headers["content-type"] = "application/json"
+
+        try:
+            response = await proxy_service.handle_request(
+                method="POST",
+                path=COUNT_TOKENS_PATH,
+                headers=forward_headers,
+                body=json.dumps(payload).encode("utf-8"),
+            )
+        except Exception as e:
+            logger.warning("count_tokens_upstream_failed", error=str(e))
+            return None
+
+        if isinstance(response, StreamingResponse):
+            return None
+
+        status_code, _, body = response
+        if status_code >= 400:
+            logger.warning(
+                "count_tokens_upstream_error",
+                status_code=status_code,
+                body=body[:200].decode("utf-8", errors="replace"),
+            )
+            return None
+
+        try:
+            input_tokens = json.loads(body.decode("utf-8"))["input_tokens"]
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+            logger.warning("count_tokens_upstream_invalid_response")
+            return None
+
+        return input_tokens if isinstance(input_tokens, int) else None
+
+
+# Global instance for easy access
+_token_count_service: TokenCountService | None = None
+
+
+def get_token_count_service() -> TokenCountService:
+    """Get or create the global token count service."""
+    global _token_count_service
+    if _token_count_service is None:
+        _token_count_service = TokenCountService()
+    return _token_count_service
@@ -5,28 +5,46 @@ This package provides comprehensive testing utilities including:
 - Request payload builders for dual-format testing
 - Response processing and metrics collection
 - Traffic pattern generation and scenario management
+- Local mock upstream replaying recorded streams for load testing
+- End-to-end capacity harness ramping load until an SLO breaks
 """
 
+from ccproxy.testing.capacity import CapacityHarness
 from ccproxy.testing.config import (
+    CapacityConfig,
     MockResponseConfig,
+    MockUpstreamConfig,
     RequestScenario,
     TrafficConfig,
     TrafficMetrics,
 )
 from ccproxy.testing.content_generation import MessageContentGenerator, PayloadBuilder
 from ccproxy.testing.mock_responses import RealisticMockResponseGenerator
+from ccproxy.testing.mock_upstream import (
+    Cassette,
+    MockUpstream,
+    load_cassettes,
+    record_cassettes,
+)
 from ccproxy.testing.response_handlers import MetricsExtractor, ResponseHandler
 from ccproxy.testing.scenarios import ScenarioGenerator, TrafficPatternAnalyzer
 
 
 __all__ = [
+    "CapacityConfig",
+    "CapacityHarness",
     "MockResponseConfig",
+    "MockUpstreamConfig",
     "RequestScenario",
     "TrafficConfig",
     "TrafficMetrics",
     "MessageContentGenerator",
     "PayloadBuilder",
     "RealisticMockResponseGenerator",
+    "Cassette",
+    "MockUpstream",
+    "load_cassettes",
+    "record_cassettes",
     "MetricsExtractor",
     "ResponseHandler",
     "ScenarioGenerator",
@@ -0,0 +1,807 @@
+"""End-to-end capacity harness measuring proxy throughput, latency and cost.
+
+Starts the mock upstream and a real ``ccproxy serve`` process pointed at it,
+then drives one route at a time with closed-loop streaming clients, doubling
+the concurrency each step until a service level objective breaks. The
+``/sdk`` route is served by a stub Claude CLI, so every route runs the
+proxy's own code path while the upstream side stays cheap and predictable.
+
+Each step reports:
+
+- throughput and client-side time to first token (TTFT) percentiles
+- proxy-added TTFT: proxy TTFT minus the upstream TTFT measured by the mock
+  upstream (or configured in the stub CLI) at the same percentile
+- CPU seconds and RSS of the proxy process tree, sampled from ``/proc``
+- event loop lag of the proxy, read from ``/logs/loop-lag``
+
+The proxy runs with ``HOME`` pointed at a scratch directory holding fake
+Claude and Codex credentials, so no real accounts or CLI sessions are used.
+Resource sampling reads ``/proc`` and therefore needs Linux.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+import httpx
+import structlog
+
+from ccproxy.testing.config import CapacityConfig, CapacityRoute, MockUpstreamConfig
+
+
+logger = structlog.get_logger(__name__)
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+@dataclass(frozen=True)
+class RouteTarget:
+    """Request sent to one proxy route and the marker of its first token."""
+
+    path: str
+    body: dict[str, Any]
+    token_marker: bytes
+
+
+_MESSAGES_BODY: dict[str, Any] = {
+    "model": "claude-sonnet-4-20250514",
+    "max_tokens": 1024,
+    "stream": True,
+    "messages": [{"role": "user", "content": "Summarize the release notes."}],
+}
+
+ROUTE_TARGETS: dict[CapacityRoute, RouteTarget] = {
+    "api": RouteTarget("/api/v1/messages", _MESSAGES_BODY, b'"text_delta"'),
+    "sdk": RouteTarget("/sdk/v1/messages", _MESSAGES_BODY, b'"text_delta"'),
+    "codex": RouteTarget(
+        "/codex/responses",
+        {
+            "model": "gpt-5",
+            "stream": True,
+            "input": [
+                {
+                    "type": "message",
+                    "role": "user",
+                    "content": [
+                        {"type": "input_text", "text": "Summarize the release notes."}
+                    ],
+                }
+            ],
+        },
+        b"output_text.delta",
+    ),
+}
+
+
+# Stub Claude CLI speaking the stream-json protocol of the Claude Code SDK
+STUB_CLAUDE_CLI = '''#!{python}
+"""Stub Claude CLI for capacity testing; answers every prompt after a delay."""
+import json, os, sys, time, uuid
+
+TTFT = int(os.environ.get("CCPROXY_STUB_TTFT_MS", "300")) / 1000
+TOKENS = int(os.environ.get("CCPROXY_STUB_OUTPUT_TOKENS", "40"))
+ARGS = sys.argv[1:]
+PARTIAL = "--include-partial-messages" in ARGS
+MODEL = ARGS[ARGS.index("--model") + 1] if "--model" in ARGS else "claude-stub"
+SESSION = str(uuid.uuid4())
+
+
+def emit(message):
+    sys.stdout.write(json.dumps(message) + "\\n")
+    sys.stdout.flush()
+
+
+def answer():
+    time.sleep(TTFT)
+    words = [" token"] * TOKENS
+    emit({{"type": "system", "subtype": "init", "session_id": SESSION, "model": MODEL}})
+    if PARTIAL:
+        for word in words:
+            emit({{
+                "type": "stream_event", "uuid": str(uuid.uuid4()),
+                "session_id": SESSION,
+                "event": {{
+                    "type": "content_block_delta", "index": 0,
+                    "delta": {{"type": "text_delta", "text": word}},
+                }},
+            }})
+    text = "".join(words)
+    emit({{
+        "type": "assistant",
+        "message": {{"model": MODEL, "content": [{{"type": "text", "text": text}}]}},
+    }})
+    emit({{
+        "type": "result", "subtype": "success", "duration_ms": int(TTFT * 1000),
+        "duration_api_ms": int(TTFT * 1000), "is_error": False, "num_turns": 1,
+        "session_id": SESSION, "total_cost_usd": 0.0, "result": text,
+        "usage": {{"input_tokens": 10, "output_tokens": TOKENS}},
+    }})
+
+
+if "--print" in ARGS:
+    answer()
+    sys.exit(0)
+for line in sys.stdin:
+    message = json.loads(line)
+    if message.get("type") == "control_request":
+        emit({{
+            "type": "control_response",
+            "response": {{
+                "subtype": "success", "request_id": message["request_id"],
+                "response": {{}},
+            }},
+        }})
+    elif message.get("type") == "user":
+        answer()
+'''
+
+
+def write_stub_cli(directory: Path) -> Path:
+    """Write the stub Claude CLI as an executable ``claude`` in ``directory``."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "claude"
+    path.write_text(STUB_CLAUDE_CLI.format(python=sys.executable))
+    path.chmod(0o755)
+    return path
+
+
+def _unsigned_jwt(claims: dict[str, Any]) -> str:
+    def encode(data: dict[str, Any]) -> str:
+        raw = json.dumps(data).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.harness"
+
+
+def write_fake_credentials(home: Path) -> None:
+    """Write long-lived fake Claude and Codex credentials under ``home``."""
+    claude_dir = home / ".claude"
+    claude_dir.mkdir(parents=True, exist_ok=True)
+    expires_ms = int((time.time() + 365 * 86400) * 1000)
+    (claude_dir / ".credentials.json").write_text(
+        json.dumps(
+            {
+                "claudeAiOauth": {
+                    "accessToken": "sk-ant-REDACTED",
+                    "refreshToken": "capacity-harness",
+                    "expiresAt": expires_ms,
+                    "scopes": ["user:inference", "user:profile"],
+                    "subscriptionType": "max",
+                }
+            }
+        )
+    )
+
+    codex_dir = home / ".codex"
+    codex_dir.mkdir(parents=True, exist_ok=True)
+    account_id = "capacity-harness"
+    access_token = _unsigned_jwt(
+        {
+            "exp": int(time.time() + 365 * 86400),
+            "https://api.openai.com/auth": {"chatgpt_account_id": account_id},
+        }
+    )
+    (codex_dir / "auth.json").write_text(
+        json.dumps(
+            {
+                "tokens": {
+                    "access_token": access_token,
+                    "refresh_token": "capacity-harness",
+                    "account_id": account_id,
+                }
+            }
+        )
+    )
+
+
+# Resource sampling
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    """CPU time and resident memory of a process tree at one instant."""
+
+    at: float
+    cpu_seconds: float
+    rss_bytes: int
+    processes: int
+
+
+class ProcessSampler:
+    """Samples CPU time and RSS of a process and its descendants from /proc.
+
+    CPU time includes reaped children (``cutime``/``cstime``), so short-lived
+    CLI subprocesses are accounted for after they exit. RSS is summed over
+    live processes and counts shared pages once per process.
+    """
+
+    def __init__(self, pid: int, proc: Path = Path("/proc")) -> None:
+        self.pid = pid
+        self._proc = proc
+        if not (proc / str(pid) / "stat").exists():
+            raise RuntimeError(f"Cannot read {proc}/{pid}/stat; sampling needs Linux")
+
+    def sample(self) -> ResourceSample:
+        cpu_ticks = 0
+        rss_kib = 0
+        pids = self._tree()
+        for pid in pids:
+            try:
+                stat = (self._proc / str(pid) / "stat").read_text()
+                status = (self._proc / str(pid) / "status").read_text()
+            except (FileNotFoundError, ProcessLookupError):
+                continue
+            # Fields after the parenthesized command name, which may hold spaces
+            fields = stat.rsplit(")", 1)[1].split()
+            cpu_ticks += sum(int(value) for value in fields[11:15])
+            for line in status.splitlines():
+                if line.startswith("VmRSS:"):
+                    rss_kib += int(line.split()[1])
+                    break
+        return ResourceSample(
+            at=time.monotonic(),
+            cpu_seconds=cpu_ticks / _CLOCK_TICKS,
+            rss_bytes=rss_kib * 1024,
+            processes=len(pids),
+        )
+
+    def _tree(self) -> list[int]:
+        pids = [self.pid]
+        index = 0
+        while index < len(pids):
+            task_dir = self._proc / str(pids[index]) / "task"
+            index += 1
+            try:
+                tasks = list(task_dir.iterdir())
+            except FileNotFoundError:
+                continue
+            for task in tasks:
+                try:
+                    children = (task / "children").read_text().split()
+                except FileNotFoundError:
+                    continue
+                pids.extend(int(child) for child in children)
+        return pids
+
+
+# Step and route results
+
+
+@dataclass
+class RequestResult:
+    """Outcome of one streaming request."""
+
+    started: float
+    ok: bool
+    ttft_ms: float | None
+    latency_ms: float
+
+
+@dataclass
+class StepResult:
+    """Measurements of one concurrency step against one route."""
+
+    concurrency: int
+    duration_seconds: float
+    requests: int
+    errors: int
+    error_rate: float
+    requests_per_second: float
+    ttft_p50_ms: float
+    ttft_p99_ms: float
+    upstream_ttft_p50_ms: float
+    upstream_ttft_p99_ms: float
+    added_ttft_p50_ms: float
+    added_ttft_p99_ms: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    cpu_seconds: float
+    cpu_cores_used: float
+    cpu_seconds_per_1k_requests: float
+    rss_peak_mb: float
+    rss_growth_mb_per_1k_requests: float
+    loop_lag_p50_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+    client_cpu_cores_used: float
+    slo_breaches: list[str] = field(default_factory=list)
+
+    @property
+    def slo_ok(self) -> bool:
+        return not self.slo_breaches
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0..1), 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize_step(
+    config: CapacityConfig,
+    concurrency: int,
+    duration: float,
+    results: list[RequestResult],
+    upstream_ttft: tuple[float, float],
+    resources: list[ResourceSample],
+    loop_lag: dict[str, Any],
+    client_cpu_seconds: float = 0.0,
+) -> StepResult:
+    """Aggregate one step's requests and samples and check the SLOs."""
+    ttfts = [r.ttft_ms for r in results if r.ok and r.ttft_ms is not None]
+    latencies = [r.latency_ms for r in results if r.ok]
+    errors = sum(1 for r in results if not r.ok)
+    requests = len(results)
+    ttft_p50, ttft_p99 = percentile(ttfts, 0.5), percentile(ttfts, 0.99)
+
+    first, last = (resources[0], resources[-1]) if resources else (None, None)
+    cpu_seconds = last.cpu_seconds - first.cpu_seconds if first and last else 0.0
+    rss_growth = last.rss_bytes - first.rss_bytes if first and last else 0
+    per_1k = 1000 / requests if requests else 0.0
+
+    step = StepResult(
+        concurrency=concurrency,
+        duration_seconds=duration,
+        requests=requests,
+        errors=errors,
+        error_rate=errors / requests if requests else 1.0,
+        requests_per_second=(requests - errors) / duration if duration else 0.0,
+        ttft_p50_ms=ttft_p50,
+        ttft_p99_ms=ttft_p99,
+        upstream_ttft_p50_ms=upstream_ttft[0],
+        upstream_ttft_p99_ms=upstream_ttft[1],
+        added_ttft_p50_ms=max(0.0, ttft_p50 - upstream_ttft[0]),
+        added_ttft_p99_ms=max(0.0, ttft_p99 - upstream_ttft[1]),
+        latency_p50_ms=percentile(latencies, 0.5),
+        latency_p99_ms=percentile(latencies, 0.99),
+        cpu_seconds=cpu_seconds,
+        cpu_cores_used=cpu_seconds / duration if duration else 0.0,
+        cpu_seconds_per_1k_requests=cpu_seconds * per_1k,
+        rss_peak_mb=max((s.rss_bytes for s in resources), default=0) / 2**20,
+        rss_growth_mb_per_1k_requests=rss_growth / 2**20 * per_1k,
+        loop_lag_p50_ms=float(loop_lag.get("p50_ms", 0.0)),
+        loop_lag_p99_ms=float(loop_lag.get("p99_ms", 0.0)),
+        loop_lag_max_ms=float(loop_lag.get("max_ms", 0.0)),
+        client_cpu_cores_used=client_cpu_seconds / duration if duration else 0.0,
+    )
+
+    if step.error_rate > config.slo_error_rate:
+        step.slo_breaches.append(
+            f"error rate {step.error_rate:.1%} > {config.slo_error_rate:.1%}"
+        )
+    if step.added_ttft_p99_ms > config.slo_added_ttft_p99_ms:
+        step.slo_breaches.append(
+            f"added TTFT p99 {step.added_ttft_p99_ms:.0f}ms "
+            f"> {config.slo_added_ttft_p99_ms:.0f}ms"
+        )
+    if step.loop_lag_p99_ms > config.slo_loop_lag_p99_ms:
+        step.slo_breaches.append(
+            f"loop lag p99 {step.loop_lag_p99_ms:.0f}ms "
+            f"> {config.slo_loop_lag_p99_ms:.0f}ms"
+        )
+    return step
+
+
+def summarize_route(route: str, steps: list[StepResult]) -> dict[str, Any]:
+    """Summarize a route's ramp: the best step that met every SLO."""
+    passing = [step for step in steps if step.slo_ok]
+    best = max(
+        passing,
+        key=lambda step: (step.requests_per_second, step.concurrency),
+        default=None,
+    )
+    breach = next((step for step in steps if not step.slo_ok), None)
+    summary: dict[str, Any] = {
+        "route": route,
+        "max_sustainable_rps": best.requests_per_second if best else 0.0,
+        "max_sustainable_concurrency": (
+            max(step.concurrency for step in passing) if passing else 0
+        ),
+        "breached_at_concurrency": breach.concurrency if breach else None,
+        "breaches": breach.slo_breaches if breach else [],
+    }
+    if best is not None:
+        cores = best.cpu_cores_used or None
+        summary.update(
+            {
+                "added_ttft_p50_ms": best.added_ttft_p50_ms,
+                "added_ttft_p99_ms": best.added_ttft_p99_ms,
+                "cpu_seconds_per_1k_requests": best.cpu_seconds_per_1k_requests,
+                "rss_peak_mb": best.rss_peak_mb,
+                "rss_growth_mb_per_1k_requests": best.rss_growth_mb_per_1k_requests,
+                "loop_lag_p99_ms": best.loop_lag_p99_ms,
+                "rps_per_core": best.requests_per_second / cores if cores else None,
+                "streams_per_core": best.concurrency / cores if cores else None,
+            }
+        )
+    return summary
+
+
+# Charts
+
+
+_CHART_COLORS = ("#1f77b4", "#d62728", "#2ca02c", "#9467bd", "#ff7f0e")
+
+
+def line_chart_svg(
+    title: str,
+    y_label: str,
+    series: dict[str, list[tuple[float, float]]],
+    width: int = 640,
+    height: int = 360,
+) -> str:
+    """Render series of (concurrency, value) points as an SVG line chart.
+
+    The concurrency axis is logarithmic, matching the multiplicative ramp.
+    """
+    import math
+
+    left, right, top, bottom = 64, 120, 36, 48
+    points = [point for values in series.values() for point in values]
+    xs = [math.log2(max(x, 1)) for x, _ in points] or [0.0]
+    x_min, x_max = min(xs), max(max(xs), min(xs) + 1)
+    y_max = max((y for _, y in points), default=0.0) * 1.1 or 1.0
+    plot_w, plot_h = width - left - right, height - top - bottom
+
+    def position(x: float, y: float) -> tuple[float, float]:
+        px = left + (math.log2(max(x, 1)) - x_min) / (x_max - x_min) * plot_w
+        py = top + plot_h - y / y_max * plot_h
+        return px, py
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" font-family="sans-serif" font-size="12">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{width / 2}" y="20" text-anchor="middle" '
+        f'font-size="14">{title}</text>',
+        f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" '
+        f'y2="{top + plot_h}" stroke="black"/>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" '
+        f'stroke="black"/>',
+        f'<text x="{left + plot_w / 2}" y="{height - 10}" '
+        f'text-anchor="middle">concurrency</text>',
+        f'<text x="14" y="{top + plot_h / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 14 {top + plot_h / 2})">{y_label}</text>',
+    ]
+    for tick in range(5):
+        value = y_max * tick / 4
+        _, py = position(1, value)
+        parts.append(
+            f'<text x="{left - 6}" y="{py + 4:.1f}" text-anchor="end">'
+            f"{value:.3g}</text>"
+        )
+    for x in sorted({x for x, _ in points}):
+        px, _ = position(x, 0)
+        parts.append(
+            f'<text x="{px:.1f}" y="{top + plot_h + 16}" '
+            f'text-anchor="middle">{x:g}</text>'
+        )
+    for index, (name, values) in enumerate(series.items()):
+        color = _CHART_COLORS[index % len(_CHART_COLORS)]
+        coords = " ".join(
+            f"{px:.1f},{py:.1f}" for px, py in (position(x, y) for x, y in values)
+        )
+        parts.append(
+            f'<polyline points="{coords}" fill="none" stroke="{color}" '
+            f'stroke-width="2"/>'
+        )
+        legend_y = top + 16 * index
+        parts.append(
+            f'<rect x="{width - right + 12}" y="{legend_y}" width="12" '
+            f'height="12" fill="{color}"/>'
+        )
+        parts.append(
+            f'<text x="{width - right + 30}" y="{legend_y + 10}">{name}</text>'
+        )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+CHARTS: dict[str, tuple[str, str]] = {
+    "throughput": ("requests_per_second", "requests/s"),
+    "added_ttft_p99": ("added_ttft_p99_ms", "ms"),
+    "cpu_per_1k": ("cpu_seconds_per_1k_requests", "CPU s / 1k requests"),
+    "rss_peak": ("rss_peak_mb", "MiB"),
+    "loop_lag_p99": ("loop_lag_p99_ms", "ms"),
+}
+
+
+def write_report(report: dict[str, Any], output_dir: Path) -> list[Path]:
+    """Write ``report.json`` and one SVG chart per metric to ``output_dir``."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / "report.json"
+    report_path.write_text(json.dumps(report, indent=2))
+    written = [report_path]
+    for name, (metric, unit) in CHARTS.items():
+        series = {
+            route: [(step["concurrency"], step[metric]) for step in data["steps"]]
+            for route, data in report["routes"].items()
+        }
+        chart_path = output_dir / f"{name}.svg"
+        chart_path.write_text(line_chart_svg(f"{metric} by concurrency", unit, series))
+        written.append(chart_path)
+    return written
+
+
+# Processes under test
+
+
+def _serve_mock_upstream(config: MockUpstreamConfig) -> None:
+    from ccproxy.testing.mock_upstream import create_mock_upstream_server
+
+    asyncio.run(create_mock_upstream_server(config).serve())
+
+
+async def _wait_until_ready(
+    client: httpx.AsyncClient, url: str, timeout: float, alive: Any
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not alive():
+            raise RuntimeError(f"Process serving {url} exited during startup")
+        try:
+            if (await client.get(url)).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} did not become ready within {timeout:.0f}s")
+
+
+class CapacityHarness:
+    """Ramps concurrency against each configured route and reports capacity."""
+
+    def __init__(self, config: CapacityConfig, workdir: Path) -> None:
+        """Initialize the harness.
+
+        Args:
+            config: Harness configuration
+            workdir: Scratch directory for the fake home and stub CLI
+        """
+        self.config = config
+        self.workdir = workdir
+        self.mock_url = (
+            f"http://{config.mock_upstream.host}:{config.mock_upstream.port}"
+        )
+        self.proxy_url = f"http://127.0.0.1:{config.proxy_port}"
+
+    async def run(self) -> dict[str, Any]:
+        """Run every route's ramp and return the machine-readable report."""
+        home = self.workdir / "home"
+        write_fake_credentials(home)
+        stub = write_stub_cli(self.workdir / "bin")
+
+        mock = multiprocessing.get_context("spawn").Process(
+            target=_serve_mock_upstream, args=(self.config.mock_upstream,), daemon=True
+        )
+        mock.start()
+        routes: dict[str, Any] = {}
+        limits = httpx.Limits(
+            max_connections=self.config.concurrency_max + 8,
+            max_keepalive_connections=self.config.concurrency_max + 8,
+        )
+        timeout = httpx.Timeout(self.config.request_timeout_seconds, connect=10.0)
+        try:
+            async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+                await _wait_until_ready(
+                    client, f"{self.mock_url}/stats", 30.0, mock.is_alive
+                )
+                for route in self.config.routes:
+                    steps = await self._run_route(client, route, home, stub)
+                    routes[route] = {
+                        "summary": summarize_route(route, steps),
+                        "steps": [
+                            {**asdict(step), "slo_ok": step.slo_ok} for step in steps
+                        ],
+                    }
+        finally:
+            mock.terminate()
+            mock.join(10)
+
+        return {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "machine": {
+                "cpu_count": os.cpu_count(),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+            },
+            "config": self.config.model_dump(mode="json"),
+            "routes": routes,
+        }
+
+    def _proxy_env(self, home: Path, stub: Path) -> dict[str, str]:
+        observability_interval = str(self.config.loop_lag_interval_ms)
+        return {
+            **os.environ,
+            "HOME": str(home),
+            "REVERSE_PROXY__TARGET_URL": self.mock_url,
+            "CODEX__BASE_URL": self.mock_url,
+            "CLAUDE__CLI_PATH": str(stub),
+            "CCPROXY_STUB_TTFT_MS": str(self.config.stub_ttft_ms),
+            "CCPROXY_STUB_OUTPUT_TOKENS": str(self.config.stub_output_tokens),
+            "OBSERVABILITY__LOGS_ENDPOINTS_ENABLED": "true",
+            "OBSERVABILITY__EVENT_LOOP_LAG_INTERVAL_MS": observability_interval,
+            **self.config.proxy_env,
+        }
+
+    async def _run_route(
+        self, client: httpx.AsyncClient, route: CapacityRoute, home: Path, stub: Path
+    ) -> list[StepResult]:
+        """Start a fresh proxy and ramp concurrency until an SLO breaks."""
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.config.output_dir / f"proxy-{route}.log"
+        with log_path.open("wb") as log:
+            process = await self._start_proxy(client, home, stub, log)
+            try:
+                sampler = ProcessSampler(process.pid)
+                steps: list[StepResult] = []
+                concurrency = self.config.concurrency_start
+                while concurrency <= self.config.concurrency_max:
+                    step = await self._run_step(client, route, concurrency, sampler)
+                    steps.append(step)
+                    logger.info(
+                        "capacity_step_complete",
+                        route=route,
+                        concurrency=concurrency,
+                        rps=round(step.requests_per_second, 1),
+                        added_ttft_p99_ms=round(step.added_ttft_p99_ms, 1),
+                        loop_lag_p99_ms=round(step.loop_lag_p99_ms, 1),
+                        breaches=step.slo_breaches,
+                    )
+                    if not step.slo_ok:
+                        break
+                    concurrency = max(
+                        concurrency + 1,
+                        int(concurrency * self.config.concurrency_factor),
+                    )
+                return steps
+            finally:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), 15)
+                except TimeoutError:
+                    process.kill()
+                    await process.wait()
+
+    async def _start_proxy(
+        self, client: httpx.AsyncClient, home: Path, stub: Path, log: IO[bytes]
+    ) -> asyncio.subprocess.Process:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "ccproxy",
+            "serve",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(self.config.proxy_port),
+            env=self._proxy_env(home, stub),
+            stdout=log,
+            stderr=log,
+        )
+        try:
+            await _wait_until_ready(
+                client,
+                f"{self.proxy_url}/health/live",
+                60.0,
+                lambda: process.returncode is None,
+            )
+        except Exception:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        return process
+
+    async def _run_step(
+        self,
+        client: httpx.AsyncClient,
+        route: CapacityRoute,
+        concurrency: int,
+        sampler: ProcessSampler,
+    ) -> StepResult:
+        config = self.config
+        target = ROUTE_TARGETS[route]
+        started = time.monotonic()
+        record_after = started + config.warmup_seconds
+        stop_at = record_after + config.step_seconds
+        results: list[RequestResult] = []
+        resources: list[ResourceSample] = []
+
+        async def sample_resources() -> None:
+            await asyncio.sleep(max(0.0, record_after - time.monotonic()))
+            await client.post(f"{self.mock_url}/stats/reset")
+            while time.monotonic() < stop_at:
+                resources.append(sampler.sample())
+                await asyncio.sleep(config.sample_interval_seconds)
+            resources.append(sampler.sample())
+
+        client_cpu_start = _own_cpu_seconds()
+        sampling = asyncio.create_task(sample_resources())
+        await asyncio.gather(
+            *(
+                self._client_loop(client, target, record_after, stop_at, results)
+                for _ in range(concurrency)
+            )
+        )
+        await sampling
+        client_cpu = _own_cpu_seconds() - client_cpu_start
+        duration = max(resources[-1].at - record_after, config.step_seconds)
+
+        if route == "sdk":
+            upstream_ttft = (float(config.stub_ttft_ms), float(config.stub_ttft_ms))
+        else:
+            ttft = (await client.get(f"{self.mock_url}/stats")).json()["ttft_ms"]
+            upstream_ttft = (ttft["p50"], ttft["p99"])
+        loop_lag = (
+            await client.get(
+                f"{self.proxy_url}/logs/loop-lag",
+                params={"window_seconds": min(900, duration)},
+            )
+        ).json()
+
+        return summarize_step(
+            config,
+            concurrency,
+            duration,
+            results,
+            upstream_ttft,
+            resources,
+            loop_lag,
+            client_cpu * duration / (time.monotonic() - started),
+        )
+
+    async def _client_loop(
+        self,
+        client: httpx.AsyncClient,
+        target: RouteTarget,
+        record_after: float,
+        stop_at: float,
+        results: list[RequestResult],
+    ) -> None:
+        """Send requests back to back, recording those started in the window."""
+        url = f"{self.proxy_url}{target.path}"
+        while (started := time.monotonic()) < stop_at:
+            ttft_ms = None
+            ok = False
+            tail = b""
+            try:
+                async with client.stream("POST", url, json=target.body) as response:
+                    async for chunk in response.aiter_bytes():
+                        if ttft_ms is None:
+                            if target.token_marker in tail + chunk:
+                                ttft_ms = (time.monotonic() - started) * 1000
+                            tail = chunk[-64:]
+                    ok = response.status_code == 200 and ttft_ms is not None
+            except httpx.HTTPError as e:
+                logger.debug("capacity_request_failed", error=str(e))
+            if started >= record_after:
+                results.append(
+                    RequestResult(
+                        started=started,
+                        ok=ok,
+                        ttft_ms=ttft_ms,
+                        latency_ms=(time.monotonic() - started) * 1000,
+                    )
+                )
+            if not ok:
+                # Avoid spinning on immediate failures
+                await asyncio.sleep(0.01)
+
+
+def _own_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
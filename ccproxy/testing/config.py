@@ -11,6 +11,7 @@ from pydantic import BaseModel
 TrafficPattern = Literal["constant", "burst", "ramping", "realistic"]
 ResponseType = Literal["success", "error", "mixed", "unavailable"]
 AuthType = Literal["none", "bearer", "configured", "credentials"]
+CapacityRoute = Literal["api", "sdk", "codex"]
 
 
 class MockResponseConfig(BaseModel):
@@ -40,6 +41,63 @@ class MockResponseConfig(BaseModel):
     token_generation_rate: float = 50.0  # Tokens per second for streaming
 
 
+class MockUpstreamConfig(BaseModel):
+    """Configuration for the local mock upstream server."""
+
+    host: str = "127.0.0.1"
+    port: int = 8081
+    cassette_dir: Path | None = None  # Recorded streams; synthetic when empty
+
+    # Streaming timing
+    ttft_ms: int = 400  # Delay before the first event
+    tokens_per_second: float = 80.0  # Output token rate, 0 for no delay
+
+    # Error mix
+    error_rate: float = 0.0  # Chance of an error response instead of a stream
+    error_status_codes: list[int] = [429, 500, 529]
+    mid_stream_error_rate: float = 0.0  # Chance of an error event mid-stream
+
+    # Rate limits per minute, advertised in headers and enforced (0 disables)
+    rate_limit_requests: int = 4000
+    rate_limit_tokens: int = 400000
+
+    seed: int | None = None  # Seed for reproducible error and cassette choice
+
+
+class CapacityConfig(BaseModel):
+    """Configuration for the end-to-end capacity harness."""
+
+    routes: list[CapacityRoute] = ["api", "sdk", "codex"]
+    proxy_port: int = 8010
+    proxy_env: dict[str, str] = {}  # Extra environment for the proxy process
+    mock_upstream: MockUpstreamConfig = MockUpstreamConfig(
+        ttft_ms=300, tokens_per_second=0.0, rate_limit_requests=0
+    )
+
+    # Stub Claude CLI answering /sdk requests
+    stub_ttft_ms: int = 300
+    stub_output_tokens: int = 40
+
+    # Concurrency ramp: start, multiply by factor each step until max or SLO breach
+    concurrency_start: int = 1
+    concurrency_max: int = 512
+    concurrency_factor: float = 2.0
+    step_seconds: float = 15.0
+    warmup_seconds: float = 2.0  # Excluded from each step's measurements
+    request_timeout_seconds: float = 60.0
+
+    # Service level objectives; a step breaching any of them ends the ramp
+    slo_added_ttft_p99_ms: float = 100.0  # Proxy TTFT minus upstream TTFT
+    slo_error_rate: float = 0.01
+    slo_loop_lag_p99_ms: float = 50.0
+
+    # Resource sampling
+    sample_interval_seconds: float = 0.5
+    loop_lag_interval_ms: float = 20.0
+
+    output_dir: Path = Path("capacity-report")
+
+
 class TrafficConfig(BaseModel):
     """Configuration for traffic generation scenarios."""
 
@@ -0,0 +1,618 @@
+"""Local mock upstream replaying recorded SSE streams for load testing.
+
+Serves the Anthropic Messages API (``/v1/messages``) and the ChatGPT Responses
+API used by Codex (``/responses``), so a proxy pointed at it through
+``reverse_proxy.target_url`` and ``codex.base_url`` exercises its HTTP client,
+connection pool, SSE handling and upstream header processing as in
+production, unlike the in-process bypass mode.
+
+Streams are replayed from cassettes recorded from ``CCPROXY_LOG_REQUESTS``
+raw logs (see ``record_cassettes``); synthetic streams are generated when no
+cassette exists for an API. Time to first token, output token rate, the error
+mix and rate-limit headers are configured with ``MockUpstreamConfig``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import structlog
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+
+from ccproxy.testing.config import MockUpstreamConfig
+from ccproxy.testing.mock_responses import RealisticMockResponseGenerator
+
+
+if TYPE_CHECKING:
+    import uvicorn
+
+
+logger = structlog.get_logger(__name__)
+
+UpstreamApi = Literal["anthropic", "codex"]
+
+CASSETTE_SUFFIX = ".cassette.json"
+
+# Raw stream logs written with CCPROXY_LOG_REQUESTS; upstream logs win
+_STREAM_LOG_TYPES = ("upstream_streaming", "middleware_streaming")
+
+# Headers that describe the recorded transfer rather than the response
+_SKIPPED_HEADERS = frozenset(
+    {
+        "connection",
+        "content-encoding",
+        "content-length",
+        "date",
+        "keep-alive",
+        "set-cookie",
+        "transfer-encoding",
+    }
+)
+
+_ERROR_TYPES = {
+    400: "invalid_request_error",
+    401: "authentication_error",
+    429: "rate_limit_error",
+    500: "api_error",
+    529: "overloaded_error",
+}
+
+
+class Cassette(BaseModel):
+    """One recorded upstream SSE response."""
+
+    name: str
+    api: UpstreamApi
+    status_code: int = 200
+    headers: dict[str, str] = Field(default_factory=dict)
+    events: list[str]  # SSE event blocks without the trailing blank line
+
+    def save(self, directory: Path) -> Path:
+        """Write the cassette to a directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.name}{CASSETTE_SUFFIX}"
+        path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+        return path
+
+
+def split_sse_events(raw: str) -> list[str]:
+    """Split a raw SSE stream into event blocks."""
+    blocks = raw.replace("\r\n", "\n").split("\n\n")
+    return [block.strip("\n") for block in blocks if block.strip()]
+
+
+def event_data(event: str) -> dict[str, Any] | None:
+    """Parse the JSON data of an SSE event block."""
+    lines = [line[5:].strip() for line in event.split("\n") if line.startswith("data:")]
+    if not lines:
+        return None
+    try:
+        data = json.loads("\n".join(lines))
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def detect_api(events: list[str]) -> UpstreamApi | None:
+    """Tell Anthropic Messages streams from Responses API streams."""
+    for event in events:
+        data = event_data(event)
+        if data is None:
+            continue
+        event_type = str(data.get("type", ""))
+        if event_type == "message_start":
+            return "anthropic"
+        if event_type.startswith("response."):
+            return "codex"
+    return None
+
+
+def record_cassettes(log_dir: Path, output_dir: Path) -> list[Path]:
+    """Convert raw streaming request logs into cassettes.
+
+    Args:
+        log_dir: CCPROXY_REQUEST_LOG_DIR of a proxy run with CCPROXY_LOG_REQUESTS
+        output_dir: Directory to write cassettes to
+
+    Returns:
+        Paths of the written cassettes
+    """
+    streams: dict[str, Path] = {}
+    for log_type in reversed(_STREAM_LOG_TYPES):
+        for path in sorted(log_dir.glob(f"*_{log_type}.raw")):
+            streams[path.name.removesuffix(f"_{log_type}.raw")] = path
+
+    written = []
+    for prefix, path in sorted(streams.items()):
+        events = split_sse_events(path.read_text(encoding="utf-8", errors="replace"))
+        api = detect_api(events)
+        if api is None:
+            logger.debug("mock_upstream_stream_skipped", file=str(path))
+            continue
+
+        status_code, headers = 200, {}
+        headers_file = log_dir / f"{prefix}_upstream_response_headers.json"
+        if headers_file.exists():
+            logged = json.loads(headers_file.read_text(encoding="utf-8"))
+            status_code = int(logged.get("status_code", 200))
+            headers = {
+                key.lower(): str(value)
+                for key, value in logged.get("headers", {}).items()
+                if key.lower() not in _SKIPPED_HEADERS
+                and "ratelimit" not in key.lower()
+            }
+
+        cassette = Cassette(
+            name=prefix,
+            api=api,
+            status_code=status_code,
+            headers=headers,
+            events=events,
+        )
+        written.append(cassette.save(output_dir))
+
+    logger.info(
+        "mock_upstream_cassettes_recorded",
+        log_dir=str(log_dir),
+        streams=len(streams),
+        cassettes=len(written),
+    )
+    return written
+
+
+def load_cassettes(directory: Path) -> list[Cassette]:
+    """Load all cassettes in a directory, skipping unreadable files."""
+    cassettes = []
+    for path in sorted(directory.glob(f"*{CASSETTE_SUFFIX}")):
+        try:
+            cassettes.append(Cassette.model_validate_json(path.read_text("utf-8")))
+        except Exception as e:
+            logger.warning(
+                "mock_upstream_cassette_invalid", file=str(path), error=str(e)
+            )
+    return cassettes
+
+
+def synthetic_cassette(api: UpstreamApi, model: str) -> Cassette:
+    """Generate a cassette for an API without recordings."""
+    generator = RealisticMockResponseGenerator()
+    content, input_tokens, output_tokens = generator.generate_response_content(
+        "short", model
+    )
+
+    if api == "anthropic":
+        chunks = generator.generate_realistic_anthropic_stream(
+            f"msg_{uuid.uuid4().hex[:24]}",
+            model,
+            content,
+            input_tokens,
+            output_tokens,
+            0,
+            0,
+        )
+    else:
+        chunks = _responses_api_stream(model, content, input_tokens, output_tokens)
+
+    return Cassette(
+        name=f"synthetic-{api}",
+        api=api,
+        events=[
+            f"event: {chunk['type']}\ndata: {json.dumps(chunk)}" for chunk in chunks
+        ],
+    )
+
+
+def _responses_api_stream(
+    model: str, content: str, input_tokens: int, output_tokens: int
+) -> list[dict[str, Any]]:
+    response: dict[str, Any] = {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "model": model,
+        "status": "in_progress",
+        "output": [],
+    }
+    item_id = f"msg_{uuid.uuid4().hex}"
+    words = content.split(" ")
+    deltas = [
+        {
+            "type": "response.output_text.delta",
+            "item_id": item_id,
+            "output_index": 0,
+            "content_index": 0,
+            "delta": word if index == 0 else f" {word}",
+        }
+        for index, word in enumerate(words)
+    ]
+    completed = {
+        **response,
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "id": item_id,
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": content}],
+            }
+        ],
+        "usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        },
+    }
+    return [
+        {"type": "response.created", "response": response},
+        *deltas,
+        {"type": "response.completed", "response": completed},
+    ]
+
+
+def _delta_text(data: dict[str, Any]) -> str | None:
+    """Generated text carried by a delta event, None for other events."""
+    event_type = str(data.get("type", ""))
+    if event_type == "content_block_delta":
+        delta = data.get("delta") or {}
+        return str(
+            delta.get("text")
+            or delta.get("partial_json")
+            or delta.get("thinking")
+            or ""
+        )
+    if event_type.startswith("response.") and event_type.endswith(".delta"):
+        return str(data.get("delta") or "")
+    return None
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _quantile(values: list[float], q: float) -> float:
+    """Nearest-rank quantile of sorted values, 0.0 when empty."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def anthropic_message(events: list[str]) -> dict[str, Any]:
+    """Assemble a non-streaming Messages API response from stream events."""
+    message: dict[str, Any] = {}
+    blocks: dict[int, dict[str, Any]] = {}
+    partial_json: dict[int, str] = {}
+
+    for event in events:
+        data = event_data(event)
+        if data is None:
+            continue
+        event_type = data.get("type")
+        index = int(data.get("index", 0))
+        if event_type == "message_start":
+            message = dict(data.get("message") or {})
+        elif event_type == "content_block_start":
+            blocks[index] = dict(data.get("content_block") or {})
+        elif event_type == "content_block_delta":
+            delta = data.get("delta") or {}
+            block = blocks.setdefault(index, {"type": "text", "text": ""})
+            if "text" in delta:
+                block["text"] = block.get("text", "") + delta["text"]
+            elif "thinking" in delta:
+                block["thinking"] = block.get("thinking", "") + delta["thinking"]
+            elif "partial_json" in delta:
+                partial_json[index] = (
+                    partial_json.get(index, "") + delta["partial_json"]
+                )
+        elif event_type == "message_delta":
+            message.update(data.get("delta") or {})
+            message["usage"] = {
+                **(message.get("usage") or {}),
+                **(data.get("usage") or {}),
+            }
+
+    for index, raw_input in partial_json.items():
+        try:
+            blocks[index]["input"] = json.loads(raw_input)
+        except json.JSONDecodeError:
+            blocks[index]["input"] = {}
+    message["content"] = [blocks[index] for index in sorted(blocks)]
+    return message
+
+
+def responses_api_response(events: list[str]) -> dict[str, Any]:
+    """The final response object of a Responses API stream."""
+    for event in reversed(events):
+        data = event_data(event)
+        if data and data.get("type") in ("response.completed", "response.failed"):
+            return dict(data.get("response") or {})
+    return {}
+
+
+@dataclass
+class _PreparedStream:
+    """Cassette encoded once for replay, with output tokens per event."""
+
+    cassette: Cassette
+    chunks: list[bytes]
+    tokens: list[int]
+
+    @classmethod
+    def from_cassette(cls, cassette: Cassette) -> _PreparedStream:
+        tokens = []
+        for event in cassette.events:
+            data = event_data(event)
+            text = _delta_text(data) if data else None
+            tokens.append(_estimate_tokens(text) if text is not None else 0)
+        chunks = [f"{event}\n\n".encode() for event in cassette.events]
+        return cls(cassette=cassette, chunks=chunks, tokens=tokens)
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(self.tokens)
+
+
+class MockUpstream:
+    """Replays cassettes with configured timing, errors and rate limits."""
+
+    def __init__(
+        self,
+        config: MockUpstreamConfig | None = None,
+        cassettes: list[Cassette] | None = None,
+    ) -> None:
+        self.config = config or MockUpstreamConfig()
+        if cassettes is None and self.config.cassette_dir:
+            cassettes = load_cassettes(self.config.cassette_dir)
+        self._rng = random.Random(self.config.seed)
+        self._streams: dict[UpstreamApi, list[_PreparedStream]] = {
+            "anthropic": [],
+            "codex": [],
+        }
+        for cassette in cassettes or []:
+            self._streams[cassette.api].append(_PreparedStream.from_cassette(cassette))
+        self._next: dict[UpstreamApi, int] = {"anthropic": 0, "codex": 0}
+
+        self._window_start = time.monotonic()
+        self._requests_used = 0
+        self._tokens_used = 0
+        self.stats = {
+            "requests": 0,
+            "streams": 0,
+            "errors": 0,
+            "mid_stream_errors": 0,
+            "rate_limited": 0,
+        }
+        self._ttft_ms: list[float] = []
+
+    def create_app(self) -> FastAPI:
+        """Create the FastAPI application serving both upstream APIs."""
+        app = FastAPI(
+            title="CCProxy Mock Upstream",
+            openapi_url=None,
+            docs_url=None,
+            redoc_url=None,
+        )
+
+        @app.post("/v1/messages")
+        async def messages(request: Request) -> Response:
+            return await self.handle(request, "anthropic")
+
+        @app.post("/responses")
+        async def responses(request: Request) -> Response:
+            return await self.handle(request, "codex")
+
+        @app.get("/stats")
+        async def stats() -> dict[str, Any]:
+            return self.get_stats()
+
+        @app.post("/stats/reset")
+        async def reset_stats() -> dict[str, Any]:
+            self.reset_stats()
+            return self.get_stats()
+
+        return app
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get request and error counts and the time to first token."""
+        ttft = sorted(self._ttft_ms)
+        return {
+            **self.stats,
+            "cassettes": {api: len(streams) for api, streams in self._streams.items()},
+            "ttft_ms": {
+                "count": len(ttft),
+                "p50": _quantile(ttft, 0.5),
+                "p99": _quantile(ttft, 0.99),
+            },
+        }
+
+    def reset_stats(self) -> None:
+        """Zero the counters and time to first token samples."""
+        self.stats = dict.fromkeys(self.stats, 0)
+        self._ttft_ms.clear()
+
+    async def handle(self, request: Request, api: UpstreamApi) -> Response:
+        """Answer one upstream request."""
+        try:
+            body = await request.json()
+        except ValueError:
+            body = {}
+        started = time.monotonic()
+        self.stats["requests"] += 1
+
+        limited = self._consume_rate_limit()
+        headers = self._rate_limit_headers(api)
+        if limited:
+            self.stats["rate_limited"] += 1
+            return self._error_response(api, 429, headers)
+        if self._rng.random() < self.config.error_rate:
+            self.stats["errors"] += 1
+            status_code = self._rng.choice(self.config.error_status_codes)
+            return self._error_response(api, status_code, headers)
+
+        stream = self._next_stream(api, str(body.get("model") or "mock-model"))
+        self._tokens_used += stream.total_tokens
+        headers = {**stream.cassette.headers, **headers}
+        headers.pop("content-type", None)
+
+        if not body.get("stream"):
+            await asyncio.sleep(self._generation_seconds(stream.total_tokens))
+            events = stream.cassette.events
+            content = (
+                anthropic_message(events)
+                if api == "anthropic"
+                else responses_api_response(events)
+            )
+            return JSONResponse(
+                content, status_code=stream.cassette.status_code, headers=headers
+            )
+
+        self.stats["streams"] += 1
+        return StreamingResponse(
+            self._replay(stream, api, started),
+            status_code=stream.cassette.status_code,
+            headers=headers,
+            media_type="text/event-stream",
+        )
+
+    async def _replay(
+        self, stream: _PreparedStream, api: UpstreamApi, started: float
+    ) -> AsyncIterator[bytes]:
+        if self.config.ttft_ms:
+            await asyncio.sleep(self.config.ttft_ms / 1000)
+
+        fail_at = None
+        if (
+            len(stream.chunks) > 1
+            and self._rng.random() < self.config.mid_stream_error_rate
+        ):
+            fail_at = self._rng.randrange(1, len(stream.chunks))
+
+        rate = self.config.tokens_per_second
+        first_token = True
+        for index, (chunk, tokens) in enumerate(
+            zip(stream.chunks, stream.tokens, strict=True)
+        ):
+            if index == fail_at:
+                self.stats["mid_stream_errors"] += 1
+                yield self._error_event(api)
+                return
+            if tokens and rate > 0:
+                await asyncio.sleep(tokens / rate)
+            if tokens and first_token:
+                first_token = False
+                self._ttft_ms.append((time.monotonic() - started) * 1000)
+            yield chunk
+
+    def _next_stream(self, api: UpstreamApi, model: str) -> _PreparedStream:
+        streams = self._streams[api]
+        if not streams:
+            return _PreparedStream.from_cassette(synthetic_cassette(api, model))
+        stream = streams[self._next[api] % len(streams)]
+        self._next[api] += 1
+        return stream
+
+    def _generation_seconds(self, tokens: int) -> float:
+        rate = self.config.tokens_per_second
+        return self.config.ttft_ms / 1000 + (tokens / rate if rate > 0 else 0.0)
+
+    def _consume_rate_limit(self) -> bool:
+        """Count a request, returning True when the current minute is exhausted."""
+        if not self.config.rate_limit_requests:
+            return False
+        if time.monotonic() - self._window_start >= 60:
+            self._window_start = time.monotonic()
+            self._requests_used = 0
+            self._tokens_used = 0
+        if (
+            self._requests_used >= self.config.rate_limit_requests
+            or self._tokens_used >= self.config.rate_limit_tokens
+        ):
+            return True
+        self._requests_used += 1
+        return False
+
+    def _rate_limit_headers(self, api: UpstreamApi) -> dict[str, str]:
+        config = self.config
+        if not config.rate_limit_requests:
+            return {}
+        reset_in = max(0.0, 60 - (time.monotonic() - self._window_start))
+        requests_remaining = max(0, config.rate_limit_requests - self._requests_used)
+        tokens_remaining = max(0, config.rate_limit_tokens - self._tokens_used)
+
+        if api == "anthropic":
+            reset_at = (datetime.now(UTC) + timedelta(seconds=reset_in)).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+            return {
+                "anthropic-ratelimit-requests-limit": str(config.rate_limit_requests),
+                "anthropic-ratelimit-requests-remaining": str(requests_remaining),
+                "anthropic-ratelimit-requests-reset": reset_at,
+                "anthropic-ratelimit-tokens-limit": str(config.rate_limit_tokens),
+                "anthropic-ratelimit-tokens-remaining": str(tokens_remaining),
+                "anthropic-ratelimit-tokens-reset": reset_at,
+            }
+        return {
+            "x-ratelimit-limit-requests": str(config.rate_limit_requests),
+            "x-ratelimit-remaining-requests": str(requests_remaining),
+            "x-ratelimit-reset-requests": f"{reset_in:.0f}s",
+            "x-ratelimit-limit-tokens": str(config.rate_limit_tokens),
+            "x-ratelimit-remaining-tokens": str(tokens_remaining),
+            "x-ratelimit-reset-tokens": f"{reset_in:.0f}s",
+        }
+
+    def _error_response(
+        self, api: UpstreamApi, status_code: int, headers: dict[str, str]
+    ) -> JSONResponse:
+        error_type = _ERROR_TYPES.get(status_code, "api_error")
+        message = f"Mock upstream {error_type}"
+        if status_code in (429, 529):
+            headers = {**headers, "retry-after": "1"}
+        content: dict[str, Any] = (
+            {"type": "error", "error": {"type": error_type, "message": message}}
+            if api == "anthropic"
+            else {"error": {"type": error_type, "code": error_type, "message": message}}
+        )
+        return JSONResponse(content, status_code=status_code, headers=headers)
+
+    def _error_event(self, api: UpstreamApi) -> bytes:
+        if api == "anthropic":
+            data: dict[str, Any] = {
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Overloaded"},
+            }
+        else:
+            data = {
+                "type": "response.failed",
+                "response": {
+                    "status": "failed",
+                    "error": {"code": "server_error", "message": "Mock stream failure"},
+                },
+            }
+        return f"event: {data['type']}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def create_mock_upstream_server(
+    config: MockUpstreamConfig, upstream: MockUpstream | None = None
+) -> uvicorn.Server:
+    """Create a uvicorn server for the mock upstream; run it with ``serve()``."""
+    import uvicorn
+
+    upstream = upstream or MockUpstream(config)
+    server_config = uvicorn.Config(
+        upstream.create_app(),
+        host=config.host,
+        port=config.port,
+        log_level="warning",
+        access_log=False,
+    )
+    return uvicorn.Server(server_config)
@@ -0,0 +1,189 @@
+"""Context-window aware history compaction for Messages API requests.
+
+When the estimated size of a request exceeds the model's context window
+minus the requested ``max_tokens``, the oldest parts of the conversation
+are removed before the request is sent upstream:
+
+1. Large tool results in older turns are replaced with a short placeholder.
+2. If that is not enough, the oldest turns are dropped and a note is added
+   to the first remaining user message.
+
+The most recent messages are never dropped or elided.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import Any
+
+from ccproxy.utils.token_estimation import TokenEstimator, get_token_estimator
+
+
+TOOL_RESULT_PLACEHOLDER = (
+    "[tool result omitted by ccproxy to fit the context window: ~{tokens} tokens]"
+)
+DROPPED_MESSAGES_NOTE = "[ccproxy omitted {count} earlier messages (~{tokens} tokens) to fit the context window]"
+ORPHANED_TOOL_RESULT_NOTE = "[tool result for an omitted tool call]"
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of compacting a request payload."""
+
+    payload: dict[str, Any]
+    estimated_tokens_before: int
+    estimated_tokens_after: int
+    budget: int
+    tool_results_elided: int = 0
+    messages_dropped: int = 0
+
+    @property
+    def compacted(self) -> bool:
+        """Whether the payload was modified."""
+        return self.tool_results_elided > 0 or self.messages_dropped > 0
+
+    @property
+    def dropped_tokens(self) -> int:
+        """Estimated number of tokens removed from the request."""
+        return max(0, self.estimated_tokens_before - self.estimated_tokens_after)
+
+    @property
+    def fits(self) -> bool:
+        """Whether the compacted payload fits the budget."""
+        return self.estimated_tokens_after <= self.budget
+
+
+def _has_tool_result(message: dict[str, Any]) -> bool:
+    content = message.get("content")
+    return isinstance(content, list) and any(
+        isinstance(block, dict) and block.get("type") == "tool_result"
+        for block in content
+    )
+
+
+class ContextCompactor:
+    """Fit Messages API payloads into a token budget."""
+
+    def __init__(
+        self,
+        estimator: TokenEstimator | None = None,
+        preserve_recent_messages: int = 4,
+        min_tool_result_tokens: int = 200,
+    ) -> None:
+        """Initialize the compactor.
+
+        Args:
+            estimator: Token estimator (defaults to the shared instance)
+            preserve_recent_messages: Number of trailing messages never modified
+            min_tool_result_tokens: Tool results smaller than this are kept
+        """
+        self.estimator = estimator or get_token_estimator()
+        self.preserve_recent_messages = max(1, preserve_recent_messages)
+        self.min_tool_result_tokens = min_tool_result_tokens
+
+    def compact(self, payload: dict[str, Any], budget: int) -> CompactionResult:
+        """Compact ``payload`` so its estimated input size fits ``budget``.
+
+        The input payload is not modified; a compacted copy is returned in
+        the result when changes are needed.
+
+        Args:
+            payload: Anthropic Messages API request body
+            budget: Maximum number of input tokens
+
+        Returns:
+            Compaction result with the (possibly) new payload and statistics
+        """
+        messages = payload.get("messages")
+        estimator = self.estimator
+        fixed_tokens = estimator.estimate_system(
+            payload.get("system")
+        ) + estimator.estimate_tools(payload.get("tools"))
+
+        if not isinstance(messages, list) or not messages:
+            return CompactionResult(payload, fixed_tokens, fixed_tokens, budget)
+
+        message_tokens = [estimator.estimate_message(m) for m in messages]
+        total_before = fixed_tokens + sum(message_tokens)
+        result = CompactionResult(payload, total_before, total_before, budget)
+        if total_before <= budget:
+            return result
+
+        messages = list(messages)
+        protected_start = max(0, len(messages) - self.preserve_recent_messages)
+        total = total_before
+
+        # 1. Elide tool results in older turns, oldest first
+        for index in range(protected_start):
+            if total <= budget:
+                break
+            if not _has_tool_result(messages[index]):
+                continue
+
+            message = copy.deepcopy(messages[index])
+            elided = 0
+            saved_tokens = 0
+            for block in message["content"]:
+                if not isinstance(block, dict) or block.get("type") != "tool_result":
+                    continue
+                block_tokens = estimator.estimate_content(block.get("content"))
+                if block_tokens < self.min_tool_result_tokens:
+                    continue
+                placeholder = TOOL_RESULT_PLACEHOLDER.format(tokens=block_tokens)
+                block["content"] = placeholder
+                # The block keeps its tool_use_id, whose cached estimate is
+                # for the original content, so account for the change here
+                saved_tokens += block_tokens - estimator.estimate_text(placeholder)
+                elided += 1
+
+            if elided:
+                messages[index] = message
+                total -= saved_tokens
+                message_tokens[index] -= saved_tokens
+                result.tool_results_elided += elided
+
+        # 2. Drop the oldest turns
+        drop = 0
+        dropped_tokens = 0
+        while total - dropped_tokens > budget and drop < protected_start:
+            dropped_tokens += message_tokens[drop]
+            drop += 1
+
+        # The conversation must start with a user message
+        while drop and drop < protected_start and messages[drop].get("role") != "user":
+            dropped_tokens += message_tokens[drop]
+            drop += 1
+
+        if drop and messages[drop].get("role") != "user":
+            # No valid cut point outside the protected tail; keep the turns
+            drop = 0
+            dropped_tokens = 0
+
+        if drop:
+            first = copy.deepcopy(messages[drop])
+            content = first.get("content")
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            # Tool results for tool_use blocks in dropped turns would be
+            # rejected upstream, so keep only a textual marker for them
+            content = [
+                {"type": "text", "text": ORPHANED_TOOL_RESULT_NOTE}
+                if isinstance(block, dict) and block.get("type") == "tool_result"
+                else block
+                for block in (content or [])
+            ]
+            note = {
+                "type": "text",
+                "text": DROPPED_MESSAGES_NOTE.format(count=drop, tokens=dropped_tokens),
+            }
+            first["content"] = [note, *content]
+
+            note_tokens = estimator.estimate_message(first) - message_tokens[drop]
+            messages = [first, *messages[drop + 1 :]]
+            total = total - dropped_tokens + note_tokens
+            result.messages_dropped = drop
+
+        if result.compacted:
+            result.payload = {**payload, "messages": messages}
+            result.estimated_tokens_after = total
+
+        return result
@@ -4,12 +4,87 @@ This module provides shared cost calculation functionality that can be used
 across different services to ensure consistent pricing calculations.
 """
 
+from typing import TYPE_CHECKING
+
 import structlog
 
 
+if TYPE_CHECKING:
+    from ccproxy.pricing.models import PricingData
+    from ccproxy.services.model_registry import ModelRates
+
+
 logger = structlog.get_logger(__name__)
 
 
+def _load_pricing_from_disk(stale_cache_event: str) -> "PricingData | None":
+    """Read pricing data from the cache file (used before the registry has pricing)."""
+    import json
+
+    from ccproxy.config.pricing import PricingSettings
+    from ccproxy.pricing.cache import PricingCache
+    from ccproxy.pricing.loader import PricingLoader
+
+    # Create pricing components with dependency injection
+    settings = PricingSettings()
+    cache = PricingCache(settings)
+    cached_data = cache.load_cached_data()
+
+    # If cache is expired, try to use stale cache as fallback
+    if not cached_data:
+        try:
+            if cache.cache_file.exists():
+                with cache.cache_file.open(encoding="utf-8") as f:
+                    cached_data = json.load(f)
+                logger.debug(
+                    stale_cache_event,
+                    cache_age_hours=cache.get_cache_info().get("age_hours"),
+                )
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    if not cached_data:
+        return None
+
+    return PricingLoader.load_pricing_from_data(cached_data, verbose=False)
+
+
+def _get_model_rates(
+    model: str, stale_cache_event: str
+) -> tuple[str, "ModelRates | None", bool]:
+    """Look up pricing rates for a model.
+
+    Rates come from the in-memory model registry once pricing has been loaded;
+    until then the pricing cache file is read directly.
+
+    Returns:
+        Tuple of (canonical_model, rates, pricing_available)
+    """
+    from ccproxy.services.model_registry import ModelRates, get_model_registry
+
+    registry = get_model_registry()
+    canonical_model = registry.canonical_name(model)
+    if registry.has_pricing:
+        return canonical_model, registry.rates(canonical_model), True
+
+    pricing_data = _load_pricing_from_disk(stale_cache_event)
+    if not pricing_data:
+        return canonical_model, None, False
+    model_pricing = pricing_data.get(canonical_model)
+    if model_pricing is None:
+        return canonical_model, None, True
+    return (
+        canonical_model,
+        ModelRates(
+            input=float(model_pricing.input),
+            output=float(model_pricing.output),
+            cache_read=float(model_pricing.cache_read),
+            cache_write=float(model_pricing.cache_write),
+        ),
+        True,
+    )
+
+
 def calculate_token_cost(
     tokens_input: int | None,
     tokens_output: int | None,
@@ -41,41 +116,13 @@ def calculate_token_cost(
         return None
 
     try:
-        # Import pricing system components
-        from ccproxy.config.pricing import PricingSettings
-        from ccproxy.pricing.cache import PricingCache
-        from ccproxy.pricing.loader import PricingLoader
-
-        # Get canonical model name
-        canonical_model = PricingLoader.get_canonical_model_name(model)
-
-        # Create pricing components with dependency injection
-        settings = PricingSettings()
-        cache = PricingCache(settings)
-        cached_data = cache.load_cached_data()
-
-        # If cache is expired, try to use stale cache as fallback
-        if not cached_data:
-            try:
-                import json
-
-                if cache.cache_file.exists():
-                    with cache.cache_file.open(encoding="utf-8") as f:
-                        cached_data = json.load(f)
-                    logger.debug(
-                        "cost_calculation_using_stale_cache",
-                        cache_age_hours=cache.get_cache_info().get("age_hours"),
-                    )
-            except (OSError, json.JSONDecodeError):
-                pass
-
-        if not cached_data:
+        canonical_model, rates, pricing_available = _get_model_rates(
+            model, "cost_calculation_using_stale_cache"
+        )
+        if not pricing_available:
             logger.debug("cost_calculation_skipped", reason="no_pricing_data")
             return None
-
-        # Load pricing data
-        pricing_data = PricingLoader.load_pricing_from_data(cached_data, verbose=False)
-        if not pricing_data or canonical_model not in pricing_data:
+        if rates is None:
             logger.debug(
                 "cost_calculation_skipped",
                 model=canonical_model,
@@ -83,16 +130,9 @@ def calculate_token_cost(
             )
             return None
 
-        model_pricing = pricing_data[canonical_model]
-
         # Calculate cost (pricing is per 1M tokens)
-        input_cost = ((tokens_input or 0) / 1_000_000) * float(model_pricing.input)
-        output_cost = ((tokens_output or 0) / 1_000_000) * float(model_pricing.output)
-        cache_read_cost = ((cache_read_tokens or 0) / 1_000_000) * float(
-            model_pricing.cache_read
-        )
-        cache_write_cost = ((cache_write_tokens or 0) / 1_000_000) * float(
-            model_pricing.cache_write
+        input_cost, output_cost, cache_read_cost, cache_write_cost = rates.costs(
+            tokens_input, tokens_output, cache_read_tokens, cache_write_tokens
         )
 
         total_cost = input_cost + output_cost + cache_read_cost + cache_write_cost
@@ -146,52 +186,15 @@ def calculate_cost_breakdown(
         return None
 
     try:
-        # Import pricing system components
-        from ccproxy.config.pricing import PricingSettings
-        from ccproxy.pricing.cache import PricingCache
-        from ccproxy.pricing.loader import PricingLoader
-
-        # Get canonical model name
-        canonical_model = PricingLoader.get_canonical_model_name(model)
-
-        # Create pricing components with dependency injection
-        settings = PricingSettings()
-        cache = PricingCache(settings)
-        cached_data = cache.load_cached_data()
-
-        # If cache is expired, try to use stale cache as fallback
-        if not cached_data:
-            try:
-                import json
-
-                if cache.cache_file.exists():
-                    with cache.cache_file.open(encoding="utf-8") as f:
-                        cached_data = json.load(f)
-                    logger.debug(
-                        "cost_breakdown_using_stale_cache",
-                        cache_age_hours=cache.get_cache_info().get("age_hours"),
-                    )
-            except (OSError, json.JSONDecodeError):
-                pass
-
-        if not cached_data:
-            return None
-
-        # Load pricing data
-        pricing_data = PricingLoader.load_pricing_from_data(cached_data, verbose=False)
-        if not pricing_data or canonical_model not in pricing_data:
+        canonical_model, rates, _ = _get_model_rates(
+            model, "cost_breakdown_using_stale_cache"
+        )
+        if rates is None:
             return None
 
-        model_pricing = pricing_data[canonical_model]
-
         # Calculate individual costs (pricing is per 1M tokens)
-        input_cost = ((tokens_input or 0) / 1_000_000) * float(model_pricing.input)
-        output_cost = ((tokens_output or 0) / 1_000_000) * float(model_pricing.output)
-        cache_read_cost = ((cache_read_tokens or 0) / 1_000_000) * float(
-            model_pricing.cache_read
-        )
-        cache_write_cost = ((cache_write_tokens or 0) / 1_000_000) * float(
-            model_pricing.cache_write
+        input_cost, output_cost, cache_read_cost, cache_write_cost = rates.costs(
+            tokens_input, tokens_output, cache_read_tokens, cache_write_tokens
         )
 
         total_cost = input_cost + output_cost + cache_read_cost + cache_write_cost
@@ -42,21 +42,34 @@ async def get_anthropic_models_async() -> list[dict[str, Any]]:
         claude_models = [model for model in available_models if model.startswith("claude-")]
         
         # Create Anthropic-style model entries
-        models = []
-        for model_id in claude_models:
-            models.append({
-                "type": "model",
-                "id": model_id,
-                "display_name": _get_display_name(model_id),
-                "created_at": _get_model_timestamp(model_id),
-            })
-        
-        return models
+        return build_anthropic_model_entries(claude_models)
     except Exception:
         # Fallback to static list if dynamic fetching fails
         return _get_fallback_anthropic_models()
 
 
+def build_anthropic_model_entries(model_ids: list[str] | None) -> list[dict[str, Any]]:
+    """Build Anthropic-style model entries.
+
+    Args:
+        model_ids: Claude model IDs, or None for the static fallback list
+
+    Returns:
+        List of Anthropic model entries
+    """
+    if model_ids is None:
+        return _get_fallback_anthropic_models()
+    return [
+        {
+            "type": "model",
+            "id": model_id,
+            "display_name": _get_display_name(model_id),
+            "created_at": _get_model_timestamp(model_id),
+        }
+        for model_id in model_ids
+    ]
+
+
 def _get_display_name(model_id: str) -> str:
     """Get display name for a model ID."""
     display_names = {
@@ -151,21 +164,34 @@ async def get_openai_models_async() -> list[dict[str, Any]]:
         )]
         
         # Create OpenAI-style model entries
-        models = []
-        for model_id in openai_models:
-            models.append({
-                "id": model_id,
-                "object": "model",
-                "created": _get_openai_model_timestamp(model_id),
-                "owned_by": "openai",
-            })
-        
-        return models
+        return build_openai_model_entries(openai_models)
     except Exception:
         # Fallback to static list if dynamic fetching fails
         return _get_fallback_openai_models()
 
 
+def build_openai_model_entries(model_ids: list[str] | None) -> list[dict[str, Any]]:
+    """Build OpenAI-style model entries.
+
+    Args:
+        model_ids: OpenAI model IDs, or None for the static fallback list
+
+    Returns:
+        List of OpenAI model entries
+    """
+    if model_ids is None:
+        return _get_fallback_openai_models()
+    return [
+        {
+            "id": model_id,
+            "object": "model",
+            "created": _get_openai_model_timestamp(model_id),
+            "owned_by": "openai",
+        }
+        for model_id in model_ids
+    ]
+
+
 def _get_openai_model_timestamp(model_id: str) -> int:
     """Get creation timestamp for an OpenAI model ID."""
     timestamps = {
@@ -282,6 +308,8 @@ async def get_models_list_async() -> dict[str, Any]:
 
 
 __all__ = [
+    "build_anthropic_model_entries",
+    "build_openai_model_entries",
     "get_anthropic_models",
     "get_anthropic_models_async", 
     "get_openai_models",
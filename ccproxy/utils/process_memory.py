@@ -0,0 +1,86 @@
+"""Resident memory of process trees read from ``/proc``.
+
+Used to attribute memory to Claude CLI subprocesses (and the tools they spawn)
+so the session pool can enforce a memory budget. On platforms without
+``/proc`` every lookup returns no data and callers treat memory as unknown.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+
+PROC_ROOT = Path("/proc")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def proc_available(proc_root: Path = PROC_ROOT) -> bool:
+    """Check whether per-process memory can be read on this platform."""
+    return (proc_root / "self" / "statm").exists()
+
+
+def _read_ppid(stat_path: Path) -> int | None:
+    try:
+        stat = stat_path.read_text()
+    except OSError:
+        return None
+    # The command name is parenthesised and may contain spaces
+    fields = stat[stat.rfind(")") + 2 :].split()
+    return int(fields[1]) if len(fields) > 1 else None
+
+
+def _read_rss(pid: int, proc_root: Path) -> int:
+    try:
+        statm = (proc_root / str(pid) / "statm").read_text().split()
+    except OSError:
+        return 0
+    return int(statm[1]) * PAGE_SIZE if len(statm) > 1 else 0
+
+
+def children_map(proc_root: Path = PROC_ROOT) -> dict[int, list[int]]:
+    """Map each running pid to its direct children."""
+    children: dict[int, list[int]] = {}
+    for entry in proc_root.iterdir():
+        if not entry.name.isdigit():
+            continue
+        ppid = _read_ppid(entry / "stat")
+        if ppid is not None:
+            children.setdefault(ppid, []).append(int(entry.name))
+    return children
+
+
+def process_tree_rss(
+    pids: Iterable[int], proc_root: Path = PROC_ROOT
+) -> dict[int, int]:
+    """Resident set size in bytes of each pid together with its descendants.
+
+    The process table is scanned once for all pids. Pids that are no longer
+    running are omitted from the result.
+
+    Args:
+        pids: Root pids of the process trees to measure
+        proc_root: Mount point of procfs
+
+    Returns:
+        Mapping of root pid to the summed RSS of its tree
+    """
+    roots = [pid for pid in pids if (proc_root / str(pid)).exists()]
+    if not roots:
+        return {}
+
+    children = children_map(proc_root)
+    result: dict[int, int] = {}
+    for root in roots:
+        total = 0
+        stack, seen = [root], {root}
+        while stack:
+            pid = stack.pop()
+            total += _read_rss(pid, proc_root)
+            for child in children.get(pid, ()):
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        result[root] = total
+    return result
@@ -17,6 +17,8 @@ from ccproxy.auth.credentials_adapter import CredentialsAuthManager
 from ccproxy.auth.exceptions import CredentialsNotFoundError
 from ccproxy.auth.openai.credentials import OpenAITokenManager
 from ccproxy.observability import get_metrics
+from ccproxy.observability.access_bus import get_access_log_bus
+from ccproxy.observability.loop_lag import configure_loop_lag_monitor
 
 # Note: get_claude_cli_info is imported locally to avoid circular imports
 from ccproxy.observability.storage.duckdb_simple import SimpleDuckDBStorage
@@ -298,6 +300,41 @@ async def initialize_log_storage_startup(app: FastAPI, settings: Settings) -> No
             # Continue without log storage (graceful degradation)
 
 
+async def setup_log_archival_startup(app: FastAPI, settings: Settings) -> None:
+    """Schedule archival of old access logs once log storage is available.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    scheduler = getattr(app.state, "scheduler", None)
+    storage = getattr(app.state, "log_storage", None)
+    if not scheduler or not storage or not settings.scheduler.log_archival_enabled:
+        return
+
+    try:
+        await scheduler.add_task(
+            task_name="log_archival",
+            task_type="log_archival",
+            interval_seconds=settings.scheduler.log_archival_interval_hours * 3600,
+            enabled=True,
+            storage=storage,
+            archive_dir=str(settings.observability.log_archive_dir),
+            retention_days=settings.observability.log_retention_days,
+        )
+        logger.debug(
+            "log_archival_task_added",
+            interval_hours=settings.scheduler.log_archival_interval_hours,
+            retention_days=settings.observability.log_retention_days,
+        )
+    except Exception as e:
+        logger.error(
+            "log_archival_task_add_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
 async def initialize_log_storage_shutdown(app: FastAPI) -> None:
     """Close log storage if initialized.
 
@@ -312,6 +349,94 @@ async def initialize_log_storage_shutdown(app: FastAPI) -> None:
             logger.error("log_storage_close_failed", error=str(e))
 
 
+async def start_access_log_bus_startup(app: FastAPI, settings: Settings) -> None:
+    """Start dispatching access log records to their sinks off the request path.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    try:
+        bus = get_access_log_bus()
+        bus.start()
+        app.state.access_log_bus = bus
+        logger.debug(
+            "access_log_bus_ready",
+            sinks=[sink.name for sink in bus.sinks],
+            queue_size=settings.observability.access_log_bus_queue_size,
+        )
+    except Exception as e:
+        logger.error("access_log_bus_start_failed", error=str(e))
+        # Records are delivered inline while the bus is not running
+
+
+async def stop_access_log_bus_shutdown(app: FastAPI) -> None:
+    """Deliver queued access log records and stop the bus.
+
+    Args:
+        app: FastAPI application instance
+    """
+    bus = getattr(app.state, "access_log_bus", None)
+    if bus is not None:
+        try:
+            await bus.stop()
+            logger.debug("access_log_bus_flushed")
+        except Exception as e:
+            logger.error("access_log_bus_stop_failed", error=str(e))
+
+
+async def start_loop_lag_monitor_startup(app: FastAPI, settings: Settings) -> None:
+    """Start sampling event loop lag when an interval is configured.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    interval_ms = settings.observability.event_loop_lag_interval_ms
+    if not interval_ms:
+        return
+    try:
+        monitor = configure_loop_lag_monitor(interval_ms / 1000)
+        monitor.start()
+        app.state.loop_lag_monitor = monitor
+        logger.debug("loop_lag_monitor_started", interval_ms=interval_ms)
+    except Exception as e:
+        logger.error("loop_lag_monitor_start_failed", error=str(e))
+
+
+async def stop_loop_lag_monitor_shutdown(app: FastAPI) -> None:
+    """Stop the event loop lag monitor.
+
+    Args:
+        app: FastAPI application instance
+    """
+    monitor = getattr(app.state, "loop_lag_monitor", None)
+    if monitor is not None:
+        await monitor.stop()
+
+
+async def initialize_model_registry_startup(app: FastAPI, settings: Settings) -> None:
+    """Build the model registry from cached pricing and model metadata.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    try:
+        from ccproxy.services.model_info_service import get_model_info_service
+
+        registry = await get_model_info_service().refresh_registry()
+        logger.debug(
+            "model_registry_initialized",
+            model_count=len(registry),
+            has_pricing=registry.has_pricing,
+            has_metadata=registry.has_metadata,
+        )
+    except Exception as e:
+        logger.warning("model_registry_initialization_failed", error=str(e))
+        # Continue with the static registry built from fallback data
+
+
 async def setup_scheduler_startup(app: FastAPI, settings: Settings) -> None:
     """Start scheduler system and configure tasks.
 
@@ -379,6 +504,37 @@ async def setup_session_manager_shutdown(app: FastAPI) -> None:
             logger.error("claude_sdk_session_manager_shutdown_failed", error=str(e))
 
 
+async def load_claude_detection_cache_startup(app: FastAPI, settings: Settings) -> None:
+    """Serve the last cached Claude detection data until detection is refreshed.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    detection_service = ClaudeDetectionService(settings)
+    claude_data = detection_service.load_latest_cached_data()
+    app.state.claude_detection_data = claude_data
+    app.state.claude_detection_service = detection_service
+    logger.debug("claude_detection_cache_loaded", version=claude_data.claude_version)
+
+
+async def load_codex_detection_cache_startup(app: FastAPI, settings: Settings) -> None:
+    """Serve the last cached Codex detection data until detection is refreshed.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    detection_service = CodexDetectionService(settings)
+    if settings.codex.enabled:
+        codex_data = detection_service.load_latest_cached_data()
+    else:
+        codex_data = detection_service._get_fallback_data()
+    app.state.codex_detection_data = codex_data
+    app.state.codex_detection_service = detection_service
+    logger.debug("codex_detection_cache_loaded", version=codex_data.codex_version)
+
+
 async def initialize_claude_detection_startup(app: FastAPI, settings: Settings) -> None:
     """Initialize Claude detection service.
 
@@ -513,6 +669,16 @@ async def initialize_permission_service_startup(
         settings: Application settings
     """
     if settings.claude.builtin_permissions:
+        try:
+            from ccproxy.api.services.permission_policy import (
+                configure_permission_policy,
+            )
+
+            policy = configure_permission_policy(settings.security.permission_policy)
+            logger.debug("permission_policy_configured", rules=len(policy.rules))
+        except Exception as e:
+            logger.error("permission_policy_configuration_failed", error=str(e))
+
         try:
             from ccproxy.api.services.permission_service import get_permission_service
 
@@ -586,6 +752,57 @@ async def setup_permission_service_shutdown(app: FastAPI, settings: Settings) ->
             logger.error("permission_service_stop_failed", error=str(e))
 
 
+async def initialize_batch_service_startup(app: FastAPI, settings: Settings) -> None:
+    """Initialize the local batch service and resume interrupted batches.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    if not settings.batch.enabled:
+        logger.debug("batch_service_skipped", reason="batch_disabled")
+        return
+
+    try:
+        from ccproxy.services.batch import BatchService, create_proxy_batch_executor
+
+        batch_service = BatchService(
+            settings=settings.batch,
+            executor=create_proxy_batch_executor(settings, app.state),
+        )
+        await batch_service.start()
+        app.state.batch_service = batch_service
+        logger.debug(
+            "batch_service_initialized",
+            storage_dir=settings.batch.storage_dir,
+            max_concurrency=settings.batch.max_concurrency,
+        )
+    except Exception as e:
+        logger.error("batch_service_initialization_failed", error=str(e))
+        # Continue without batch processing (endpoints return 503)
+
+
+async def setup_batch_service_shutdown(app: FastAPI) -> None:
+    """Suspend running batches so they resume on the next startup.
+
+    Also closes the HTTP client of the batch executor.
+
+    Args:
+        app: FastAPI application instance
+    """
+    batch_service = getattr(app.state, "batch_service", None)
+    if batch_service is not None:
+        from ccproxy.services.batch import ProxyServiceBatchExecutor
+
+        try:
+            await batch_service.stop()
+            if isinstance(batch_service.executor, ProxyServiceBatchExecutor):
+                await batch_service.executor.close()
+            logger.debug("batch_service_stopped")
+        except Exception as e:
+            logger.error("batch_service_stop_failed", error=str(e))
+
+
 async def flush_streaming_batches_shutdown(app: FastAPI) -> None:
     """Flush any remaining streaming log batches.
 
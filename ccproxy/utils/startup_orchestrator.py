@@ -0,0 +1,259 @@
+"""Dependency-aware startup orchestration for the application lifespan.
+
+Lifecycle components declare the components they depend on. Components whose
+dependencies are satisfied start concurrently. Critical components run
+without a timeout unless they declare one, since the server cannot serve
+traffic without them; deferred components are bounded by a default timeout.
+Deferred components (version checks, CLI probes, detection refresh)
+are scheduled as background tasks once the critical components are up, so the
+server accepts traffic without waiting for them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal, NotRequired, TypedDict
+
+import structlog
+from fastapi import FastAPI
+
+
+logger = structlog.get_logger(__name__)
+
+
+ComponentStatus = Literal[
+    "pending", "running", "completed", "failed", "timeout", "cancelled", "skipped"
+]
+
+
+class LifecycleComponent(TypedDict):
+    name: str
+    startup: Callable[[FastAPI, Any], Awaitable[None]] | None
+    shutdown: (
+        Callable[[FastAPI], Awaitable[None]]
+        | Callable[[FastAPI, Any], Awaitable[None]]
+        | None
+    )
+    depends_on: NotRequired[list[str]]
+    timeout: NotRequired[float | None]
+    deferred: NotRequired[bool]
+
+
+class ShutdownComponent(TypedDict):
+    name: str
+    shutdown: Callable[[FastAPI], Awaitable[None]] | None
+
+
+def component_slug(name: str) -> str:
+    """Return the snake_case form of a component name used in log events."""
+    return name.lower().replace(" ", "_")
+
+
+@dataclass
+class ComponentTiming:
+    """Startup outcome and timing of a single lifecycle component."""
+
+    name: str
+    deferred: bool
+    depends_on: list[str] = field(default_factory=list)
+    status: ComponentStatus = "pending"
+    started_at_ms: float | None = None
+    duration_ms: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "deferred": self.deferred,
+            "depends_on": self.depends_on,
+            "started_at_ms": _round_ms(self.started_at_ms),
+            "duration_ms": _round_ms(self.duration_ms),
+            "error": self.error,
+        }
+
+
+def _round_ms(value: float | None) -> float | None:
+    return round(value, 2) if value is not None else None
+
+
+class StartupOrchestrator:
+    """Run lifecycle component startups concurrently in dependency order."""
+
+    def __init__(
+        self,
+        components: Sequence[LifecycleComponent],
+        deferred_timeout: float | None = 30.0,
+    ) -> None:
+        """Validate the dependency graph of the components.
+
+        Args:
+            components: Lifecycle components, in declaration order
+            deferred_timeout: Timeout in seconds for deferred components
+                without their own ``timeout`` (None waits indefinitely).
+                Critical components only time out if they set ``timeout``.
+
+        Raises:
+            ValueError: If names repeat, a dependency is unknown, the graph has
+                a cycle, or a critical component depends on a deferred one
+        """
+        self.components = list(components)
+        self.deferred_timeout = deferred_timeout
+        self.timings: dict[str, ComponentTiming] = {}
+        self.critical_path_ms: float | None = None
+        self._by_name: dict[str, LifecycleComponent] = {}
+        self._done: dict[str, asyncio.Event] = {}
+        self._deferred_tasks: list[asyncio.Task[None]] = []
+        self._started_at: float | None = None
+
+        for component in self.components:
+            name = component["name"]
+            if name in self._by_name:
+                raise ValueError(f"Duplicate lifecycle component: {name}")
+            self._by_name[name] = component
+            self.timings[name] = ComponentTiming(
+                name=name,
+                deferred=component.get("deferred", False),
+                depends_on=list(component.get("depends_on", [])),
+                status="pending" if component["startup"] else "skipped",
+            )
+            self._done[name] = asyncio.Event()
+
+        for component in self.components:
+            for dependency in component.get("depends_on", []):
+                if dependency not in self._by_name:
+                    raise ValueError(
+                        f"Component '{component['name']}' depends on unknown "
+                        f"component '{dependency}'"
+                    )
+                if not component.get("deferred") and self._by_name[dependency].get(
+                    "deferred"
+                ):
+                    raise ValueError(
+                        f"Component '{component['name']}' cannot depend on "
+                        f"deferred component '{dependency}'"
+                    )
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through component '{name}'")
+            visiting.add(name)
+            for dependency in self._by_name[name].get("depends_on", []):
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._by_name:
+            visit(name)
+
+    async def start(self, app: FastAPI, settings: Any) -> None:
+        """Start critical components and schedule the deferred ones.
+
+        Returns once every critical component has finished, failed or timed
+        out. Deferred components keep running as background tasks.
+
+        Args:
+            app: FastAPI application instance
+            settings: Application settings
+        """
+        self._started_at = time.perf_counter()
+        for timing in self.timings.values():
+            if timing.status == "skipped":
+                self._done[timing.name].set()
+
+        critical = [
+            component
+            for component in self.components
+            if component["startup"] and not component.get("deferred")
+        ]
+        await asyncio.gather(
+            *(self._run(component, app, settings) for component in critical)
+        )
+        self.critical_path_ms = (time.perf_counter() - self._started_at) * 1000
+
+        for component in self.components:
+            if component["startup"] and component.get("deferred"):
+                self._deferred_tasks.append(
+                    asyncio.create_task(
+                        self._run(component, app, settings),
+                        name=f"startup_{component_slug(component['name'])}",
+                    )
+                )
+
+        logger.debug(
+            "startup_critical_path_completed",
+            duration_ms=round(self.critical_path_ms, 2),
+            deferred=len(self._deferred_tasks),
+        )
+
+    async def _run(
+        self, component: LifecycleComponent, app: FastAPI, settings: Any
+    ) -> None:
+        name = component["name"]
+        slug = component_slug(name)
+        timing = self.timings[name]
+        startup = component["startup"]
+        assert startup is not None and self._started_at is not None
+
+        for dependency in component.get("depends_on", []):
+            await self._done[dependency].wait()
+
+        timeout = component.get(
+            "timeout", self.deferred_timeout if component.get("deferred") else None
+        )
+        started = time.perf_counter()
+        timing.status = "running"
+        timing.started_at_ms = (started - self._started_at) * 1000
+        logger.debug(f"starting_{slug}")
+        try:
+            await asyncio.wait_for(startup(app, settings), timeout=timeout)
+            timing.status = "completed"
+        except TimeoutError:
+            timing.status = "timeout"
+            timing.error = f"Startup exceeded {timeout}s"
+            logger.error(
+                f"{slug}_startup_timeout", component=name, timeout_seconds=timeout
+            )
+        except asyncio.CancelledError:
+            timing.status = "cancelled"
+            raise
+        except Exception as e:
+            timing.status = "failed"
+            timing.error = str(e)
+            logger.error(f"{slug}_startup_failed", error=str(e), component=name)
+            # Continue with graceful degradation
+        finally:
+            timing.duration_ms = (time.perf_counter() - started) * 1000
+            self._done[name].set()
+
+    async def cancel_deferred(self) -> None:
+        """Cancel deferred startups that are still running."""
+        pending = [task for task in self._deferred_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.debug("startup_deferred_cancelled", count=len(pending))
+
+    def report(self) -> dict[str, Any]:
+        """Return per-component startup timings for the health endpoint."""
+        pending = sum(
+            timing.status in ("pending", "running") for timing in self.timings.values()
+        )
+        return {
+            "critical_path_ms": _round_ms(self.critical_path_ms),
+            "pending": pending,
+            "components": {
+                component_slug(name): timing.to_dict()
+                for name, timing in self.timings.items()
+            },
+        }
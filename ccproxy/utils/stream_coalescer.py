@@ -0,0 +1,194 @@
+"""Adaptive write coalescing for streaming (SSE) responses.
+
+Fast upstream models emit many tiny SSE frames; passing each one straight to
+the ASGI ``send`` costs one socket write per frame. This module provides an
+output stage that reads the upstream iterator in a background task into a
+bounded buffer and yields the buffered bytes as a single write when either the
+flush window expires or enough bytes have accumulated.
+
+The first frame after an idle period is flushed immediately, so
+time-to-first-token is unaffected; frames arriving in quick succession are
+held back for at most ``flush_interval`` seconds. When the client reads slower
+than upstream produces, the buffer fills up to ``max_buffer_bytes`` and the
+upstream reader is paused until the client catches up.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+# Request header a client can send to opt out of coalescing and receive each
+# upstream frame as its own write (per-token delivery)
+STREAM_COALESCING_HEADER = "x-ccproxy-stream-coalescing"
+_OPT_OUT_VALUES = frozenset({"off", "false", "0", "no", "none"})
+
+
+def coalescing_disabled_by_client(headers: Iterable[tuple[bytes, bytes]]) -> bool:
+    """Check raw ASGI request headers for a per-token delivery opt-out.
+
+    Args:
+        headers: ASGI ``scope["headers"]`` list of (name, value) byte pairs
+
+    Returns:
+        True if the client asked for coalescing to be disabled
+    """
+    name = STREAM_COALESCING_HEADER.encode("latin-1")
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1").strip().lower() in _OPT_OUT_VALUES
+    return False
+
+
+@dataclass
+class StreamWriteStats:
+    """Write statistics for a single streamed response."""
+
+    upstream_chunks: int = 0
+    writes: int = 0
+    bytes: int = 0
+    max_buffered_bytes: int = 0
+    backpressure_waits: int = 0
+
+    def record_write(self, size: int) -> None:
+        """Record one write of ``size`` bytes handed to the transport."""
+        self.writes += 1
+        self.bytes += size
+
+    def as_metadata(self) -> dict[str, Any]:
+        """Return the statistics as request context metadata."""
+        return {
+            "stream_upstream_chunks": self.upstream_chunks,
+            "stream_writes": self.writes,
+            "stream_bytes": self.bytes,
+            "stream_max_buffered_bytes": self.max_buffered_bytes,
+            "stream_backpressure_waits": self.backpressure_waits,
+        }
+
+
+class SSEWriteCoalescer:
+    """Coalesce adjacent upstream chunks into fewer, larger writes."""
+
+    def __init__(
+        self,
+        source: AsyncIterator[bytes],
+        flush_interval: float = 0.01,
+        max_write_bytes: int = 16384,
+        max_buffer_bytes: int = 1024 * 1024,
+        stats: StreamWriteStats | None = None,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            source: Upstream byte iterator
+            flush_interval: Maximum seconds a chunk may be held back
+            max_write_bytes: Flush immediately once this many bytes are buffered
+            max_buffer_bytes: Pause the upstream reader above this many buffered bytes
+            stats: Optional stats object to update (a new one is created otherwise)
+        """
+        self._source = source
+        self._flush_interval = flush_interval
+        self._max_write_bytes = max_write_bytes
+        self._max_buffer_bytes = max(max_buffer_bytes, max_write_bytes)
+        self.stats = stats or StreamWriteStats()
+
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._done = False
+        self._error: BaseException | None = None
+        self._condition = asyncio.Condition()
+
+    async def _produce(self) -> None:
+        """Read upstream chunks into the bounded buffer."""
+        condition = self._condition
+        try:
+            async for chunk in self._source:
+                if not chunk:
+                    continue
+                async with condition:
+                    # Backpressure: stop reading upstream while the buffer is full
+                    if self._buffered >= self._max_buffer_bytes:
+                        self.stats.backpressure_waits += 1
+                        await condition.wait_for(
+                            lambda: self._buffered < self._max_buffer_bytes
+                        )
+                    self._buffer.append(chunk)
+                    self._buffered += len(chunk)
+                    self.stats.upstream_chunks += 1
+                    if self._buffered > self.stats.max_buffered_bytes:
+                        self.stats.max_buffered_bytes = self._buffered
+                    condition.notify_all()
+                    ready = self._buffered >= self._max_write_bytes
+                if ready:
+                    # Let the writer take a full batch before reading further
+                    # from an upstream iterator that never suspends
+                    await asyncio.sleep(0)
+        except Exception as e:
+            self._error = e
+        finally:
+            async with condition:
+                self._done = True
+                condition.notify_all()
+
+    async def _wait_for_flush(self, deadline: float) -> None:
+        """Wait until the deadline, the byte threshold or end of stream."""
+        loop = asyncio.get_running_loop()
+        condition = self._condition
+        while not self._done and self._buffered < self._max_write_bytes:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                async with asyncio.timeout(remaining):
+                    await condition.wait()
+            except TimeoutError:
+                return
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        """Yield coalesced writes until the upstream iterator is exhausted.
+
+        Errors raised by the upstream iterator are re-raised after all data
+        buffered before the error has been yielded.
+        """
+        loop = asyncio.get_running_loop()
+        condition = self._condition
+        producer = asyncio.create_task(self._produce())
+        last_flush = float("-inf")
+
+        try:
+            while True:
+                async with condition:
+                    await condition.wait_for(lambda: bool(self._buffer) or self._done)
+                    if not self._buffer:
+                        break
+
+                    # After an idle period the deadline has already passed, so
+                    # the first chunk of a burst is flushed without delay
+                    await self._wait_for_flush(last_flush + self._flush_interval)
+
+                    data = (
+                        self._buffer[0]
+                        if len(self._buffer) == 1
+                        else b"".join(self._buffer)
+                    )
+                    self._buffer.clear()
+                    self._buffered = 0
+                    condition.notify_all()
+
+                last_flush = loop.time()
+                self.stats.record_write(len(data))
+                yield data
+
+            if self._error is not None:
+                raise self._error
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+            aclose = getattr(self._source, "aclose", None)
+            if aclose is not None:
+                with contextlib.suppress(Exception):
+                    await aclose()
@@ -0,0 +1,190 @@
+"""Fast local token estimation for Anthropic message payloads.
+
+The estimates are intentionally approximate: they are used to make budget
+decisions (history compaction, local token counting) without a round trip
+to the upstream API. Text is counted by its length, which costs less than
+any cache lookup. Tool calls and results need their JSON size, so their
+estimates are cached by tool call id: turns re-sent on every request of a
+long conversation are only serialized once.
+"""
+
+import hashlib
+import json
+import math
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+# Average characters per token for English text and code with Claude's tokenizer
+DEFAULT_CHARS_PER_TOKEN = 3.5
+
+# Fixed overheads approximating the framing tokens the API adds
+MESSAGE_OVERHEAD_TOKENS = 4
+BLOCK_OVERHEAD_TOKENS = 3
+TOOL_OVERHEAD_TOKENS = 12
+# System prompt the API adds when tools are provided. Anthropic's tool use
+# pricing table lists 346 tokens for tool_choice auto/none on current Claude
+# models (313 for any/tool); the larger value keeps budget checks conservative.
+TOOL_USE_SYSTEM_PROMPT_TOKENS = 346
+
+# Images are billed by size; without decoding them assume a large image
+IMAGE_TOKENS = 1600
+# Documents (PDF) are billed per page; assume a short document
+DOCUMENT_TOKENS = 3000
+
+
+def content_hash(value: Any) -> str:
+    """Return a stable hash for a JSON-compatible value."""
+    encoded = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class TokenEstimator:
+    """Character-based token estimator with a tool-call LRU cache."""
+
+    def __init__(
+        self,
+        chars_per_token: float = DEFAULT_CHARS_PER_TOKEN,
+        cache_size: int = 10_000,
+    ) -> None:
+        """Initialize the estimator.
+
+        Args:
+            chars_per_token: Average characters per token
+            cache_size: Maximum number of cached tool call and result estimates
+        """
+        self.chars_per_token = chars_per_token
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def estimate_text(self, text: str) -> int:
+        """Estimate tokens for a plain string."""
+        if not text:
+            return 0
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def estimate_block(self, block: Any) -> int:
+        """Estimate tokens for a single content block."""
+        if isinstance(block, str):
+            return self.estimate_text(block)
+        if not isinstance(block, dict):
+            return self.estimate_text(json.dumps(block, default=str))
+
+        block_type = block.get("type")
+        if block_type in ("tool_use", "server_tool_use", "tool_result"):
+            return self._estimate_tool_block(block, block_type)
+
+        tokens = BLOCK_OVERHEAD_TOKENS
+
+        if block_type == "text":
+            tokens += self.estimate_text(block.get("text", ""))
+        elif block_type in ("thinking", "redacted_thinking"):
+            tokens += self.estimate_text(
+                block.get("thinking", "") or block.get("data", "")
+            )
+        elif block_type == "image":
+            tokens += IMAGE_TOKENS
+        elif block_type == "document":
+            tokens += DOCUMENT_TOKENS
+        else:
+            # Unknown blocks and tool definitions are counted by their JSON size
+            tokens += self.estimate_text(json.dumps(block, separators=(",", ":")))
+
+        return tokens
+
+    def _estimate_tool_block(self, block: dict[str, Any], block_type: str) -> int:
+        """Estimate a tool call or result, cached by its tool call id."""
+        tool_id = block.get("tool_use_id" if block_type == "tool_result" else "id")
+        key = (block_type, tool_id) if isinstance(tool_id, str) and tool_id else None
+
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached
+
+        tokens = BLOCK_OVERHEAD_TOKENS
+        if block_type == "tool_result":
+            tokens += self.estimate_content(block.get("content", ""))
+        else:
+            tokens += self.estimate_text(block.get("name", ""))
+            tokens += self.estimate_text(
+                json.dumps(block.get("input", {}), separators=(",", ":"))
+            )
+
+        if key is not None:
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = tokens
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return tokens
+
+    def estimate_content(self, content: Any) -> int:
+        """Estimate tokens for message content (string or list of blocks)."""
+        if content is None:
+            return 0
+        if isinstance(content, str):
+            return self.estimate_text(content)
+        if isinstance(content, list):
+            return sum(self.estimate_block(block) for block in content)
+        return self.estimate_block(content)
+
+    def estimate_message(self, message: dict[str, Any]) -> int:
+        """Estimate tokens for a message."""
+        return MESSAGE_OVERHEAD_TOKENS + self.estimate_content(message.get("content"))
+
+    def estimate_system(self, system: Any) -> int:
+        """Estimate tokens for the system prompt field."""
+        return self.estimate_content(system)
+
+    def estimate_tools(self, tools: list[dict[str, Any]] | None) -> int:
+        """Estimate tokens for tool definitions."""
+        if not tools:
+            return 0
+        return TOOL_USE_SYSTEM_PROMPT_TOKENS + sum(
+            TOOL_OVERHEAD_TOKENS + self.estimate_block(tool) for tool in tools
+        )
+
+    def estimate_request(self, payload: dict[str, Any]) -> int:
+        """Estimate input tokens for a complete Messages API request."""
+        messages = payload.get("messages") or []
+        return (
+            self.estimate_system(payload.get("system"))
+            + self.estimate_tools(payload.get("tools"))
+            + sum(
+                self.estimate_message(message)
+                for message in messages
+                if isinstance(message, dict)
+            )
+        )
+
+    def cache_info(self) -> dict[str, int]:
+        """Return cache statistics."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_token_estimator: TokenEstimator | None = None
+
+
+def get_token_estimator() -> TokenEstimator:
+    """Get or create the global token estimator."""
+    global _token_estimator
+    if _token_estimator is None:
+        _token_estimator = TokenEstimator()
+    return _token_estimator
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark import time of common ccproxy CLI invocations.
+
+Runs each command in a fresh interpreter under ``python -X importtime``,
+parses the per-module report and prints the wall time, the total import time
+and the heaviest top-level imports. ``--version`` has an import-time budget;
+the script exits non-zero when it is exceeded so it can guard regressions in
+CI. ``--output`` writes the report as JSON for tracking over time.
+
+Usage:
+    uv run python scripts/benchmark_cli_import.py --repeat 5
+    uv run python scripts/benchmark_cli_import.py --output importtime.json
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import typer
+
+
+COMMANDS: list[list[str]] = [
+    ["--version"],
+    ["--help"],
+    ["codex", "info"],
+    ["auth", "--help"],
+    ["config", "--help"],
+    ["serve", "--help"],
+]
+
+
+@dataclass
+class ImportReport:
+    """Import time of one command, median over repeats."""
+
+    command: str
+    wall_ms: float
+    import_ms: float
+    modules: int
+    top: list[tuple[str, float]] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str) -> tuple[float, int, dict[str, float]]:
+    """Parse ``-X importtime`` output.
+
+    Returns:
+        Total import time in ms, number of imported modules, and the
+        cumulative time in ms of each top-level import
+    """
+    top_level: dict[str, float] = {}
+    modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|", 2)
+        modules += 1
+        if not name.startswith("  "):
+            # Exactly one leading space marks an import made by the command
+            top_level[name.strip()] = int(cumulative) / 1000
+    return sum(top_level.values()), modules, top_level
+
+
+def measure(args: list[str], repeat: int, top: int) -> ImportReport:
+    walls: list[float] = []
+    imports: list[float] = []
+    modules = 0
+    heaviest: dict[str, float] = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "ccproxy", *args],
+            capture_output=True,
+            text=True,
+        )
+        walls.append((time.perf_counter() - started) * 1000)
+        total, modules, heaviest = parse_importtime(result.stderr)
+        imports.append(total)
+
+    ranked = sorted(heaviest.items(), key=lambda item: item[1], reverse=True)
+    return ImportReport(
+        command=" ".join(args),
+        wall_ms=round(statistics.median(walls), 1),
+        import_ms=round(statistics.median(imports), 1),
+        modules=modules,
+        top=[(name, round(ms, 1)) for name, ms in ranked[:top]],
+    )
+
+
+def main(
+    repeat: int = typer.Option(5, help="Runs per command (median is reported)"),
+    top: int = typer.Option(3, help="Heaviest top-level imports shown per command"),
+    version_budget_ms: float = typer.Option(
+        400.0, help="Import-time budget for 'ccproxy --version'"
+    ),
+    output: Path | None = typer.Option(None, help="Write the report as JSON"),
+) -> None:
+    reports = [measure(args, repeat, top) for args in COMMANDS]
+
+    typer.echo(f"{'command':<16} {'wall ms':>9} {'import ms':>10} {'modules':>8}")
+    for report in reports:
+        typer.echo(
+            f"{report.command:<16} {report.wall_ms:>9.1f} "
+            f"{report.import_ms:>10.1f} {report.modules:>8}"
+        )
+        for name, ms in report.top:
+            typer.echo(f"    {name:<40} {ms:>8.1f}")
+
+    if output:
+        output.write_text(json.dumps([asdict(report) for report in reports], indent=2))
+
+    version = reports[0]
+    if version.import_ms > version_budget_ms:
+        typer.echo(
+            f"'ccproxy --version' imports take {version.import_ms:.1f} ms, "
+            f"over the {version_budget_ms:.0f} ms budget",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
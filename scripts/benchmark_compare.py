@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Report and compare microbenchmark runs from the ``benchmarks/`` suite.
+
+Runs are pytest-benchmark JSON files, written with ``--benchmark-json`` or
+``--benchmark-autosave``. A run can be given as a path or as the id prefix of
+an autosaved run under ``.benchmarks/`` (``0001``). ``compare`` lists each
+benchmark's ops/sec, µs per event and peak allocation per op in both runs and
+exits with status 1 when the mean time or the allocation of any benchmark
+grew by more than the threshold.
+
+Usage:
+    uv run pytest benchmarks --no-cov --benchmark-autosave
+    uv run python scripts/benchmark_compare.py report 0001
+    uv run python scripts/benchmark_compare.py compare 0001 0002 --threshold 10
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import typer
+
+
+app = typer.Typer(help="Report and compare microbenchmark runs")
+
+STORAGE = Path(".benchmarks")
+
+
+def _resolve(run: str) -> Path:
+    path = Path(run)
+    if path.is_file():
+        return path
+    matches = sorted(STORAGE.glob(f"*/{run}*.json"))
+    if not matches:
+        raise typer.BadParameter(f"No benchmark run found for {run!r}")
+    return matches[-1]
+
+
+def _load(run: str) -> dict[str, dict[str, Any]]:
+    """Load a run as ``{fullname: metrics}``."""
+    data = json.loads(_resolve(run).read_text())
+    results = {}
+    for bench in data["benchmarks"]:
+        info = bench.get("extra_info", {})
+        mean = bench["stats"]["mean"]
+        results[bench["fullname"]] = {
+            "mean": mean,
+            "ops": bench["stats"]["ops"],
+            "us_per_event": info.get("us_per_event", mean * 1e6),
+            "alloc_peak_bytes": info.get("alloc_peak_bytes"),
+            "alloc_blocks": info.get("alloc_blocks"),
+        }
+    return results
+
+
+def _short(fullname: str) -> str:
+    return fullname.split("::", 1)[-1]
+
+
+def _change(old: float | None, new: float | None) -> float | None:
+    if old is None or new is None or old == 0:
+        return None
+    return (new - old) / old * 100
+
+
+def _format_change(change: float | None) -> str:
+    return "n/a" if change is None else f"{change:+.1f}%"
+
+
+@app.command()
+def report(run: str = typer.Argument(..., help="Run file or autosave id")) -> None:
+    """Print ops/sec, µs per event and allocations for one run."""
+    results = _load(run)
+    width = max((len(_short(name)) for name in results), default=10)
+    typer.echo(
+        f"{'benchmark':<{width}} {'ops/sec':>12} {'µs/event':>10} "
+        f"{'alloc KiB/op':>13} {'blocks/op':>10}"
+    )
+    for name, result in sorted(results.items()):
+        peak, blocks = result["alloc_peak_bytes"], result["alloc_blocks"]
+        typer.echo(
+            f"{_short(name):<{width}} {result['ops']:>12,.1f} "
+            f"{result['us_per_event']:>10.2f} "
+            f"{'n/a' if peak is None else f'{peak / 1024:.1f}':>13} "
+            f"{'n/a' if blocks is None else blocks:>10}"
+        )
+
+
+@app.command()
+def compare(
+    baseline: str = typer.Argument(..., help="Baseline run file or autosave id"),
+    current: str = typer.Argument(..., help="Current run file or autosave id"),
+    threshold: float = typer.Option(
+        10.0, "--threshold", help="Regression threshold in percent"
+    ),
+    alloc_threshold: float | None = typer.Option(
+        None,
+        "--alloc-threshold",
+        help="Allocation regression threshold in percent (defaults to --threshold)",
+    ),
+) -> None:
+    """Diff two runs and fail if any benchmark regressed beyond the threshold."""
+    alloc_limit = threshold if alloc_threshold is None else alloc_threshold
+    old_results = _load(baseline)
+    new_results = _load(current)
+    names = sorted(old_results.keys() & new_results.keys())
+    width = max((len(_short(name)) for name in names), default=10)
+
+    typer.echo(
+        f"{'benchmark':<{width}} {'old µs/ev':>10} {'new µs/ev':>10} {'time':>8} "
+        f"{'old KiB':>9} {'new KiB':>9} {'alloc':>8}"
+    )
+    regressions = []
+    for name in names:
+        old, new = old_results[name], new_results[name]
+        time_change = _change(old["mean"], new["mean"])
+        alloc_change = _change(old["alloc_peak_bytes"], new["alloc_peak_bytes"])
+        flags = []
+        if time_change is not None and time_change > threshold:
+            flags.append("time")
+        if alloc_change is not None and alloc_change > alloc_limit:
+            flags.append("alloc")
+        if flags:
+            regressions.append((name, flags))
+
+        old_kib = (old["alloc_peak_bytes"] or 0) / 1024
+        new_kib = (new["alloc_peak_bytes"] or 0) / 1024
+        typer.echo(
+            f"{_short(name):<{width}} {old['us_per_event']:>10.2f} "
+            f"{new['us_per_event']:>10.2f} {_format_change(time_change):>8} "
+            f"{old_kib:>9.1f} {new_kib:>9.1f} {_format_change(alloc_change):>8}"
+            + ("  REGRESSION" if flags else "")
+        )
+
+    for name in sorted(old_results.keys() ^ new_results.keys()):
+        side = "baseline" if name in old_results else "current"
+        typer.echo(f"only in {side}: {_short(name)}")
+
+    if regressions:
+        typer.echo(
+            f"\n{len(regressions)} regression(s) above {threshold:g}% time "
+            f"/ {alloc_limit:g}% allocation:"
+        )
+        for name, flags in regressions:
+            typer.echo(f"  {_short(name)} ({', '.join(flags)})")
+        raise typer.Exit(1)
+    typer.echo(f"\nNo regressions above {threshold:g}%")
+
+
+if __name__ == "__main__":
+    app()
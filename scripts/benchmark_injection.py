@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark system prompt / instructions injection per request.
+
+Compares the previous per-request approach (parse the body, insert the
+injected value, deep-copy for cache_control limiting and re-serialize
+everything with ``json.dumps``) with splicing the pre-encoded fragments.
+Reports CPU time per request for Claude system prompt injection and Codex
+instructions injection with a large injected payload.
+
+Usage:
+    uv run python scripts/benchmark_injection.py --prompt-kb 64 --requests 2000
+"""
+
+import copy
+import json
+import logging
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import typer
+
+from ccproxy.core.codex_transformers import CodexRequestTransformer
+from ccproxy.core.http_transformers import HTTPRequestTransformer
+from ccproxy.core.injection_fragments import get_fragment_cache
+from ccproxy.core.logging import configure_structlog
+
+
+def _make_prompt(size_kb: int) -> str:
+    line = "Follow the repository conventions and explain every change clearly.\n"
+    return (line * (size_kb * 1024 // len(line) + 1))[: size_kb * 1024]
+
+
+def _claude_app_state(prompt: str) -> Any:
+    system_field = [
+        {
+            "type": "text",
+            "text": "You are Claude Code, Anthropic's official CLI for Claude.",
+            "cache_control": {"type": "ephemeral"},
+        },
+        {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
+    ]
+    return SimpleNamespace(
+        claude_detection_data=SimpleNamespace(
+            system_prompt=SimpleNamespace(system_field=system_field)
+        )
+    )
+
+
+def _codex_detection(prompt: str) -> Any:
+    return SimpleNamespace(instructions=SimpleNamespace(instructions_field=prompt))
+
+
+def _request_body(stream_key: bool) -> bytes:
+    body: dict[str, Any] = {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 1024,
+        "messages": [
+            {"role": "user", "content": "Summarize the failing test output."},
+            {"role": "assistant", "content": "The failure is in the parser."},
+            {"role": "user", "content": "Fix it."},
+        ],
+    }
+    if stream_key:
+        body["stream"] = True
+    return json.dumps(body).encode()
+
+
+def claude_reference(
+    transformer: HTTPRequestTransformer, body: bytes, app_state: Any
+) -> bytes:
+    """Previous implementation: parse, prepend, deep-copy and re-serialize."""
+    data = json.loads(body.decode("utf-8"))
+    data["system"] = app_state.claude_detection_data.system_prompt.system_field
+    data = transformer._limit_cache_control_blocks(copy.deepcopy(data))
+    return json.dumps(data).encode("utf-8")
+
+
+def codex_reference(body: bytes, detection: Any) -> bytes:
+    """Previous implementation: parse, override and re-serialize."""
+    data = json.loads(body.decode("utf-8"))
+    data["instructions"] = detection.instructions.instructions_field
+    if "stream" not in data:
+        data["stream"] = True
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _cpu_per_request(run: Callable[[], bytes], requests: int) -> float:
+    run()  # warm the fragment cache
+    start = time.process_time()
+    for _ in range(requests):
+        run()
+    return (time.process_time() - start) / requests
+
+
+def main(
+    prompt_kb: int = typer.Option(64, help="Size of the injected prompt in KiB"),
+    requests: int = typer.Option(2000, help="Number of requests per measurement"),
+) -> None:
+    """Run the injection benchmark."""
+    configure_structlog(logging.WARNING)
+    prompt = _make_prompt(prompt_kb)
+    claude_transformer = HTTPRequestTransformer()
+    codex_transformer = CodexRequestTransformer()
+    app_state = _claude_app_state(prompt)
+    detection = _codex_detection(prompt)
+    claude_body = _request_body(stream_key=True)
+    codex_body = _request_body(stream_key=True)
+    get_fragment_cache().clear()
+
+    # Both implementations must produce equivalent payloads
+    assert json.loads(
+        claude_transformer.transform_system_prompt(claude_body, app_state, "full")
+    ) == json.loads(claude_reference(claude_transformer, claude_body, app_state))
+    assert json.loads(
+        codex_transformer.transform_codex_body(codex_body, detection)
+    ) == json.loads(codex_reference(codex_body, detection))
+
+    cases: list[tuple[str, Callable[[], bytes], Callable[[], bytes]]] = [
+        (
+            "claude system",
+            lambda: claude_reference(claude_transformer, claude_body, app_state),
+            lambda: claude_transformer.transform_system_prompt(
+                claude_body, app_state, "full"
+            ),
+        ),
+        (
+            "codex instructions",
+            lambda: codex_reference(codex_body, detection),
+            lambda: codex_transformer.transform_codex_body(codex_body, detection),
+        ),
+    ]
+
+    typer.echo(f"injected prompt: {len(prompt) / 1024:.0f} KiB, {requests} requests")
+    typer.echo(f"{'case':<20} {'re-serialize':>14} {'spliced':>14} {'speedup':>9}")
+    for name, reference, spliced in cases:
+        before = _cpu_per_request(reference, requests)
+        after = _cpu_per_request(spliced, requests)
+        typer.echo(
+            f"{name:<20} {before * 1e6:>11.1f} us {after * 1e6:>11.1f} us "
+            f"{before / after:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
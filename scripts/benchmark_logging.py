@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark logging overhead per streamed chunk.
+
+Replays the per-chunk log calls of the streaming paths (``sdk_message_received``
+with a dumped message and ``chunk_yielded`` with a preview) for a number of
+chunks and reports the time spent in the streaming thread per chunk. Modes:
+
+- ``legacy``: plain ``structlog.stdlib.BoundLogger``, arguments always built,
+  handlers called synchronously (the previous configuration)
+- ``sync``: early level filtering and guarded arguments, synchronous handlers
+- ``queue``: as ``sync`` with rendering and I/O on the listener thread
+- ``sampled``: as ``queue`` with DEBUG sampling at ``--sample-rate`` per second
+
+Console output goes to /dev/null and file output to a temporary JSON log, so
+the numbers measure rendering and the handler chain rather than a terminal.
+
+Usage:
+    uv run python scripts/benchmark_logging.py --chunks 20000
+    uv run python scripts/benchmark_logging.py --levels DEBUG --modes legacy,queue
+"""
+
+import contextlib
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+import typer
+
+from ccproxy.core.logging import (
+    ContextQueueHandler,
+    is_enabled_for,
+    setup_logging,
+    stop_log_queue,
+)
+
+
+LOGGER_NAME = "ccproxy.services.proxy_service"
+CHUNK = (
+    b'event: content_block_delta\ndata: {"type":"content_block_delta","index":0,'
+    b'"delta":{"type":"text_delta","text":"Hello there, streaming world"}}\n\n'
+)
+
+
+def _message(i: int) -> dict[str, object]:
+    return {
+        "type": "assistant",
+        "index": i,
+        "content": [{"type": "text", "text": "Hello there, streaming world"}],
+    }
+
+
+def stream(chunks: int, guarded: bool) -> None:
+    """Log the way one streamed response does, chunk by chunk."""
+    logger = structlog.get_logger(LOGGER_NAME)
+    log_chunks = is_enabled_for(logger, logging.DEBUG) if guarded else True
+    for i in range(chunks):
+        if log_chunks:
+            logger.debug(
+                "sdk_message_received",
+                message_type="AssistantMessage",
+                request_id="bench",
+                message_content=_message(i),
+            )
+            logger.debug(
+                "chunk_yielded",
+                chunk_number=i,
+                chunk_size=len(CHUNK),
+                chunk_preview=CHUNK[:100].decode("utf-8", errors="replace"),
+            )
+        if i % 1000 == 0:
+            logger.info("stream_progress", chunks=i)
+
+
+def run(mode: str, level: str, chunks: int, sample_rate: int, log_file: Path) -> str:
+    with Path(os.devnull).open("w") as devnull, contextlib.redirect_stdout(devnull):
+        setup_logging(
+            log_level_name=level,
+            log_file=str(log_file),
+            async_logs=mode in ("queue", "sampled"),
+            debug_sample_rate=sample_rate if mode == "sampled" else 0,
+        )
+        if mode == "legacy":
+            structlog.configure(wrapper_class=structlog.stdlib.BoundLogger)
+
+        stream(min(chunks, 200), guarded=mode != "legacy")  # warm up caches
+        started_cpu = time.thread_time()
+        started = time.perf_counter()
+        stream(chunks, guarded=mode != "legacy")
+        caller_s = time.perf_counter() - started
+        caller_cpu_s = time.thread_time() - started_cpu
+
+        queue_handlers = [
+            h
+            for h in logging.getLogger().handlers
+            if isinstance(h, ContextQueueHandler)
+        ]
+        dropped = sum(h.dropped for h in queue_handlers)
+        stop_log_queue()
+        total_s = time.perf_counter() - started
+
+    return (
+        f"{level:<6} {mode:<8} {caller_s / chunks * 1e6:>10.2f} "
+        f"{caller_cpu_s / chunks * 1e6:>10.2f} {total_s / chunks * 1e6:>10.2f} "
+        f"{dropped:>8}"
+    )
+
+
+def main(
+    chunks: int = typer.Option(20000, help="Chunks per streamed response"),
+    levels: str = typer.Option("INFO,DEBUG", help="Comma-separated log levels"),
+    modes: str = typer.Option(
+        "legacy,sync,queue,sampled", help="Comma-separated logging modes"
+    ),
+    sample_rate: int = typer.Option(
+        100, help="DEBUG events per second per event name in 'sampled' mode"
+    ),
+) -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for level in levels.split(","):
+            for mode in modes.split(","):
+                log_file = Path(tmp) / f"{level}-{mode}.log"
+                rows.append(run(mode, level.upper(), chunks, sample_rate, log_file))
+
+    typer.echo(
+        f"{'level':<6} {'mode':<8} {'us/chunk':>10} {'cpu us':>10} "
+        f"{'drained':>10} {'dropped':>8}"
+    )
+    for row in rows:
+        typer.echo(row)
+    typer.echo(
+        "us/chunk and cpu us are measured in the streaming thread; drained "
+        "includes flushing the log queue",
+        err=True,
+    )
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark dashboard SSE broadcast under load.
+
+Compares the previous per-connection approach (every connection queues the
+event dict and serializes it with ``json.dumps`` itself, one frame per event)
+with the current manager (serialize once, shared frames, coalesced batches).
+Simulates dashboard clients consuming ``/logs/stream`` while requests emit a
+``request_start`` and a ``request_complete`` event each, and reports CPU time,
+frames and events delivered per client.
+
+Usage:
+    uv run python scripts/benchmark_sse_broadcast.py --clients 50 --rate 500
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncGenerator
+from typing import Any, Protocol
+
+import typer
+
+from ccproxy.core.logging import configure_structlog
+from ccproxy.observability.sse_events import SSEEventManager
+
+
+BATCH_PREFIX = 'data: {"type": "batch", "count": '
+
+
+class _Manager(Protocol):
+    def add_connection(self, connection_id: str) -> AsyncGenerator[str, None]: ...
+
+    async def emit_event(self, event_type: str, data: dict[str, Any]) -> None: ...
+
+
+class ReferenceManager:
+    """Previous implementation: per-connection queues, serialize per connection."""
+
+    def __init__(self, max_queue_size: int = 100) -> None:
+        self._connections: dict[str, asyncio.Queue[dict[str, Any]]] = {}
+        self._max_queue_size = max_queue_size
+
+    async def add_connection(self, connection_id: str) -> AsyncGenerator[str, None]:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+            maxsize=self._max_queue_size
+        )
+        self._connections[connection_id] = queue
+        try:
+            while True:
+                event = await queue.get()
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        finally:
+            del self._connections[connection_id]
+
+    async def emit_event(self, event_type: str, data: dict[str, Any]) -> None:
+        event = {"type": event_type, "data": data, "timestamp": time.time()}
+        for queue in list(self._connections.values()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait({"type": "overflow", "timestamp": time.time()})
+
+
+def _request_data(i: int) -> dict[str, Any]:
+    return {
+        "request_id": f"req-{i:08d}",
+        "method": "POST",
+        "path": "/api/v1/messages",
+        "model": "claude-sonnet-4-20250514",
+        "service_type": "proxy_service",
+        "status_code": 200,
+        "duration_ms": 812.5,
+        "tokens_input": 1520,
+        "tokens_output": 430,
+        "cost_usd": 0.01101,
+    }
+
+
+async def _run(
+    manager: _Manager, clients: int, rate: int, seconds: float
+) -> tuple[float, int, int]:
+    frames = [0] * clients
+    events = [0] * clients
+
+    async def consume(index: int) -> None:
+        async for frame in manager.add_connection(f"client-{index}"):
+            frames[index] += 1
+            if frame.startswith(BATCH_PREFIX):
+                count_end = frame.index(",", len(BATCH_PREFIX))
+                events[index] += int(frame[len(BATCH_PREFIX) : count_end])
+            elif '"type": "request_' in frame:
+                events[index] += 1
+
+    consumers = [asyncio.create_task(consume(i)) for i in range(clients)]
+    await asyncio.sleep(0.05)
+
+    tick = 0.01
+    per_tick = rate * tick
+    start_cpu = time.process_time()
+    start = time.monotonic()
+    emitted = 0.0
+    i = 0
+    while (elapsed := time.monotonic() - start) < seconds:
+        emitted += per_tick
+        while i < int(emitted):
+            data = _request_data(i)
+            await manager.emit_event("request_start", data)
+            await manager.emit_event("request_complete", data)
+            i += 1
+        await asyncio.sleep(max(0.0, (elapsed + tick) - (time.monotonic() - start)))
+    await asyncio.sleep(0.25)  # let clients drain
+    cpu = time.process_time() - start_cpu
+
+    for task in consumers:
+        task.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    return cpu, sum(frames) // clients, sum(events) // clients
+
+
+def main(
+    clients: int = typer.Option(50, help="Number of dashboard clients"),
+    rate: int = typer.Option(500, help="Requests per second (2 events each)"),
+    seconds: float = typer.Option(5.0, help="Duration of each measurement"),
+    max_rate: float = typer.Option(10.0, help="Max frames per second per client"),
+) -> None:
+    """Run the SSE broadcast benchmark."""
+    configure_structlog(logging.WARNING)
+    cases: list[tuple[str, _Manager]] = [
+        ("per-connection", ReferenceManager()),
+        ("shared+batched", SSEEventManager(max_flush_rate=max_rate)),
+    ]
+
+    typer.echo(f"{clients} clients, {rate} req/s ({rate * 2} events/s), {seconds:.0f}s")
+    typer.echo(
+        f"{'case':<16} {'cpu':>8} {'cpu/event':>11} "
+        f"{'frames/client':>14} {'events/client':>14}"
+    )
+    for name, manager in cases:
+        cpu, frames, events = asyncio.run(_run(manager, clients, rate, seconds))
+        typer.echo(
+            f"{name:<16} {cpu:>7.2f}s {cpu / (rate * 2 * seconds) * 1e6:>8.1f} us "
+            f"{frames:>14} {events:>14}"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark OpenAI-format SSE chunk encoding.
+
+Compares the previous per-chunk approach (build a dict, ``json.dumps`` it,
+wrap it in an f-string and encode) with the per-stream precompiled
+``OpenAIChunkEncoder`` template. Reports chunks/sec and the bytes allocated
+per chunk (transient high-water mark measured with ``tracemalloc``).
+
+Usage:
+    uv run python scripts/benchmark_sse_encoder.py --chunks 200000
+"""
+
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import typer
+
+from ccproxy.adapters.openai.streaming import OpenAIChunkEncoder
+
+
+MESSAGE_ID = "chatcmpl-0123456789abcdef0123456789"
+MODEL = "claude-sonnet-4-20250514"
+CREATED = 1_700_000_000
+
+# Typical token-sized deltas, including characters that need escaping
+DELTAS = ["Hello", " world", ",", " the", ' "quoted"', " text\n", " café", " 🚀"]
+
+
+def encode_with_dict(text: str) -> bytes:
+    """Reference implementation matching the previous per-chunk code path."""
+    data = {
+        "id": MESSAGE_ID,
+        "object": "chat.completion.chunk",
+        "created": CREATED,
+        "model": MODEL,
+        "choices": [
+            {
+                "index": 0,
+                "delta": {"content": text},
+                "logprobs": None,
+                "finish_reason": None,
+            }
+        ],
+    }
+    return f"data: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+def _measure(
+    name: str, encode: Callable[[str], bytes], chunks: int
+) -> dict[str, float]:
+    deltas = [DELTAS[i % len(DELTAS)] for i in range(chunks)]
+
+    start = time.perf_counter()
+    for text in deltas:
+        encode(text)
+    elapsed = time.perf_counter() - start
+
+    # Measure the transient allocation high-water mark per chunk on a smaller
+    # sample; tracemalloc slows execution considerably
+    sample = deltas[: min(chunks, 10_000)]
+    tracemalloc.start()
+    allocated = 0
+    for text in sample:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        encode(text)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    tracemalloc.stop()
+
+    return {
+        "name": name,  # type: ignore[dict-item]
+        "chunks_per_sec": chunks / elapsed,
+        "alloc_bytes_per_chunk": allocated / len(sample),
+    }
+
+
+def main(
+    chunks: int = typer.Option(200_000, help="Number of chunks to encode"),
+) -> None:
+    """Run the SSE encoder benchmark."""
+    encoder = OpenAIChunkEncoder(MESSAGE_ID, MODEL, CREATED)
+
+    # Both implementations must produce identical frames
+    for text in DELTAS:
+        assert encoder.content(text) == encode_with_dict(text)
+
+    results = [
+        _measure("dict + json.dumps", encode_with_dict, chunks),
+        _measure("OpenAIChunkEncoder", encoder.content, chunks),
+    ]
+
+    typer.echo(f"{'implementation':<22} {'chunks/sec':>14} {'alloc B/chunk':>14}")
+    for result in results:
+        typer.echo(
+            f"{result['name']:<22} {result['chunks_per_sec']:>14,.0f} "
+            f"{result['alloc_bytes_per_chunk']:>14.1f}"
+        )
+    speedup = results[1]["chunks_per_sec"] / results[0]["chunks_per_sec"]
+    typer.echo(f"\nspeedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""End-to-end capacity harness for CCProxy.
+
+Starts the mock upstream and a ``ccproxy serve`` process against it, then
+ramps closed-loop streaming concurrency on each route (``/api``, ``/sdk``
+with a stub Claude CLI, ``/codex``) until a service level objective breaks.
+Writes ``report.json`` with per-step throughput, proxy-added TTFT, CPU
+seconds and RSS per 1k requests and event loop lag, plus SVG charts of each
+metric by concurrency, to the output directory.
+
+Usage:
+    uv run python scripts/capacity_harness.py
+    uv run python scripts/capacity_harness.py --route api --max-concurrency 256
+    uv run python scripts/capacity_harness.py --step-seconds 30 \\
+        --slo-added-ttft-p99-ms 50 --output-dir ./capacity-report
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import typer
+
+from ccproxy.testing.capacity import CapacityHarness, write_report
+from ccproxy.testing.config import CapacityConfig, CapacityRoute, MockUpstreamConfig
+
+
+app = typer.Typer(help="Ramp load against CCProxy until an SLO breaks")
+
+
+@app.command()
+def run(
+    routes: list[str] = typer.Option(
+        ["api", "sdk", "codex"], "--route", help="Route to test (repeatable)"
+    ),
+    proxy_port: int = typer.Option(8010, "--proxy-port", help="Proxy port"),
+    upstream_port: int = typer.Option(8081, "--upstream-port", help="Mock port"),
+    cassettes: Path | None = typer.Option(
+        None, "--cassettes", help="Cassette directory (synthetic streams if unset)"
+    ),
+    ttft_ms: int = typer.Option(
+        300, "--ttft-ms", help="Upstream and stub CLI time to first token"
+    ),
+    tokens_per_second: float = typer.Option(
+        0.0, "--tokens-per-second", help="Upstream output token rate, 0 for no delay"
+    ),
+    start_concurrency: int = typer.Option(1, "--start-concurrency"),
+    max_concurrency: int = typer.Option(512, "--max-concurrency"),
+    concurrency_factor: float = typer.Option(
+        2.0, "--concurrency-factor", help="Concurrency multiplier per step"
+    ),
+    step_seconds: float = typer.Option(15.0, "--step-seconds"),
+    warmup_seconds: float = typer.Option(2.0, "--warmup-seconds"),
+    slo_added_ttft_p99_ms: float = typer.Option(100.0, "--slo-added-ttft-p99-ms"),
+    slo_error_rate: float = typer.Option(0.01, "--slo-error-rate"),
+    slo_loop_lag_p99_ms: float = typer.Option(50.0, "--slo-loop-lag-p99-ms"),
+    output_dir: Path = typer.Option(Path("capacity-report"), "--output-dir"),
+) -> None:
+    """Run the concurrency ramp on each route and write the report."""
+    known: tuple[CapacityRoute, ...] = ("api", "sdk", "codex")
+    for route in routes:
+        if route not in known:
+            raise typer.BadParameter(f"Unknown route {route!r}")
+    selected = [route for route in known if route in routes]
+    config = CapacityConfig(
+        routes=selected,
+        proxy_port=proxy_port,
+        mock_upstream=MockUpstreamConfig(
+            port=upstream_port,
+            cassette_dir=cassettes,
+            ttft_ms=ttft_ms,
+            tokens_per_second=tokens_per_second,
+            rate_limit_requests=0,
+        ),
+        stub_ttft_ms=ttft_ms,
+        concurrency_start=start_concurrency,
+        concurrency_max=max_concurrency,
+        concurrency_factor=concurrency_factor,
+        step_seconds=step_seconds,
+        warmup_seconds=warmup_seconds,
+        slo_added_ttft_p99_ms=slo_added_ttft_p99_ms,
+        slo_error_rate=slo_error_rate,
+        slo_loop_lag_p99_ms=slo_loop_lag_p99_ms,
+        output_dir=output_dir,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="ccproxy-capacity-") as workdir:
+        report = asyncio.run(CapacityHarness(config, Path(workdir)).run())
+    written = write_report(report, output_dir)
+
+    typer.echo(
+        f"{'route':<6} {'conc':>5} {'req/s':>8} {'+ttft p50':>10} {'+ttft p99':>10} "
+        f"{'cpu s/1k':>9} {'rss MiB':>8} {'lag p99':>8}  slo"
+    )
+    for route, data in report["routes"].items():
+        for step in data["steps"]:
+            typer.echo(
+                f"{route:<6} {step['concurrency']:>5} "
+                f"{step['requests_per_second']:>8.1f} "
+                f"{step['added_ttft_p50_ms']:>10.1f} "
+                f"{step['added_ttft_p99_ms']:>10.1f} "
+                f"{step['cpu_seconds_per_1k_requests']:>9.2f} "
+                f"{step['rss_peak_mb']:>8.1f} {step['loop_lag_p99_ms']:>8.1f}  "
+                + ("ok" if step["slo_ok"] else "; ".join(step["slo_breaches"]))
+            )
+    typer.echo("")
+    for route, data in report["routes"].items():
+        summary = data["summary"]
+        streams = summary.get("streams_per_core")
+        typer.echo(
+            f"{route}: {summary['max_sustainable_rps']:.1f} req/s sustainable at "
+            f"concurrency {summary['max_sustainable_concurrency']}"
+            + (f", {streams:.0f} streams/core" if streams else "")
+        )
+    typer.echo(f"\nWrote {', '.join(str(path) for path in written)}")
+
+
+if __name__ == "__main__":
+    app()
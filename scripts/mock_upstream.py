@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Local mock upstream for load testing CCProxy against recorded streams.
+
+Record cassettes from the raw request logs of a proxy run with
+``CCPROXY_LOG_REQUESTS=true`` and ``CCPROXY_REQUEST_LOG_DIR`` set, then serve
+them and point the proxy at the mock upstream.
+
+Usage:
+    uv run python scripts/mock_upstream.py record /tmp/ccproxy/requests ./cassettes
+    uv run python scripts/mock_upstream.py serve --cassettes ./cassettes --ttft-ms 300
+    REVERSE_PROXY__TARGET_URL=http://127.0.0.1:8081 \\
+        CODEX__BASE_URL=http://127.0.0.1:8081 uv run ccproxy serve
+"""
+
+import asyncio
+from pathlib import Path
+
+import typer
+
+from ccproxy.testing.config import MockUpstreamConfig
+from ccproxy.testing.mock_upstream import (
+    MockUpstream,
+    create_mock_upstream_server,
+    record_cassettes,
+)
+
+
+app = typer.Typer(help="Mock upstream replaying recorded SSE streams")
+
+
+@app.command()
+def record(
+    log_dir: Path = typer.Argument(..., help="Request log directory to read"),
+    output_dir: Path = typer.Argument(..., help="Directory to write cassettes to"),
+) -> None:
+    """Convert raw streaming request logs into cassettes."""
+    written = record_cassettes(log_dir, output_dir)
+    typer.echo(f"Recorded {len(written)} cassettes to {output_dir}")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Host to bind"),
+    port: int = typer.Option(8081, "--port", help="Port to bind"),
+    cassettes: Path | None = typer.Option(
+        None, "--cassettes", help="Cassette directory (synthetic streams if unset)"
+    ),
+    ttft_ms: int = typer.Option(400, "--ttft-ms", help="Time to first token"),
+    tokens_per_second: float = typer.Option(
+        80.0, "--tokens-per-second", help="Output token rate, 0 for no delay"
+    ),
+    error_rate: float = typer.Option(
+        0.0, "--error-rate", help="Chance of an error response"
+    ),
+    mid_stream_error_rate: float = typer.Option(
+        0.0, "--mid-stream-error-rate", help="Chance of an error event mid-stream"
+    ),
+    rate_limit_requests: int = typer.Option(
+        4000, "--rate-limit-requests", help="Requests per minute, 0 disables"
+    ),
+    rate_limit_tokens: int = typer.Option(
+        400000, "--rate-limit-tokens", help="Output tokens per minute"
+    ),
+    seed: int | None = typer.Option(None, "--seed", help="Random seed"),
+) -> None:
+    """Serve the Anthropic Messages and Responses APIs from cassettes."""
+    config = MockUpstreamConfig(
+        host=host,
+        port=port,
+        cassette_dir=cassettes,
+        ttft_ms=ttft_ms,
+        tokens_per_second=tokens_per_second,
+        error_rate=error_rate,
+        mid_stream_error_rate=mid_stream_error_rate,
+        rate_limit_requests=rate_limit_requests,
+        rate_limit_tokens=rate_limit_tokens,
+        seed=seed,
+    )
+    upstream = MockUpstream(config)
+    counts = upstream.get_stats()["cassettes"]
+    typer.echo(
+        f"Mock upstream on http://{host}:{port} "
+        f"(cassettes: {counts['anthropic']} anthropic, {counts['codex']} codex)"
+    )
+    typer.echo(
+        f"Point ccproxy at it: REVERSE_PROXY__TARGET_URL=http://{host}:{port} "
+        f"CODEX__BASE_URL=http://{host}:{port}"
+    )
+    asyncio.run(create_mock_upstream_server(config, upstream).serve())
+
+
+if __name__ == "__main__":
+    app()
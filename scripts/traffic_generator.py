@@ -4,6 +4,10 @@
 This script generates realistic API traffic patterns for testing and development.
 It reuses the test infrastructure's factories and fixtures to provide consistent
 mocking and authentication patterns.
+
+With ``--mock-upstream`` it also starts the local mock upstream and sends
+requests without bypass headers, so a proxy pointed at the mock upstream
+(``REVERSE_PROXY__TARGET_URL``) runs its full upstream path.
 """
 
 import asyncio
@@ -21,6 +25,8 @@ import structlog
 import typer
 
 from ccproxy.testing import (
+    MockUpstream,
+    MockUpstreamConfig,
     PayloadBuilder,
     RequestScenario,
     ResponseHandler,
@@ -253,8 +259,35 @@ class TrafficGenerator:
             return self.response_handler.process_response(response, scenario)
 
 
-async def run_traffic_generation(config: TrafficConfig) -> dict[str, Any]:
+async def run_traffic_generation(
+    config: TrafficConfig, mock_upstream: MockUpstreamConfig | None = None
+) -> dict[str, Any]:
     """Run traffic generation with real HTTP client and proper concurrency."""
+    if mock_upstream is None:
+        return await _run_traffic_generation(config)
+
+    from ccproxy.testing.mock_upstream import create_mock_upstream_server
+
+    upstream = MockUpstream(mock_upstream)
+    server = create_mock_upstream_server(mock_upstream, upstream)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        if server_task.done():
+            await server_task
+            raise RuntimeError("Mock upstream failed to start")
+        await asyncio.sleep(0.05)
+
+    try:
+        results_data = await _run_traffic_generation(config)
+    finally:
+        server.should_exit = True
+        await server_task
+
+    results_data["mock_upstream"] = upstream.get_stats()
+    return results_data
+
+
+async def _run_traffic_generation(config: TrafficConfig) -> dict[str, Any]:
     generator = TrafficGenerator(config)
     scenarios = generator.generate_scenarios()
 
@@ -460,6 +493,26 @@ def generate(
         "--end-time",
         help="End timestamp (ISO format, e.g., 2024-01-15T11:30:00Z)",
     ),
+    mock_upstream: bool = typer.Option(
+        False,
+        "--mock-upstream",
+        help="Start the local mock upstream and send requests without bypass",
+    ),
+    mock_upstream_port: int = typer.Option(
+        8081, "--mock-upstream-port", help="Port for the mock upstream"
+    ),
+    cassettes: Path | None = typer.Option(
+        None, "--cassettes", help="Cassette directory for the mock upstream"
+    ),
+    mock_ttft_ms: int = typer.Option(
+        400, "--mock-ttft-ms", help="Mock upstream time to first token"
+    ),
+    mock_tokens_per_second: float = typer.Option(
+        80.0, "--mock-tokens-per-second", help="Mock upstream output token rate"
+    ),
+    mock_error_rate: float = typer.Option(
+        0.0, "--mock-error-rate", help="Mock upstream error response rate"
+    ),
 ) -> None:
     """Generate API traffic based on specified parameters."""
 
@@ -482,6 +535,17 @@ def generate(
     if "openai" in format_list:
         format_distribution["openai"] = openai_weight
 
+    mock_config = None
+    if mock_upstream:
+        bypass_mode = False
+        mock_config = MockUpstreamConfig(
+            port=mock_upstream_port,
+            cassette_dir=cassettes,
+            ttft_ms=mock_ttft_ms,
+            tokens_per_second=mock_tokens_per_second,
+            error_rate=mock_error_rate,
+        )
+
     config = TrafficConfig(
         duration_seconds=duration,
         requests_per_second=rps,
@@ -505,10 +569,16 @@ def generate(
     )
     typer.echo(f"Pattern: {pattern.value}, RPS: {rps}, Duration: {duration}s")
     typer.echo(f"Bypass Mode: {'Enabled' if bypass_mode else 'Disabled'}")
+    if mock_config:
+        mock_url = f"http://{mock_config.host}:{mock_config.port}"
+        typer.echo(
+            f"Mock Upstream: {mock_url} (start the proxy with "
+            f"REVERSE_PROXY__TARGET_URL={mock_url} CODEX__BASE_URL={mock_url})"
+        )
 
     # Run traffic generation
     try:
-        results_data = asyncio.run(run_traffic_generation(config))
+        results_data = asyncio.run(run_traffic_generation(config, mock_config))
 
         # Display results
         metrics = results_data["metrics"]
@@ -536,6 +606,14 @@ def generate(
                 f"Total Tokens: {metrics['total_input_tokens']} input, {metrics['total_output_tokens']} output"
             )
 
+        if "mock_upstream" in results_data:
+            upstream_stats = results_data["mock_upstream"]
+            typer.echo(
+                f"Mock Upstream: {upstream_stats['requests']} requests, "
+                f"{upstream_stats['errors'] + upstream_stats['mid_stream_errors']} injected errors, "
+                f"{upstream_stats['rate_limited']} rate limited"
+            )
+
         if output:
             # Save detailed results
             with output.open("w") as f:
@@ -783,6 +783,7 @@ def docker_adapter_success(
     """
     from ccproxy.docker.adapter import DockerAdapter
 
+    DockerAdapter.clear_cache()
     return DockerAdapter()
 
 
@@ -794,6 +795,7 @@ def docker_adapter_unavailable(mock_docker_run_unavailable: Any) -> DockerAdapte
     """
     from ccproxy.docker.adapter import DockerAdapter
 
+    DockerAdapter.clear_cache()
     return DockerAdapter()
 
 
@@ -807,6 +809,7 @@ def docker_adapter_failure(
     """
     from ccproxy.docker.adapter import DockerAdapter
 
+    DockerAdapter.clear_cache()
     return DockerAdapter()
 
 
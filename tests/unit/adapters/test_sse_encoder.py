@@ -0,0 +1,106 @@
+"""Tests for the precompiled OpenAI SSE chunk encoder."""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from ccproxy.adapters.openai.adapter import OpenAIAdapter
+from ccproxy.adapters.openai.streaming import OpenAIChunkEncoder, OpenAISSEFormatter
+
+
+def _parse_frame(frame: bytes) -> Any:
+    assert frame.startswith(b"data: ")
+    assert frame.endswith(b"\n\n")
+    return json.loads(frame[len(b"data: ") : -2])
+
+
+async def _anthropic_stream() -> AsyncIterator[dict[str, Any]]:
+    events: list[dict[str, Any]] = [
+        {"type": "message_start", "message": {"id": "msg_1"}},
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text"}},
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": 'Hello "world"\n'},
+        },
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": " café 🚀"},
+        },
+        {"type": "content_block_stop", "index": 0},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"input_tokens": 10, "output_tokens": 4},
+        },
+        {"type": "message_stop"},
+    ]
+    for event in events:
+        yield event
+
+
+@pytest.mark.unit
+class TestOpenAIChunkEncoder:
+    """Test the per-stream chunk template."""
+
+    @pytest.mark.parametrize(
+        "text",
+        ["plain", 'quote " and \\ backslash', "line\nbreak\t", "ünïcode 🚀", "%s %d"],
+    )
+    def test_content_matches_formatter_output(self, text: str) -> None:
+        """Template frames are byte-identical to the dict-based formatter."""
+        encoder = OpenAIChunkEncoder("chatcmpl-1", "claude-sonnet-4", 1700000000)
+
+        expected = OpenAISSEFormatter.format_content_chunk(
+            "chatcmpl-1", "claude-sonnet-4", 1700000000, text
+        )
+
+        assert encoder.content(text) == expected.encode()
+
+    def test_frames_are_valid_chunks(self) -> None:
+        """Every frame type decodes to a valid chat.completion.chunk."""
+        encoder = OpenAIChunkEncoder('id"%s', "model", 1)
+        usage = {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}
+
+        role = _parse_frame(encoder.role())
+        content = _parse_frame(encoder.content("hi", index=2))
+        final = _parse_frame(encoder.finish("length", usage=usage))
+        error = _parse_frame(encoder.error("api_error", "boom"))
+
+        assert role["id"] == 'id"%s'
+        assert role["choices"][0]["delta"] == {"role": "assistant"}
+        assert content["choices"][0]["index"] == 2
+        assert content["choices"][0]["delta"] == {"content": "hi"}
+        assert final["choices"][0]["finish_reason"] == "length"
+        assert final["usage"] == usage
+        assert error["error"] == {"type": "api_error", "message": "boom"}
+        assert encoder.DONE == b"data: [DONE]\n\n"
+
+    async def test_adapt_stream_sse_matches_adapt_stream(self) -> None:
+        """Encoded frames carry the same chunks as the dict stream plus [DONE]."""
+        adapter = OpenAIAdapter()
+
+        dict_chunks = [
+            chunk async for chunk in adapter.adapt_stream(_anthropic_stream())
+        ]
+        frames = [
+            frame async for frame in adapter.adapt_stream_sse(_anthropic_stream())
+        ]
+
+        assert frames[-1] == b"data: [DONE]\n\n"
+        decoded = [_parse_frame(frame) for frame in frames[:-1]]
+        strip = ("id", "created")
+        assert [
+            {k: v for k, v in chunk.items() if k not in strip} for chunk in decoded
+        ] == [
+            {k: v for k, v in chunk.items() if k not in strip} for chunk in dict_chunks
+        ]
+        assert (
+            "".join(
+                chunk["choices"][0]["delta"].get("content", "") for chunk in decoded
+            )
+            == 'Hello "world"\n café 🚀'
+        )
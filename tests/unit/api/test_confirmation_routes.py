@@ -166,7 +166,9 @@ class TestConfirmationRoutes:
         assert data["allowed"] is True
 
         # Verify service was called
-        mock_confirmation_service.resolve.assert_called_once_with("test-id", True)
+        mock_confirmation_service.resolve.assert_called_once_with(
+            "test-id", True, remember=None
+        )
 
     @patch_confirmation_service
     def test_respond_to_confirmation_denied(
@@ -193,7 +195,9 @@ class TestConfirmationRoutes:
         assert data["allowed"] is False
 
         # Verify service was called
-        mock_confirmation_service.resolve.assert_called_once_with("test-id", False)
+        mock_confirmation_service.resolve.assert_called_once_with(
+            "test-id", False, remember=None
+        )
 
     @patch_confirmation_service
     def test_respond_to_non_existent_confirmation(
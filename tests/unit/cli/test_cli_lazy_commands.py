@@ -0,0 +1,88 @@
+"""Tests for lazily loaded CLI subcommands."""
+
+import subprocess
+import sys
+
+import click
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from ccproxy.cli.main import CCProxyGroup
+from ccproxy.cli.main import app as cli_app
+
+
+COMMAND_MODULES = [
+    "ccproxy.cli.commands.serve",
+    "ccproxy.cli.commands.auth",
+    "ccproxy.cli.commands.codex",
+    "ccproxy.cli.commands.config",
+    "ccproxy.cli.commands.permission_handler",
+]
+
+
+def _loaded_command_modules(code: str) -> list[str]:
+    """Run code in a fresh interpreter and list the command modules it imported."""
+    script = f"{code}\nimport sys\nprint(sorted(m for m in {COMMAND_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return eval(result.stdout.strip().splitlines()[-1])  # type: ignore[no-any-return]
+
+
+@pytest.mark.unit
+class TestLazyCommands:
+    """Test that subcommand modules are imported only when invoked."""
+
+    def test_importing_cli_loads_no_command_modules(self) -> None:
+        """The root CLI and --version do not import any subcommand module."""
+        loaded = _loaded_command_modules(
+            "import ccproxy.cli\n"
+            "from typer.testing import CliRunner\n"
+            "CliRunner().invoke(ccproxy.cli.app, ['--version'])"
+        )
+
+        assert loaded == []
+
+    def test_invoking_command_loads_only_its_module(self) -> None:
+        """Running one subcommand imports that module and not the others."""
+        loaded = _loaded_command_modules(
+            "from ccproxy.cli.main import app\n"
+            "from typer.testing import CliRunner\n"
+            "CliRunner().invoke(app, ['auth', '--help'])"
+        )
+
+        assert loaded == ["ccproxy.cli.commands.auth"]
+
+    def test_registered_commands_resolve(self) -> None:
+        """Every lazy command resolves to a click command with its own name."""
+        group = typer.main.get_command(cli_app)
+        assert isinstance(group, CCProxyGroup)
+        ctx = click.Context(group)
+
+        assert group.list_commands(ctx) == list(CCProxyGroup.lazy_commands)
+        for name in CCProxyGroup.lazy_commands:
+            command = group.get_command(ctx, name)
+            assert command is not None and command.name == name
+        assert isinstance(group.get_command(ctx, "auth"), click.Group)
+
+    def test_shell_completion_uses_registry(self) -> None:
+        """Completing subcommand names returns the registered help."""
+        group = typer.main.get_command(cli_app)
+
+        items = group.shell_complete(click.Context(group), "co")
+
+        assert {item.value: item.help for item in items} == {
+            "config": "Configuration management commands",
+            "confirmation-handler": (
+                "Connect to the API server and handle confirmation requests"
+            ),
+            "codex": "Codex (OpenAI) management commands",
+        }
+
+    def test_version_option(self) -> None:
+        """--version prints the version through the eager callback."""
+        result = CliRunner().invoke(cli_app, ["--version"])
+
+        assert result.exit_code == 0
+        assert "ccproxy" in result.output
@@ -0,0 +1,28 @@
+"""Tests for nested settings sections given as plain dicts."""
+
+import pytest
+
+from ccproxy.config.batch import BatchSettings
+from ccproxy.config.settings import Settings
+from ccproxy.config.streaming import StreamingSettings
+
+
+@pytest.mark.unit
+class TestNestedSettings:
+    """Test that nested sections accept dicts as well as models."""
+
+    def test_batch_settings_from_dict(self) -> None:
+        """The batch section is built from a plain dict."""
+        settings = Settings(batch={"max_concurrency": 8})  # type: ignore[arg-type]
+
+        assert isinstance(settings.batch, BatchSettings)
+        assert settings.batch.max_concurrency == 8
+
+    def test_streaming_settings_from_dict(self) -> None:
+        """The streaming section is built from a plain dict."""
+        settings = Settings(
+            streaming={"flush_interval_ms": 5.0},  # type: ignore[arg-type]
+        )
+
+        assert isinstance(settings.streaming, StreamingSettings)
+        assert settings.streaming.flush_interval_ms == 5.0
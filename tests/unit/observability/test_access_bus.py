@@ -0,0 +1,209 @@
+"""Tests for the access log event bus and its sinks."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from sqlmodel import Session, select
+
+from ccproxy.observability.access_bus import (
+    AccessLogBus,
+    AccessLogSink,
+    AccessRecord,
+    PrometheusSink,
+    StorageSink,
+)
+from ccproxy.observability.context import RequestContext
+from ccproxy.observability.storage.duckdb_simple import SimpleDuckDBStorage
+from ccproxy.observability.storage.models import AccessLog
+
+
+def _context(request_id: str = "req-1", **metadata: object) -> RequestContext:
+    return RequestContext(
+        request_id=request_id,
+        start_time=0.0,
+        logger=Mock(),
+        metadata={"method": "POST", "path": "/v1/messages", **metadata},
+    )
+
+
+class RecordingSink(AccessLogSink):
+    """Sink keeping every batch it receives."""
+
+    name = "recording"
+
+    def __init__(self, max_queue_size: int = 1000) -> None:
+        super().__init__(max_queue_size)
+        self.batches: list[list[AccessRecord]] = []
+
+    async def write(self, records: list[AccessRecord]) -> None:
+        self.batches.append(records)
+
+    @property
+    def request_ids(self) -> list[str]:
+        return [record.request_id for batch in self.batches for record in batch]
+
+
+@pytest.mark.unit
+class TestAccessRecord:
+    """Test the compact per-request record."""
+
+    def test_streaming_start_omits_response_fields(self) -> None:
+        """Until the stream completes, response fields are not logged."""
+        record = AccessRecord(
+            _context(streaming=True, tokens_input=10, session_type="direct"),
+            status_code=200,
+        )
+
+        fields = record.log_fields()
+        assert record.event == "access_log_streaming_start"
+        assert "status_code" not in fields and "duration_ms" not in fields
+        assert fields["tokens_input"] == 10
+        assert fields["session_type"] == "direct"
+        assert "status_code" not in record.sse_data()
+
+    def test_storage_payload_defaults(self) -> None:
+        """The storage row fills defaults for missing values."""
+        record = AccessRecord(_context(model="m1"), status_code=201)
+
+        payload = record.storage_payload()
+
+        assert record.event == "access_log"
+        assert payload["status_code"] == 201
+        assert payload["endpoint"] == "/v1/messages"
+        assert payload["tokens_input"] == 0
+        assert payload["model"] == "m1"
+
+    def test_stream_write_statistics_reach_extra(self) -> None:
+        """Streaming write statistics are carried into the log fields."""
+        record = AccessRecord(
+            _context(
+                event_type="streaming_complete",
+                stream_writes=3,
+                stream_max_buffered_bytes=2048,
+            ),
+            status_code=200,
+        )
+
+        assert record.extra["stream_writes"] == 3
+        assert record.extra["stream_max_buffered_bytes"] == 2048
+
+
+@pytest.mark.unit
+class TestAccessLogBus:
+    """Test dispatching records to sinks off the request path."""
+
+    async def test_published_records_reach_every_sink(self) -> None:
+        """Each sink receives every record, batched by its own worker."""
+        first, second = RecordingSink(), RecordingSink()
+        bus = AccessLogBus([first, second])
+        bus.start()
+
+        for i in range(5):
+            assert bus.publish(AccessRecord(_context(f"req-{i}")))
+        assert first.batches == []
+        await bus.stop()
+
+        expected = [f"req-{i}" for i in range(5)]
+        assert first.request_ids == expected
+        assert second.request_ids == expected
+        assert len(first.batches) < 5
+
+    async def test_publish_falls_back_when_not_running(self) -> None:
+        """Without a running bus, records are delivered inline."""
+        sink = RecordingSink()
+        bus = AccessLogBus([sink])
+        record = AccessRecord(_context())
+
+        assert not bus.publish(record)
+        await bus.deliver(record)
+
+        assert sink.request_ids == ["req-1"]
+
+    async def test_drop_policies_bound_sink_queues(self) -> None:
+        """Full sink queues drop the oldest or the newest record."""
+        oldest, newest = RecordingSink(2), RecordingSink(2)
+        newest.drop_policy = "drop_newest"
+
+        for i in range(4):
+            record = AccessRecord(_context(f"req-{i}"))
+            oldest.offer(record)
+            newest.offer(record)
+        await oldest.drain()
+        await newest.drain()
+
+        assert oldest.request_ids == ["req-2", "req-3"]
+        assert newest.request_ids == ["req-0", "req-1"]
+        assert oldest.dropped == newest.dropped == 2
+
+    async def test_slow_sink_does_not_block_others(self) -> None:
+        """A sink blocked in write does not hold back the other sinks."""
+        release = asyncio.Event()
+
+        class BlockedSink(RecordingSink):
+            async def write(self, records: list[AccessRecord]) -> None:
+                await release.wait()
+                await super().write(records)
+
+        blocked, fast = BlockedSink(), RecordingSink()
+        bus = AccessLogBus([blocked, fast])
+        bus.start()
+
+        bus.publish(AccessRecord(_context()))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert fast.request_ids == ["req-1"]
+        assert blocked.request_ids == []
+        release.set()
+        await bus.stop()
+        assert blocked.request_ids == ["req-1"]
+
+
+@pytest.mark.unit
+class TestAccessLogSinks:
+    """Test the storage and Prometheus sinks."""
+
+    def test_sinks_must_implement_write(self) -> None:
+        """The base sink cannot be used without a write implementation."""
+        with pytest.raises(TypeError):
+            AccessLogSink()  # type: ignore[abstract]
+
+    async def test_storage_sink_upserts_streaming_record(self, tmp_path: Path) -> None:
+        """A stream's final record replaces the row stored at stream start."""
+        storage = SimpleDuckDBStorage(tmp_path / "metrics.duckdb")
+        await storage.initialize()
+        try:
+            start = _context(streaming=True)
+            started = AccessRecord(start, storage=storage)
+            start.metadata.update(event_type="streaming_complete", tokens_output=42)
+            completed = AccessRecord(start, status_code=200, storage=storage)
+
+            await StorageSink().write([started, completed])
+
+            assert storage._engine is not None
+            with Session(storage._engine) as session:
+                rows = session.exec(select(AccessLog)).all()
+            assert len(rows) == 1
+            assert rows[0].tokens_output == 42
+        finally:
+            await storage.close()
+
+    async def test_prometheus_sink_records_request_and_tokens(self) -> None:
+        """Successful requests are counted with their token usage."""
+        metrics = Mock()
+        record = AccessRecord(
+            _context(model="m1", tokens_input=5, cost_usd=0.1),
+            status_code=200,
+            metrics=metrics,
+        )
+
+        await PrometheusSink().write([record])
+
+        metrics.record_request.assert_called_once()
+        metrics.record_tokens.assert_called_once_with(
+            token_count=5, token_type="input", model="m1", service_type=None
+        )
+        metrics.record_cost.assert_called_once()
+        metrics.record_error.assert_not_called()
@@ -0,0 +1,178 @@
+"""Tests for Parquet archival of old access logs."""
+
+import time
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from sqlmodel import Session, func, select
+
+from ccproxy.config.settings import Settings
+from ccproxy.observability.storage.archive import (
+    access_log_source,
+    clear_archive,
+    list_archive_files,
+)
+from ccproxy.observability.storage.duckdb_simple import (
+    AccessLogPayload,
+    SimpleDuckDBStorage,
+)
+from ccproxy.observability.storage.models import AccessLog
+from ccproxy.scheduler.tasks import LogArchivalTask
+from ccproxy.utils.startup_helpers import setup_log_archival_startup
+
+
+DAY = 86400
+
+
+def _log(request_id: str, days_ago: float, tokens: int = 10) -> AccessLogPayload:
+    return {
+        "request_id": request_id,
+        "timestamp": time.time() - days_ago * DAY,
+        "method": "POST",
+        "endpoint": "/v1/messages",
+        "service_type": "proxy_service",
+        "model": "claude-sonnet-4-20250514",
+        "status_code": 200,
+        "duration_ms": 100.0,
+        "tokens_input": tokens,
+    }
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> AsyncGenerator[SimpleDuckDBStorage, None]:
+    """Initialized file-backed storage with logs spread over two weeks."""
+    storage = SimpleDuckDBStorage(tmp_path / "metrics.duckdb")
+    await storage.initialize()
+    await storage.store_batch(
+        [
+            _log("today", 0),
+            _log("old-1", 10),
+            _log("old-2", 10),
+            _log("older", 14, tokens=5),
+        ]
+    )
+    yield storage
+    await storage.close()
+
+
+def _count(storage: SimpleDuckDBStorage, source: object) -> int:
+    with Session(storage._engine) as session:
+        return session.exec(select(func.count()).select_from(source)).one()  # type: ignore[arg-type,no-any-return]
+
+
+@pytest.mark.unit
+class TestAccessLogArchive:
+    """Test moving access logs between the hot table and Parquet partitions."""
+
+    async def test_archives_days_past_retention(
+        self, storage: SimpleDuckDBStorage, tmp_path: Path
+    ) -> None:
+        """Old rows move to one partition per day and leave the hot table."""
+        archive_dir = tmp_path / "archive"
+
+        archived = await storage.archive_old_logs(archive_dir, retention_days=7)
+
+        assert archived == 3
+        assert _count(storage, AccessLog) == 1
+        partitions = sorted(p.name for p in archive_dir.iterdir())
+        assert len(partitions) == 2
+        assert all(name.startswith("day=") for name in partitions)
+        assert await storage.archive_old_logs(archive_dir, retention_days=7) == 0
+
+    async def test_source_unions_hot_table_and_archive(
+        self, storage: SimpleDuckDBStorage, tmp_path: Path
+    ) -> None:
+        """Queries see archived rows together with the hot table."""
+        archive_dir = tmp_path / "archive"
+        await storage.archive_old_logs(archive_dir, retention_days=7)
+
+        logs = access_log_source(archive_dir)
+
+        assert logs is not AccessLog
+        assert _count(storage, logs) == 4
+        with Session(storage._engine) as session:
+            rows = session.exec(
+                select(logs).where(logs.tokens_input == 5).order_by(logs.timestamp)
+            ).all()
+        assert [row.request_id for row in rows] == ["older"]
+
+    async def test_partitions_outside_range_are_pruned(
+        self, storage: SimpleDuckDBStorage, tmp_path: Path
+    ) -> None:
+        """Only partitions overlapping the requested range are read."""
+        archive_dir = tmp_path / "archive"
+        await storage.archive_old_logs(archive_dir, retention_days=7)
+        now = datetime.now()
+
+        recent = access_log_source(archive_dir, now - timedelta(days=1), now)
+        older = list_archive_files(
+            archive_dir, now - timedelta(days=12), now - timedelta(days=8)
+        )
+
+        assert recent is AccessLog
+        assert len(older) == 1
+        assert older[0].parent.name == f"day={(now - timedelta(days=10)).date()}"
+
+    async def test_clear_archive_removes_partitions(
+        self, storage: SimpleDuckDBStorage, tmp_path: Path
+    ) -> None:
+        """Resetting the archive drops every day partition."""
+        archive_dir = tmp_path / "archive"
+        await storage.archive_old_logs(archive_dir, retention_days=7)
+
+        assert clear_archive(archive_dir) == 2
+        assert list_archive_files(archive_dir) == []
+
+
+@pytest.mark.unit
+class TestLogArchivalTask:
+    """Test the scheduled log archival task."""
+
+    async def test_run_archives_through_storage(self) -> None:
+        """The task archives with its configured directory and retention."""
+        storage = AsyncMock()
+        storage.archive_old_logs.return_value = 3
+        task = LogArchivalTask(
+            name="log_archival",
+            interval_seconds=3600,
+            storage=storage,
+            archive_dir="/tmp/archive",
+            retention_days=14,
+        )
+
+        assert await task.run()
+        storage.archive_old_logs.assert_awaited_once_with("/tmp/archive", 14)
+
+    async def test_run_reports_failures(self) -> None:
+        """Archival errors are reported so the scheduler can back off."""
+        storage = AsyncMock()
+        storage.archive_old_logs.side_effect = OSError("disk full")
+        task = LogArchivalTask(
+            name="log_archival",
+            interval_seconds=3600,
+            storage=storage,
+            archive_dir="/tmp/archive",
+        )
+
+        assert not await task.run()
+
+    async def test_archival_is_opt_in(self) -> None:
+        """The task is only scheduled when archival is enabled."""
+        app = FastAPI()
+        app.state.scheduler = Mock(add_task=AsyncMock())
+        app.state.log_storage = Mock()
+        settings = Settings()
+
+        await setup_log_archival_startup(app, settings)
+        app.state.scheduler.add_task.assert_not_awaited()
+
+        settings.scheduler.log_archival_enabled = True
+        await setup_log_archival_startup(app, settings)
+        app.state.scheduler.add_task.assert_awaited_once()
+        assert app.state.scheduler.add_task.call_args.kwargs["task_type"] == (
+            "log_archival"
+        )
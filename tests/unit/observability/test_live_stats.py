@@ -0,0 +1,261 @@
+"""Tests for the in-process sliding-window live stats aggregator."""
+
+import time
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest_httpx import HTTPXMock
+
+from ccproxy.api.routes.metrics import logs_router
+from ccproxy.config.observability import ObservabilitySettings
+from ccproxy.config.settings import Settings
+from ccproxy.observability.access_logger import log_request_access
+from ccproxy.observability.context import RequestContext
+from ccproxy.observability.live_stats import (
+    LIVE_WINDOWS,
+    LatencySketch,
+    SlidingWindowAggregator,
+    get_live_stats,
+    reset_live_stats,
+)
+from ccproxy.observability.stats_printer import StatsCollector
+from ccproxy.services.proxy_service import ProxyService
+
+
+NOW = 1_700_000_000.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def fresh_live_stats() -> Iterator[None]:
+    """Give each test an empty global aggregator."""
+    reset_live_stats()
+    yield
+    reset_live_stats()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def aggregator(clock: FakeClock) -> SlidingWindowAggregator:
+    return SlidingWindowAggregator(clock=clock)
+
+
+@pytest.mark.unit
+class TestLatencySketch:
+    """Test the mergeable latency sketch."""
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """Quantiles are within the configured relative error."""
+        sketch = LatencySketch()
+        for value in range(1, 1001):
+            sketch.add(float(value))
+
+        for q, expected in [(0.5, 500.5), (0.9, 900.1), (0.99, 990.01)]:
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.02)
+
+    def test_merge_matches_single_sketch(self) -> None:
+        """Merging two sketches equals adding every value to one."""
+        merged, low, high, combined = (LatencySketch() for _ in range(4))
+        for value in range(1, 101):
+            (low if value <= 50 else high).add(float(value))
+            combined.add(float(value))
+
+        merged.merge(low)
+        merged.merge(high)
+
+        assert merged.count == 100
+        assert merged.quantile(0.95) == combined.quantile(0.95)
+
+    def test_subtract_undoes_merge(self) -> None:
+        """Subtracting a merged sketch restores the previous counts."""
+        sketch, other = LatencySketch(), LatencySketch()
+        for value in range(1, 51):
+            sketch.add(float(value))
+            other.add(float(value * 10))
+        before = dict(sketch.bins)
+
+        sketch.merge(other)
+        sketch.subtract(other)
+
+        assert sketch.count == 50
+        assert sketch.bins == before
+
+
+@pytest.mark.unit
+class TestSlidingWindowAggregator:
+    """Test windows computed from the per-second bucket ring."""
+
+    def test_windows_include_only_recent_seconds(
+        self, aggregator: SlidingWindowAggregator
+    ) -> None:
+        """Each window only sums the requests completed within it."""
+        aggregator.record(100.0, model="a", tokens_input=10, timestamp=NOW - 200)
+        aggregator.record(300.0, model="b", tokens_input=20, cost_usd=0.5)
+        aggregator.record(200.0, model="b", error=True, timestamp=NOW - 30)
+
+        last_minute = aggregator.window(60)
+        last_five = aggregator.window(300)
+
+        assert last_minute.requests == 2
+        assert last_minute.errors == 1
+        assert last_minute.tokens_input == 20
+        assert last_minute.cost_usd == pytest.approx(0.5)
+        assert last_minute.avg_duration_ms == pytest.approx(250.0)
+        assert last_minute.top_model == "b"
+        assert last_five.requests == 3
+        assert last_five.models == {"a": 1, "b": 2}
+        assert last_five.p50_duration_ms == pytest.approx(200.0, rel=0.02)
+
+    def test_old_buckets_expire_and_are_reused(
+        self, aggregator: SlidingWindowAggregator, clock: FakeClock
+    ) -> None:
+        """Buckets outside the ring are reset while totals keep counting."""
+        aggregator.record(100.0)
+        clock.now += aggregator.window_seconds
+
+        assert aggregator.window(900).requests == 0
+
+        aggregator.record(50.0)
+
+        assert aggregator.window(900).requests == 1
+        assert aggregator.window(900).avg_duration_ms == pytest.approx(50.0)
+        assert aggregator.totals().requests == 2
+
+    def test_running_windows_match_bucket_merges(
+        self, aggregator: SlidingWindowAggregator, clock: FakeClock
+    ) -> None:
+        """Snapshot windows equal a fresh merge of the buckets they cover."""
+        for step in range(1200):
+            clock.now = NOW + step
+            aggregator.record(
+                float(step % 97 + 1),
+                model=f"m{step % 3}",
+                tokens_input=step,
+                error=step % 11 == 0,
+            )
+            if step % 7 == 0:
+                # Late arrivals land in older buckets
+                aggregator.record(5.0, model="m0", timestamp=clock.now - 100)
+            if step % 150 == 0:
+                clock.now += 0.5
+                windows = aggregator.snapshot()["windows"]
+                for name, seconds in LIVE_WINDOWS.items():
+                    assert windows[name] == aggregator.window(seconds).to_dict()
+
+    def test_snapshot_reports_live_windows(
+        self, aggregator: SlidingWindowAggregator
+    ) -> None:
+        """The snapshot has the 1m/5m/15m windows, totals and in-flight count."""
+        aggregator.request_started()
+        aggregator.record(120.0, model="claude-sonnet-4-20250514")
+
+        snapshot = aggregator.snapshot()
+
+        assert set(snapshot["windows"]) == {"1m", "5m", "15m"}
+        assert snapshot["windows"]["1m"]["requests"] == 1
+        assert snapshot["totals"]["requests"] == 1
+        assert snapshot["active_requests"] == 1
+
+
+@pytest.mark.unit
+class TestLiveStatsConsumers:
+    """Test the access-log feed and the readers of the aggregator."""
+
+    async def test_access_log_records_completed_requests(self) -> None:
+        """Completed requests are recorded, streaming starts are not."""
+        context = RequestContext(
+            request_id="req-1",
+            start_time=0.0,
+            logger=Mock(),
+            metadata={"model": "claude-sonnet-4-20250514", "tokens_input": 42},
+        )
+
+        await log_request_access(context, status_code=200, method="POST")
+        context.metadata["streaming"] = True
+        await log_request_access(context, status_code=200, method="POST")
+
+        last_minute = get_live_stats().window(60)
+        assert last_minute.requests == 1
+        assert last_minute.tokens_input == 42
+
+    async def test_streaming_upstream_errors_are_counted(
+        self, httpx_mock: HTTPXMock, test_settings: Settings
+    ) -> None:
+        """An upstream error before a stream starts is recorded as an error."""
+        httpx_mock.add_response(status_code=529, json={"type": "error"})
+        proxy_service = ProxyService(Mock(), Mock(), test_settings)
+        context = RequestContext(
+            request_id="req-1",
+            start_time=time.perf_counter(),
+            logger=Mock(),
+            metadata={"model": "claude-sonnet-4-20250514", "streaming": True},
+        )
+
+        response = await proxy_service._handle_streaming_request(
+            {
+                "method": "POST",
+                "url": "https://api.anthropic.com/v1/messages",
+                "headers": {},
+                "body": b"{}",
+            },
+            "/v1/messages",
+            5.0,
+            context,
+        )
+
+        assert isinstance(response, tuple)
+        assert response[0] == 529
+        last_minute = get_live_stats().window(60)
+        assert last_minute.requests == 1
+        assert last_minute.errors == 1
+
+    async def test_stats_collector_reads_live_stats(
+        self, aggregator: SlidingWindowAggregator
+    ) -> None:
+        """The collector fills its snapshot from the aggregator, not DuckDB."""
+        storage = AsyncMock()
+        aggregator.record(100.0, model="m1", tokens_output=7, cost_usd=0.25)
+        aggregator.record(300.0, model="m1", error=True)
+        collector = StatsCollector(
+            settings=ObservabilitySettings(),
+            storage_instance=storage,
+            live_stats=aggregator,
+        )
+
+        snapshot = await collector.collect_stats()
+
+        assert snapshot.requests_last_minute == 2
+        assert snapshot.requests_total == 2
+        assert snapshot.avg_response_time_ms == pytest.approx(200.0)
+        assert snapshot.tokens_output_last_minute == 7
+        assert snapshot.errors_last_minute == 1
+        assert snapshot.top_model == "m1"
+        assert snapshot.top_model_percentage == pytest.approx(100.0)
+        storage.get_analytics.assert_not_called()
+
+    def test_live_endpoint_serves_snapshot(self) -> None:
+        """/logs/live returns the global aggregator's windows."""
+        get_live_stats().record(80.0, model="claude-sonnet-4-20250514")
+        app = FastAPI()
+        app.include_router(logs_router, prefix="/logs")
+
+        response = TestClient(app).get("/logs/live")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["windows"]["15m"]["requests"] == 1
+        assert body["windows"]["1m"]["top_model"] == "claude-sonnet-4-20250514"
@@ -0,0 +1,92 @@
+"""Tests for the event loop lag monitor."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ccproxy.api.routes.metrics import logs_router
+from ccproxy.observability.loop_lag import (
+    EventLoopLagMonitor,
+    configure_loop_lag_monitor,
+    get_loop_lag_monitor,
+    reset_loop_lag_monitor,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def fresh_monitor() -> Iterator[None]:
+    """Give each test an unconfigured global monitor."""
+    reset_loop_lag_monitor()
+    yield
+    reset_loop_lag_monitor()
+
+
+@pytest.mark.unit
+class TestEventLoopLagMonitor:
+    """Test lag sampling and windowed summaries."""
+
+    def test_snapshot_percentiles_within_window(self) -> None:
+        """Only samples inside the window are summarized."""
+        clock = FakeClock()
+        monitor = EventLoopLagMonitor(interval=1.0, clock=clock)
+        monitor.record(500.0)
+        clock.now += 120
+        for lag in range(1, 101):
+            monitor.record(float(lag))
+
+        snapshot = monitor.snapshot(60)
+
+        assert snapshot["samples"] == 100
+        assert snapshot["p50_ms"] == 51.0
+        assert snapshot["p99_ms"] == 100.0
+        assert snapshot["max_ms"] == 100.0
+        assert monitor.snapshot()["max_ms"] == 500.0
+
+    def test_empty_snapshot(self) -> None:
+        """A monitor without samples reports zeros."""
+        snapshot = EventLoopLagMonitor().snapshot(10)
+
+        assert snapshot["samples"] == 0
+        assert snapshot["p99_ms"] == 0.0
+        assert snapshot["running"] is False
+
+    async def test_detects_blocking_callback(self) -> None:
+        """Blocking the loop shows up as lag once the monitor wakes up."""
+        monitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.03)
+        time.sleep(0.1)
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        assert not monitor.running
+        assert monitor.snapshot()["max_ms"] >= 50
+
+    def test_global_monitor_and_route(self) -> None:
+        """The logs route summarizes the configured global monitor."""
+        assert get_loop_lag_monitor() is get_loop_lag_monitor()
+        monitor = configure_loop_lag_monitor(0.05)
+        monitor.record(7.0)
+        app = FastAPI()
+        app.include_router(logs_router, prefix="/logs")
+
+        response = TestClient(app).get("/logs/loop-lag", params={"window_seconds": 30})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["interval_ms"] == 50.0
+        assert body["window_seconds"] == 30
+        assert body["samples"] == 1
+        assert body["p99_ms"] == 7.0
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ccproxy.observability.context import RequestContext
-from ccproxy.observability.streaming_response import StreamingResponseWithLogging
+from ccproxy.observability.streaming_response import (
+    StreamingResponseWithLogging,
+    _contains_token,
+)
 
 
 class TestStreamingResponseWithLogging:
@@ -76,9 +80,11 @@ class TestStreamingResponseWithLogging:
             )
 
             # Verify context metadata was updated with streaming completion event
-            mock_request_context.add_metadata.assert_called_once_with(
-                event_type="streaming_complete"
-            )
+            mock_request_context.add_metadata.assert_called_once()
+            metadata = mock_request_context.add_metadata.call_args.kwargs
+            assert metadata["event_type"] == "streaming_complete"
+            assert "stream_writes" in metadata
+            assert "stream_max_buffered_bytes" in metadata
 
     @pytest.mark.asyncio
     async def test_streaming_response_logs_on_error(
@@ -112,9 +118,11 @@ class TestStreamingResponseWithLogging:
             )
 
             # Verify context metadata was updated with streaming completion event
-            mock_request_context.add_metadata.assert_called_once_with(
-                event_type="streaming_complete"
-            )
+            mock_request_context.add_metadata.assert_called_once()
+            metadata = mock_request_context.add_metadata.call_args.kwargs
+            assert metadata["event_type"] == "streaming_complete"
+            assert "stream_writes" in metadata
+            assert "stream_max_buffered_bytes" in metadata
 
     @pytest.mark.asyncio
     async def test_streaming_response_handles_logging_errors(
@@ -272,3 +280,43 @@ class TestStreamingResponseWithLogging:
                 status_code=200,
                 metrics=mock_metrics,
             )
+
+    @pytest.mark.asyncio
+    async def test_records_time_to_first_token(
+        self, mock_request_context: MagicMock
+    ) -> None:
+        """ttft_ms is taken at the first chunk carrying a content delta."""
+        mock_request_context.start_time = time.perf_counter() - 0.5
+
+        async def token_stream() -> AsyncGenerator[bytes, None]:
+            yield b'event: message_start\ndata: {"type":"message_start"}\n\n'
+            assert "ttft_ms" not in mock_request_context.metadata
+            yield b'event: content_block_delta\ndata: {"type":"content_block_delta"}\n\n'
+            yield b'event: content_block_delta\ndata: {"type":"content_block_delta"}\n\n'
+
+        with patch(
+            "ccproxy.observability.streaming_response.log_request_access",
+            new_callable=AsyncMock,
+        ):
+            response = StreamingResponseWithLogging(
+                content=token_stream(),
+                request_context=mock_request_context,
+                media_type="text/event-stream",
+            )
+            chunks = [chunk async for chunk in response.body_iterator]
+
+        assert len(chunks) == 3
+        assert 500 <= mock_request_context.metadata["ttft_ms"] < 5000
+
+    @pytest.mark.parametrize(
+        "chunk",
+        [
+            b'data: {"choices":[{"delta":{"content":"Hi"}}]}\n\n',
+            b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\n',
+            b'data: {"type": "response.output_text.delta", "delta": "Hi"}\n\n',
+        ],
+    )
+    def test_token_markers_ignore_json_spacing(self, chunk: bytes) -> None:
+        """Content deltas are found in compact and spaced JSON alike."""
+        assert _contains_token(chunk)
+        assert not _contains_token(b'data: {"choices": [{"delta": {"role": "x"}}]}')
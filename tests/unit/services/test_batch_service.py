@@ -0,0 +1,380 @@
+"""Tests for the local message batch subsystem.
+
+Batch items are executed through a real ProxyService whose HTTP client is a
+local stub upstream, so the whole proxy pipeline (auth, transformation,
+response parsing) is exercised without network access.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ccproxy.config.batch import BatchSettings
+from ccproxy.config.settings import Settings
+from ccproxy.core.http import BaseProxyClient, HTTPClient
+from ccproxy.services.batch import (
+    BatchItem,
+    BatchNotFoundError,
+    BatchService,
+    ExecutionOutcome,
+    ProxyServiceBatchExecutor,
+)
+from ccproxy.services.proxy_service import ProxyService
+
+
+class StubUpstream(HTTPClient):
+    """Local stub of the Anthropic Messages API."""
+
+    def __init__(self, rate_limited_prompts: set[str] | None = None) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self.rate_limited_prompts = set(rate_limited_prompts or ())
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None = None,
+        timeout: float | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        payload = json.loads(body or b"{}")
+        self.requests.append(payload)
+        prompt = payload["messages"][-1]["content"]
+        if isinstance(prompt, list):
+            prompt = prompt[0]["text"]
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if prompt in self.rate_limited_prompts:
+            # Rate limit once, then succeed on retry
+            self.rate_limited_prompts.discard(prompt)
+            return (
+                429,
+                {"content-type": "application/json", "retry-after": "0.05"},
+                json.dumps(
+                    {
+                        "type": "error",
+                        "error": {"type": "rate_limit_error", "message": "slow down"},
+                    }
+                ).encode(),
+            )
+
+        if prompt == "fail":
+            return (
+                400,
+                {"content-type": "application/json"},
+                json.dumps(
+                    {
+                        "type": "error",
+                        "error": {
+                            "type": "invalid_request_error",
+                            "message": "bad prompt",
+                        },
+                    }
+                ).encode(),
+            )
+
+        return (
+            200,
+            {"content-type": "application/json"},
+            json.dumps(
+                {
+                    "id": f"msg_{len(self.requests)}",
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": f"echo: {prompt}"}],
+                    "model": payload.get("model", "claude-3-5-sonnet-20241022"),
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 10, "output_tokens": 5},
+                }
+            ).encode(),
+        )
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _items(prompts: list[str]) -> list[BatchItem]:
+    return [
+        BatchItem(
+            custom_id=f"req-{i}",
+            params={
+                "model": "claude-3-5-sonnet-20241022",
+                "max_tokens": 32,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        )
+        for i, prompt in enumerate(prompts)
+    ]
+
+
+async def _wait_for_end(service: BatchService, batch_id: str) -> None:
+    for _ in range(500):
+        record = await service.get_batch(batch_id)
+        if record.processing_status == "ended":
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("batch did not finish")
+
+
+@pytest.fixture
+def batch_settings(tmp_path: Path) -> BatchSettings:
+    return BatchSettings(
+        storage_dir=str(tmp_path / "batches"),
+        max_concurrency=3,
+        rate_limit_backoff_seconds=0.1,
+        checkpoint_interval=2,
+    )
+
+
+@pytest.fixture
+def stub_upstream() -> StubUpstream:
+    return StubUpstream(rate_limited_prompts={"prompt 2"})
+
+
+@pytest.fixture
+def proxy_executor(stub_upstream: StubUpstream) -> ProxyServiceBatchExecutor:
+    credentials_manager = AsyncMock()
+    credentials_manager.get_access_token = AsyncMock(return_value="test-token")
+    proxy_service = ProxyService(
+        proxy_client=BaseProxyClient(stub_upstream),
+        credentials_manager=credentials_manager,
+        settings=Settings(),
+        metrics=AsyncMock(),
+    )
+    return ProxyServiceBatchExecutor(proxy_service, timeout=10.0)
+
+
+@pytest.mark.unit
+class TestBatchService:
+    """Test batch execution against a local stub upstream."""
+
+    async def test_batch_executes_all_items_through_proxy_service(
+        self,
+        batch_settings: BatchSettings,
+        proxy_executor: ProxyServiceBatchExecutor,
+        stub_upstream: StubUpstream,
+    ) -> None:
+        """Every item runs through ProxyService and the results are persisted."""
+        service = BatchService(settings=batch_settings, executor=proxy_executor)
+        prompts = [f"prompt {i}" for i in range(8)] + ["fail"]
+        record = await service.create_batch(_items(prompts))
+
+        await _wait_for_end(service, record.id)
+        record = await service.get_batch(record.id)
+
+        assert record.request_counts.succeeded == 8
+        assert record.request_counts.errored == 1
+        assert record.request_counts.processing == 0
+        assert 1 <= stub_upstream.max_in_flight <= batch_settings.max_concurrency
+        # The rate limited item was retried once
+        assert record.throughput.retries == 1
+        assert record.throughput.rate_limit_pauses >= 1
+        assert record.throughput.input_tokens == 80
+        assert record.throughput.output_tokens == 40
+        assert record.throughput.items_per_second > 0
+        assert record.throughput.tokens_per_second > 0
+
+        results = [r async for r in service.iter_results(record.id)]
+        by_id = {r.custom_id: r for r in results}
+        assert len(results) == 9
+        assert by_id["req-2"].type == "succeeded"
+        assert by_id["req-2"].body is not None
+        assert by_id["req-2"].body["content"][0]["text"] == "echo: prompt 2"
+        assert by_id["req-8"].type == "errored"
+        assert by_id["req-8"].to_anthropic()["result"]["error"]["error"]["type"] == (
+            "invalid_request_error"
+        )
+
+    async def test_executor_close_closes_http_client(
+        self,
+        proxy_executor: ProxyServiceBatchExecutor,
+        stub_upstream: StubUpstream,
+    ) -> None:
+        """Closing the executor releases the proxy service's HTTP client."""
+        await proxy_executor.close()
+
+        assert stub_upstream.closed
+
+    async def test_openai_batch_results_are_converted(
+        self,
+        batch_settings: BatchSettings,
+        proxy_executor: ProxyServiceBatchExecutor,
+    ) -> None:
+        """OpenAI batches accept chat completion bodies and return OpenAI output."""
+        service = BatchService(settings=batch_settings, executor=proxy_executor)
+        items = [
+            BatchItem(
+                custom_id="chat-1",
+                params={
+                    "model": "gpt-4o",
+                    "messages": [{"role": "user", "content": "hello"}],
+                },
+            )
+        ]
+        record = await service.create_batch(items, batch_format="openai")
+        await _wait_for_end(service, record.id)
+
+        results = [r.to_openai() async for r in service.iter_results(record.id)]
+        assert results[0]["custom_id"] == "chat-1"
+        assert results[0]["response"]["status_code"] == 200
+        assert results[0]["response"]["body"]["object"] == "chat.completion"
+        assert (await service.get_batch(record.id)).to_openai()["status"] == (
+            "completed"
+        )
+
+    async def test_batch_resumes_after_restart(
+        self, batch_settings: BatchSettings
+    ) -> None:
+        """A suspended batch resumes from its checkpoint without re-running items."""
+        executed: list[str] = []
+        release = asyncio.Event()
+
+        class SlowExecutor:
+            async def execute(
+                self, batch_format: str, params: dict[str, Any]
+            ) -> ExecutionOutcome:
+                prompt = params["messages"][-1]["content"]
+                if prompt != "prompt 0":
+                    await release.wait()
+                executed.append(prompt)
+                return ExecutionOutcome(status_code=200, body={"usage": {}})
+
+        service = BatchService(settings=batch_settings, executor=SlowExecutor())
+        record = await service.create_batch(_items([f"prompt {i}" for i in range(5)]))
+
+        # Let the first item finish, then shut down mid-batch
+        for _ in range(100):
+            if executed:
+                break
+            await asyncio.sleep(0.01)
+        await service.stop()
+        assert executed == ["prompt 0"]
+
+        release.set()
+        restarted = BatchService(settings=batch_settings, executor=SlowExecutor())
+        await restarted.start()
+        await _wait_for_end(restarted, record.id)
+
+        resumed = await restarted.get_batch(record.id)
+        assert resumed.request_counts.succeeded == 5
+        assert sorted(executed) == sorted(f"prompt {i}" for i in range(5))
+
+    async def test_cancel_marks_pending_items_canceled(
+        self, batch_settings: BatchSettings
+    ) -> None:
+        """Canceling a batch records remaining items as canceled."""
+        release = asyncio.Event()
+
+        class BlockingExecutor:
+            async def execute(
+                self, batch_format: str, params: dict[str, Any]
+            ) -> ExecutionOutcome:
+                await release.wait()
+                return ExecutionOutcome(status_code=200, body={})
+
+        service = BatchService(settings=batch_settings, executor=BlockingExecutor())
+        record = await service.create_batch(_items([f"p{i}" for i in range(10)]))
+        await service.cancel_batch(record.id)
+        release.set()
+        await _wait_for_end(service, record.id)
+
+        record = await service.get_batch(record.id)
+        assert record.cancel_initiated_at is not None
+        assert record.request_counts.canceled >= 10 - batch_settings.max_concurrency
+        assert record.request_counts.completed == 10
+
+    async def test_cancel_without_running_task_ends_batch(
+        self, batch_settings: BatchSettings
+    ) -> None:
+        """A batch that is not running is canceled straight to ended."""
+        release = asyncio.Event()
+
+        class BlockingExecutor:
+            async def execute(
+                self, batch_format: str, params: dict[str, Any]
+            ) -> ExecutionOutcome:
+                await release.wait()
+                return ExecutionOutcome(status_code=200, body={})
+
+        service = BatchService(settings=batch_settings, executor=BlockingExecutor())
+        record = await service.create_batch(_items([f"p{i}" for i in range(4)]))
+        await service.stop()
+
+        restarted = BatchService(
+            settings=batch_settings.model_copy(update={"resume_on_startup": False}),
+            executor=BlockingExecutor(),
+        )
+        await restarted.start()
+        canceled = await restarted.cancel_batch(record.id)
+
+        assert canceled.processing_status == "ended"
+        assert canceled.request_counts.canceled == 4
+        stored = await restarted.get_batch(record.id)
+        assert stored.processing_status == "ended"
+
+    async def test_execution_failure_ends_batch_with_remaining_errored(
+        self, batch_settings: BatchSettings
+    ) -> None:
+        """A failure escaping the workers ends the batch and errors unrun items."""
+
+        class EchoExecutor:
+            async def execute(
+                self, batch_format: str, params: dict[str, Any]
+            ) -> ExecutionOutcome:
+                return ExecutionOutcome(status_code=200, body={"usage": {}})
+
+        service = BatchService(
+            settings=batch_settings.model_copy(update={"max_concurrency": 1}),
+            executor=EchoExecutor(),
+        )
+        execute_item = service._execute_item
+
+        async def failing_execute_item(run: Any, item: BatchItem) -> Any:
+            if item.custom_id == "req-2":
+                raise RuntimeError("executor crashed")
+            return await execute_item(run, item)
+
+        with patch.object(service, "_execute_item", failing_execute_item):
+            record = await service.create_batch(
+                _items([f"prompt {i}" for i in range(5)])
+            )
+            await _wait_for_end(service, record.id)
+
+        stored = await service.store.load(record.id)
+        assert stored is not None
+        assert stored.processing_status == "ended"
+        assert stored.ended_at is not None
+        assert stored.request_counts.succeeded == 2
+        assert stored.request_counts.errored == 3
+        assert stored.request_counts.processing == 0
+
+        results = {r.custom_id: r async for r in service.iter_results(record.id)}
+        assert len(results) == 5
+        assert results["req-2"].type == "errored"
+        assert results["req-2"].error is not None
+        assert results["req-2"].error["error"]["message"] == "executor crashed"
+
+    async def test_create_batch_validation(self, batch_settings: BatchSettings) -> None:
+        """Empty batches and duplicate custom ids are rejected."""
+        service = BatchService(settings=batch_settings, executor=AsyncMock())
+
+        with pytest.raises(ValueError):
+            await service.create_batch([])
+        with pytest.raises(ValueError):
+            await service.create_batch(_items(["a"]) + _items(["b"]))
+        with pytest.raises(BatchNotFoundError):
+            await service.get_batch("msgbatch_missing")
@@ -0,0 +1,155 @@
+"""Tests for the end-to-end capacity harness building blocks."""
+
+import json
+import os
+import subprocess
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from ccproxy.testing.capacity import (
+    ProcessSampler,
+    RequestResult,
+    ResourceSample,
+    StepResult,
+    line_chart_svg,
+    summarize_route,
+    summarize_step,
+    write_fake_credentials,
+    write_report,
+    write_stub_cli,
+)
+from ccproxy.testing.config import CapacityConfig
+
+
+def _results(ttfts: list[float], errors: int = 0) -> list[RequestResult]:
+    ok = [RequestResult(0.0, True, ttft, ttft + 50) for ttft in ttfts]
+    return ok + [RequestResult(0.0, False, None, 5.0)] * errors
+
+
+def _resources() -> list[ResourceSample]:
+    return [
+        ResourceSample(at=0.0, cpu_seconds=10.0, rss_bytes=100 * 2**20, processes=1),
+        ResourceSample(at=10.0, cpu_seconds=15.0, rss_bytes=110 * 2**20, processes=1),
+    ]
+
+
+def _step(config: CapacityConfig, concurrency: int, added_ms: float) -> StepResult:
+    return summarize_step(
+        config,
+        concurrency,
+        10.0,
+        _results([300 + added_ms] * 100),
+        (300.0, 300.0),
+        _resources(),
+        {"p50_ms": 1.0, "p99_ms": 2.0, "max_ms": 3.0},
+    )
+
+
+@pytest.mark.unit
+class TestCapacityHarness:
+    """Test step accounting, reports and the processes the harness starts."""
+
+    def test_summarize_step_accounting(self) -> None:
+        """Added TTFT, CPU and RSS are derived per step and per 1k requests."""
+        step = _step(CapacityConfig(), 4, 20.0)
+
+        assert step.requests == 100
+        assert step.requests_per_second == 10.0
+        assert step.added_ttft_p50_ms == 20.0
+        assert step.added_ttft_p99_ms == 20.0
+        assert step.cpu_seconds == 5.0
+        assert step.cpu_cores_used == 0.5
+        assert step.cpu_seconds_per_1k_requests == 50.0
+        assert step.rss_peak_mb == 110.0
+        assert step.rss_growth_mb_per_1k_requests == 100.0
+        assert step.slo_ok
+
+    def test_summarize_step_slo_breaches(self) -> None:
+        """Each breached objective is reported."""
+        step = summarize_step(
+            CapacityConfig(slo_loop_lag_p99_ms=5.0),
+            8,
+            10.0,
+            _results([450.0] * 90, errors=10),
+            (300.0, 300.0),
+            _resources(),
+            {"p99_ms": 12.0},
+        )
+
+        assert not step.slo_ok
+        assert [breach.split()[0] for breach in step.slo_breaches] == [
+            "error",
+            "added",
+            "loop",
+        ]
+
+    def test_summarize_route_uses_best_passing_step(self) -> None:
+        """Capacity is taken from the best step that met every objective."""
+        config = CapacityConfig()
+        steps = [_step(config, 1, 10.0), _step(config, 2, 20.0)]
+        steps.append(_step(config, 4, 500.0))
+
+        summary = summarize_route("api", steps)
+
+        assert summary["max_sustainable_concurrency"] == 2
+        assert summary["breached_at_concurrency"] == 4
+        assert summary["streams_per_core"] == 4.0
+        assert summary["rps_per_core"] == 20.0
+
+    def test_report_and_charts(self, tmp_path: Path) -> None:
+        """The report is JSON and every chart is well-formed SVG."""
+        step = _step(CapacityConfig(), 1, 10.0)
+        report = {
+            "routes": {"api": {"steps": [{"concurrency": 1, **step.__dict__}]}},
+        }
+
+        written = write_report(report, tmp_path)
+
+        assert json.loads((tmp_path / "report.json").read_text()) == report
+        for path in written[1:]:
+            assert ET.parse(path).getroot().tag.endswith("svg")
+        assert "polyline" in line_chart_svg("t", "ms", {"a": [(1, 1.0), (4, 2.0)]})
+
+    def test_process_sampler_reads_own_process(self) -> None:
+        """CPU time and RSS of the current process are read from /proc."""
+        if not Path("/proc/self/stat").exists():
+            pytest.skip("Requires /proc")
+        sample = ProcessSampler(os.getpid()).sample()
+
+        assert sample.processes >= 1
+        assert sample.rss_bytes > 0
+        assert sample.cpu_seconds > 0
+
+    def test_stub_cli_answers_stream_json(self, tmp_path: Path) -> None:
+        """The stub CLI acknowledges control requests and answers prompts."""
+        stub = write_stub_cli(tmp_path)
+        messages = [
+            {"type": "control_request", "request_id": "r1", "request": {}},
+            {"type": "user", "message": {"role": "user", "content": "hi"}},
+        ]
+
+        completed = subprocess.run(
+            [str(stub), "--include-partial-messages", "--model", "claude-x"],
+            input="".join(json.dumps(message) + "\n" for message in messages),
+            capture_output=True,
+            text=True,
+            env={**os.environ, "CCPROXY_STUB_TTFT_MS": "0"},
+            timeout=30,
+            check=True,
+        )
+
+        types = [json.loads(line)["type"] for line in completed.stdout.splitlines()]
+        assert types[:2] == ["control_response", "system"]
+        assert types.count("stream_event") == 40
+        assert types[-2:] == ["assistant", "result"]
+
+    def test_fake_credentials(self, tmp_path: Path) -> None:
+        """Fake credentials are written where the proxy looks for them."""
+        write_fake_credentials(tmp_path)
+
+        claude = json.loads((tmp_path / ".claude/.credentials.json").read_text())
+        codex = json.loads((tmp_path / ".codex/auth.json").read_text())
+        assert claude["claudeAiOauth"]["subscriptionType"] == "max"
+        assert codex["tokens"]["account_id"] == "capacity-harness"
@@ -4,6 +4,8 @@ Tests Docker adapter, path utilities, validation, streaming processes,
 and middleware components following the testing patterns from TESTING.md.
 """
 
+import json
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -119,6 +121,33 @@ class TestDockerAdapter:
         exists = await docker_adapter_success.image_exists("test-image", "latest")
         assert isinstance(exists, bool)
 
+    async def test_docker_checks_are_memoized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sudo detection and positive image checks run once per process."""
+        log = tmp_path / "docker.log"
+        docker = tmp_path / "docker"
+        docker.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            f"with open({str(log)!r}, 'a') as f:\n"
+            "    f.write(json.dumps(sys.argv[1:]) + '\\n')\n"
+        )
+        docker.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin:/bin")
+        DockerAdapter.clear_cache()
+        try:
+            assert not await DockerAdapter()._needs_sudo()
+            assert not await DockerAdapter()._needs_sudo()
+            assert await DockerAdapter().image_exists("img")
+            assert await DockerAdapter().image_exists("img")
+        finally:
+            DockerAdapter.clear_cache()
+
+        calls = [json.loads(line)[0] for line in log.read_text().splitlines()]
+        assert calls.count("info") == 1
+        assert calls.count("inspect") == 1
+
     async def test_pull_image_success(
         self, docker_adapter_success: DockerAdapter
     ) -> None:
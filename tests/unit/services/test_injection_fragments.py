@@ -0,0 +1,193 @@
+"""Tests for pre-encoded system prompt and instructions injection."""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from ccproxy.core.codex_transformers import (
+    FALLBACK_CODEX_INSTRUCTIONS,
+    CodexRequestTransformer,
+)
+from ccproxy.core.http_transformers import (
+    HTTPRequestTransformer,
+    get_fallback_system_field,
+    get_system_field_fragment,
+)
+from ccproxy.core.injection_fragments import body_mentions, encode_field
+
+
+def _claude_state(*texts: str) -> Any:
+    system_field = [
+        {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+        for text in texts
+    ]
+    return SimpleNamespace(
+        claude_detection_data=SimpleNamespace(
+            system_prompt=SimpleNamespace(system_field=system_field)
+        )
+    )
+
+
+def _codex_detection(instructions: str) -> Any:
+    return SimpleNamespace(
+        instructions=SimpleNamespace(instructions_field=instructions)
+    )
+
+
+def _body(**fields: Any) -> bytes:
+    data: dict[str, Any] = {
+        "model": "m",
+        "messages": [{"role": "user", "content": "hi"}],
+    }
+    data.update(fields)
+    return json.dumps(data).encode()
+
+
+@pytest.mark.unit
+class TestEncodedField:
+    """Test byte-level field splicing."""
+
+    @pytest.mark.parametrize(
+        "body", [b'{"a": 1}', b'  {"a":[1,{"b":2}]}', b"{}", b"{ }"]
+    )
+    def test_splice_produces_valid_json(self, body: bytes) -> None:
+        """The spliced field is the first member of the resulting object."""
+        field = encode_field("system", [{"type": "text", "text": 'q"uote'}])
+
+        result = json.loads(field.splice(body) or b"")
+
+        assert list(result)[0] == "system"
+        assert result["system"] == [{"type": "text", "text": 'q"uote'}]
+        assert {k: v for k, v in result.items() if k != "system"} == json.loads(body)
+
+    def test_splice_rejects_non_objects(self) -> None:
+        """Bodies that are not JSON objects are left to the slow path."""
+        assert encode_field("system", "x").splice(b"[1, 2]") is None
+
+
+@pytest.mark.unit
+class TestClaudeSystemInjection:
+    """Test system prompt injection through pre-encoded fragments."""
+
+    def test_spliced_body_matches_parsed_injection(self) -> None:
+        """Splicing yields the same payload as parse-and-inject."""
+        transformer = HTTPRequestTransformer()
+        app_state = _claude_state("You are Claude Code, Anthropic's official CLI.")
+        body = _body(stream=True)
+
+        result = json.loads(
+            transformer.transform_system_prompt(body, app_state, "full")
+        )
+
+        expected = json.loads(body)
+        expected["system"] = app_state.claude_detection_data.system_prompt.system_field
+        assert result == expected
+
+    def test_existing_system_prompt_is_merged(self) -> None:
+        """Client system prompts still go through the merge path."""
+        transformer = HTTPRequestTransformer()
+
+        result = json.loads(
+            transformer.transform_system_prompt(_body(system="Be brief."))
+        )
+
+        assert result["system"] == get_fallback_system_field() + [
+            {"type": "text", "text": "Be brief."}
+        ]
+
+    def test_escaped_system_key_is_merged(self) -> None:
+        """A system key spelled with escapes is merged, not duplicated."""
+        transformer = HTTPRequestTransformer()
+        body = _body(system="Be brief.").replace(b'"system"', b'"\\u0073ystem"')
+
+        result = transformer.transform_system_prompt(body)
+
+        assert result.count(b'"system"') == 1
+        assert json.loads(result)["system"] == get_fallback_system_field() + [
+            {"type": "text", "text": "Be brief."}
+        ]
+
+    def test_non_ascii_escapes_keep_the_fast_path(self) -> None:
+        """Escaped non-ASCII text does not count as a possible key."""
+        assert not body_mentions(_body(stream=True), b"system")
+        assert not body_mentions(
+            _body(messages=[{"role": "user", "content": "caf\u00e9 \u2603"}]),
+            b"system",
+        )
+        assert body_mentions(b'{"\\u0073ystem": "x"}', b"system")
+
+    def test_cache_control_limit_still_applied(self) -> None:
+        """Bodies that could exceed the cache_control limit are rewritten."""
+        transformer = HTTPRequestTransformer()
+        content = [
+            {
+                "type": "text",
+                "text": f"part {i}",
+                "cache_control": {"type": "ephemeral"},
+            }
+            for i in range(4)
+        ]
+        body = _body(messages=[{"role": "user", "content": content}])
+
+        result = json.loads(transformer.transform_system_prompt(body))
+
+        blocks = [b for b in result["messages"][0]["content"] if "cache_control" in b]
+        assert len(blocks) == 3
+        assert "cache_control" in result["system"][0]
+
+    def test_fragment_rebuilt_after_detection_refresh(self) -> None:
+        """A new detection snapshot produces a new fragment."""
+        app_state = _claude_state("first prompt")
+        first = get_system_field_fragment(app_state, "full")
+
+        assert get_system_field_fragment(app_state, "full") is first
+
+        app_state.claude_detection_data = _claude_state(
+            "second prompt"
+        ).claude_detection_data
+        second = get_system_field_fragment(app_state, "full")
+
+        assert second is not first
+        assert b"second prompt" in second.encoded
+
+
+@pytest.mark.unit
+class TestCodexInstructionsInjection:
+    """Test Codex instructions injection through pre-encoded fragments."""
+
+    def test_override_splices_instructions_and_stream(self) -> None:
+        """Instructions replace any client value and stream defaults to true."""
+        transformer = CodexRequestTransformer()
+        detection = _codex_detection("detected instructions")
+
+        for body in (_body(), _body(instructions="short", stream=False)):
+            result = json.loads(transformer.transform_codex_body(body, detection))
+
+            assert result["instructions"] == "detected instructions"
+            assert result["stream"] == json.loads(body).get("stream", True)
+
+    def test_unchanged_client_payload_is_not_reserialized(self) -> None:
+        """Without other rewrites the client bytes are kept verbatim."""
+        transformer = CodexRequestTransformer()
+        body = b'{"model": "gpt-5",   "stream": true}'
+
+        result = transformer.transform_codex_body(body)
+
+        assert result.endswith(b'"model": "gpt-5",   "stream": true}')
+        assert json.loads(result)["instructions"] == FALLBACK_CODEX_INSTRUCTIONS
+
+    def test_append_mode_keeps_client_instructions(self) -> None:
+        """Append mode still combines client and detected instructions."""
+        transformer = CodexRequestTransformer()
+
+        result = json.loads(
+            transformer.transform_codex_body(
+                _body(instructions="client"),
+                _codex_detection("detected"),
+                {"system_prompt_injection_mode": "append"},
+            )
+        )
+
+        assert result["instructions"] == "client\n\ndetected"
@@ -0,0 +1,189 @@
+"""Tests for the record/replay mock upstream."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from ccproxy.testing.config import MockUpstreamConfig
+from ccproxy.testing.mock_upstream import (
+    Cassette,
+    MockUpstream,
+    load_cassettes,
+    record_cassettes,
+)
+
+
+ANTHROPIC_STREAM = (
+    "event: message_start\n"
+    'data: {"type":"message_start","message":{"id":"msg_1","type":"message",'
+    '"role":"assistant","content":[],"model":"claude-x","usage":{"input_tokens":5}}}\n\n'
+    "event: content_block_start\n"
+    'data: {"type":"content_block_start","index":0,"content_block":{"type":"text","text":""}}\n\n'
+    "event: content_block_delta\n"
+    'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":"Hello"}}\n\n'
+    "event: content_block_delta\n"
+    'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":" world"}}\n\n'
+    "event: content_block_stop\n"
+    'data: {"type":"content_block_stop","index":0}\n\n'
+    "event: message_delta\n"
+    'data: {"type":"message_delta","delta":{"stop_reason":"end_turn"},"usage":{"output_tokens":2}}\n\n'
+    "event: message_stop\n"
+    'data: {"type":"message_stop"}\n\n'
+)
+
+RESPONSES_STREAM = (
+    "event: response.created\n"
+    'data: {"type":"response.created","response":{"id":"resp_1","status":"in_progress"}}\n\n'
+    "event: response.output_text.delta\n"
+    'data: {"type":"response.output_text.delta","delta":"Hi"}\n\n'
+    "event: response.completed\n"
+    'data: {"type":"response.completed","response":{"id":"resp_1","status":"completed"}}\n\n'
+)
+
+
+def _fast(**overrides: object) -> MockUpstreamConfig:
+    settings: dict[str, object] = {"ttft_ms": 0, "tokens_per_second": 0, "seed": 1}
+    settings.update(overrides)
+    return MockUpstreamConfig.model_validate(settings)
+
+
+def _client(upstream: MockUpstream) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=upstream.create_app()),
+        base_url="http://upstream",
+    )
+
+
+@pytest.fixture
+def cassette_dir(tmp_path: Path) -> Path:
+    """Cassettes recorded from request logs of one Anthropic and one Codex stream."""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "20260101000000_req1_upstream_streaming.raw").write_text(
+        ANTHROPIC_STREAM
+    )
+    (log_dir / "20260101000000_req1_middleware_streaming.raw").write_text(
+        ANTHROPIC_STREAM
+    )
+    (log_dir / "20260101000000_req1_upstream_response_headers.json").write_text(
+        json.dumps(
+            {
+                "status_code": 200,
+                "headers": {
+                    "Content-Type": "text/event-stream",
+                    "Request-Id": "req_abc",
+                    "Content-Length": "10",
+                    "anthropic-ratelimit-requests-remaining": "3",
+                },
+            }
+        )
+    )
+    (log_dir / "20260101000001_req2_middleware_streaming.raw").write_text(
+        RESPONSES_STREAM
+    )
+    (log_dir / "20260101000002_req3_middleware_streaming.raw").write_text(
+        'data: {"object":"chat.completion.chunk"}\n\ndata: [DONE]\n\n'
+    )
+
+    output_dir = tmp_path / "cassettes"
+    assert len(record_cassettes(log_dir, output_dir)) == 2
+    return output_dir
+
+
+@pytest.mark.unit
+class TestMockUpstream:
+    """Test recording cassettes and replaying them over HTTP."""
+
+    def test_record_cassettes(self, cassette_dir: Path) -> None:
+        """Streams are classified by API and transfer headers are dropped."""
+        anthropic, codex = load_cassettes(cassette_dir)
+
+        assert (anthropic.api, codex.api) == ("anthropic", "codex")
+        assert len(anthropic.events) == 7
+        assert anthropic.headers == {
+            "content-type": "text/event-stream",
+            "request-id": "req_abc",
+        }
+
+    async def test_replays_recorded_stream(self, cassette_dir: Path) -> None:
+        """A streaming request receives the recorded events and rate-limit headers."""
+        upstream = MockUpstream(_fast(cassette_dir=cassette_dir))
+
+        async with _client(upstream) as client:
+            response = await client.post(
+                "/v1/messages?beta=true", json={"model": "m", "stream": True}
+            )
+
+        assert response.status_code == 200
+        assert response.text == ANTHROPIC_STREAM
+        assert response.headers["request-id"] == "req_abc"
+        assert response.headers["anthropic-ratelimit-requests-remaining"] == "3999"
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+    async def test_non_streaming_responses(self, cassette_dir: Path) -> None:
+        """Non-streaming requests get the message assembled from the stream."""
+        upstream = MockUpstream(_fast(cassette_dir=cassette_dir))
+
+        async with _client(upstream) as client:
+            message = (await client.post("/v1/messages", json={"model": "m"})).json()
+            response = (await client.post("/responses", json={})).json()
+
+        assert message["content"] == [{"type": "text", "text": "Hello world"}]
+        assert message["stop_reason"] == "end_turn"
+        assert message["usage"] == {"input_tokens": 5, "output_tokens": 2}
+        assert response == {"id": "resp_1", "status": "completed"}
+
+    async def test_error_mix_and_rate_limits(self) -> None:
+        """Injected errors use API error bodies; exhausted limits return 429."""
+        upstream = MockUpstream(
+            _fast(error_rate=1.0, error_status_codes=[529], rate_limit_requests=2)
+        )
+
+        async with _client(upstream) as client:
+            overloaded = await client.post("/v1/messages", json={"stream": True})
+            failed = await client.post("/responses", json={"stream": True})
+            limited = await client.post("/v1/messages", json={"stream": True})
+
+        assert overloaded.status_code == 529
+        assert overloaded.json()["error"]["type"] == "overloaded_error"
+        assert failed.json()["error"]["code"] == "overloaded_error"
+        assert limited.status_code == 429
+        assert limited.headers["retry-after"] == "1"
+        assert limited.headers["anthropic-ratelimit-requests-remaining"] == "0"
+        assert upstream.get_stats()["rate_limited"] == 1
+
+    async def test_synthetic_and_mid_stream_errors(self) -> None:
+        """Without cassettes streams are generated; errors can cut them short."""
+        upstream = MockUpstream(_fast(mid_stream_error_rate=1.0), cassettes=[])
+
+        async with _client(upstream) as client:
+            response = await client.post(
+                "/responses", json={"model": "gpt-5", "stream": True}
+            )
+
+        assert response.text.startswith("event: response.created")
+        assert response.text.rstrip().split("\n")[-2] == "event: response.failed"
+        assert upstream.get_stats()["mid_stream_errors"] == 1
+
+    def test_cassette_round_trip(self, tmp_path: Path) -> None:
+        """Saved cassettes load back unchanged."""
+        cassette = Cassette(name="c", api="codex", events=["data: {}"])
+        cassette.save(tmp_path)
+
+        assert load_cassettes(tmp_path) == [cassette]
+
+    async def test_ttft_stats_and_reset(self, cassette_dir: Path) -> None:
+        """Time to first token is recorded per stream and cleared on reset."""
+        upstream = MockUpstream(_fast(cassette_dir=cassette_dir, ttft_ms=20))
+
+        async with _client(upstream) as client:
+            await client.post("/v1/messages", json={"model": "m", "stream": True})
+            stats = (await client.get("/stats")).json()
+            reset = (await client.post("/stats/reset")).json()
+
+        assert stats["ttft_ms"]["count"] == 1
+        assert stats["ttft_ms"]["p99"] >= 20
+        assert reset["requests"] == 0
+        assert reset["ttft_ms"] == {"count": 0, "p50": 0.0, "p99": 0.0}
@@ -0,0 +1,192 @@
+"""Tests for the in-memory model registry."""
+
+import json
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ccproxy.api.app import models_router
+from ccproxy.pricing.model_metadata import ModelMetadata, ModelsMetadata
+from ccproxy.pricing.models import ModelPricing, PricingData
+from ccproxy.services.model_registry import (
+    build_model_registry,
+    get_model_registry,
+    set_model_registry,
+    update_model_registry,
+)
+from ccproxy.utils.cost_calculator import calculate_cost_breakdown, calculate_token_cost
+
+
+@pytest.fixture(autouse=True)
+def reset_registry() -> Iterator[None]:
+    """Restore the static registry after each test."""
+    set_model_registry(None)
+    yield
+    set_model_registry(None)
+
+
+def _pricing() -> PricingData:
+    return PricingData(
+        {
+            "claude-sonnet-4-20250514": ModelPricing(
+                input=Decimal("3.00"),
+                output=Decimal("15.00"),
+                cache_read=Decimal("0.30"),
+                cache_write=Decimal("3.75"),
+            )
+        }
+    )
+
+
+def _metadata() -> ModelsMetadata:
+    return ModelsMetadata(
+        models={
+            "claude-sonnet-4-20250514": ModelMetadata(
+                max_input_tokens=200_000,
+                max_output_tokens=64_000,
+                max_tokens=200_000,
+                supports_function_calling=True,
+                supports_vision=True,
+            ),
+            "claude-new-model-20260101": ModelMetadata(
+                max_input_tokens=500_000,
+                max_output_tokens=32_000,
+                max_tokens=500_000,
+            ),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestModelRegistry:
+    """Test registry lookups and snapshot swapping."""
+
+    def test_static_registry_uses_fallback_limits(self) -> None:
+        """Without pricing or metadata the static fallbacks are served."""
+        registry = get_model_registry()
+
+        assert not registry.has_pricing
+        assert registry.context_window("gpt-4o") == 128_000
+        assert registry.max_output_tokens("claude-3-5-sonnet-20241022") == 8192
+        assert registry.max_output_tokens("unknown-model") == 4096
+        assert registry.capabilities("claude-3-opus-20240229")["supports_vision"]
+        assert registry.provider("o3-mini") == "openai"
+        assert registry.provider("claude-3-opus-20240229") == "anthropic"
+
+    def test_metadata_and_pricing_are_merged(self) -> None:
+        """Entries combine metadata limits, capabilities and pricing rates."""
+        registry = build_model_registry(_pricing(), _metadata())
+
+        assert registry.context_window("claude-new-model-20260101") == 500_000
+        assert registry.max_output_tokens("claude-sonnet-4-20250514") == 64_000
+        assert registry.available_models == [
+            "claude-sonnet-4-20250514",
+            "claude-new-model-20260101",
+        ]
+        rates = registry.rates("claude-sonnet-4-20250514")
+        assert rates is not None
+        assert rates.output == 15.0
+
+    def test_aliases_resolve_to_canonical_rates(self) -> None:
+        """OpenAI names and aliases resolve to the canonical model's rates."""
+        registry = build_model_registry(_pricing())
+
+        assert registry.canonical_name("gpt-5") == "claude-sonnet-4-20250514"
+        assert registry.rates("gpt-5") == registry.rates("claude-sonnet-4-20250514")
+
+    def test_dated_variants_fall_back_to_their_family(self) -> None:
+        """Unregistered snapshots and suffixes resolve to the closest model."""
+        registry = build_model_registry(_pricing(), None)
+
+        assert registry.is_known("claude-sonnet-4-20250601")
+        assert registry.is_known("gpt-4o-2024-08-06")
+        assert not registry.is_known("made-up-model-123")
+        assert registry.context_window("gpt-4o-2024-08-06") == 128_000
+        assert registry.max_output_tokens("claude-3-5-haiku-latest") == 8192
+        assert registry.rates("claude-sonnet-4-20250601") == registry.rates(
+            "claude-sonnet-4-20250514"
+        )
+
+    def test_providers(self) -> None:
+        """Entries and unregistered names report the provider they belong to."""
+        metadata = _metadata()
+        metadata.models["gpt-4.1"] = ModelMetadata(
+            max_input_tokens=1_000_000, max_output_tokens=32_000, max_tokens=1_032_000
+        )
+        registry = build_model_registry(None, metadata)
+
+        assert registry.provider("gpt-4.1") == "openai"
+        assert registry.provider("claude-new-model-20260101") == "anthropic"
+        # OpenAI names mapped to Claude models still identify OpenAI requests
+        assert registry.provider("gpt-4") == "openai"
+        assert registry.provider("text-davinci-003") == "openai"
+
+    def test_update_swaps_snapshot(self) -> None:
+        """An update publishes a new snapshot without mutating the old one."""
+        before = get_model_registry()
+
+        after = update_model_registry(_pricing(), _metadata())
+
+        assert get_model_registry() is after
+        assert before.context_window("claude-new-model-20260101") == 200_000
+        assert after.context_window("claude-new-model-20260101") == 500_000
+        assert before.etag != after.etag
+
+    def test_cost_calculation_uses_registry_rates(self) -> None:
+        """Costs are computed from the registry once pricing is loaded."""
+        update_model_registry(_pricing(), None)
+
+        cost = calculate_token_cost(1_000_000, 1_000_000, "claude-sonnet-4-20250514")
+        breakdown = calculate_cost_breakdown(
+            1_000_000, 0, "gpt-5", cache_read_tokens=1_000_000
+        )
+
+        assert cost == pytest.approx(18.0)
+        assert breakdown is not None
+        assert breakdown["model"] == "claude-sonnet-4-20250514"
+        assert breakdown["total_cost"] == pytest.approx(3.3)
+
+
+@pytest.mark.unit
+class TestModelsEndpoint:
+    """Test the pre-rendered, ETagged /v1/models response."""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        app = FastAPI()
+        app.include_router(models_router)
+        return TestClient(app)
+
+    def test_serves_registry_body_with_etag(self, client: TestClient) -> None:
+        """The response body and ETag come from the registry snapshot."""
+        registry = update_model_registry(None, _metadata())
+
+        response = client.get("/v1/models")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == registry.etag
+        ids = [model["id"] for model in response.json()["data"]]
+        assert "claude-new-model-20260101" in ids
+        assert "gpt-4o" in ids
+
+    def test_if_none_match_returns_not_modified(self, client: TestClient) -> None:
+        """A matching If-None-Match is answered with 304 and no body."""
+        etag = get_model_registry().etag
+
+        response = client.get("/v1/models", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_refresh_changes_etag(self, client: TestClient) -> None:
+        """A registry refresh invalidates previously issued ETags."""
+        etag = client.get("/v1/models").headers["etag"]
+        update_model_registry(None, _metadata())
+
+        response = client.get("/v1/models", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert json.loads(response.content)["object"] == "list"
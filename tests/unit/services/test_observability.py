@@ -386,6 +386,83 @@ class TestPrometheusEndpoint:
                     assert "ccproxy_tokens_total" in content
 
 
+@pytest.mark.unit
+class TestPrometheusCardinalityAndExposition:
+    """Test model label limiting and cached exposition rendering."""
+
+    def _samples(self, registry: Any, name: str) -> list[Any]:
+        return [
+            sample
+            for metric in registry.collect()
+            for sample in metric.samples
+            if sample.name == name
+        ]
+
+    def test_unknown_and_overflow_models_map_to_other(self) -> None:
+        """Only known models up to the limit get their own series."""
+        from prometheus_client import CollectorRegistry
+
+        from ccproxy.observability import PrometheusMetrics
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(registry=registry, max_model_labels=1)
+
+        metrics.record_request("POST", "/v1/messages", "claude-3-opus-20240229", 200)
+        metrics.record_request("POST", "/v1/messages", "gpt-4o", 200)
+        metrics.record_tokens(10, "input", "made-up-model-123")
+        metrics.record_tokens(10, "input", None)
+
+        request_models = {
+            sample.labels["model"]
+            for sample in self._samples(registry, "ccproxy_requests_total")
+        }
+        token_models = {
+            sample.labels["model"]
+            for sample in self._samples(registry, "ccproxy_tokens_total")
+        }
+        dropped = self._samples(registry, "ccproxy_metrics_dropped_label_values")
+        assert request_models == {"claude-3-opus-20240229", "other"}
+        assert token_models == {"other", "unknown"}
+        assert dropped[0].value == 2
+
+    def test_dated_model_variants_keep_their_label(self) -> None:
+        """Snapshots of known model families are not bucketed as "other"."""
+        from prometheus_client import CollectorRegistry
+
+        from ccproxy.observability import PrometheusMetrics
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(registry=registry)
+
+        metrics.record_request("POST", "/v1/messages", "claude-opus-4-1-20250805", 200)
+
+        assert {
+            sample.labels["model"]
+            for sample in self._samples(registry, "ccproxy_requests_total")
+        } == {"claude-opus-4-1-20250805"}
+
+    async def test_exposition_is_cached_and_shared(self) -> None:
+        """Concurrent scrapes share one render, reused within the cache window."""
+        from prometheus_client import CollectorRegistry
+
+        from ccproxy.observability import PrometheusMetrics
+
+        metrics = PrometheusMetrics(registry=CollectorRegistry())
+
+        with patch(
+            "prometheus_client.generate_latest", return_value=b"rendered"
+        ) as render:
+            results = await asyncio.gather(
+                *(metrics.render_exposition(60.0) for _ in range(5))
+            )
+            cached = await metrics.render_exposition(60.0)
+            fresh = await metrics.render_exposition(0.0)
+
+        assert results == [b"rendered"] * 5
+        assert cached == fresh == b"rendered"
+        assert render.call_count == 2
+
+
 @pytest.mark.unit
 class TestProxyServiceObservabilityIntegration:
     """Test ProxyService integration with observability system."""
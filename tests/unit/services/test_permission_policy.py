@@ -0,0 +1,160 @@
+"""Tests for permission rules and remembered confirmation decisions."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from ccproxy.api.routes.mcp import PermissionCheckRequest, check_permission
+from ccproxy.api.services import permission_policy
+from ccproxy.api.services.permission_policy import (
+    PermissionPolicy,
+    configure_permission_policy,
+    decision_key,
+)
+from ccproxy.api.services.permission_service import PermissionService
+from ccproxy.config.security import PermissionPolicySettings, PermissionRule
+from ccproxy.models.responses import (
+    PermissionToolAllowResponse,
+    PermissionToolDenyResponse,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_policy() -> Iterator[None]:
+    """Isolate the global permission policy between tests."""
+    with patch.object(permission_policy, "_permission_policy", None):
+        yield
+
+
+def _rules() -> list[PermissionRule]:
+    return [
+        PermissionRule(
+            tool="Read", input={"file_path": "/workspace/*"}, action="allow"
+        ),
+        PermissionRule(tool="*", input={"file_path": "*.env"}, action="deny"),
+        PermissionRule(tool="mcp__*", action="allow"),
+    ]
+
+
+@pytest.mark.unit
+class TestPermissionPolicy:
+    """Test rule matching, remembered decisions and their statistics."""
+
+    def test_rules_match_tool_and_input_patterns(self) -> None:
+        """Allow rules need every input pattern to match; deny rules win."""
+        policy = PermissionPolicy(rules=_rules())
+
+        allowed = policy.evaluate("Read", {"file_path": "/workspace/main.py"})
+        assert allowed is not None and allowed.allowed
+        assert allowed.source == "rule"
+
+        denied = policy.evaluate("Read", {"file_path": "/workspace/.env"})
+        assert denied is not None and not denied.allowed
+
+        assert policy.evaluate("Read", {"file_path": "/etc/passwd"}) is None
+        assert policy.evaluate("Read", {}) is None
+        assert policy.evaluate("mcp__search", {"query": "x"}) is not None
+
+        stats = policy.get_stats()
+        assert (stats["rule_allows"], stats["rule_denies"]) == (2, 1)
+        assert stats["cache_misses"] == 2
+
+    def test_allow_rules_resist_path_traversal(self) -> None:
+        """Parent segments never auto-allow; deny rules see normalized paths."""
+        policy = PermissionPolicy(rules=_rules())
+
+        assert (
+            policy.evaluate("Read", {"file_path": "/workspace/../etc/passwd"}) is None
+        )
+        assert policy.evaluate("Read", {"file_path": "/workspace/a/../../etc"}) is None
+        allowed = policy.evaluate("Read", {"file_path": "/workspace/./src//main.py"})
+        assert allowed is not None and allowed.allowed
+
+        denied = policy.evaluate("Read", {"file_path": "/workspace/x/../.env"})
+        assert denied is not None and not denied.allowed
+
+    def test_remembered_decisions_and_scopes(self) -> None:
+        """Only decisions a human asked to remember are reused."""
+        policy = PermissionPolicy(remember_window_seconds=60)
+        policy.record_decision("Bash", {"command": "ls"}, True, 4.0)
+        assert policy.evaluate("Bash", {"command": "ls"}) is None
+
+        policy.record_decision("Bash", {"command": "ls"}, True, 2.0, "process")
+        policy.record_decision("Bash", {"command": "rm x"}, False, 3.0, "window")
+
+        hit = policy.evaluate("Bash", {"command": " ls "})
+        assert hit is not None and hit.allowed and hit.source == "remembered"
+
+        with patch("time.monotonic", return_value=10**9):
+            assert policy.evaluate("Bash", {"command": "rm x"}) is None
+            assert policy.evaluate("Bash", {"command": "ls"}) is not None
+
+        stats = policy.get_stats()
+        assert (stats["cache_hits"], stats["human_decisions"]) == (2, 3)
+        assert stats["avg_human_wait_seconds"] == 3.0
+        assert stats["time_saved_seconds"] == 6.0
+
+    def test_decision_cache_is_bounded_lru(self) -> None:
+        """The least recently used decision is evicted first."""
+        policy = PermissionPolicy(cache_size=2)
+        for command in ("a", "b"):
+            policy.record_decision("Bash", {"command": command}, True, 1.0, "process")
+        assert policy.evaluate("Bash", {"command": "a"}) is not None
+
+        policy.record_decision("Bash", {"command": "c"}, True, 1.0, "process")
+
+        assert policy.evaluate("Bash", {"command": "b"}) is None
+        assert policy.evaluate("Bash", {"command": "a"}) is not None
+        assert policy.get_stats()["evictions"] == 1
+
+    def test_decision_key_normalizes_input(self) -> None:
+        """Key order and surrounding whitespace do not change the key."""
+        assert decision_key("Read", {"a": "1", "b": "2"}) == decision_key(
+            " Read", {"b": "2 ", "a": "1"}
+        )
+        assert decision_key("Read", {"a": "1"}) != decision_key("Write", {"a": "1"})
+
+    async def test_resolve_remembers_for_later_checks(self) -> None:
+        """A remembered confirmation answers the next identical MCP check."""
+        service = PermissionService(timeout_seconds=30)
+        request_id = await service.request_permission("Bash", {"command": "make"})
+        assert await service.resolve(request_id, True, remember="process")
+
+        settings = Mock()
+        settings.security.confirmation_timeout_seconds = 30
+        waiting_service = Mock(spec=PermissionService)
+        waiting_service.request_permission = AsyncMock()
+        with patch(
+            "ccproxy.api.routes.mcp.get_permission_service",
+            return_value=waiting_service,
+        ):
+            response = await check_permission(
+                PermissionCheckRequest(tool_name="Bash", input={"command": "make"}),
+                settings,
+            )
+
+        assert isinstance(response, PermissionToolAllowResponse)
+        waiting_service.request_permission.assert_not_called()
+        assert service.get_stats()["policy"]["cache_hits"] == 1
+
+    async def test_deny_rule_short_circuits_mcp_check(self) -> None:
+        """Configured deny rules answer without creating a request."""
+        configure_permission_policy(PermissionPolicySettings(rules=_rules()))
+        settings = Mock()
+        waiting_service = Mock(spec=PermissionService)
+        waiting_service.request_permission = AsyncMock()
+
+        with patch(
+            "ccproxy.api.routes.mcp.get_permission_service",
+            return_value=waiting_service,
+        ):
+            response = await check_permission(
+                PermissionCheckRequest(
+                    tool_name="Write", input={"file_path": "/app/.env"}
+                ),
+                settings,
+            )
+
+        assert isinstance(response, PermissionToolDenyResponse)
+        waiting_service.request_permission.assert_not_called()
@@ -1,5 +1,6 @@
 """Test pricing module functionality with dependency injection."""
 
+import asyncio
 import json
 import os
 import time
@@ -746,6 +747,142 @@ class TestPricingUpdater:
             assert result is False
 
 
+class TestPricingUpdaterRevalidation:
+    """Test stale-while-revalidate behavior of PricingUpdater."""
+
+    SOURCE_DATA = {
+        "claude-3-5-sonnet-20241022": {
+            "litellm_provider": "anthropic",
+            "input_cost_per_token": 0.000004,
+            "output_cost_per_token": 0.00002,
+        }
+    }
+
+    @pytest.fixture
+    def updater(self, tmp_path: Path) -> PricingUpdater:
+        """Create an updater whose cache has expired."""
+        settings = PricingSettings(
+            cache_dir=tmp_path / "cache",
+            cache_ttl_hours=1,
+            memory_cache_ttl=60,
+        )
+        updater = PricingUpdater(PricingCache(settings), settings)
+        updater._cached_pricing = updater._get_embedded_pricing()
+        updater._last_load_time = time.time() - 120
+        return updater
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_while_refreshing(
+        self, updater: PricingUpdater
+    ) -> None:
+        """Readers get the current snapshot while the download is in flight."""
+        stale = updater._cached_pricing
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_download(timeout: int | None = None) -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return self.SOURCE_DATA
+
+        with patch.object(updater.cache, "download_pricing_data", slow_download):
+            results = [await updater.get_current_pricing() for _ in range(5)]
+            assert all(result is stale for result in results)
+
+            release.set()
+            assert updater._revalidation_task is not None
+            await updater._revalidation_task
+
+        assert calls == 1
+        fresh = await updater.get_current_pricing()
+        assert fresh is not stale
+        assert fresh is not None
+        assert fresh["claude-3-5-sonnet-20241022"].input == Decimal("4.00")
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_backs_off(self, updater: PricingUpdater) -> None:
+        """A failed refresh delays the next attempt instead of retrying per read."""
+        with patch.object(
+            updater.cache, "download_pricing_data", return_value=None
+        ) as mock_download:
+            await updater.get_current_pricing()
+            assert updater._revalidation_task is not None
+            await updater._revalidation_task
+
+            retry_after = updater._retry_after
+            assert retry_after > time.time()
+            assert updater._consecutive_failures == 1
+
+            updater._last_load_time = time.time() - 120
+            await updater.get_current_pricing()
+
+            assert mock_download.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_forced_refresh_backs_off(
+        self, updater: PricingUpdater
+    ) -> None:
+        """Explicit refreshes update the retry backoff like background ones."""
+        with patch.object(updater.cache, "download_pricing_data", return_value=None):
+            await updater.get_current_pricing(force_refresh=True)
+
+        assert updater._consecutive_failures == 1
+        assert updater._retry_after > time.time()
+
+    @pytest.mark.asyncio
+    async def test_revalidation_failure_is_logged(
+        self, updater: PricingUpdater
+    ) -> None:
+        """An exception escaping the background task is logged, not lost."""
+        with (
+            patch.object(updater, "revalidate", side_effect=RuntimeError("boom")),
+            patch("ccproxy.pricing.updater.logger") as mock_logger,
+        ):
+            await updater.get_current_pricing()
+            task = updater._revalidation_task
+            assert task is not None
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.args[0] == "pricing_revalidation_failed"
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_is_not_revalidated(
+        self, updater: PricingUpdater
+    ) -> None:
+        """No background work is started for a snapshot within its TTL."""
+        updater._last_load_time = time.time()
+        updater._last_file_check_time = time.time()
+
+        await updater.get_current_metadata()
+
+        assert updater._revalidation_task is None
+
+    def test_snapshot_age_metric(self) -> None:
+        """The snapshot age gauge reports seconds since the data was fetched."""
+        from prometheus_client import CollectorRegistry
+
+        from ccproxy.observability.metrics import PrometheusMetrics
+
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(registry=registry, pushgateway_client=Mock())
+        metrics.set_pricing_snapshot_timestamp(time.time() - 30)
+        metrics.record_pricing_refresh(1.5, success=True)
+
+        age = registry.get_sample_value("ccproxy_pricing_snapshot_age_seconds")
+        assert age is not None
+        assert 29 <= age <= 60
+        assert (
+            registry.get_sample_value(
+                "ccproxy_pricing_refresh_duration_seconds_count",
+                {"status": "success"},
+            )
+            == 1
+        )
+
+
 class TestPricingIntegration:
     """Integration tests for the complete pricing system."""
 
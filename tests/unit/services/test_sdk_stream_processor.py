@@ -0,0 +1,155 @@
+"""Tests for incremental text output of the Claude SDK stream processor."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from ccproxy.claude_sdk.converter import MessageConverter
+from ccproxy.claude_sdk.streaming import ClaudeStreamProcessor
+from ccproxy.config.claude import SDKMessageMode, SDKStreamingSettings
+from ccproxy.models import claude_sdk as sdk_models
+
+
+def _event(event: dict[str, Any], parent: str | None = None) -> sdk_models.StreamEvent:
+    return sdk_models.StreamEvent(
+        uuid="u", session_id="s", event=event, parent_tool_use_id=parent
+    )
+
+
+def _text_events(text: str, parent: str | None = None) -> list[Any]:
+    return [
+        _event(
+            {"type": "content_block_start", "content_block": {"type": "text"}}, parent
+        ),
+        *(
+            _event(
+                {
+                    "type": "content_block_delta",
+                    "delta": {"type": "text_delta", "text": t},
+                },
+                parent,
+            )
+            for t in text.split(" ")
+        ),
+        _event({"type": "content_block_stop"}, parent),
+    ]
+
+
+async def _run(
+    messages: list[Any], settings: SDKStreamingSettings | None = None
+) -> list[dict[str, Any]]:
+    async def stream() -> AsyncIterator[Any]:
+        for message in messages:
+            yield message
+
+    processor = ClaudeStreamProcessor(MessageConverter(), streaming_settings=settings)
+    return [
+        chunk
+        async for chunk in processor.process_stream(
+            stream(),
+            model="claude-sonnet-4-20250514",
+            request_id="req",
+            ctx=None,
+            sdk_message_mode=SDKMessageMode.FORWARD,
+            pretty_format=False,
+        )
+    ]
+
+
+def _blocks(chunks: list[dict[str, Any]]) -> list[tuple[str, int, str]]:
+    """Content block events as (type, index, text delta)."""
+    return [
+        (c["type"], c["index"], c.get("delta", {}).get("text", ""))
+        for c in chunks
+        if c["type"].startswith("content_block")
+    ]
+
+
+@pytest.mark.unit
+class TestStreamProcessorIncrementalText:
+    """Test partial message forwarding and whole-block re-chunking."""
+
+    async def test_partial_events_are_forwarded_and_not_repeated(self) -> None:
+        """Text deltas stream through; the complete message only adds tool use."""
+        tool = sdk_models.ToolUseBlock(id="t1", name="Read", input={"path": "a"})
+        chunks = await _run(
+            [
+                *_text_events("Hello streaming world"),
+                _event(
+                    {
+                        "type": "content_block_start",
+                        "content_block": {"type": "tool_use"},
+                    }
+                ),
+                _event(
+                    {
+                        "type": "content_block_delta",
+                        "delta": {"type": "input_json_delta"},
+                    }
+                ),
+                _event({"type": "content_block_stop"}),
+                sdk_models.AssistantMessage(
+                    content=[sdk_models.TextBlock(text="Helloworld"), tool]
+                ),
+                sdk_models.ResultMessage(session_id="s"),
+            ]
+        )
+
+        assert _blocks(chunks)[:5] == [
+            ("content_block_start", 0, ""),
+            ("content_block_delta", 0, "Hello"),
+            ("content_block_delta", 0, "streaming"),
+            ("content_block_delta", 0, "world"),
+            ("content_block_stop", 0, ""),
+        ]
+        assert chunks[6]["content_block"]["type"] == "tool_use_sdk"
+        assert chunks[6]["index"] == 1
+        assert len(_blocks(chunks)) == 9  # text, tool use and result blocks only
+        assert chunks[-1] == {"type": "message_stop"}
+
+    async def test_whole_blocks_are_rechunked(self) -> None:
+        """Without partial events, long text blocks become several deltas."""
+        text = "x" * 25
+        chunks = await _run(
+            [
+                sdk_models.AssistantMessage(content=[sdk_models.TextBlock(text=text)]),
+                sdk_models.ResultMessage(session_id="s"),
+            ],
+            SDKStreamingSettings(rechunk_chars=10, rechunk_interval_ms=1),
+        )
+
+        deltas = [t for kind, _, t in _blocks(chunks) if kind == "content_block_delta"]
+        assert deltas == ["x" * 10, "x" * 10, "x" * 5]
+
+    async def test_rechunking_can_be_disabled(self) -> None:
+        """rechunk_chars=0 keeps one delta per text block."""
+        chunks = await _run(
+            [
+                sdk_models.AssistantMessage(
+                    content=[sdk_models.TextBlock(text="y" * 500)]
+                ),
+                sdk_models.ResultMessage(session_id="s"),
+            ],
+            SDKStreamingSettings(rechunk_chars=0),
+        )
+
+        deltas = [t for kind, _, t in _blocks(chunks) if kind == "content_block_delta"]
+        assert deltas == ["y" * 500]
+
+    async def test_subagent_events_and_unterminated_blocks(self) -> None:
+        """Sub-agent deltas are not forwarded; an open block is closed at the end."""
+        chunks = await _run(
+            [
+                *_text_events("inner", parent="toolu_1"),
+                *_text_events("outer")[:-1],
+                sdk_models.ResultMessage(session_id="s"),
+            ]
+        )
+
+        assert _blocks(chunks)[:4] == [
+            ("content_block_start", 0, ""),
+            ("content_block_delta", 0, "outer"),
+            ("content_block_stop", 0, ""),
+            ("content_block_start", 1, ""),  # result message block
+        ]
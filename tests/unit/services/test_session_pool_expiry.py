@@ -0,0 +1,118 @@
+"""Tests for SessionPool expiry scheduling and memory budget eviction."""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from claude_code_sdk import ClaudeCodeOptions
+
+from ccproxy.claude_sdk.session_client import SessionClient
+from ccproxy.claude_sdk.session_pool import SessionPool
+from ccproxy.config.claude import SessionPoolSettings
+from ccproxy.utils.process_memory import process_tree_rss
+
+
+MB = 1024 * 1024
+
+
+def _add_session(
+    pool: SessionPool, session_id: str, idle: float = 0.0, pid: int | None = None
+) -> SessionClient:
+    """Register a session the way the pool does, without connecting it."""
+    session_client = SessionClient(session_id, ClaudeCodeOptions())
+    session_client.metrics.last_used = time.time() - idle
+    if pid is not None:
+        session_client.claude_client = SimpleNamespace(  # type: ignore[assignment]
+            _transport=SimpleNamespace(_process=SimpleNamespace(pid=pid))
+        )
+    pool.sessions[session_id] = session_client
+    pool._schedule_expiry(session_client, time.time())
+    return session_client
+
+
+@pytest.mark.unit
+class TestSessionPoolExpiryHeap:
+    """Test that cleanup only visits sessions whose deadline has passed."""
+
+    async def test_cleanup_removes_only_due_sessions(self) -> None:
+        """Idle sessions are removed; others stay scheduled."""
+        pool = SessionPool(SessionPoolSettings(idle_threshold=60))
+        _add_session(pool, "fresh")
+        stale = _add_session(pool, "stale", idle=120)
+
+        with patch.object(
+            SessionClient, "should_cleanup", autospec=True, return_value=True
+        ) as should_cleanup:
+            await pool._cleanup_sessions()
+
+        assert [call.args[0] for call in should_cleanup.call_args_list] == [stale]
+        assert list(pool.sessions) == ["fresh"]
+        stats = await pool.get_stats()
+        assert stats["expiry_heap_size"] == 1
+        assert stats["expired_sessions"] == 1
+        assert 0 < stats["next_expiry_in_seconds"] <= 60
+
+    async def test_used_sessions_are_rescheduled(self) -> None:
+        """A session used after it was scheduled is pushed back, not removed."""
+        pool = SessionPool(SessionPoolSettings(idle_threshold=60))
+        session_client = _add_session(pool, "s", idle=120)
+        session_client.update_usage()
+
+        await pool._cleanup_sessions()
+
+        assert pool.sessions == {"s": session_client}
+        assert len(pool._expiry_heap) == 1
+        assert pool._expiry_heap[0][0] > time.time() + 50
+
+    async def test_entries_of_replaced_sessions_are_dropped(self) -> None:
+        """Heap entries of a removed session do not affect its replacement."""
+        pool = SessionPool(SessionPoolSettings(idle_threshold=60))
+        _add_session(pool, "s", idle=120)
+        replacement = _add_session(pool, "s")
+
+        await pool._cleanup_sessions()
+
+        assert pool.sessions == {"s": replacement}
+        assert len(pool._expiry_heap) == 1
+
+
+@pytest.mark.unit
+class TestSessionPoolMemoryBudget:
+    """Test LRU eviction of idle sessions over the memory budget."""
+
+    async def test_evicts_least_recently_used_idle_sessions(self) -> None:
+        """Busy sessions are kept; idle ones go oldest first until under budget."""
+        pool = SessionPool(SessionPoolSettings(memory_budget_mb=100))
+        busy = _add_session(pool, "busy", idle=300, pid=1)
+        busy.has_active_stream = True
+        _add_session(pool, "old", idle=200, pid=2)
+        _add_session(pool, "recent", idle=10, pid=3)
+
+        with patch(
+            "ccproxy.claude_sdk.session_pool.process_tree_rss",
+            return_value={1: 40 * MB, 2: 40 * MB, 3: 40 * MB},
+        ):
+            await pool._enforce_memory_budget()
+
+        assert sorted(pool.sessions) == ["busy", "recent"]
+        stats = await pool.get_stats()
+        assert stats["memory_evictions"] == 1
+        assert stats["memory_rss_mb"] == 80.0
+        assert stats["memory_rss_by_session_mb"] == {"busy": 40.0, "recent": 40.0}
+
+    def test_process_tree_rss_sums_descendants(self, tmp_path: Path) -> None:
+        """RSS of a pid includes its children and grandchildren only."""
+        page = 4096
+        processes = {10: (1, 100), 11: (10, 50), 12: (11, 25), 20: (1, 1000)}
+        for pid, (ppid, pages) in processes.items():
+            proc = tmp_path / str(pid)
+            proc.mkdir()
+            (proc / "stat").write_text(f"{pid} (claude (node)) S {ppid} 1 1 0")
+            (proc / "statm").write_text(f"9999 {pages} 0 0 0 0 0")
+
+        with patch("ccproxy.utils.process_memory.PAGE_SIZE", page):
+            rss = process_tree_rss([10, 11, 99], proc_root=tmp_path)
+
+        assert rss == {10: 175 * page, 11: 75 * page}
@@ -0,0 +1,202 @@
+"""Tests for recycling long-lived session CLI processes."""
+
+import asyncio
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from claude_code_sdk import ClaudeCodeOptions
+from prometheus_client import CollectorRegistry
+
+from ccproxy.claude_sdk.session_client import SessionClient
+from ccproxy.claude_sdk.session_pool import SessionPool
+from ccproxy.config.claude import SessionPoolSettings
+from ccproxy.observability.metrics import PrometheusMetrics
+
+
+MB = 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def connect() -> Iterator[AsyncMock]:
+    """Connect and disconnect session clients without a CLI."""
+    with (
+        patch.object(SessionClient, "connect", AsyncMock(return_value=True)) as mock,
+        patch.object(SessionClient, "disconnect", AsyncMock()),
+    ):
+        yield mock
+
+
+async def _session(pool: SessionPool, sdk_session_id: str = "sdk-1") -> SessionClient:
+    session_client = await pool._create_session(
+        "s", ClaudeCodeOptions(model="m", continue_conversation=True)
+    )
+    await session_client.ensure_connected()
+    session_client.sdk_session_id = sdk_session_id
+    return session_client
+
+
+async def _finish_pending(pool: SessionPool) -> None:
+    await asyncio.gather(*pool._background_tasks)
+    for _, _, connect_task, _ in list(pool._recycling.values()):
+        await connect_task
+
+
+async def _finish_turn(pool: SessionPool, session_client: SessionClient) -> None:
+    """Report the end of a streamed turn and let deferred recycles connect."""
+    session_client.notify_stream_finished()
+    await _finish_pending(pool)
+
+
+@pytest.mark.unit
+class TestSessionPoolRecycling:
+    """Test the recycle policy and swapping in replacements between requests."""
+
+    async def test_message_limit_swaps_in_resumed_replacement(self) -> None:
+        """A replacement resumes the conversation and keeps session metrics."""
+        pool = SessionPool(SessionPoolSettings(recycle_max_messages=2))
+        old = await _session(pool)
+        old.metrics.message_count = 1
+        pool._maybe_recycle_unlocked(old)
+        assert not pool._recycling
+
+        old.metrics.message_count = 2
+        pool._maybe_recycle_unlocked(old)
+        await _finish_turn(pool, old)
+        pool._swap_recycled_unlocked("s")
+
+        new = pool.sessions["s"]
+        assert new is not old
+        assert new.options.resume == "sdk-1"
+        assert not new.options.continue_conversation
+        assert (new.sdk_session_id, new.metrics.message_count) == ("sdk-1", 2)
+        stats = await pool.get_stats()
+        assert stats["recycles"] == {"messages": 1, "rss": 0, "age": 0}
+        assert stats["recycles_pending"] == 0
+
+        # The message limit counts from the replacement's start
+        new.metrics.message_count = 3
+        pool._maybe_recycle_unlocked(new)
+        assert not pool._recycling
+
+    async def test_replacement_sees_the_turn_that_triggered_it(
+        self, connect: AsyncMock
+    ) -> None:
+        """The replacement connects after the old process finished its turn."""
+        pool = SessionPool(SessionPoolSettings(recycle_max_messages=2))
+        old = await _session(pool)
+        transcript = ["turn 1"]
+        loaded: list[list[str]] = []
+
+        def load_transcript() -> bool:
+            loaded.append(list(transcript))
+            return True
+
+        connect.side_effect = load_transcript
+
+        # The limit is reached when the second request starts
+        old.metrics.message_count = 2
+        pool._maybe_recycle_unlocked(old)
+        await _finish_pending(pool)
+        assert not pool._recycling
+        assert (await pool.get_stats())["recycles_pending"] == 1
+
+        # The old process handles that request's turn
+        transcript.append("turn 2")
+        old.sdk_session_id = "sdk-2"
+        await _finish_turn(pool, old)
+        pool._swap_recycled_unlocked("s")
+
+        new = pool.sessions["s"]
+        assert new is not old
+        assert loaded == [["turn 1", "turn 2"]]
+        assert new.options.resume == "sdk-2"
+
+    async def test_stale_replacement_is_not_swapped_in(self) -> None:
+        """A replacement that missed a turn is replaced after that turn."""
+        pool = SessionPool(SessionPoolSettings(recycle_max_age=60))
+        old = await _session(pool)
+        pool._start_recycle_unlocked(old, "age")
+        await _finish_pending(pool)
+        stale = pool._recycling["s"][0]
+
+        old.metrics.message_count += 1
+        pool._swap_recycled_unlocked("s")
+        assert pool.sessions["s"] is old
+        assert not pool._recycling
+
+        await _finish_turn(pool, old)
+        pool._swap_recycled_unlocked("s")
+        assert pool.sessions["s"] not in (old, stale)
+
+    async def test_never_swaps_mid_stream(self) -> None:
+        """A session with an active stream keeps its process until it is idle."""
+        pool = SessionPool(SessionPoolSettings(recycle_max_age=60))
+        old = await _session(pool)
+        pool._process_started["s"] = (0.0, 0)
+        pool._maybe_recycle_unlocked(old)
+        await _finish_turn(pool, old)
+
+        old.has_active_stream = True
+        pool._swap_recycled_unlocked("s")
+        assert pool.sessions["s"] is old
+
+        old.has_active_stream = False
+        pool._swap_recycled_unlocked("s")
+        assert pool.sessions["s"] is not old
+        assert (await pool.get_stats())["recycles"]["age"] == 1
+
+    async def test_oversized_processes_are_recycled(self) -> None:
+        """The memory pass recycles processes over the RSS limit."""
+        pool = SessionPool(SessionPoolSettings(recycle_max_rss_mb=100))
+        old = await _session(pool)
+        old.claude_client = SimpleNamespace(  # type: ignore[assignment]
+            _transport=SimpleNamespace(_process=SimpleNamespace(pid=42))
+        )
+
+        with patch(
+            "ccproxy.claude_sdk.session_pool.process_tree_rss",
+            return_value={42: 150 * MB},
+        ):
+            await pool._check_memory()
+            await _finish_pending(pool)
+            await pool._check_memory()
+
+        assert pool.sessions["s"] is not old
+        stats = await pool.get_stats()
+        assert stats["recycles"]["rss"] == 1
+
+    async def test_failed_replacement_keeps_session(self, connect: AsyncMock) -> None:
+        """A replacement that cannot connect is dropped and counted."""
+        pool = SessionPool(SessionPoolSettings(recycle_max_messages=1))
+        old = await _session(pool)
+        old.metrics.message_count = 1
+        connect.return_value = False
+        pool._maybe_recycle_unlocked(old)
+        await _finish_turn(pool, old)
+        pool._swap_recycled_unlocked("s")
+
+        assert pool.sessions["s"] is old
+        assert (await pool.get_stats())["recycle_failures"] == 1
+
+    def test_prometheus_metrics(self) -> None:
+        """Cumulative recycle counts become counter increments."""
+        registry = CollectorRegistry()
+        metrics = PrometheusMetrics(namespace="test", registry=registry)
+
+        metrics.update_session_pool_metrics({"rss": 2}, {"a": 10 * MB, "b": 30 * MB})
+        metrics.update_session_pool_metrics({"rss": 3}, {"a": 10 * MB + 12345})
+
+        assert (
+            registry.get_sample_value("test_session_recycles_total", {"reason": "rss"})
+            == 3
+        )
+        assert (
+            registry.get_sample_value("test_session_processes_rss_bytes")
+            == 10 * MB + 12345
+        )
+        assert (
+            registry.get_sample_value("test_session_process_max_rss_bytes")
+            == 10 * MB + 12345
+        )
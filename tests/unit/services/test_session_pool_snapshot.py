@@ -0,0 +1,149 @@
+"""Tests for SessionPool snapshot and resume across restarts."""
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from claude_code_sdk import ClaudeCodeOptions
+
+from ccproxy.claude_sdk.session_client import SessionClient
+from ccproxy.claude_sdk.session_pool import SessionPool
+from ccproxy.claude_sdk.session_snapshot import (
+    SessionPoolSnapshot,
+    SessionSnapshotEntry,
+    load_snapshot,
+    options_fingerprint,
+    save_snapshot,
+)
+from ccproxy.config.claude import SessionPoolSettings
+
+
+def _options(model: str | None, system_prompt: str | None = None) -> ClaudeCodeOptions:
+    return ClaudeCodeOptions(model=model, system_prompt=system_prompt)
+
+
+def _pool(snapshot_file: Path, restore_max_sessions: int = 10) -> SessionPool:
+    config = SessionPoolSettings(
+        snapshot_enabled=True,
+        snapshot_file=snapshot_file,
+        restore_max_sessions=restore_max_sessions,
+    )
+    return SessionPool(config, options_factory=_options)
+
+
+def _entry(
+    session_id: str, model: str = "m", idle: float = 0.0
+) -> SessionSnapshotEntry:
+    return SessionSnapshotEntry(
+        session_id=session_id,
+        sdk_session_id=f"sdk-{session_id}",
+        options_fingerprint=options_fingerprint(_options(model)),
+        last_used=time.time() - idle,
+        model=model,
+    )
+
+
+@pytest.fixture
+def snapshot_file(tmp_path: Path) -> Path:
+    return tmp_path / "session_pool.json"
+
+
+@pytest.mark.unit
+class TestSessionPoolSnapshot:
+    """Test saving the manifest and resuming sessions from it."""
+
+    async def test_stop_saves_manifest(self, snapshot_file: Path) -> None:
+        """Sessions and their SDK session ids are written on shutdown."""
+        pool = _pool(snapshot_file)
+        session_client = SessionClient("s1", _options("m", "be brief"))
+        session_client.sdk_session_id = "sdk-1"
+        pool.sessions["s1"] = session_client
+
+        await pool.stop()
+
+        snapshot = load_snapshot(snapshot_file)
+        assert snapshot is not None
+        [entry] = snapshot.sessions
+        assert (entry.session_id, entry.sdk_session_id) == ("s1", "sdk-1")
+        assert (entry.model, entry.system_prompt) == ("m", "be brief")
+        assert entry.options_fingerprint == options_fingerprint(
+            _options("m", "be brief")
+        )
+
+    async def test_restores_most_recent_sessions(self, snapshot_file: Path) -> None:
+        """Only the hottest sessions with unchanged options are reconnected."""
+        save_snapshot(
+            snapshot_file,
+            SessionPoolSnapshot(
+                sessions=[
+                    _entry("cold", idle=100),
+                    _entry("hot", idle=10),
+                    _entry("warm", idle=50),
+                    _entry("idle", idle=5000),
+                ]
+            ),
+        )
+        pool = _pool(snapshot_file, restore_max_sessions=2)
+
+        with patch.object(SessionClient, "connect", AsyncMock(return_value=True)):
+            await pool.start()
+            assert pool._restore_task is not None
+            await pool._restore_task
+
+        assert sorted(pool.sessions) == ["hot", "warm"]
+        assert pool.sessions["hot"].options.resume == "sdk-hot"
+        assert not pool.sessions["hot"].options.continue_conversation
+        stats = (await pool.get_stats())["restore"]
+        assert stats["restored"] == 2
+        assert stats["warmup_ms"] is not None
+
+        await pool.stop()
+
+    async def test_first_request_hit_and_miss(self, snapshot_file: Path) -> None:
+        """Matching options reuse the session; others resume in a new process."""
+        pool = _pool(snapshot_file)
+        for session_id in ("a", "b"):
+            session_client = SessionClient(session_id, _options("m"))
+            session_client.sdk_session_id = f"sdk-{session_id}"
+            pool.sessions[session_id] = session_client
+            pool._restored[session_id] = options_fingerprint(_options("m"))
+
+        hit, miss = _options("m"), _options("other")
+        await pool._claim_restored_unlocked("a", hit)
+        await pool._claim_restored_unlocked("b", miss)
+
+        assert list(pool.sessions) == ["a"] and hit.resume is None
+        assert miss.resume == "sdk-b"
+        stats = (await pool.get_stats())["restore"]
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    async def test_unrestored_entries_resume_on_request(
+        self, snapshot_file: Path
+    ) -> None:
+        """Entries that were not reconnected still resume their conversation."""
+        pool = _pool(snapshot_file)
+        pool._resume_entries["c"] = _entry("c")
+        options = _options("m")
+        options.continue_conversation = True
+
+        await pool._claim_restored_unlocked("c", options)
+
+        assert options.resume == "sdk-c"
+        assert not options.continue_conversation
+        assert (await pool.get_stats())["restore"]["resumed_cold"] == 1
+
+    def test_outdated_manifest_is_ignored(self, snapshot_file: Path) -> None:
+        """A manifest from another format version is not loaded."""
+        snapshot_file.write_text('{"version": 0, "sessions": []}')
+
+        assert load_snapshot(snapshot_file) is None
+
+    def test_manifest_is_private_to_the_owner(self, tmp_path: Path) -> None:
+        """The manifest and the directory created for it are owner-only."""
+        snapshot_file = tmp_path / "cache" / "session_pool.json"
+
+        save_snapshot(snapshot_file, SessionPoolSnapshot())
+
+        assert snapshot_file.stat().st_mode & 0o777 == 0o600
+        assert snapshot_file.parent.stat().st_mode & 0o777 == 0o700
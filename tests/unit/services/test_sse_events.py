@@ -318,6 +318,101 @@ class TestSSEEventManager:
         assert info["active_connections"] == 0
 
 
+class TestSSEBroadcastCoalescing:
+    """Test shared encoding, batching and ring buffer overflow."""
+
+    async def _collect(
+        self, manager: SSEEventManager, connection_id: str, events: list[str]
+    ) -> None:
+        async for event in manager.add_connection(connection_id):
+            events.append(event)
+
+    async def test_frames_are_shared_between_connections(self) -> None:
+        """An event is encoded once and every connection gets the same frame."""
+        manager = SSEEventManager(max_flush_rate=0)
+        first: list[str] = []
+        second: list[str] = []
+        tasks = [
+            asyncio.create_task(self._collect(manager, "a", first)),
+            asyncio.create_task(self._collect(manager, "b", second)),
+        ]
+        await asyncio.sleep(0.05)
+
+        await manager.emit_event("request_start", {"request_id": "shared"})
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert first[1] is second[1]
+        assert json.loads(first[1][6:])["data"]["request_id"] == "shared"
+
+    async def test_events_within_interval_are_batched(self) -> None:
+        """Events arriving faster than the flush rate share one batch frame."""
+        manager = SSEEventManager(max_flush_rate=5)
+        events: list[str] = []
+        task = asyncio.create_task(self._collect(manager, "batch", events))
+        await asyncio.sleep(0.05)
+
+        await manager.emit_event("request_start", {"request_id": "req-0"})
+        await asyncio.sleep(0.01)
+        for i in range(1, 4):
+            await manager.emit_event("request_start", {"request_id": f"req-{i}"})
+        await asyncio.sleep(0.3)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        frames = [json.loads(event[6:]) for event in events[1:]]
+        assert frames[0]["type"] == "request_start"
+        assert frames[1]["type"] == "batch"
+        assert frames[1]["count"] == 3
+        assert [e["data"]["request_id"] for e in frames[1]["events"]] == [
+            "req-1",
+            "req-2",
+            "req-3",
+        ]
+
+    async def test_overflow_reports_missed_events(self) -> None:
+        """A full ring keeps the newest events and reports how many were lost."""
+        manager = SSEEventManager(max_queue_size=3, max_flush_rate=0)
+        events: list[str] = []
+        task = asyncio.create_task(self._collect(manager, "slow", events))
+        await asyncio.sleep(0.05)
+
+        for i in range(5):
+            await manager.emit_event("request_start", {"request_id": f"req-{i}"})
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        overflow = json.loads(events[1][6:])
+        frames = [json.loads(event[6:]) for event in events[2:5]]
+        assert overflow["type"] == "overflow"
+        assert overflow["dropped"] == 2
+        assert [frame["data"]["request_id"] for frame in frames] == [
+            "req-2",
+            "req-3",
+            "req-4",
+        ]
+
+    async def test_events_are_not_batched_by_default(self) -> None:
+        """Without a flush rate every pending event keeps its own frame."""
+        manager = SSEEventManager()
+        events: list[str] = []
+        task = asyncio.create_task(self._collect(manager, "default", events))
+        await asyncio.sleep(0.05)
+
+        for i in range(3):
+            await manager.emit_event("request_start", {"request_id": f"req-{i}"})
+        await asyncio.sleep(0.05)
+        await manager.disconnect_all()
+        await asyncio.wait_for(task, timeout=1)
+
+        frames = [json.loads(event[6:]) for event in events[1:4]]
+        assert [frame["type"] for frame in frames] == ["request_start"] * 3
+        assert json.loads(events[-1][6:])["type"] == "disconnect"
+
+
 class TestSSEGlobalFunctions:
     """Test global SSE functions."""
 
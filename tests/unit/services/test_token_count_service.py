@@ -0,0 +1,179 @@
+"""Tests for local count_tokens support."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ccproxy.config.settings import Settings
+from ccproxy.core.http_transformers import get_system_field_fragment
+from ccproxy.services.token_count_service import TokenCountService
+from ccproxy.utils.token_estimation import TokenEstimator
+
+
+# Request bodies with the input_tokens reported by the upstream count_tokens
+# endpoint, taken from Anthropic's token counting documentation.
+RECORDED_UPSTREAM_COUNTS: list[tuple[dict[str, Any], int]] = [
+    (
+        {
+            "model": "claude-3-5-sonnet-20241022",
+            "system": "You are a scientist",
+            "messages": [{"role": "user", "content": "Hello, Claude"}],
+        },
+        14,
+    ),
+    (
+        {
+            "model": "claude-3-5-sonnet-20241022",
+            "tools": [
+                {
+                    "name": "get_weather",
+                    "description": "Get the current weather in a given location",
+                    "input_schema": {
+                        "type": "object",
+                        "properties": {
+                            "location": {
+                                "type": "string",
+                                "description": "The city and state, e.g. San Francisco, CA",
+                            }
+                        },
+                        "required": ["location"],
+                    },
+                }
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": "What's the weather like in San Francisco?",
+                }
+            ],
+        },
+        403,
+    ),
+]
+
+
+def _proxy_service(status_code: int = 200, input_tokens: int = 42) -> MagicMock:
+    proxy_service = MagicMock()
+    proxy_service.handle_request = AsyncMock(
+        return_value=(
+            status_code,
+            {"content-type": "application/json"},
+            json.dumps({"input_tokens": input_tokens}).encode(),
+        )
+    )
+    return proxy_service
+
+
+@pytest.mark.unit
+class TestTokenCountService:
+    """Test token counting modes and caching."""
+
+    @pytest.mark.parametrize(("payload", "upstream_tokens"), RECORDED_UPSTREAM_COUNTS)
+    def test_estimate_accuracy_against_recorded_counts(
+        self, payload: dict[str, Any], upstream_tokens: int
+    ) -> None:
+        """Local estimates stay within 15% of recorded upstream counts."""
+        service = TokenCountService(estimator=TokenEstimator())
+
+        estimate = service.estimate(payload).input_tokens
+
+        assert abs(estimate - upstream_tokens) <= upstream_tokens * 0.15
+
+    async def test_growing_conversation_adds_new_blocks(self) -> None:
+        """A longer conversation is estimated as the sum of its messages."""
+        estimator = TokenEstimator()
+        service = TokenCountService(estimator=estimator)
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": [{"type": "text", "text": "first turn"}]}
+        ]
+        first = await service.count({"messages": messages})
+
+        added = [
+            {"role": "assistant", "content": "reply"},
+            {"role": "user", "content": "second turn"},
+        ]
+        result = await service.count({"messages": messages + added})
+
+        assert result.source == "estimate"
+        assert result.input_tokens == first.input_tokens + sum(
+            estimator.estimate_message(message) for message in added
+        )
+
+    async def test_exact_mode_forwards_once_and_caches(self) -> None:
+        """Exact counts come from upstream and are cached per request."""
+        service = TokenCountService(estimator=TokenEstimator())
+        proxy_service = _proxy_service(input_tokens=1234)
+        payload = RECORDED_UPSTREAM_COUNTS[0][0]
+
+        first = await service.count(payload, mode="exact", proxy_service=proxy_service)
+        second = await service.count(payload, mode="exact", proxy_service=proxy_service)
+
+        assert (first.input_tokens, first.source) == (1234, "exact")
+        assert (second.input_tokens, second.source) == (1234, "cache")
+        proxy_service.handle_request.assert_awaited_once()
+        assert (
+            proxy_service.handle_request.call_args.kwargs["path"]
+            == "/v1/messages/count_tokens"
+        )
+
+    async def test_exact_mode_falls_back_to_estimate_on_upstream_error(self) -> None:
+        """Upstream errors degrade to the local estimate and are not cached."""
+        service = TokenCountService(estimator=TokenEstimator())
+        proxy_service = _proxy_service(status_code=429)
+        payload = RECORDED_UPSTREAM_COUNTS[0][0]
+
+        result = await service.count(payload, mode="exact", proxy_service=proxy_service)
+        await service.count(payload, mode="exact", proxy_service=proxy_service)
+
+        assert result.source == "estimate"
+        assert proxy_service.handle_request.await_count == 2
+
+
+@pytest.mark.unit
+class TestCountTokensEndpoint:
+    """Test the locally served count_tokens endpoint."""
+
+    @pytest.mark.parametrize("prefix", ["/api", "/sdk"])
+    def test_count_tokens_is_served_locally(
+        self, client: TestClient, prefix: str
+    ) -> None:
+        """Both API prefixes answer without contacting upstream."""
+        payload, upstream_tokens = RECORDED_UPSTREAM_COUNTS[0]
+
+        response = client.post(f"{prefix}/v1/messages/count_tokens", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["x-ccproxy-token-count-source"] == "estimate"
+        if prefix == "/sdk":
+            assert response.json()["input_tokens"] == pytest.approx(
+                upstream_tokens, rel=0.15
+            )
+
+    def test_api_estimate_includes_injected_system_prompt(
+        self, client: TestClient, test_settings: Settings
+    ) -> None:
+        """/api estimates count the system prompt injected before forwarding."""
+        payload = RECORDED_UPSTREAM_COUNTS[0][0]
+        injected = get_system_field_fragment(
+            client.app.state,  # type: ignore[attr-defined]
+            test_settings.claude.system_prompt_injection_mode.value,
+        ).value
+
+        api = client.post("/api/v1/messages/count_tokens", json=payload).json()
+        sdk = client.post("/sdk/v1/messages/count_tokens", json=payload).json()
+
+        assert api["input_tokens"] - sdk["input_tokens"] == (
+            TokenEstimator().estimate_system(injected)
+        )
+        assert api["input_tokens"] > sdk["input_tokens"]
+
+    def test_count_tokens_requires_messages(self, client: TestClient) -> None:
+        """Requests without messages are rejected."""
+        response = client.post(
+            "/api/v1/messages/count_tokens", json={"model": "claude-3-5-sonnet"}
+        )
+
+        assert response.status_code == 400
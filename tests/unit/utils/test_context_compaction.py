@@ -0,0 +1,171 @@
+"""Tests for token estimation and context-window history compaction."""
+
+import copy
+from typing import Any
+
+import pytest
+
+from ccproxy.utils.context_compaction import ContextCompactor
+from ccproxy.utils.token_estimation import TokenEstimator
+
+
+def _conversation(turns: int, tool_result_chars: int = 4000) -> list[dict[str, Any]]:
+    """Build a tool-using conversation with ``turns`` assistant/user pairs."""
+    messages: list[dict[str, Any]] = [{"role": "user", "content": "Start the task"}]
+    for i in range(turns):
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": f"Reading file {i}"},
+                    {
+                        "type": "tool_use",
+                        "id": f"toolu_{i}",
+                        "name": "read_file",
+                        "input": {"path": f"/src/file_{i}.py"},
+                    },
+                ],
+            }
+        )
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": f"toolu_{i}",
+                        "content": "x" * tool_result_chars,
+                    }
+                ],
+            }
+        )
+    messages.append({"role": "assistant", "content": "Done reading files."})
+    messages.append({"role": "user", "content": "Now summarize them."})
+    return messages
+
+
+@pytest.mark.unit
+class TestTokenEstimator:
+    """Test the local token estimator."""
+
+    def test_message_estimate_depends_on_content_only(self) -> None:
+        """Equal messages get equal estimates that scale with their length."""
+        estimator = TokenEstimator()
+        message = {"role": "user", "content": "hello world " * 50}
+
+        first = estimator.estimate_message(message)
+        second = estimator.estimate_message(dict(message))
+        as_block = estimator.estimate_message(
+            {"role": "user", "content": [{"type": "text", "text": message["content"]}]}
+        )
+
+        assert first == second == 4 + 172
+        assert as_block == first + 3
+
+    def test_tool_blocks_are_cached_by_tool_call_id(self) -> None:
+        """Re-sent tool calls and results are only serialized once."""
+        estimator = TokenEstimator()
+        messages = _conversation(3)
+
+        first = [estimator.estimate_message(m) for m in messages]
+        second = [estimator.estimate_message(m) for m in copy.deepcopy(messages)]
+
+        assert first == second
+        assert estimator.cache_info()["misses"] == 6
+        assert estimator.cache_info()["hits"] == 6
+
+    def test_cache_is_bounded(self) -> None:
+        """The cache evicts least recently used entries."""
+        estimator = TokenEstimator(cache_size=2)
+        estimator.estimate_request({"messages": _conversation(5)})
+
+        assert estimator.cache_info()["size"] == 2
+
+    def test_request_estimate_includes_system_and_tools(self) -> None:
+        """System prompt and tool definitions count towards the request size."""
+        estimator = TokenEstimator()
+        messages = [{"role": "user", "content": "hi"}]
+        bare = estimator.estimate_request({"messages": messages})
+        full = estimator.estimate_request(
+            {
+                "messages": messages,
+                "system": "You are a helpful assistant." * 10,
+                "tools": [{"name": "read_file", "input_schema": {"type": "object"}}],
+            }
+        )
+
+        assert full > bare
+
+
+@pytest.mark.unit
+class TestContextCompactor:
+    """Test history compaction."""
+
+    def test_payload_within_budget_is_untouched(self) -> None:
+        """Requests that fit are returned as-is."""
+        payload = {"model": "m", "messages": _conversation(2)}
+        result = ContextCompactor(estimator=TokenEstimator()).compact(
+            payload, budget=100_000
+        )
+
+        assert not result.compacted
+        assert result.payload is payload
+        assert result.dropped_tokens == 0
+
+    def test_tool_results_are_elided_first(self) -> None:
+        """Old tool results are replaced before any turn is dropped."""
+        payload = {"model": "m", "messages": _conversation(10)}
+        estimator = TokenEstimator()
+        before = estimator.estimate_request(payload)
+        compactor = ContextCompactor(estimator=estimator, preserve_recent_messages=4)
+
+        result = compactor.compact(payload, budget=before - 3000)
+
+        assert result.tool_results_elided > 0
+        assert result.messages_dropped == 0
+        assert result.fits
+        assert result.dropped_tokens > 0
+        assert result.estimated_tokens_after == (
+            TokenEstimator().estimate_request(result.payload)
+        )
+        assert len(result.payload["messages"]) == len(payload["messages"])
+        # The original payload is not mutated
+        assert payload["messages"][2]["content"][0]["content"] == "x" * 4000
+        # Recent messages are preserved verbatim
+        assert result.payload["messages"][-4:] == payload["messages"][-4:]
+
+    def test_oldest_turns_are_dropped_when_eliding_is_not_enough(self) -> None:
+        """Turns are dropped from the front, leaving a valid conversation."""
+        messages = _conversation(10, tool_result_chars=100)
+        for message in messages:
+            if message["role"] == "assistant" and isinstance(message["content"], list):
+                message["content"][0]["text"] = "thinking out loud " * 100
+        payload = {"model": "m", "messages": messages}
+        estimator = TokenEstimator()
+        before = estimator.estimate_request(payload)
+
+        result = ContextCompactor(estimator=estimator).compact(
+            payload, budget=before // 2
+        )
+
+        compacted = result.payload["messages"]
+        assert result.messages_dropped > 0
+        assert result.fits
+        assert result.estimated_tokens_after < result.estimated_tokens_before
+        assert compacted[0]["role"] == "user"
+        assert compacted[0]["content"][0]["text"].startswith("[ccproxy omitted")
+        # The first message must not reference a dropped tool_use
+        assert not any(
+            block.get("type") == "tool_result" for block in compacted[0]["content"]
+        )
+        assert compacted[-1] == messages[-1]
+
+    def test_protected_tail_is_never_dropped(self) -> None:
+        """If only the protected tail remains, the result is reported as not fitting."""
+        payload = {"model": "m", "messages": _conversation(1)}
+        result = ContextCompactor(
+            estimator=TokenEstimator(), preserve_recent_messages=10
+        ).compact(payload, budget=10)
+
+        assert not result.compacted
+        assert not result.fits
@@ -0,0 +1,120 @@
+"""Tests for early level filtering, debug sampling and queued logging."""
+
+import json
+import logging
+import queue
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import structlog
+
+from ccproxy.core.logging import (
+    ContextQueueHandler,
+    DebugEventSampler,
+    LevelFilteringBoundLogger,
+    is_enabled_for,
+    setup_logging,
+    stop_log_queue,
+)
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    """Restore root handlers and structlog configuration after a test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    config = structlog.get_config()
+    yield
+    stop_log_queue()
+    root.handlers, root.level = handlers, level
+    structlog.configure(**config)
+    structlog.contextvars.clear_contextvars()
+
+
+@pytest.mark.unit
+class TestLevelFiltering:
+    """Test that disabled levels skip the processor chain."""
+
+    def test_disabled_levels_skip_processors(self) -> None:
+        """Processors run only for levels the stdlib logger enables."""
+        seen: list[str] = []
+
+        def spy(logger: Any, method_name: str, event_dict: Any) -> Any:
+            seen.append(method_name)
+            raise structlog.DropEvent
+
+        stdlib_logger = logging.getLogger("test_level_filtering")
+        stdlib_logger.setLevel(logging.INFO)
+        logger = LevelFilteringBoundLogger(stdlib_logger, [spy], {})
+
+        logger.debug("skipped")
+        logger.info("kept")
+        stdlib_logger.setLevel(logging.ERROR)
+        logger.warning("skipped")
+        logger.exception("kept")
+
+        assert seen == ["info", "exception"]
+        assert is_enabled_for(logger, logging.ERROR)
+        assert not is_enabled_for(logger, logging.INFO)
+
+
+@pytest.mark.unit
+class TestDebugEventSampler:
+    """Test per-event rate limiting of DEBUG events."""
+
+    def test_rate_limits_per_event_and_reports_drops(self) -> None:
+        """Excess events in a second are dropped and counted on the next one."""
+        now = [100.0]
+        sampler = DebugEventSampler(2, clock=lambda: now[0])
+
+        def passes(method: str, event: str) -> dict[str, Any] | None:
+            try:
+                return dict(sampler(None, method, {"event": event}))
+            except structlog.DropEvent:
+                return None
+
+        results = [passes("debug", "chunk") for _ in range(5)]
+        assert [r is not None for r in results] == [True, True, False, False, False]
+        assert passes("debug", "other") == {"event": "other"}
+        assert passes("info", "chunk") == {"event": "chunk"}
+
+        now[0] = 101.2
+        assert passes("debug", "chunk") == {"event": "chunk", "sampled_out": 3}
+        assert passes("debug", "chunk") == {"event": "chunk"}
+
+
+@pytest.mark.unit
+class TestQueuedLogging:
+    """Test the queue-backed handler and listener."""
+
+    def test_records_are_written_by_listener_with_context(
+        self, tmp_path: Path, restore_logging: None
+    ) -> None:
+        """Structlog and stdlib records reach the file with request context."""
+        log_file = tmp_path / "ccproxy.log"
+        setup_logging(log_level_name="INFO", log_file=str(log_file), async_logs=True)
+        root = logging.getLogger()
+        assert [type(h) for h in root.handlers] == [ContextQueueHandler]
+
+        structlog.contextvars.bind_contextvars(request_id="req-1")
+        structlog.get_logger("queued").info("structlog_event", value=1)
+        logging.getLogger("queued.stdlib").warning("stdlib %s", "event")
+        structlog.get_logger("queued").debug("filtered_event")
+        stop_log_queue()
+
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [line["event"] for line in lines] == ["structlog_event", "stdlib event"]
+        assert all(line["request_id"] == "req-1" for line in lines)
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        """Records beyond the queue size are counted, not enqueued."""
+        handler = ContextQueueHandler(queue.Queue(maxsize=1))
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "m", None, None)
+
+        handler.handle(record)
+        handler.handle(record)
+
+        assert handler.queue.qsize() == 1  # type: ignore[attr-defined]
+        assert handler.dropped == 1
@@ -0,0 +1,137 @@
+"""Tests for the dependency-aware startup orchestrator."""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from ccproxy.utils.startup_orchestrator import LifecycleComponent, StartupOrchestrator
+
+
+def _component(
+    name: str,
+    calls: list[str],
+    delay: float = 0.0,
+    **options: Any,
+) -> LifecycleComponent:
+    async def startup(app: FastAPI, settings: Any) -> None:
+        calls.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        calls.append(f"end:{name}")
+
+    return {"name": name, "startup": startup, "shutdown": None, **options}  # type: ignore[typeddict-item]
+
+
+@pytest.mark.unit
+class TestStartupOrchestrator:
+    """Test concurrent startup, deferral and timing reports."""
+
+    async def test_independent_components_start_concurrently(self) -> None:
+        """Components without dependencies overlap; dependents wait."""
+        calls: list[str] = []
+        orchestrator = StartupOrchestrator(
+            [
+                _component("A", calls, delay=0.1),
+                _component("B", calls, delay=0.1),
+                _component("C", calls, depends_on=["A", "B"]),
+            ]
+        )
+
+        started = time.perf_counter()
+        await orchestrator.start(FastAPI(), None)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.18
+        assert calls[:2] == ["start:A", "start:B"]
+        assert calls.index("start:C") > max(calls.index("end:A"), calls.index("end:B"))
+        assert orchestrator.timings["C"].status == "completed"
+
+    async def test_timeouts_and_failures_do_not_block_dependents(self) -> None:
+        """A slow or failing component is recorded and startup continues."""
+        calls: list[str] = []
+
+        async def broken(app: FastAPI, settings: Any) -> None:
+            raise RuntimeError("boom")
+
+        orchestrator = StartupOrchestrator(
+            [
+                _component("Slow", calls, delay=10, timeout=0.05),
+                {"name": "Broken", "startup": broken, "shutdown": None},
+                _component("After", calls, depends_on=["Slow", "Broken"]),
+            ]
+        )
+
+        await orchestrator.start(FastAPI(), None)
+
+        report = orchestrator.report()["components"]
+        assert report["slow"]["status"] == "timeout"
+        assert report["broken"]["status"] == "failed"
+        assert report["broken"]["error"] == "boom"
+        assert report["after"]["status"] == "completed"
+
+    async def test_default_timeout_only_applies_to_deferred_components(
+        self,
+    ) -> None:
+        """Critical components may take as long as they need by default."""
+        calls: list[str] = []
+        orchestrator = StartupOrchestrator(
+            [
+                _component("Critical", calls, delay=0.1),
+                _component("Probe", calls, delay=10, deferred=True),
+            ],
+            deferred_timeout=0.05,
+        )
+
+        await orchestrator.start(FastAPI(), None)
+        await asyncio.gather(*orchestrator._deferred_tasks)
+
+        assert orchestrator.timings["Critical"].status == "completed"
+        assert orchestrator.timings["Probe"].status == "timeout"
+
+    async def test_deferred_components_run_after_start(self) -> None:
+        """Deferred components do not hold up startup and can be cancelled."""
+        calls: list[str] = []
+        orchestrator = StartupOrchestrator(
+            [
+                _component("Critical", calls),
+                _component("Probe", calls, deferred=True),
+                _component("Refresh", calls, delay=10, deferred=True),
+            ]
+        )
+
+        await orchestrator.start(FastAPI(), None)
+        assert calls == ["start:Critical", "end:Critical"]
+        assert orchestrator.report()["pending"] == 2
+
+        await asyncio.sleep(0.01)
+        await orchestrator.cancel_deferred()
+
+        report = orchestrator.report()
+        assert report["critical_path_ms"] is not None
+        assert report["components"]["probe"]["status"] == "completed"
+        assert report["components"]["probe"]["deferred"] is True
+        assert report["components"]["refresh"]["status"] == "cancelled"
+        assert report["pending"] == 0
+
+    @pytest.mark.parametrize(
+        "components, message",
+        [
+            ([{"depends_on": ["Missing"]}, {}], "unknown component"),
+            ([{"depends_on": ["B"]}, {"depends_on": ["A"]}], "cycle"),
+            ([{"depends_on": ["B"]}, {"deferred": True}], "deferred component"),
+        ],
+    )
+    def test_invalid_dependency_graphs_are_rejected(
+        self, components: list[dict[str, Any]], message: str
+    ) -> None:
+        """Unknown, cyclic and critical-on-deferred dependencies are errors."""
+        calls: list[str] = []
+        with pytest.raises(ValueError, match=message):
+            StartupOrchestrator(
+                [
+                    _component(name, calls, **options)
+                    for name, options in zip("AB", components, strict=True)
+                ]
+            )
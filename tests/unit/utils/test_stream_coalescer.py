@@ -0,0 +1,156 @@
+"""Tests for SSE write coalescing."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from ccproxy.utils.stream_coalescer import (
+    SSEWriteCoalescer,
+    coalescing_disabled_by_client,
+)
+
+
+def _frame(i: int) -> bytes:
+    return f'data: {{"i":{i}}}\n\n'.encode()
+
+
+async def _burst(count: int, delay: float = 0.0) -> AsyncIterator[bytes]:
+    for i in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield _frame(i)
+
+
+async def _with_timeout(
+    stream: AsyncIterator[bytes], timeout: float = 5.0
+) -> AsyncIterator[bytes]:
+    """Iterate a stream, failing instead of hanging past the timeout."""
+    async with asyncio.timeout(timeout):
+        async for data in stream:
+            yield data
+
+
+@pytest.mark.unit
+class TestSSEWriteCoalescer:
+    """Test flush window, byte threshold and backpressure behavior."""
+
+    async def test_burst_is_coalesced_without_reordering(self) -> None:
+        """A fast burst collapses into few writes with identical bytes."""
+        coalescer = SSEWriteCoalescer(_burst(200), flush_interval=0.05)
+
+        writes = [data async for data in coalescer.stream()]
+
+        assert b"".join(writes) == b"".join(_frame(i) for i in range(200))
+        assert coalescer.stats.upstream_chunks == 200
+        assert coalescer.stats.writes == len(writes) < 10
+        assert coalescer.stats.bytes == sum(len(w) for w in writes)
+
+    async def test_first_frame_is_not_delayed(self) -> None:
+        """The first frame after an idle period is flushed immediately."""
+
+        async def source() -> AsyncIterator[bytes]:
+            yield _frame(0)
+            await asyncio.sleep(10)
+            yield _frame(1)
+
+        coalescer = SSEWriteCoalescer(source(), flush_interval=5.0)
+        stream = coalescer.stream()
+
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+        await stream.aclose()
+
+        assert first == _frame(0)
+
+    async def test_max_write_bytes_triggers_flush(self) -> None:
+        """Writes are flushed once the byte threshold is reached."""
+        frame_size = len(_frame(0))
+        coalescer = SSEWriteCoalescer(
+            _burst(100), flush_interval=60.0, max_write_bytes=frame_size * 10
+        )
+
+        writes = [data async for data in _with_timeout(coalescer.stream())]
+
+        assert len(writes) > 5
+        assert all(len(w) <= frame_size * 11 for w in writes)
+
+    async def test_slow_source_is_passed_through(self) -> None:
+        """Frames further apart than the flush window keep their own write."""
+        coalescer = SSEWriteCoalescer(_burst(5, delay=0.02), flush_interval=0.001)
+
+        writes = [data async for data in coalescer.stream()]
+
+        assert writes == [_frame(i) for i in range(5)]
+
+    async def test_buffer_is_bounded_for_slow_clients(self) -> None:
+        """The upstream reader pauses while the buffer is full."""
+        frame_size = len(_frame(0))
+        coalescer = SSEWriteCoalescer(
+            _burst(500),
+            flush_interval=0.0,
+            max_write_bytes=frame_size,
+            max_buffer_bytes=frame_size * 4,
+        )
+
+        total = 0
+        async for data in coalescer.stream():
+            total += len(data)
+            await asyncio.sleep(0.001)
+
+        assert total == sum(len(_frame(i)) for i in range(500))
+        assert coalescer.stats.max_buffered_bytes <= frame_size * 5
+        assert coalescer.stats.backpressure_waits > 0
+
+    async def test_upstream_error_raised_after_buffered_data(self) -> None:
+        """Buffered frames are delivered before an upstream error surfaces."""
+
+        async def failing() -> AsyncIterator[bytes]:
+            yield _frame(0)
+            yield _frame(1)
+            raise RuntimeError("upstream reset")
+
+        coalescer = SSEWriteCoalescer(failing(), flush_interval=0.01)
+        received: list[bytes] = []
+
+        with pytest.raises(RuntimeError, match="upstream reset"):
+            async for data in coalescer.stream():
+                received.append(data)
+
+        assert b"".join(received) == _frame(0) + _frame(1)
+
+    async def test_close_stops_upstream_reader(self) -> None:
+        """Closing the output stream closes the upstream iterator."""
+        closed = asyncio.Event()
+
+        async def endless() -> AsyncIterator[bytes]:
+            try:
+                i = 0
+                while True:
+                    yield _frame(i)
+                    i += 1
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        coalescer = SSEWriteCoalescer(endless(), flush_interval=0.0)
+        stream = coalescer.stream()
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert closed.is_set()
+
+    @pytest.mark.parametrize(
+        ("headers", "disabled"),
+        [
+            ([], False),
+            ([(b"x-ccproxy-stream-coalescing", b"off")], True),
+            ([(b"X-CCProxy-Stream-Coalescing", b"False")], True),
+            ([(b"x-ccproxy-stream-coalescing", b"on")], False),
+        ],
+    )
+    def test_client_opt_out_header(
+        self, headers: list[tuple[bytes, bytes]], disabled: bool
+    ) -> None:
+        """Clients can request per-token delivery."""
+        assert coalescing_disabled_by_client(headers) is disabled
+